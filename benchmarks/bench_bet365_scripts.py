@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Bet365 Extraction Script Benchmark
+What each pregame extraction call costs the browser with the scripts sent
+inline (the full source on every page.evaluate, as before) against the
+installed script library (a call stub plus name and config):
+
+- CDP payload bytes per call, per sport
+- V8 parse + compile time of what each call sends, measured in node (the
+  same engine Chromium uses) with a unique source per iteration so the
+  compilation cache cannot hide the cost
+- the library's one-off install cost, and the break-even number of calls
+
+No browser or DOM is needed. End-to-end in-page latency per sport is logged
+by the scraper itself at the end of a run; compare
+`bet365_pregame_homepage_scraper.py --scripts inline` with the default
+`--scripts library`.
+
+Usage:
+    python benchmarks/bench_bet365_scripts.py [--iterations 200] [--json out.json]
+"""
+
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "bookmakers" / "bet365"))
+
+from utils.helpers.page_scripts import PageScriptRegistry
+from bet365_pregame_scripts import NAMESPACE, HELPERS, EXTRACTORS, SECTION_CONFIGS
+
+# Sport -> (script, config) as called by EnhancedIntelligentScraper
+SPORT_CALLS = {
+    'MLB': ('mlb', {}), 'NHL': ('nhl', {}), 'Tennis': ('tennis', {}), 'CFL': ('cfl', {}),
+    'NCAAF': ('ncaaf', {}), 'NFL': ('nfl', {}), 'NBA2K': ('nba2k', {}), 'PGA': ('pga', {}),
+    'UFC': ('ufc', {}), 'Soccer': ('soccer', {}),
+    'NBA': ('basketball_section', SECTION_CONFIGS['NBA']), 'NCAAB': ('basketball_section', SECTION_CONFIGS['NCAAB']),
+    'EPL': ('soccer_section', SECTION_CONFIGS['EPL']), 'UCL': ('soccer_section', SECTION_CONFIGS['UCL']),
+    'MLS': ('soccer_section', SECTION_CONFIGS['MLS']),
+}
+
+NODE_SCRIPT = r"""
+const vm = require('vm');
+const { sources, iterations } = JSON.parse(require('fs').readFileSync(process.argv[2], 'utf8'));
+const out = {};
+for (const [key, source] of Object.entries(sources)) {
+    // Parenthesised function expressions are compiled eagerly, as CDP does before calling them
+    for (let i = 0; i < 5; i++) new vm.Script(`(${source})\n//w${i}`);
+    const start = process.hrtime.bigint();
+    for (let i = 0; i < iterations; i++) new vm.Script(`(${source})\n//${key}:${i}`);
+    out[key] = Number(process.hrtime.bigint() - start) / 1e6 / iterations;
+}
+console.log(JSON.stringify(out));
+"""
+
+
+def call_payloads(registry_inline: PageScriptRegistry, registry_library: PageScriptRegistry) -> dict:
+    """What crosses CDP for one page-level call per sport in each mode"""
+    rows = {}
+    for sport, (name, config) in SPORT_CALLS.items():
+        inline_src = f"(cfg) => ({registry_inline.scripts[name]})(document, cfg, ({registry_inline.helpers_js}))"
+        args = [registry_library.namespace, registry_library.version, name, config]
+        rows[sport] = {
+            'script': name,
+            'inline_source': inline_src,
+            'inline_bytes': len(inline_src) + len(json.dumps(config)),
+            'library_source': registry_library._PAGE_CALL,
+            'library_bytes': len(registry_library._PAGE_CALL) + len(json.dumps(args)),
+        }
+    return rows
+
+
+def compile_times(sources: dict, iterations: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        data = Path(tmp) / 'sources.json'
+        data.write_text(json.dumps({'sources': sources, 'iterations': iterations}), encoding='utf-8')
+        script = Path(tmp) / 'compile.js'
+        script.write_text(NODE_SCRIPT, encoding='utf-8')
+        out = subprocess.run(['node', str(script), str(data)], capture_output=True, text=True, check=True)
+    return json.loads(out.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bet365 extraction script benchmark')
+    parser.add_argument('--iterations', type=int, default=200, help='Compilations per source')
+    parser.add_argument('--json', type=str, default=None, help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    inline = PageScriptRegistry(NAMESPACE, HELPERS, EXTRACTORS, mode='inline')
+    library = PageScriptRegistry(NAMESPACE, HELPERS, EXTRACTORS, mode='library')
+    rows = call_payloads(inline, library)
+
+    have_node = shutil.which('node') is not None
+    times = {}
+    if have_node:
+        sources = {f"inline:{sport}": row['inline_source'] for sport, row in rows.items()}
+        sources['stub'] = library._PAGE_CALL
+        sources['library'] = library.library_js
+        times = compile_times(sources, args.iterations)
+
+    results = {'sports': {}, 'library_bytes': len(library.library_js), 'library_compile_ms': times.get('library')}
+    for sport, row in rows.items():
+        results['sports'][sport] = {
+            'script': row['script'],
+            'inline_bytes': row['inline_bytes'],
+            'library_bytes': row['library_bytes'],
+            'inline_compile_ms': round(times[f"inline:{sport}"], 4) if have_node else None,
+            'library_compile_ms': round(times['stub'], 4) if have_node else None,
+        }
+    inline_total = sum(r['inline_bytes'] for r in results['sports'].values())
+    library_total = sum(r['library_bytes'] for r in results['sports'].values())
+    results['cycle'] = {'inline_bytes': inline_total, 'library_bytes': library_total}
+    if have_node:
+        results['cycle']['inline_compile_ms'] = round(sum(r['inline_compile_ms'] for r in results['sports'].values()), 3)
+        results['cycle']['library_compile_ms'] = round(sum(r['library_compile_ms'] for r in results['sports'].values()), 3)
+
+    print("=" * 60)
+    print(f"BET365 EXTRACTION SCRIPTS ({len(EXTRACTORS)} scripts, library {results['library_bytes'] / 1024:.1f} KB)")
+    print("=" * 60)
+    for sport, r in results['sports'].items():
+        compile_text = (f" | compile {r['inline_compile_ms']:.3f} -> {r['library_compile_ms']:.3f} ms"
+                        if have_node else "")
+        print(f"  {sport:<7} {r['script']:<19} {r['inline_bytes']:7d} -> {r['library_bytes']:4d} B/call{compile_text}")
+    cycle = results['cycle']
+    print(f"  one call per sport: {cycle['inline_bytes'] / 1024:.1f} KB -> {cycle['library_bytes'] / 1024:.1f} KB sent")
+    if have_node:
+        print(f"  one call per sport: {cycle['inline_compile_ms']:.2f} -> {cycle['library_compile_ms']:.2f} ms "
+              f"parse+compile, library install {results['library_compile_ms']:.2f} ms once per page")
+    else:
+        print("[WARN] node not found - compile times skipped")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"[OK] Results written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
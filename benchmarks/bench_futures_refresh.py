@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+1xBet Futures Refresh Benchmark
+Full refresh (futures list + one GetGameZip per event, file rewritten every
+run) against the incremental refresh engine (per-event fingerprints, hot/cold
+poll intervals, file rewritten only on change) over a simulated day.
+
+The catalogue is synthetic and deterministic: N outright events whose lines
+change with a small hourly probability, a few events added and removed per
+hour. The network is replaced by an in-memory catalogue on a simulated clock,
+so the numbers count requests and estimate wall time from a per-request
+latency instead of sleeping.
+
+Usage:
+    python benchmarks/bench_futures_refresh.py [--events 800] [--hours 24] [--run-every 10] [--json out.json]
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+_spec = importlib.util.spec_from_file_location(
+    "futures_scraper", Path(__file__).parent.parent / "bookmakers" / "1xbet" / "1xbet_futures_scraper.py")
+futures_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(futures_module)
+futures_module.logger.setLevel('WARNING')
+
+
+class Catalogue:
+    """Synthetic outright catalogue that drifts on a simulated clock"""
+
+    def __init__(self, n_events: int, change_rate: float, churn: int, seed: int = 7):
+        self.rng = random.Random(seed)
+        self.change_rate = change_rate   # probability an event's line changes per hour
+        self.churn = churn               # events added and removed per hour
+        self.next_id = 500000000
+        self.events = {}
+        for _ in range(n_events):
+            self._add()
+
+    def _add(self):
+        event_id = self.next_id
+        self.next_id += 1
+        self.events[event_id] = {
+            'list': {'I': event_id, 'SI': 2999, 'SN': 'Long-term bets', 'LI': self.rng.randrange(900),
+                     'L': f"League {self.rng.randrange(900)}", 'O1': f"Outright {event_id}",
+                     'S': 1790000000 + self.rng.randrange(10 ** 7), 'CN': 'World', 'COI': 225},
+            'line': {'E': [{'I': event_id * 100 + k, 'G': 1, 'T': k, 'C': round(self.rng.uniform(1.5, 200), 2),
+                            'CV': '+500', 'P': None, 'PL': {'N': f"Team {k}", 'I': k}}
+                           for k in range(self.rng.randrange(4, 40))]},
+        }
+
+    def advance(self, hours: float):
+        for event in self.events.values():
+            if self.rng.random() < self.change_rate * hours:
+                selection = self.rng.choice(event['line']['E'])
+                selection['C'] = round(selection['C'] * self.rng.uniform(0.9, 1.1), 2)
+        for _ in range(int(self.churn * hours + self.rng.random())):
+            self.events.pop(self.rng.choice(list(self.events)))
+            self._add()
+
+
+def make_scraper(catalogue: Catalogue, data_dir: Path, clock):
+    scraper = futures_module.FuturesScraper()
+    scraper.data_dir = data_dir
+    scraper.futures_file = data_dir / "1xbet_future.json"
+    scraper.refresh_state = futures_module.FuturesRefreshState(data_dir / "1xbet_future_state.json")
+    scraper.clock = clock
+
+    async def fetch_sport_futures(sport_id=2999):
+        scraper.request_count += 1
+        return [json.loads(json.dumps(e['list'])) for e in catalogue.events.values()]
+
+    async def fetch_event_line(event_id):
+        scraper.request_count += 1
+        event = catalogue.events.get(event_id)
+        return json.loads(json.dumps(event['line'])) if event else None
+
+    scraper.fetch_sport_futures = fetch_sport_futures
+    scraper.fetch_event_line = fetch_event_line
+    return scraper
+
+
+async def simulate(mode: str, n_events: int, hours: float, run_every_min: float,
+                   change_rate: float, churn: int, latency_ms: float, warmup_hours: float) -> dict:
+    catalogue = Catalogue(n_events, change_rate, churn)
+    sim_now = [1790000000.0]
+    step_h = run_every_min / 60.0
+    totals = {'mode': mode, 'runs': 0, 'requests': 0, 'writes': 0, 'cpu_s': 0.0,
+              'steady_runs': 0, 'steady_requests': 0}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = make_scraper(catalogue, Path(tmp), lambda: sim_now[0])
+        for run in range(int(hours / step_h)):
+            before = scraper.request_count
+            start = time.perf_counter()
+            if mode == 'full':
+                futures = await scraper.collect_futures()
+                scraper.save_futures(futures)
+                totals['writes'] += 1
+            else:
+                mtime = scraper.futures_file.stat().st_mtime_ns if scraper.futures_file.exists() else None
+                await scraper.refresh_and_save()
+                if scraper.futures_file.stat().st_mtime_ns != mtime:
+                    totals['writes'] += 1
+            totals['cpu_s'] += time.perf_counter() - start
+            totals['runs'] += 1
+            totals['requests'] += scraper.request_count - before
+            if run * step_h >= warmup_hours:
+                totals['steady_runs'] += 1
+                totals['steady_requests'] += scraper.request_count - before
+            catalogue.advance(step_h)
+            sim_now[0] += step_h * 3600
+
+    # The list request is sequential; line requests run 5 at a time (the scraper's semaphore)
+    per_run = totals['requests'] / totals['runs']
+    totals['requests_per_run'] = round(per_run, 1)
+    totals['steady_requests_per_run'] = round(totals['steady_requests'] / max(1, totals['steady_runs']), 1)
+    totals['est_wall_s_per_run'] = round((1 + max(0.0, per_run - 1) / 5) * latency_ms / 1000, 2)
+    totals['cpu_ms_per_run'] = round(totals['cpu_s'] / totals['runs'] * 1000, 2)
+    totals['cpu_s'] = round(totals['cpu_s'], 3)
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description='1xBet futures refresh benchmark')
+    parser.add_argument('--events', type=int, default=800)
+    parser.add_argument('--hours', type=float, default=24)
+    parser.add_argument('--run-every', type=float, default=10, help='Minutes between runs')
+    parser.add_argument('--change-rate', type=float, default=0.03, help='Per-event line change probability per hour')
+    parser.add_argument('--churn', type=int, default=4, help='Events added/removed per hour')
+    parser.add_argument('--warmup', type=float, default=6, help='Hours before steady-state counting starts')
+    parser.add_argument('--latency-ms', type=float, default=150, help='Assumed per-request latency')
+    parser.add_argument('--json', type=str, default=None, help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    results = [asyncio.run(simulate(mode, args.events, args.hours, args.run_every,
+                                    args.change_rate, args.churn, args.latency_ms, args.warmup))
+               for mode in ('full', 'incremental')]
+    full, incremental = results
+
+    print("=" * 60)
+    print(f"FUTURES REFRESH BENCHMARK ({args.events} events, {args.hours:g}h, run every {args.run_every:g} min)")
+    print("=" * 60)
+    for r in results:
+        print(f"  {r['mode']:<12} {r['requests_per_run']:8.1f} req/run | ~{r['est_wall_s_per_run']:6.2f} s/run | "
+              f"{r['cpu_ms_per_run']:8.2f} ms CPU/run | {r['writes']}/{r['runs']} file writes | "
+              f"steady {r['steady_requests_per_run']:.1f} req/run")
+    print(f"  request reduction: x{full['requests'] / max(1, incremental['requests']):.1f} overall, "
+          f"x{full['steady_requests_per_run'] / max(1, incremental['steady_requests_per_run']):.1f} "
+          f"after {args.warmup:g}h warm-up")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'args': vars(args), 'results': results}, f, indent=2)
+        print(f"[OK] Results written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+History Cleanup Benchmark
+HistoryManager.clean_all cost against source-file size.
+
+Per size, four 1xBet/FanDuel pregame/live files are written with mostly
+future (unexpired) matches, then:
+  - first run:   builds the expiry index (one read + parse per file)
+  - idle run:    nothing expired, files unchanged -> no file is read
+  - expiry run:  5 matches expired -> only their file rewritten
+  - full scan:   the previous behaviour (read + parse every match of every file)
+
+Usage:
+    python benchmarks/bench_history_cleanup.py [--sizes 1000 10000 50000] [--json out.json]
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.helpers.history_manager import HistoryManager
+
+
+EXPIRING = 5          # 1xBet pregame matches starting 10 minutes after setup
+CLOCK_ADVANCE = 11 * 60  # past those starts, before any live match goes stale (30 min)
+
+
+def write_sources(base: Path, n: int, seed: int = 42):
+    """Write n matches per source file; all in the future except EXPIRING soon-to-start 1xBet matches"""
+    rng = random.Random(seed)
+    now = datetime.now()
+    (base / '1xbet').mkdir(parents=True, exist_ok=True)
+    (base / 'fanduel').mkdir(parents=True, exist_ok=True)
+
+    def pregame(i):
+        start = now + timedelta(hours=rng.uniform(1, 72))
+        if i < EXPIRING and soon:
+            start = now + timedelta(minutes=10)
+        return {'match_id': i, 'team1': f"Home {i}", 'team2': f"Away {i}",
+                'start_time': start.strftime('%Y-%m-%d %H:%M:%S'), 'odds': {'home': 1.9, 'away': 1.9}}
+
+    def live(i):
+        updated = now - timedelta(minutes=rng.uniform(0, 5))
+        return {'match_id': i, 'team1': f"Home {i}", 'team2': f"Away {i}", 'status': 'live',
+                'last_updated': updated.isoformat(), 'odds': {'home': 1.9, 'away': 1.9}}
+
+    files = {
+        base / '1xbet' / '1xbet_pregame.json': lambda ms: {'matches': ms},
+        base / '1xbet' / '1xbet_live.json': lambda ms: {'matches': ms},
+        base / 'fanduel' / 'fanduel_pregame.json': lambda ms: {'data': {'matches': ms}},
+        base / 'fanduel' / 'fanduel_live.json': lambda ms: {'data': {'matches': ms}},
+    }
+    for path, wrap in files.items():
+        make = live if 'live' in path.name else pregame
+        soon = path.name == '1xbet_pregame.json'
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(wrap([make(i) for i in range(n)]), f)
+
+
+def legacy_scan(manager: HistoryManager) -> None:
+    """Old per-run work: load every file and parse every match's timestamp"""
+    for path, keys, _, phase in manager.cleanup_sources.values():
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        matches = data.get('matches') if keys == ('matches',) else data['data']['matches']
+        for match in matches:
+            if phase == 'pregame':
+                datetime.strptime(match['start_time'], '%Y-%m-%d %H:%M:%S') < datetime.now()
+            else:
+                (datetime.now() - datetime.fromisoformat(match['last_updated'])).total_seconds()
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def run(sizes: list) -> dict:
+    results = []
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp)
+            write_sources(base, n)
+            manager = HistoryManager(str(base))
+
+            first_ms = timed(manager.clean_all)
+            reads_before = manager.cleanup_stats['files_read']
+            idle_ms = timed(manager.clean_all)
+            idle_reads = manager.cleanup_stats['files_read'] - reads_before
+
+            # Move the clock past the soon-to-start matches
+            real_time = time.time
+            time.time = lambda: real_time() + CLOCK_ADVANCE
+            try:
+                writes_before = manager.cleanup_stats['files_written']
+                expiry_ms = timed(manager.clean_all)
+                writes = manager.cleanup_stats['files_written'] - writes_before
+            finally:
+                time.time = real_time
+
+            legacy_ms = timed(lambda: legacy_scan(manager))
+            results.append({
+                'matches_per_file': n,
+                'first_run_ms': round(first_ms, 1),
+                'idle_run_ms': round(idle_ms, 3),
+                'idle_files_read': idle_reads,
+                'expiry_run_ms': round(expiry_ms, 1),
+                'expiry_files_written': writes,
+                'removed': manager.cleanup_stats['removed'],
+                'legacy_full_scan_ms': round(legacy_ms, 1),
+            })
+    return {'sizes': results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='History cleanup benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 50000])
+    parser.add_argument('--json', type=str, default=None, help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    result = run(args.sizes)
+
+    print("=" * 60)
+    print("HISTORY CLEANUP BENCHMARK (4 source files)")
+    print("=" * 60)
+    for entry in result['sizes']:
+        print(f"  {entry['matches_per_file']:>6}/file: first {entry['first_run_ms']:8.1f} ms | "
+              f"idle {entry['idle_run_ms']:.3f} ms ({entry['idle_files_read']} reads) | "
+              f"expiry {entry['expiry_run_ms']:7.1f} ms ({entry['removed']} moved, "
+              f"{entry['expiry_files_written']} file written) | full scan {entry['legacy_full_scan_ms']:8.1f} ms")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        print(f"[OK] Results written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+History Index Benchmark
+Page latency and payload of HistoryIndex queries as history grows, versus the
+old approach of loading and filtering the whole file on every request.
+
+Usage:
+    python benchmarks/bench_history_index.py [--sizes 10000 100000 300000] [--queries 200] [--json out.json]
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.helpers.history_index import HistoryIndex, parse_timestamp
+
+SPORTS = ['Football', 'Basketball', 'Ice Hockey', 'Tennis', 'Baseball', 'Volleyball']
+
+
+def write_history(path: Path, n: int, seed: int = 42):
+    rng = random.Random(seed)
+    now = int(time.time())
+    matches = [{
+        'match_id': i,
+        'sport_name': rng.choice(SPORTS),
+        'league_name': f"League {rng.randrange(200)}",
+        'team1': f"Home {i}",
+        'team2': f"Away {i}",
+        'start_time': now - rng.randrange(180 * 86400),
+        'removed_at': now,
+        'odds_data': {'moneyline_home': '+120', 'moneyline_away': '-140'},
+    } for i in range(n)]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'pregame': matches, 'live': []}, f)
+
+
+def build_entries(path: Path):
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return [{'record': m, 'sport': m['sport_name'], 'bookmaker': '1xbet',
+             'timestamp': parse_timestamp(m['start_time']), 'id': m['match_id']} for m in data['pregame']]
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def run(sizes: list, n_queries: int) -> dict:
+    rng = random.Random(7)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            path = Path(tmp) / f"history_{n}.json"
+            write_history(path, n)
+            index = HistoryIndex('bench', [path], lambda: build_entries(path))
+
+            start = time.perf_counter()
+            index.refresh()
+            build_s = time.perf_counter() - start
+
+            latencies, payloads = [], []
+            cursor = None
+            for q in range(n_queries):
+                kind = q % 4
+                start = time.perf_counter()
+                if kind == 0:
+                    page = index.query(limit=100)
+                elif kind == 1:
+                    page = index.query(limit=100, sport=rng.choice(SPORTS))
+                elif kind == 2:
+                    page = index.query(limit=100, date_from=time.time() - 30 * 86400, date_to=time.time())
+                else:
+                    page = index.query(cursor=cursor, limit=100)   # walk deeper every round
+                    cursor = page['next_cursor']
+                latencies.append((time.perf_counter() - start) * 1000)
+                payloads.append(len(json.dumps(page)))
+
+            # Old behaviour: json.load the whole file and filter per request
+            start = time.perf_counter()
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            [m for m in data['pregame'] if m['sport_name'] == 'Tennis'][:100]
+            full_load_ms = (time.perf_counter() - start) * 1000
+
+            results.append({
+                'entries': n,
+                'index_build_s': round(build_s, 3),
+                'query_p50_ms': round(percentile(latencies, 0.50), 3),
+                'query_p99_ms': round(percentile(latencies, 0.99), 3),
+                'payload_bytes_max': max(payloads),
+                'full_load_per_request_ms': round(full_load_ms, 1),
+            })
+    return {'queries_per_size': n_queries, 'sizes': results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='History index benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 300000])
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--json', type=str, default=None, help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    result = run(args.sizes, args.queries)
+
+    print("=" * 60)
+    print(f"HISTORY INDEX BENCHMARK ({result['queries_per_size']} queries per size)")
+    print("=" * 60)
+    for entry in result['sizes']:
+        print(f"  {entry['entries']:>7} entries: build {entry['index_build_s']:6.2f}s | "
+              f"p50 {entry['query_p50_ms']:.3f} ms | p99 {entry['query_p99_ms']:.3f} ms | "
+              f"max page {entry['payload_bytes_max'] / 1024:.1f} KB | "
+              f"full load {entry['full_load_per_request_ms']:.0f} ms/request")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        print(f"[OK] Results written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
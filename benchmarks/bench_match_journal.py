@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Match History Journal Benchmark
+Cost of recording live-match history the old way (bet365 live scraper: the
+whole history JSON rewritten on every change batch) against the append-only
+journal (one line per change), as history accumulates, plus replaying one
+match's timeline through the index against loading the full history.
+
+Matches are synthetic bet365-shaped dicts; each cycle a share of the live
+matches change score/odds and a few finish and are replaced.
+
+Usage:
+    python benchmarks/bench_match_journal.py [--cycles 600] [--live 150] [--json out.json]
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.helpers.match_journal import JournalReader, MatchJournal
+
+
+def make_match(rng: random.Random, n: int) -> dict:
+    return {
+        'sport': rng.choice(['Soccer', 'Basketball', 'Tennis', 'NHL']),
+        'teams': {'home': f"Home {n}", 'away': f"Away {n}"},
+        'scores': {'home': 0, 'away': 0}, 'status': 'live', 'time': '00:00',
+        'odds': {'home': 1.9, 'away': 1.9, 'tie': 3.2},
+        'markets': [{'name': m, 'odds': [round(rng.uniform(1.2, 5), 2) for _ in range(3)]}
+                    for m in ('spread', 'total', 'moneyline')],
+    }
+
+
+def simulate(mode: str, cycles: int, live: int, change_share: float, finish_per_cycle: int, tmp: Path) -> dict:
+    rng = random.Random(11)
+    next_id = 0
+    current = {}
+    for _ in range(live):
+        current[f"m{next_id}"] = make_match(rng, next_id)
+        next_id += 1
+
+    history = {'completed_matches': {}, 'removed_matches': {}, 'session_stats': {'total_completed': 0}}
+    history_file = tmp / f"{mode}_history.json"
+    journal = MatchJournal(tmp / f"{mode}_history.jsonl", compact_every=10 ** 9) if mode == 'journal' else None
+    if journal is not None:
+        for key, match in current.items():
+            journal.record_new(key, match)
+
+    samples = []
+    start = time.perf_counter()
+    for cycle in range(cycles):
+        t0 = time.perf_counter()
+        for key, match in current.items():
+            if rng.random() < change_share:
+                match['scores']['home'] += rng.random() < 0.2
+                match['odds']['home'] = round(rng.uniform(1.2, 5), 2)
+                if journal is not None:
+                    journal.record_update(key, match, ['score', 'odds'])
+        for key in rng.sample(list(current), finish_per_cycle):
+            match = current.pop(key)
+            if journal is not None:
+                journal.record_completed(key, match)
+            else:
+                history['completed_matches'][key] = match
+            new_key = f"m{next_id}"
+            current[new_key] = make_match(rng, next_id)
+            next_id += 1
+            if journal is not None:
+                journal.record_new(new_key, current[new_key])
+        if journal is not None:
+            journal.flush()
+        else:
+            with open(history_file, 'w', encoding='utf-8') as f:
+                json.dump(history, f, indent=2, ensure_ascii=False)
+        if cycle % max(1, cycles // 10) == 0 or cycle == cycles - 1:
+            samples.append({'cycle': cycle, 'ms': round((time.perf_counter() - t0) * 1000, 3)})
+    total = time.perf_counter() - start
+
+    # Replay the timeline of one early (completed) match
+    key = 'm3'
+    if journal is not None:
+        journal.close()
+    t0 = time.perf_counter()
+    if journal is not None:
+        reader = JournalReader(journal.path)   # sidecar index + tail scan
+        state = reader.replay(key)
+        size = journal.path.stat().st_size
+    else:
+        with open(history_file, 'r', encoding='utf-8') as f:
+            state = json.load(f)['completed_matches'].get(key)
+        size = history_file.stat().st_size
+    replay_ms = (time.perf_counter() - t0) * 1000
+
+    return {'mode': mode, 'total_s': round(total, 3), 'per_cycle_ms': samples,
+            'file_mb': round(size / 1e6, 2), 'lookup_ms': round(replay_ms, 3), 'found': state is not None}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Match history journal benchmark')
+    parser.add_argument('--cycles', type=int, default=600)
+    parser.add_argument('--live', type=int, default=150, help='Live matches at any time')
+    parser.add_argument('--change-share', type=float, default=0.3, help='Share of live matches changing per cycle')
+    parser.add_argument('--finish', type=int, default=3, help='Matches finishing per cycle')
+    parser.add_argument('--json', type=str, default=None, help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = [simulate(mode, args.cycles, args.live, args.change_share, args.finish, Path(tmp))
+                   for mode in ('rewrite', 'journal')]
+
+    print("=" * 60)
+    print(f"MATCH HISTORY JOURNAL BENCHMARK ({args.cycles} cycles, {args.live} live matches)")
+    print("=" * 60)
+    for r in results:
+        first, last = r['per_cycle_ms'][0], r['per_cycle_ms'][-1]
+        print(f"  {r['mode']:<8} total {r['total_s']:8.3f} s | cycle {first['cycle']}: {first['ms']:8.3f} ms, "
+              f"cycle {last['cycle']}: {last['ms']:8.3f} ms | file {r['file_mb']:.2f} MB | "
+              f"one-match lookup {r['lookup_ms']:.3f} ms")
+    rewrite, journal = results
+    print(f"  recording speedup: x{rewrite['total_s'] / journal['total_s']:.1f}")
+    print("  (the journal also keeps every score/odds change; the rewrite file only finished matches)")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'args': vars(args), 'results': results}, f, indent=2)
+        print(f"[OK] Results written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Match Name Memo Benchmark
+merge_pregame_data time with and without the per-cycle name memo
+(MatchNameMemo) at several total match counts, split across 3 bookmakers.
+
+Team names come from a shared pool with bookmaker-specific spellings
+("Los Angeles Lakers" / "LA Lakers" / "Lakers"), so both the cache path and
+the fuzzy fallback are exercised. Both runs must produce identical output.
+
+Usage:
+    python benchmarks/bench_match_memo.py [--sizes 2000 5000 10000] [--baseline-max 2000] [--json out.json]
+"""
+
+import argparse
+import copy
+import io
+import json
+import random
+import sys
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.unified_odds_collector import UnifiedOddsCollector
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+CITIES = ['Los Angeles', 'New York', 'Boston', 'Chicago', 'Dallas', 'Denver', 'Miami', 'Phoenix',
+          'Seattle', 'Atlanta', 'Houston', 'Detroit', 'Toronto', 'Portland', 'Orlando', 'Memphis']
+NICKNAMES = ['Lions', 'Tigers', 'Bears', 'Hawks', 'Eagles', 'Sharks', 'Wolves', 'Kings', 'Giants',
+             'Rangers', 'Rockets', 'Comets', 'Storm', 'Thunder', 'Falcons', 'Pirates', 'Knights']
+SPORTS = ['Basketball', 'Ice Hockey', 'Soccer', 'Baseball', 'American Football']
+BOOKS = ('bet365', 'fanduel', '1xbet')
+
+
+def _spelling(team: tuple, book: str) -> str:
+    city, nickname = team
+    if book == 'fanduel':
+        return f"{city} {nickname}"
+    if book == 'bet365':
+        short = ''.join(word[0] for word in city.split()) if ' ' in city else city[:3].upper()
+        return f"{short} {nickname}"
+    return f"{city} {nickname} FC" if nickname in ('Lions', 'Eagles') else f"{city} {nickname}"
+
+
+def generate_books(total: int, seed: int = 42) -> dict:
+    """Deterministic pregame matches per bookmaker; ~70% of events listed by every book"""
+    rng = random.Random(seed)
+    teams = [(f"{city}{'' if i == 0 else f' {i}'}", nickname)
+             for i in range(max(1, total // 200)) for city in CITIES for nickname in NICKNAMES]
+    per_book = total // len(BOOKS)
+    events = []
+    for e in range(per_book):
+        home, away = rng.sample(teams, 2)
+        events.append((rng.choice(SPORTS), home, away, e))
+
+    books = {}
+    for book in BOOKS:
+        matches = []
+        for sport, home, away, e in events:
+            if rng.random() > 0.7:
+                home, away = rng.sample(teams, 2)  # book-specific event
+            matches.append({
+                'sport': sport,
+                'home_team': _spelling(home, book),
+                'away_team': _spelling(away, book),
+                'date': 'Mon Nov 03',
+                'time': '7:00 PM',
+                'game_id': f"{book}-{e}",
+                'match_id': f"{book}-{e}",
+                'fixture_id': f"{book}-{e}",
+                'source': book,
+                'is_live': False,
+                'raw_data': {'odds': {}},
+            })
+        books[book] = matches
+    return books
+
+
+def time_merge(books: dict, memo: bool) -> tuple:
+    data = copy.deepcopy(books)
+    with redirect_stdout(io.StringIO()):
+        collector = UnifiedOddsCollector()
+        collector.match_memo_enabled = memo
+        start = time.perf_counter()
+        result = collector.merge_pregame_data(data['bet365'], data['fanduel'], data['1xbet'])
+        elapsed = time.perf_counter() - start
+    return elapsed, result
+
+
+def signature(result: list) -> list:
+    return sorted(
+        (m['sport'], m['home_team'], m['away_team'], tuple(b for b in BOOKS if m[b]['available']))
+        for m in result
+    )
+
+
+def run(sizes: list, baseline_max: int) -> dict:
+    results = []
+    for total in sizes:
+        books = generate_books(total)
+        after, after_result = time_merge(books, memo=True)
+        entry = {
+            'matches': total,
+            'per_book': len(books['bet365']),
+            'memo_s': round(after, 3),
+            'unified_records': len(after_result),
+        }
+        if total <= baseline_max:
+            before, before_result = time_merge(books, memo=False)
+            entry['baseline_s'] = round(before, 3)
+            entry['speedup'] = round(before / after, 2) if after else None
+            entry['identical_output'] = signature(before_result) == signature(after_result)
+        results.append(entry)
+    return {'sizes': results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Match name memo benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[2000, 5000, 10000])
+    parser.add_argument('--baseline-max', type=int, default=2000,
+                        help='Skip the (slow) memo-less baseline above this size')
+    parser.add_argument('--json', type=str, default=None, help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    # Building a collector without a mappings file writes one - don't leave it behind
+    created = [p for p in (PROJECT_ROOT / 'name_mappings.json', PROJECT_ROOT / 'cache_backups') if not p.exists()]
+    try:
+        result = run(args.sizes, args.baseline_max)
+    finally:
+        for path in created:
+            if path.is_dir():
+                try:
+                    path.rmdir()
+                except OSError:
+                    pass
+            elif path.exists():
+                path.unlink()
+
+    print("=" * 60)
+    print("MATCH NAME MEMO BENCHMARK (merge_pregame_data, 3 bookmakers)")
+    print("=" * 60)
+    for entry in result['sizes']:
+        line = f"  {entry['matches']:>6} matches: memo {entry['memo_s']:8.2f}s"
+        if 'baseline_s' in entry:
+            line += (f" | baseline {entry['baseline_s']:8.2f}s | {entry['speedup']}x"
+                     f" | identical={entry['identical_output']}")
+        print(line)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        print(f"[OK] Results written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
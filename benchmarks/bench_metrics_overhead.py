@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Pipeline Metrics Overhead Benchmark
+Cost of recording a stage (stage_timer / timed_stage) against the stages it
+wraps, and the cost of rendering /metrics from several process snapshots.
+
+Stages measured (synthetic, deterministic payloads):
+  - decompress_response: gzip + json.loads of a 1xBet-sized sport payload
+  - parse_match batch:   dict building for N raw matches (timed once per batch)
+  - save:                json.dumps of N matches
+
+Usage:
+    python benchmarks/bench_metrics_overhead.py [--matches 2000] [--repeat 50] [--json out.json]
+"""
+
+import argparse
+import gzip
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.helpers.metrics import MetricsRegistry, REGISTRY, stage_timer, load_snapshots, render_prometheus
+
+
+def make_payload(n: int, seed: int = 42) -> list:
+    rng = random.Random(seed)
+    return [{
+        'I': 600000000 + i, 'SI': rng.choice([1, 2, 3, 4]), 'SN': 'Football', 'LI': rng.randrange(5000),
+        'L': f"League {rng.randrange(300)}", 'O1': f"Home {i}", 'O2': f"Away {i}", 'S': 1762190000 + i,
+        'E': [{'G': g, 'T': t, 'C': round(rng.uniform(1.1, 9.0), 2), 'CV': '+120', 'P': None}
+              for g in (1, 2, 17) for t in (1, 2, 3)],
+    } for i in range(n)]
+
+
+def parse_batch(raw: list) -> list:
+    return [{'match_id': m['I'], 'team1': m['O1'], 'team2': m['O2'], 'league': m['L'],
+             'odds': {f"{o['G']}_{o['T']}": o['C'] for o in m['E']}} for m in raw]
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(n_matches: int, repeat: int) -> dict:
+    raw = make_payload(n_matches)
+    compressed = gzip.compress(json.dumps({'Success': True, 'Value': raw}).encode('utf-8'))
+    parsed = parse_batch(raw)
+
+    stages = {
+        'decompress_response': lambda: json.loads(gzip.decompress(compressed)),
+        'parse_match_batch': lambda: parse_batch(raw),
+        'save_json_dumps': lambda: json.dumps(parsed, indent=2, ensure_ascii=False),
+    }
+
+    # Fixed cost of one recorded stage (enter + exit + histogram observe)
+    calls = 200000
+    start = time.perf_counter()
+    for _ in range(calls):
+        with stage_timer('bench_noop'):
+            pass
+    per_record_us = (time.perf_counter() - start) / calls * 1e6
+
+    results = {'matches': n_matches, 'record_cost_us': round(per_record_us, 3), 'stages': []}
+    for name, fn in stages.items():
+        plain = best_of(fn, repeat)
+
+        def instrumented():
+            with stage_timer(name):
+                fn()
+        timed = best_of(instrumented, repeat)
+        results['stages'].append({
+            'stage': name,
+            'plain_ms': round(plain * 1000, 3),
+            'instrumented_ms': round(timed * 1000, 3),
+            'overhead_pct': round(per_record_us / (plain * 1e6) * 100, 4),
+        })
+
+    # /metrics render: the viewer registry plus 6 process snapshots
+    with tempfile.TemporaryDirectory() as tmp:
+        for process in ('1xbet_pregame', '1xbet_live', 'fanduel_pregame', 'fanduel_live', 'bet365_live', 'unified'):
+            registry = MetricsRegistry()
+            registry.configure(process, snapshot_dir=Path(tmp))
+            for stage in ('fetch', 'decompress_response', 'parse_match', 'save_data', 'merge_pregame_data'):
+                for _ in range(100):
+                    registry.record_stage(stage, random.random() / 10, items=10)
+            registry.write_snapshot()
+        start = time.perf_counter()
+        text = render_prometheus([('viewer', REGISTRY.collect())] +
+                                 [(s['process'], s['metrics']) for s in load_snapshots(Path(tmp))])
+        results['render_ms'] = round((time.perf_counter() - start) * 1000, 2)
+        results['render_lines'] = text.count('\n')
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pipeline metrics overhead benchmark')
+    parser.add_argument('--matches', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--json', type=str, default=None, help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    result = run(args.matches, args.repeat)
+
+    print("=" * 60)
+    print(f"METRICS OVERHEAD BENCHMARK ({result['matches']} matches)")
+    print("=" * 60)
+    print(f"  cost per recorded stage: {result['record_cost_us']:.2f} us")
+    for entry in result['stages']:
+        print(f"  {entry['stage']:<20} {entry['plain_ms']:9.3f} ms plain | "
+              f"{entry['instrumented_ms']:9.3f} ms timed | overhead {entry['overhead_pct']:.4f}%")
+    print(f"  /metrics render (7 sources): {result['render_ms']:.2f} ms, {result['render_lines']} lines")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        print(f"[OK] Results written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Shared Name Cache Benchmark
+Memory and startup cost of the processes that hold the team-name cache
+(collector, monitoring system, auto cache updater, scraper cache hooks)
+when each one loads cache_data.json + name_mappings.json and builds its own
+EnhancedCacheManager indices, against mapping the shared snapshot
+(EnhancedCacheManager(shared=True)).
+
+All worker processes are started together on a synthetic cache and kept
+alive until every one has loaded and answered its lookups; each reports its
+RSS and PSS (shared pages split between the processes mapping them, from
+/proc/self/smaps_rollup) and a hash of its lookup results, which must match
+across modes. Load time, per-name lookup time and the cache hook's per-save
+cost (new manager + update from a file of known teams) are timed serially
+in this process.
+
+Usage:
+    python benchmarks/bench_name_cache_snapshot.py [--teams 20000] [--processes 4] [--json out.json]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+SPORTS = ['Soccer', 'Basketball', 'Tennis', 'Ice Hockey', 'Baseball', 'American Football', 'Volleyball', 'Handball']
+WORDS = ['North', 'South', 'Real', 'Atletico', 'Sporting', 'Dynamo', 'Union', 'Rapid', 'Olympic', 'Royal',
+         'Eagles', 'Lions', 'Rovers', 'Wanderers', 'Athletic', 'Rangers', 'Stars', 'Hawks', 'Bulls', 'Kings']
+
+
+def make_cache(base_dir: Path, n_teams: int, seed: int = 7):
+    """cache_data.json and name_mappings.json in the EnhancedCacheManager v3.0 layout"""
+    from utils.mappers.intelligent_name_mapper import IntelligentNameMapper
+
+    rng = random.Random(seed)
+    mapper = IntelligentNameMapper()
+    sports = {s: {'id': i + 1, 'canonical_name': s, 'teams': {}} for i, s in enumerate(SPORTS)}
+    names = []
+    for i in range(n_teams):
+        sport = rng.choice(SPORTS)
+        canonical = f"{rng.choice(WORDS)} {rng.choice(WORDS)} {i}"
+        aliases = [f"{canonical} FC", f"{canonical.split()[0][:3]}. {canonical.split()[1]} {i}"]
+        sports[sport]['teams'][canonical] = {
+            'id': i + 1, 'canonical_name': canonical,
+            'aliases': sorted({mapper.normalize_string(a) for a in [canonical] + aliases}),
+            'sources': ['bet365', 'fanduel'], 'match_count': rng.randrange(50),
+        }
+        mapper.add_canonical_name(canonical, aliases)
+        names.append((sport, canonical, aliases))
+
+    cache = {'version': '3.0', 'structure': 'enhanced_with_intelligent_mapping', 'sports': sports,
+             'metadata': {'created_at': '2026-01-01T00:00:00', 'last_updated': '2026-01-01T00:00:00',
+                          'total_sports': len(sports), 'total_teams': n_teams,
+                          'total_aliases': len(mapper.alias_to_canonical),
+                          'dedup_stats': {'duplicates_merged': 0, 'aliases_created': 0, 'last_cleanup': None}}}
+    with open(base_dir / 'cache_data.json', 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2, ensure_ascii=False)
+    with open(base_dir / 'name_mappings.json', 'w', encoding='utf-8') as f:
+        json.dump(mapper.export_mappings(), f, indent=2, ensure_ascii=False)
+
+    # Known-team match file, as a scraper would save it
+    matches = [{'sport': sport, 'home_team': rng.choice(aliases), 'away_team': canonical}
+               for sport, canonical, aliases in rng.sample(names, min(300, len(names)))]
+    with open(base_dir / 'known_matches.json', 'w', encoding='utf-8') as f:
+        json.dump({'matches': matches}, f)
+    return names
+
+
+def lookup_names(names, count: int = 2000, seed: int = 9):
+    rng = random.Random(seed)
+    out = []
+    for sport, canonical, aliases in rng.sample(names, min(count, len(names))):
+        out.extend([canonical, rng.choice(aliases), canonical.upper() + ' (W)', f"Unknown {canonical}"])
+    return out
+
+
+def memory_kb() -> dict:
+    result = {}
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                result['rss_kb'] = int(line.split()[1])
+    try:
+        with open('/proc/self/smaps_rollup') as f:
+            for line in f:
+                key = line.split(':')[0]
+                if key in ('Pss', 'Private_Clean', 'Private_Dirty'):
+                    result[key.lower() + '_kb'] = int(line.split()[1])
+    except OSError:
+        pass
+    return result
+
+
+def child(mode: str, base_dir: Path, names_file: Path):
+    """One worker process: load, look names up, report, then wait for the parent"""
+    from utils.cache_manager.enhanced_cache_manager import EnhancedCacheManager
+
+    names = json.loads(names_file.read_text(encoding='utf-8'))
+    with contextlib.redirect_stdout(io.StringIO()):
+        manager = EnhancedCacheManager(base_dir, shared=(mode == 'shared'))
+    results = [manager.get_canonical_team_name(n) for n in names]
+    results += [manager.get_canonical_sport_name(s.lower()) for s in SPORTS]
+
+    report = {'mode': mode, **memory_kb(), 'results_hash': hash(tuple(results))}
+    print(json.dumps(report), flush=True)
+    sys.stdin.readline()   # stay resident until every worker has reported
+
+
+def run_group(mode: str, processes: int, base_dir: Path, names_file: Path) -> list:
+    procs = [subprocess.Popen([sys.executable, __file__, '--child', mode, str(base_dir), str(names_file)],
+                              stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+                              env=dict(os.environ, PYTHONHASHSEED='0'))
+             for _ in range(processes)]
+    reports = [json.loads(p.stdout.readline()) for p in procs]
+    for p in procs:
+        p.stdin.write('\n')
+        p.stdin.flush()
+        p.wait()
+    return reports
+
+
+def time_mode(base_dir: Path, shared: bool, names: list, repeat: int = 3) -> dict:
+    """Serial timings: manager construction, lookups, and one cache-hook trigger"""
+    from utils.cache_manager.enhanced_cache_manager import EnhancedCacheManager
+
+    load = hook = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            manager = EnhancedCacheManager(base_dir, shared=shared)
+        load = min(load, time.perf_counter() - start)
+
+        # Hook trigger: a new manager per scraper save, updated from a file of known teams
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            summary = EnhancedCacheManager(base_dir, shared=shared).auto_update_from_json(
+                base_dir / 'known_matches.json', 'bet365', quiet=True)
+        hook = min(hook, time.perf_counter() - start)
+        assert summary['success'] and summary['new_teams'] == 0, summary
+
+    start = time.perf_counter()
+    for name in names:
+        manager.get_canonical_team_name(name)
+    lookup = (time.perf_counter() - start) / max(len(names), 1)
+    return {'load_ms': round(load * 1000, 1), 'lookup_us': round(lookup * 1e6, 2), 'hook_update_ms': round(hook * 1000, 1)}
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--child':
+        child(sys.argv[2], Path(sys.argv[3]), Path(sys.argv[4]))
+        return
+
+    parser = argparse.ArgumentParser(description='Shared name cache benchmark')
+    parser.add_argument('--teams', type=int, default=20000)
+    parser.add_argument('--processes', type=int, default=4, help='Processes holding the cache at once')
+    parser.add_argument('--json', type=str, default=None, help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base_dir = Path(tmp)
+        names = make_cache(base_dir, args.teams)
+        names_file = base_dir / 'lookup_names.json'
+        lookups = lookup_names(names)
+        names_file.write_text(json.dumps(lookups), encoding='utf-8')
+
+        # Publishes the first snapshot (what the collector does on start-up)
+        from utils.cache_manager.enhanced_cache_manager import EnhancedCacheManager
+        with contextlib.redirect_stdout(io.StringIO()):
+            EnhancedCacheManager(base_dir)
+        snapshot_kb = sum(p.stat().st_size for p in (base_dir / 'name_cache').glob('gen-*.bin')) / 1024
+        json_kb = ((base_dir / 'cache_data.json').stat().st_size + (base_dir / 'name_mappings.json').stat().st_size) / 1024
+
+        groups = {mode: run_group(mode, args.processes, base_dir, names_file) for mode in ('legacy', 'shared')}
+        if len({r['results_hash'] for reports in groups.values() for r in reports}) != 1:
+            print("[WARN] Lookup results differ between legacy and shared managers")
+            sys.exit(1)
+        timings = {'legacy': time_mode(base_dir, False, lookups), 'shared': time_mode(base_dir, True, lookups)}
+
+    summary = {}
+    for mode, reports in groups.items():
+        summary[mode] = {
+            **timings[mode],
+            'rss_mb_total': round(sum(r['rss_kb'] for r in reports) / 1024, 1),
+            'pss_mb_total': round(sum(r.get('pss_kb', r['rss_kb']) for r in reports) / 1024, 1),
+        }
+
+    print("=" * 60)
+    print(f"SHARED NAME CACHE BENCHMARK ({args.teams} teams, {args.processes} processes)")
+    print("=" * 60)
+    print(f"  JSON files {json_kb:.0f} KB | snapshot {snapshot_kb:.0f} KB")
+    for mode, s in summary.items():
+        print(f"  {mode:<7} load {s['load_ms']:7.1f} ms | lookup {s['lookup_us']:5.2f} us | "
+              f"RSS {s['rss_mb_total']:6.1f} MB | PSS {s['pss_mb_total']:6.1f} MB | hook update {s['hook_update_ms']:6.1f} ms")
+    legacy, shared = summary['legacy'], summary['shared']
+    print(f"  all processes: PSS -{legacy['pss_mb_total'] - shared['pss_mb_total']:.1f} MB, "
+          f"start-up x{legacy['load_ms'] / max(shared['load_ms'], 0.1):.0f} faster")
+    print("  [OK] lookup results identical in both modes")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'args': vars(args), 'snapshot_kb': round(snapshot_kb), 'json_kb': round(json_kb),
+                       'summary': summary, 'processes': groups}, f, indent=2)
+        print(f"[OK] Results written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
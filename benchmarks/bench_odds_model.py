@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Typed Odds Model Benchmark
+Where odds are turned into typed quote rows, and what the converters gain
+from reading them.
+
+Before: the collector parsed every bookmaker's display strings after the merge
+        (attach_quotes over the extracted 'odds' dicts).
+After:  the 1xBet scrapers build quotes from the raw coefficient/param codes,
+        FanDuel quotes are built from its numeric fields, and only Bet365's
+        scraped page text is parsed, once, by the collector's extractor.
+
+Conversion is timed on unified data with and without 'quotes'. The typed path
+emits every priced outcome while the legacy odds_to_int path silently drops
+most string odds, so both total time and time per emitted record are shown.
+
+Usage:
+    python benchmarks/bench_odds_model.py [--matches 5000] [--repeat 5] [--json out.json]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.unified_odds_collector import UnifiedOddsCollector
+from utils.converters.odds_format_converters import OpticOddsConverter, EternityFormatConverter
+from utils.helpers.odds_model import quotes_from_odds, quotes_from_xbet, pack_quotes, american_to_decimal
+
+BOOKMAKERS = ('bet365', 'fanduel', '1xbet')
+
+
+def _american(rng: random.Random) -> int:
+    value = rng.randint(100, 400)
+    return value if rng.random() < 0.5 else -value
+
+
+def _signed(value: int) -> str:
+    return f"+{value}" if value > 0 else str(value)
+
+
+def _xbet_code(american: int, param=None) -> dict:
+    return {'coefficient': american_to_decimal(american), 'american_odds': _signed(american), 'param': param}
+
+
+def _xbet_readable(code: dict, prefix: str = '') -> str:
+    """The 1xBet scrapers' _convert_odds_to_readable string for one code"""
+    if code['param'] is None:
+        return code['american_odds']
+    return f"{prefix}{code['param']} ({code['american_odds']})"
+
+
+def generate_raw(n_matches: int, seed: int = 42) -> list:
+    """Deterministic scraper records per match, as the collector's loaders hand them to the extractors"""
+    rng = random.Random(seed)
+    records = []
+    for i in range(n_matches):
+        line = rng.choice([1.5, 2.5, 3.5, 7.5])
+        total = rng.choice([2.5, 44.5, 210.5])
+        xbet_raw = {
+            '1_1': _xbet_code(_american(rng)), '1_3': _xbet_code(_american(rng)),
+            '2_7': _xbet_code(_american(rng), -line), '2_8': _xbet_code(_american(rng), line),
+            '15_11': _xbet_code(_american(rng), total), '15_12': _xbet_code(_american(rng), total),
+        }
+        records.append({
+            'match': {
+                'match_id': f"m{i}",
+                'sport': rng.choice(['Basketball', 'Soccer', 'Ice Hockey']),
+                'league': 'League',
+                'home_team': f"Home {i}",
+                'away_team': f"Away {i}",
+                'start_time': '2025-01-01 18:00:00',
+            },
+            'bet365': {'odds': {
+                'moneyline': [_signed(_american(rng)), _signed(_american(rng))],
+                'spread': [f"-{line} {_signed(_american(rng))}", f"+{line} {_signed(_american(rng))}"],
+                'total': [f"O {total} {_signed(_american(rng))}", f"U {total} {_signed(_american(rng))}"],
+            }},
+            'fanduel': {'odds': {
+                'moneyline_home': _american(rng), 'moneyline_away': _american(rng),
+                'spread_home_line': -line, 'spread_home_odds': _american(rng),
+                'spread_away_line': line, 'spread_away_odds': _american(rng),
+                'total_line': total, 'total_over_odds': _american(rng), 'total_under_odds': _american(rng),
+            }},
+            '1xbet': {
+                'odds_data': {
+                    'moneyline_home': _xbet_readable(xbet_raw['1_1']),
+                    'moneyline_away': _xbet_readable(xbet_raw['1_3']),
+                    'spread_home': _xbet_readable(xbet_raw['2_7']),
+                    'spread_away': _xbet_readable(xbet_raw['2_8']),
+                    'total_over': _xbet_readable(xbet_raw['15_11'], 'O '),
+                    'total_under': _xbet_readable(xbet_raw['15_12'], 'U '),
+                },
+                'raw_codes': xbet_raw,
+            },
+        })
+    return records
+
+
+def scraper_quotes(records: list):
+    """Same work the 1xBet scrapers now do when they store a match"""
+    for record in records:
+        record['1xbet']['quotes'] = pack_quotes(quotes_from_xbet(record['1xbet']['raw_codes']))
+
+
+def merge_before(collector: UnifiedOddsCollector, records: list) -> list:
+    """Extract display-string odds, then parse them into quotes (the old attach_quotes)"""
+    extract = {'bet365': collector.extract_bet365_odds, 'fanduel': collector.extract_fanduel_odds,
+               '1xbet': collector.extract_1xbet_odds}
+    matches = []
+    for record in records:
+        match = dict(record['match'])
+        for book in BOOKMAKERS:
+            odds = extract[book](record[book])
+            match[book] = {'available': True, 'odds': odds, 'quotes': pack_quotes(quotes_from_odds(odds))}
+        matches.append(match)
+    return matches
+
+
+def merge_after(collector: UnifiedOddsCollector, records: list) -> list:
+    """Extract display-string odds and typed quotes with the collector's extractors"""
+    extract = {'bet365': (collector.extract_bet365_odds, collector.extract_bet365_quotes),
+               'fanduel': (collector.extract_fanduel_odds, collector.extract_fanduel_quotes),
+               '1xbet': (collector.extract_1xbet_odds, collector.extract_1xbet_quotes)}
+    matches = []
+    for record in records:
+        match = dict(record['match'])
+        for book in BOOKMAKERS:
+            extract_odds, extract_quotes = extract[book]
+            match[book] = {'available': True, 'odds': extract_odds(record[book]),
+                           'quotes': extract_quotes(record[book])}
+        matches.append(match)
+    return matches
+
+
+def best_of(repeat: int, fn) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(n_matches: int, repeat: int) -> dict:
+    records = generate_raw(n_matches)
+    scraper_s = best_of(repeat, lambda: scraper_quotes(records))
+
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+        collector = UnifiedOddsCollector(base_dir=tmp)
+        before_s = best_of(repeat, lambda: merge_before(collector, records))
+        after_s = best_of(repeat, lambda: merge_after(collector, records))
+        before, after = merge_before(collector, records), merge_after(collector, records)
+    if [[m[b]['quotes'] for b in BOOKMAKERS] for m in before] != [[m[b]['quotes'] for b in BOOKMAKERS] for m in after]:
+        print("[WARN] Typed quotes differ between the old and new merge paths")
+        sys.exit(1)
+
+    typed = {'metadata': {}, 'pregame_matches': after, 'live_matches': []}
+    legacy = {'metadata': {}, 'live_matches': [],
+              'pregame_matches': [{**m, **{b: {'available': True, 'odds': m[b]['odds']} for b in BOOKMAKERS}}
+                                  for m in after]}
+
+    def convert(data):
+        optic = OpticOddsConverter.convert_unified_to_optic(data)
+        eternity = EternityFormatConverter.convert_unified_to_eternity(data)
+        return optic, eternity
+
+    legacy_convert = best_of(repeat, lambda: convert(legacy))
+    typed_convert = best_of(repeat, lambda: convert(typed))
+
+    optic_legacy, _ = convert(legacy)
+    optic_typed, _ = convert(typed)
+    count = lambda optic: sum(len(game['odds']) for game in optic['data'])
+    legacy_records = count(optic_legacy)
+    typed_records = count(optic_typed)
+
+    return {
+        'matches': n_matches,
+        'repeat': repeat,
+        'scraper_quotes_s': round(scraper_s, 4),
+        'merge_before_s': round(before_s, 4),
+        'merge_after_s': round(after_s, 4),
+        'merge_speedup': round(before_s / after_s, 2) if after_s else None,
+        'convert_legacy_s': round(legacy_convert, 4),
+        'convert_typed_s': round(typed_convert, 4),
+        'optic_records_legacy': legacy_records,
+        'optic_records_typed': typed_records,
+        # Legacy parsing silently drops most string odds, so compare per emitted record
+        'convert_legacy_us_per_record': round(legacy_convert / max(legacy_records, 1) * 1e6, 2),
+        'convert_typed_us_per_record': round(typed_convert / max(typed_records, 1) * 1e6, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Typed odds model benchmark')
+    parser.add_argument('--matches', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', type=str, default=None, help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    result = run(args.matches, args.repeat)
+
+    print("=" * 60)
+    print(f"TYPED ODDS MODEL BENCHMARK ({result['matches']} matches x 3 bookmakers)")
+    print("=" * 60)
+    print(f"  1xBet quotes in the scrapers:   {result['scraper_quotes_s'] * 1000:8.1f} ms  (from raw codes, at scrape time)")
+    print(f"  Merge extraction, before:       {result['merge_before_s'] * 1000:8.1f} ms  (odds + parse every book's strings)")
+    print(f"  Merge extraction, after:        {result['merge_after_s'] * 1000:8.1f} ms  (odds + typed extractors, "
+          f"x{result['merge_speedup']})")
+    print(f"  Convert (legacy strings):       {result['convert_legacy_s'] * 1000:8.1f} ms  "
+          f"({result['optic_records_legacy']} Optic records)")
+    print(f"  Convert (typed quotes):         {result['convert_typed_s'] * 1000:8.1f} ms  "
+          f"({result['optic_records_typed']} Optic records)")
+    print(f"  Per record legacy/typed: {result['convert_legacy_us_per_record']}/{result['convert_typed_us_per_record']} us")
+    print("  [OK] typed quotes identical on both merge paths")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        print(f"[OK] Results written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
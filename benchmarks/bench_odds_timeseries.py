@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Odds Time-Series Store Benchmark
+Sustained tick ingest through the batched writer, then downsampling/retention.
+
+Simulates `hours` of movement compressed into one run: every tick carries a
+synthetic timestamp, so the rollup and retention passes see realistic ages.
+
+Usage:
+    python benchmarks/bench_odds_timeseries.py [--series 200] [--ticks 300000] [--hours 2] [--json out.json]
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.helpers.odds_timeseries import OddsTimeSeriesStore, make_match_key
+
+
+def run(n_series: int, n_ticks: int, hours: float, seed: int = 42) -> dict:
+    rng = random.Random(seed)
+    # Six series per match: 2 books x 3 markets
+    outcomes = [(make_match_key('Basketball', f"Home {i // 6}", f"Away {i // 6}"),
+                 ('bet365', 'fanduel')[i % 2], ('moneyline', 'spread', 'total')[i // 2 % 3], 'home')
+                for i in range(n_series)]
+    prices = [rng.uniform(1.5, 2.6) for _ in range(n_series)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = OddsTimeSeriesStore(Path(tmp) / 'bench.db', raw_retention_hours=1,
+                                    rollup_retention_days=7, maintenance_interval=1e9)
+        store._last_maintenance = time.time()   # measure maintenance separately below
+        store.start()
+
+        start_ts = time.time() - hours * 3600
+        step = hours * 3600 / n_ticks
+        start = time.perf_counter()
+        for i in range(n_ticks):
+            s = rng.randrange(n_series)
+            prices[s] = round(max(1.01, prices[s] + rng.choice((-0.02, -0.01, 0.01, 0.02))), 2)
+            match_key, book, market, outcome = outcomes[s]
+            store.record(match_key, book, market, outcome, prices[s], None, start_ts + i * step)
+        ingest_s = time.perf_counter() - start
+        store.close()
+        drain_s = time.perf_counter() - start
+
+        size_before = sum(store.disk_usage().values())
+        start = time.perf_counter()
+        store.maintain()
+        maintain_s = time.perf_counter() - start
+        conn = store._connect()
+        raw_rows = conn.execute("SELECT count(*) FROM ticks").fetchone()[0]
+        rollup_rows = conn.execute("SELECT count(*) FROM rollup").fetchone()[0]
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        store.close()
+        size_after = sum(store.disk_usage().values())
+
+        start = time.perf_counter()
+        series = store.series(outcomes[0][0], max_points=500)
+        query_ms = (time.perf_counter() - start) * 1000
+
+        return {
+            'series': n_series,
+            'ticks': n_ticks,
+            'simulated_hours': hours,
+            'ticks_written': store.stats['ticks_written'],
+            'record_ticks_per_s': round(n_ticks / ingest_s),
+            'end_to_end_ticks_per_s': round(store.stats['ticks_written'] / drain_s),
+            'flushes': store.stats['flushes'],
+            'maintain_s': round(maintain_s, 3),
+            'raw_rows_after': raw_rows,
+            'rollup_rows_after': rollup_rows,
+            'db_bytes_before': size_before,
+            'db_bytes_after': size_after,
+            'series_query_ms': round(query_ms, 2),
+            'series_points': sum(len(s['points']) for s in series['series']),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Odds time-series store benchmark')
+    parser.add_argument('--series', type=int, default=200)
+    parser.add_argument('--ticks', type=int, default=300000)
+    parser.add_argument('--hours', type=float, default=2)
+    parser.add_argument('--json', type=str, default=None, help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    result = run(args.series, args.ticks, args.hours)
+
+    print("=" * 60)
+    print(f"ODDS TIME-SERIES BENCHMARK ({result['ticks']} ticks, {result['series']} series)")
+    print("=" * 60)
+    print(f"  record() rate:       {result['record_ticks_per_s']:>10} ticks/s")
+    print(f"  End-to-end written:  {result['end_to_end_ticks_per_s']:>10} ticks/s ({result['flushes']} flushes)")
+    print(f"  Rollup + retention:  {result['maintain_s'] * 1000:>10.1f} ms")
+    print(f"  Rows raw/rollup:     {result['raw_rows_after']}/{result['rollup_rows_after']}")
+    print(f"  DB size before/after:{result['db_bytes_before'] / 1e6:>7.1f} / {result['db_bytes_after'] / 1e6:.1f} MB")
+    print(f"  Series query:        {result['series_query_ms']:>10.2f} ms ({result['series_points']} points)")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        print(f"[OK] Results written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
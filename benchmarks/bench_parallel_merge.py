@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Sport-Sharded Parallel Merge Benchmark
+merge_pregame_data / merge_live_data time with the matching phase run serially
+versus partitioned by sport across a process pool (match_in_sport_shards).
+
+The merged output of every parallel run is serialized and compared byte for
+byte with the serial run. Times are whole merges, so the serial team-name
+normalization is included. Speedup is bounded by the host's cores: on a
+single-core machine the parallel runs only show the pool overhead.
+
+Usage:
+    python benchmarks/bench_parallel_merge.py [--matches 3000] [--live 1500] [--workers 2 4] [--json out.json]
+"""
+
+import argparse
+import copy
+import io
+import json
+import os
+import random
+import sys
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.unified_odds_collector import UnifiedOddsCollector
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+CITIES = ['Los Angeles', 'New York', 'Boston', 'Chicago', 'Dallas', 'Denver', 'Miami', 'Phoenix',
+          'Seattle', 'Atlanta', 'Houston', 'Detroit', 'Toronto', 'Portland', 'Orlando', 'Memphis']
+NICKNAMES = ['Lions', 'Tigers', 'Bears', 'Hawks', 'Eagles', 'Sharks', 'Wolves', 'Kings', 'Giants',
+             'Rangers', 'Rockets', 'Comets', 'Storm', 'Thunder', 'Falcons', 'Pirates', 'Knights']
+# Uneven sport mix, like real feeds (soccer dominates)
+SPORTS = ['Soccer'] * 4 + ['Basketball'] * 2 + ['Ice Hockey', 'Baseball', 'American Football', 'Tennis']
+BOOKS = ('bet365', 'fanduel', '1xbet')
+
+
+def _spelling(team: tuple, book: str) -> str:
+    city, nickname = team
+    if book == 'fanduel':
+        return f"{city} {nickname}"
+    if book == 'bet365':
+        short = ''.join(word[0] for word in city.split()) if ' ' in city else city[:3].upper()
+        return f"{short} {nickname}"
+    return f"{city} {nickname} FC" if nickname in ('Lions', 'Eagles') else f"{city} {nickname}"
+
+
+def generate_books(total: int, live: bool, seed: int = 42) -> dict:
+    """Deterministic matches per bookmaker; ~70% of events listed by every book"""
+    rng = random.Random(seed)
+    # Each sport has its own teams (real feeds never share a team across sports)
+    pool = [(f"{city}{'' if i == 0 else f' {i}'}", nickname)
+            for i in range(max(1, total // 100)) for city in CITIES for nickname in NICKNAMES]
+    rng.shuffle(pool)
+    sports = sorted(set(SPORTS))
+    teams_by_sport = {sport: pool[k::len(sports)] for k, sport in enumerate(sports)}
+    events = []
+    for e in range(total // len(BOOKS)):
+        sport = rng.choice(SPORTS)
+        home, away = rng.sample(teams_by_sport[sport], 2)
+        events.append((sport, home, away, e))
+
+    books = {}
+    for book in BOOKS:
+        matches = []
+        for sport, home, away, e in events:
+            if rng.random() > 0.7:
+                home, away = rng.sample(teams_by_sport[sport], 2)  # book-specific event
+            raw = {'odds': {}}
+            if live:
+                raw['score'] = {'home': rng.randint(0, 3), 'away': rng.randint(0, 3)}
+            matches.append({
+                'sport': sport,
+                'home_team': _spelling(home, book),
+                'away_team': _spelling(away, book),
+                'date': 'Live' if live else 'Mon Nov 03',
+                'time': '7:00 PM',
+                'game_id': f"{book}-{e}",
+                'match_id': f"{book}-{e}",
+                'fixture_id': f"{book}-{e}",
+                'source': book,
+                'is_live': live,
+                'raw_data': raw,
+            })
+        books[book] = matches
+    return books
+
+
+def time_merge(books: dict, live: bool, workers: int, pools: dict) -> tuple:
+    """One merge on a fresh collector (the name cache evolves across merges); worker pools are reused"""
+    data = copy.deepcopy(books)
+    with redirect_stdout(io.StringIO()):
+        collector = UnifiedOddsCollector()
+    collector.merge_workers = workers
+    collector.parallel_merge_min_comparisons = 0
+    if workers in pools:
+        collector._merge_pool, collector._merge_pool_workers = pools[workers], workers
+    merge = collector.merge_live_data if live else collector.merge_pregame_data
+    with redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = merge(data['bet365'], data['fanduel'], data['1xbet'])
+        elapsed = time.perf_counter() - start
+    if collector._merge_pool is not None:
+        pools[workers] = collector._merge_pool
+    return elapsed, json.dumps(result, ensure_ascii=False).encode('utf-8')
+
+
+def run(n_matches: int, n_live: int, worker_counts: list) -> dict:
+    pools = {}
+    results = {'cpu_count': os.cpu_count(), 'phases': []}
+    try:
+        for phase, total, live in (('pregame', n_matches, False), ('live', n_live, True)):
+            if not total:
+                continue
+            books = generate_books(total, live)
+            serial_s, serial_bytes = time_merge(books, live, 1, pools)
+            entry = {'phase': phase, 'matches': total, 'serial_s': round(serial_s, 3),
+                     'output_bytes': len(serial_bytes), 'parallel': []}
+            for workers in worker_counts:
+                if workers not in pools:
+                    time_merge(books, live, workers, pools)   # start and warm the worker processes
+                elapsed, output = time_merge(books, live, workers, pools)
+                entry['parallel'].append({
+                    'workers': workers,
+                    'seconds': round(elapsed, 3),
+                    'speedup': round(serial_s / elapsed, 2) if elapsed else None,
+                    'byte_identical': output == serial_bytes,
+                })
+            results['phases'].append(entry)
+    finally:
+        for pool in pools.values():
+            pool.shutdown(wait=True)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sport-sharded parallel merge benchmark')
+    parser.add_argument('--matches', type=int, default=3000, help='Pregame matches across 3 bookmakers')
+    parser.add_argument('--live', type=int, default=1500, help='Live matches across 3 bookmakers')
+    parser.add_argument('--workers', type=int, nargs='+', default=[2, 4])
+    parser.add_argument('--json', type=str, default=None, help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    # Building a collector without a mappings file writes one - don't leave it behind
+    created = [p for p in (PROJECT_ROOT / 'name_mappings.json', PROJECT_ROOT / 'cache_backups') if not p.exists()]
+    try:
+        result = run(args.matches, args.live, args.workers)
+    finally:
+        for path in created:
+            if path.is_dir():
+                try:
+                    path.rmdir()
+                except OSError:
+                    pass
+            elif path.exists():
+                path.unlink()
+
+    print("=" * 60)
+    print(f"SPORT-SHARDED MERGE BENCHMARK ({result['cpu_count']} CPUs)")
+    print("=" * 60)
+    for entry in result['phases']:
+        print(f"  {entry['phase']:<8} {entry['matches']:>6} matches: serial {entry['serial_s']:7.2f}s")
+        for run_info in entry['parallel']:
+            print(f"      {run_info['workers']} workers: {run_info['seconds']:7.2f}s | {run_info['speedup']}x"
+                  f" | byte-identical={run_info['byte_identical']}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        print(f"[OK] Results written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+1xBet Payload Decoding Benchmark
+Old trial-and-error XBetCollector.decompress_response (gzip -> new zstd
+context -> zlib -> plain JSON, catching failures) against PayloadDecoder
+(magic-byte sniffing, pooled zstd contexts).
+
+Payloads are 1xBet-shaped `{"Success": true, "Value": [...]}` bodies of
+several sizes, compressed with each codec (zstd only if zstandard is
+installed). Captured response bodies can be added with --payload-dir
+(every file in it is read as one raw body).
+
+Usage:
+    python benchmarks/bench_payload_decode.py [--repeat 20] [--payload-dir captured/] [--json out.json]
+"""
+
+import argparse
+import gzip
+import json
+import random
+import sys
+import time
+import zlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.helpers.payload_codec import PayloadDecoder, sniff_codec, ZSTD_AVAILABLE
+
+if ZSTD_AVAILABLE:
+    import zstandard
+
+
+def legacy_decompress(data: bytes) -> dict:
+    """XBetCollector.decompress_response before payload_codec (logging removed)"""
+    try:
+        if len(data) >= 2 and data[0] == 0x1f and data[1] == 0x8b:
+            try:
+                return json.loads(zlib.decompress(data, zlib.MAX_WBITS | 16).decode('utf-8'))
+            except Exception:
+                pass
+        if ZSTD_AVAILABLE:
+            try:
+                dctx = zstandard.ZstdDecompressor()
+                return json.loads(dctx.decompressobj().decompress(data).decode('utf-8'))
+            except Exception:
+                pass
+        try:
+            return json.loads(zlib.decompress(data).decode('utf-8'))
+        except Exception:
+            pass
+        try:
+            return json.loads(data.decode('utf-8'))
+        except Exception:
+            pass
+        return {}
+    except Exception:
+        return {}
+
+
+def legacy_decode(data: bytes) -> bytes:
+    """The same trial order without the JSON parse, to isolate codec cost"""
+    if len(data) >= 2 and data[0] == 0x1f and data[1] == 0x8b:
+        try:
+            return zlib.decompress(data, zlib.MAX_WBITS | 16)
+        except Exception:
+            pass
+    if ZSTD_AVAILABLE:
+        try:
+            return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+        except Exception:
+            pass
+    try:
+        return zlib.decompress(data)
+    except Exception:
+        return data
+
+
+def make_body(n_matches: int, seed: int) -> bytes:
+    rng = random.Random(seed)
+    value = [{
+        'I': 600000000 + i, 'SI': rng.choice([1, 2, 3, 4]), 'SN': 'Football', 'LI': rng.randrange(5000),
+        'L': f"League {rng.randrange(300)}", 'O1': f"Home Team {rng.randrange(2000)}",
+        'O2': f"Away Team {rng.randrange(2000)}", 'S': 1762190000 + i * 60,
+        'E': [{'G': g, 'T': t, 'C': round(rng.uniform(1.1, 9.0), 2), 'P': None}
+              for g in (1, 2, 17) for t in (1, 2, 3)],
+    } for i in range(n_matches)]
+    return json.dumps({'Success': True, 'Error': '', 'Value': value}, separators=(',', ':')).encode('utf-8')
+
+
+def build_payloads(sizes, payload_dir=None) -> list:
+    payloads = []
+    for n in sizes:
+        body = make_body(n, seed=n)
+        payloads.append((f'gzip/{n}', gzip.compress(body, 6)))
+        payloads.append((f'zlib/{n}', zlib.compress(body, 6)))
+        payloads.append((f'json/{n}', body))
+        if ZSTD_AVAILABLE:
+            payloads.append((f'zstd/{n}', zstandard.ZstdCompressor(level=3).compress(body)))
+    if payload_dir:
+        for path in sorted(Path(payload_dir).iterdir()):
+            if path.is_file():
+                data = path.read_bytes()
+                payloads.append((f'captured:{sniff_codec(data)}/{path.name}', data))
+    return payloads
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sizes, repeat: int, payload_dir=None) -> dict:
+    payloads = build_payloads(sizes, payload_dir)
+    decoder = PayloadDecoder()
+
+    rows = []
+    for name, data in payloads:
+        assert decoder.decode_json(data) == legacy_decompress(data), f"mismatch for {name}"
+        legacy = best_of(lambda: legacy_decompress(data), repeat)
+        sniffed = best_of(lambda: decoder.decode_json(data), repeat)
+        raw = best_of(lambda: decoder.decode(data), repeat)
+        legacy_raw = best_of(lambda: legacy_decode(data), repeat)
+        rows.append({
+            'payload': name,
+            'bytes_in': len(data),
+            'legacy_ms': round(legacy * 1000, 3),
+            'decoder_ms': round(sniffed * 1000, 3),
+            'legacy_decode_only_ms': round(legacy_raw * 1000, 3),
+            'decode_only_ms': round(raw * 1000, 3),
+            'speedup': round(legacy / sniffed, 2) if sniffed else None,
+        })
+
+    # A collection cycle's worth of bodies, decoded back to back
+    def cycle(fn):
+        for _, data in payloads:
+            fn(data)
+    legacy_cycle = best_of(lambda: cycle(legacy_decompress), max(3, repeat // 4))
+    decoder_cycle = best_of(lambda: cycle(decoder.decode_json), max(3, repeat // 4))
+
+    return {
+        'zstd_available': ZSTD_AVAILABLE,
+        'payloads': rows,
+        'cycle': {
+            'bodies': len(payloads),
+            'legacy_ms': round(legacy_cycle * 1000, 2),
+            'decoder_ms': round(decoder_cycle * 1000, 2),
+            'speedup': round(legacy_cycle / decoder_cycle, 2),
+        },
+        'codec_stats': decoder.summary(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='1xBet payload decoding benchmark')
+    parser.add_argument('--sizes', type=str, default='20,200,1000', help='Matches per synthetic body')
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--payload-dir', type=str, default=None, help='Directory of captured raw response bodies')
+    parser.add_argument('--json', type=str, default=None, help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(',') if s]
+    result = run(sizes, args.repeat, args.payload_dir)
+
+    print("=" * 60)
+    print(f"PAYLOAD DECODE BENCHMARK (zstd {'available' if result['zstd_available'] else 'not installed'})")
+    print("=" * 60)
+    for row in result['payloads']:
+        print(f"  {row['payload']:<22} {row['bytes_in'] / 1024:9.1f} KB | legacy {row['legacy_ms']:8.3f} ms | "
+              f"sniffed {row['decoder_ms']:8.3f} ms | x{row['speedup']:<5} | codec only "
+              f"{row['legacy_decode_only_ms']:7.3f} -> {row['decode_only_ms']:7.3f} ms")
+    cycle = result['cycle']
+    print(f"  cycle of {cycle['bodies']} bodies: legacy {cycle['legacy_ms']:.2f} ms, "
+          f"sniffed {cycle['decoder_ms']:.2f} ms (x{cycle['speedup']})")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        print(f"[OK] Results written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Merge Pipeline Benchmark Suite
+Offline, deterministic benchmark of every pipeline stage on synthetic feeds
+(see synthetic_feeds.py) at scale points from 1k to 50k matches.
+
+Stages:
+  - load:                 the seven UnifiedOddsCollector.load_* readers on written feed files
+  - add_or_update_team:   EnhancedCacheManager.add_or_update_team for every team name (per-call latency)
+  - merge_pregame_data:   UnifiedOddsCollector.merge_pregame_data (fresh collector per run)
+  - merge_live_data:      UnifiedOddsCollector.merge_live_data (fresh collector per run)
+  - optic_converter:      OpticOddsConverter.convert_unified_to_optic
+  - eternity_converter:   EternityFormatConverter.convert_unified_to_eternity
+
+Each (stage, scale) runs in a fresh spawned process, so peak RSS is that
+stage's own and no cache state leaks between measurements. A scale is skipped
+when the previous scale's time, extrapolated (quadratically for merges),
+exceeds --budget seconds.
+
+Results are written as JSON (git commit, interpreter, CPU count, seed and per
+stage throughput / latency percentiles / RSS) for comparison across commits:
+
+    python benchmarks/bench_pipeline_suite.py --json base.json
+    ... change code ...
+    python benchmarks/bench_pipeline_suite.py --json new.json --compare base.json
+
+Usage:
+    python benchmarks/bench_pipeline_suite.py [--scales 1000 5000 10000 25000 50000]
+        [--stages load merge_pregame_data ...] [--repeat 3] [--budget 120] [--seed 42]
+        [--json out.json] [--compare baseline.json]
+"""
+
+import argparse
+import copy
+import io
+import json
+import multiprocessing
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SUITE_VERSION = 1
+
+STAGES = ['load', 'add_or_update_team', 'merge_pregame_data', 'merge_live_data',
+          'optic_converter', 'eternity_converter']
+# Growth exponent used to project the next scale's time against the budget
+GROWTH = {'merge_pregame_data': 2, 'merge_live_data': 2}
+
+
+def _peak_rss_mb() -> float:
+    if resource is not None:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024   # KB on Linux
+    import psutil
+    info = psutil.Process().memory_info()
+    return getattr(info, 'peak_wset', info.rss) / (1024 * 1024)
+
+
+def _collector(feed_paths: dict, tmp: Path):
+    """UnifiedOddsCollector reading the synthetic files, with an empty, isolated name cache"""
+    from core.unified_odds_collector import UnifiedOddsCollector
+
+    # Own base_dir: the cache, its mappings and name_cache/ snapshots stay under tmp
+    with redirect_stdout(io.StringIO()):
+        collector = UnifiedOddsCollector(base_dir=tempfile.mkdtemp(dir=tmp))
+    collector.team_lookup_cache = {}
+    collector.sport_lookup_cache = {}
+    collector.team_name_cache = {}
+    collector.bet365_pregame_file = str(feed_paths['bet365_pregame'])
+    collector.bet365_live_file = str(feed_paths['bet365_live'])
+    collector.fanduel_pregame_file = str(feed_paths['fanduel_pregame'])
+    collector.fanduel_live_file = str(feed_paths['fanduel_live'])
+    collector.xbet_pregame_file = str(feed_paths['1xbet_pregame'])
+    collector.xbet_live_file = str(feed_paths['1xbet_live'])
+    collector.oddportal_file = str(feed_paths['oddportal'])
+    return collector
+
+
+def _load_all(collector) -> dict:
+    with redirect_stdout(io.StringIO()):
+        return {
+            'bet365_pregame': collector.load_bet365_pregame(),
+            'bet365_live': collector.load_bet365_live(),
+            'fanduel_pregame': collector.load_fanduel_pregame(),
+            'fanduel_live': collector.load_fanduel_live(),
+            '1xbet_pregame': collector.load_1xbet_pregame(),
+            '1xbet_live': collector.load_1xbet_live(),
+            'oddportal': collector.load_oddportal(),
+        }
+
+
+def run_stage(stage: str, n_matches: int, repeat: int, seed: int) -> dict:
+    """Worker: set up one stage at one scale, then time it (runs in its own process)"""
+    from benchmarks.synthetic_feeds import generate_feeds, generate_unified, write_feeds
+
+    latencies = []
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        if stage in ('optic_converter', 'eternity_converter'):
+            from utils.converters.odds_format_converters import OpticOddsConverter, EternityFormatConverter
+            unified = generate_unified(n_matches, seed)
+            items = len(unified['pregame_matches']) + len(unified['live_matches'])
+            convert = (OpticOddsConverter.convert_unified_to_optic if stage == 'optic_converter'
+                       else EternityFormatConverter.convert_unified_to_eternity)
+            setup_rss = _peak_rss_mb()
+            for _ in range(repeat):
+                start = time.perf_counter()
+                convert(unified)
+                latencies.append(time.perf_counter() - start)
+        else:
+            feed_paths = write_feeds(generate_feeds(n_matches, seed), tmp / 'feeds')
+            collector = _collector(feed_paths, tmp)
+            loaded = _load_all(collector)
+            items = sum(len(matches) for matches in loaded.values())
+
+            if stage == 'load':
+                setup_rss = _peak_rss_mb()
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    _load_all(collector)
+                    latencies.append(time.perf_counter() - start)
+
+            elif stage == 'add_or_update_team':
+                from utils.cache_manager.enhanced_cache_manager import EnhancedCacheManager
+                calls = [(m['sport'], m[side], source.split('_')[0])
+                         for source, matches in loaded.items() for m in matches
+                         for side in ('home_team', 'away_team') if m[side]]
+                items = len(calls)
+                with redirect_stdout(io.StringIO()):
+                    cache = EnhancedCacheManager(Path(tempfile.mkdtemp(dir=tmp)))
+                setup_rss = _peak_rss_mb()
+                add = cache.add_or_update_team
+                with redirect_stdout(io.StringIO()):
+                    for sport, name, source in calls:
+                        start = time.perf_counter()
+                        add(sport, name, source)
+                        latencies.append(time.perf_counter() - start)
+
+            else:
+                live = stage == 'merge_live_data'
+                phase = 'live' if live else 'pregame'
+                books = (loaded[f'bet365_{phase}'], loaded[f'fanduel_{phase}'], loaded[f'1xbet_{phase}'])
+                items = sum(len(b) for b in books)
+                setup_rss = _peak_rss_mb()
+                for _ in range(repeat):
+                    # The name cache evolves across merges, so every run starts from a fresh collector
+                    run_collector = _collector(feed_paths, tmp)
+                    run_collector.merge_workers = 1
+                    data = copy.deepcopy(books)
+                    merge = run_collector.merge_live_data if live else run_collector.merge_pregame_data
+                    with redirect_stdout(io.StringIO()):
+                        start = time.perf_counter()
+                        merge(*data)
+                        latencies.append(time.perf_counter() - start)
+
+    return {'latencies': latencies, 'items': items, 'setup_rss_mb': setup_rss, 'peak_rss_mb': _peak_rss_mb()}
+
+
+def _percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def summarize(stage: str, n_matches: int, raw: dict) -> dict:
+    latencies = raw['latencies']
+    total = sum(latencies)
+    # Per-call stages report calls/s; whole-batch stages report matches/s per run
+    per_call = stage == 'add_or_update_team'
+    runs = 1 if per_call else len(latencies)
+    return {
+        'stage': stage,
+        'matches': n_matches,
+        'items': raw['items'],
+        'runs': len(latencies),
+        'total_s': round(total, 4),
+        'throughput_per_s': round(raw['items'] * runs / total, 1) if total else None,
+        'latency_ms': {
+            'p50': round(_percentile(latencies, 0.50) * 1000, 4),
+            'p95': round(_percentile(latencies, 0.95) * 1000, 4),
+            'p99': round(_percentile(latencies, 0.99) * 1000, 4),
+            'max': round(max(latencies) * 1000, 4),
+        },
+        'setup_rss_mb': round(raw['setup_rss_mb'], 1),
+        'peak_rss_mb': round(raw['peak_rss_mb'], 1),
+    }
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=PROJECT_ROOT, capture_output=True,
+                              text=True, timeout=10).stdout.strip() or 'unknown'
+    except Exception:
+        return 'unknown'
+
+
+def run(stages: list, scales: list, repeat: int, budget: float, seed: int) -> dict:
+    result = {
+        'suite_version': SUITE_VERSION,
+        'git_commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'seed': seed,
+        'repeat': repeat,
+        'budget_s': budget,
+        'results': [],
+    }
+    context = multiprocessing.get_context('spawn')
+    for stage in stages:
+        previous = None   # (scale, seconds per run)
+        for n in sorted(scales):
+            if previous is not None:
+                projected = previous[1] * (n / previous[0]) ** GROWTH.get(stage, 1) * (1 if stage == 'add_or_update_team' else repeat)
+                if projected > budget:
+                    result['results'].append({'stage': stage, 'matches': n,
+                                              'skipped': f"projected {projected:.0f}s exceeds budget {budget:.0f}s"})
+                    continue
+            print(f"  running {stage} @ {n} matches...", flush=True)
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                raw = pool.submit(run_stage, stage, n, repeat, seed).result()
+            entry = summarize(stage, n, raw)
+            result['results'].append(entry)
+            per_run = entry['total_s'] if stage == 'add_or_update_team' else entry['total_s'] / entry['runs']
+            previous = (n, per_run)
+    return result
+
+
+def compare(result: dict, baseline: dict) -> list:
+    """Per (stage, matches): throughput and p50 ratios new/baseline"""
+    base = {(e['stage'], e['matches']): e for e in baseline.get('results', []) if 'skipped' not in e}
+    rows = []
+    for entry in result['results']:
+        old = base.get((entry['stage'], entry['matches']))
+        if 'skipped' in entry or old is None:
+            continue
+        rows.append({
+            'stage': entry['stage'],
+            'matches': entry['matches'],
+            'throughput_ratio': round(entry['throughput_per_s'] / old['throughput_per_s'], 3)
+            if old.get('throughput_per_s') else None,
+            'p50_ratio': round(entry['latency_ms']['p50'] / old['latency_ms']['p50'], 3)
+            if old['latency_ms']['p50'] else None,
+            'peak_rss_delta_mb': round(entry['peak_rss_mb'] - old['peak_rss_mb'], 1),
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Merge pipeline benchmark suite (synthetic feeds)')
+    parser.add_argument('--scales', type=int, nargs='+', default=[1000, 5000, 10000, 25000, 50000])
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=STAGES)
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per batch stage (per-call stages run once)')
+    parser.add_argument('--budget', type=float, default=120.0, help='Skip scales projected to take longer (seconds)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', type=str, default=None, help='Write results to this JSON file')
+    parser.add_argument('--compare', type=str, default=None, help='Baseline JSON from a previous run')
+    args = parser.parse_args()
+
+    # Building a collector without a mappings file writes one - don't leave it behind
+    created = [p for p in (PROJECT_ROOT / 'name_mappings.json', PROJECT_ROOT / 'cache_backups',
+                           PROJECT_ROOT / 'name_cache') if not p.exists()]
+    try:
+        result = run(args.stages, args.scales, args.repeat, args.budget, args.seed)
+    finally:
+        for path in created:
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            elif path.exists():
+                path.unlink()
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        result['compared_to'] = {'git_commit': baseline.get('git_commit'), 'rows': compare(result, baseline)}
+
+    print("=" * 60)
+    print(f"PIPELINE BENCHMARK SUITE (commit {result['git_commit'][:10]}, {result['cpu_count']} CPUs, seed {result['seed']})")
+    print("=" * 60)
+    for entry in result['results']:
+        if 'skipped' in entry:
+            print(f"  {entry['stage']:<20} {entry['matches']:>6}: skipped ({entry['skipped']})")
+            continue
+        lat = entry['latency_ms']
+        print(f"  {entry['stage']:<20} {entry['matches']:>6}: {entry['throughput_per_s']:>11,.0f}/s | "
+              f"p50 {lat['p50']:10.3f} ms | p99 {lat['p99']:10.3f} ms | peak RSS {entry['peak_rss_mb']:7.1f} MB")
+    if 'compared_to' in result:
+        print(f"\n  vs {str(result['compared_to']['git_commit'])[:10]} (ratio > 1 = faster throughput / slower p50):")
+        for row in result['compared_to']['rows']:
+            print(f"  {row['stage']:<20} {row['matches']:>6}: throughput x{row['throughput_ratio']} | "
+                  f"p50 x{row['p50_ratio']} | RSS {row['peak_rss_delta_mb']:+.1f} MB")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        print(f"[OK] Results written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Team Name Index Benchmark
+The bet365 scrapers' six-stage normalize_team_name (nickname candidates
+walked per call, Stage 5 `endswith` scan over the sport index) against the
+shared TeamNameIndex, on a synthetic alias cache and a few thousand scraped
+names: exact aliases, punctuation/case variants, nickname-only and city-only
+names, other sports' names and unknown names. Every result is checked to be
+identical before timing.
+
+Usage:
+    python benchmarks/bench_team_name_index.py [--teams 3000] [--names 5000] [--repeat 5] [--json out.json]
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.helpers.team_name_index import TeamNameIndex
+
+SPORTS = [('Basketball', 'NBA'), ('Basketball', 'NCAAB'), ('American Football', 'NFL'), ('American Football', 'NCAAF'),
+          ('Ice Hockey', 'NHL'), ('Baseball', 'MLB'), ('Soccer', 'EPL'), ('Soccer', 'MLS'), ('Soccer', 'UCL')]
+CITIES = ['Boston', 'Denver', 'Austin', 'Portland', 'Dallas', 'Miami', 'Phoenix', 'Toronto', 'Chicago', 'Seattle',
+          'Atlanta', 'Houston', 'Detroit', 'Orlando', 'Memphis', 'Oakland', 'Tampa', 'Buffalo', 'Columbus', 'Raleigh']
+NICKNAMES = ['Bears', 'Eagles', 'Tigers', 'Lions', 'Hawks', 'Wolves', 'Knights', 'Rangers', 'Kings', 'United', 'City',
+             'Rovers', 'Storm', 'Thunder', 'Heat', 'Sharks', 'Panthers', 'Wildcats', 'Bulldogs', 'Spartans', 'Rockets']
+
+
+class LegacyNormalizer:
+    """normalize_team_name and _build_lookup_indices as they were in the bet365 scrapers"""
+
+    def __init__(self, hierarchical_cache):
+        self.hierarchical_cache = hierarchical_cache
+        self.nickname_index = {}
+        self.sport_team_index = {}
+        for alias, path in self.hierarchical_cache.items():
+            words = alias.split()
+            if len(words) >= 2 and path.get('team'):
+                self.nickname_index.setdefault(words[-1], []).append((alias, path))
+            if path.get('team'):
+                for key in (path.get('sport', ''), path.get('league', '')):
+                    if key:
+                        self.sport_team_index.setdefault(key, {})
+                        if path.get('canonical_name'):
+                            self.sport_team_index[key][alias] = path.get('canonical_name')
+
+    def normalize_team_name(self, team_name: str, sport: Optional[str] = None) -> str:
+        if not team_name or not self.hierarchical_cache:
+            return team_name
+        team_lower = team_name.lower().strip()
+        team_cleaned = re.sub(r'[^\w\s]', '', team_lower)
+        team_cleaned = re.sub(r'\s+', ' ', team_cleaned).strip()
+        if team_lower in self.hierarchical_cache:
+            canonical = self.hierarchical_cache[team_lower].get('canonical_name')
+            if canonical:
+                return canonical
+        if team_cleaned != team_lower and team_cleaned in self.hierarchical_cache:
+            canonical = self.hierarchical_cache[team_cleaned].get('canonical_name')
+            if canonical:
+                return canonical
+        team_no_space = team_cleaned.replace(' ', '')
+        if team_no_space != team_cleaned and team_no_space in self.hierarchical_cache:
+            canonical = self.hierarchical_cache[team_no_space].get('canonical_name')
+            if canonical:
+                return canonical
+        words = team_cleaned.split()
+        if len(words) >= 2:
+            nickname = words[-1]
+            if nickname in self.nickname_index:
+                for alias, path in self.nickname_index[nickname]:
+                    if sport:
+                        cache_sport = path.get('sport', '')
+                        cache_league = path.get('league', '')
+                        if cache_sport and sport.upper() == cache_sport.upper():
+                            return path.get('canonical_name')
+                        if cache_league and sport.upper() == cache_league.upper():
+                            return path.get('canonical_name')
+                    else:
+                        return path.get('canonical_name')
+        if sport:
+            sport_index = self.sport_team_index.get(sport, {})
+            for variant in [team_lower, team_cleaned, team_no_space]:
+                if variant in sport_index:
+                    return sport_index[variant]
+            if len(words) >= 2:
+                nickname = words[-1]
+                for alias, canonical in sport_index.items():
+                    if alias.endswith(nickname):
+                        return canonical
+        if len(team_words := team_cleaned.split()) <= 3:
+            for i in range(len(team_words)):
+                for j in range(i + 1, len(team_words) + 1):
+                    subset = ' '.join(team_words[i:j])
+                    if subset in self.hierarchical_cache:
+                        path = self.hierarchical_cache[subset]
+                        if path.get('team'):
+                            canonical = path.get('canonical_name')
+                            if canonical:
+                                return canonical
+        return team_name
+
+
+def make_cache(n_teams: int, seed: int = 3):
+    rng = random.Random(seed)
+    cache, teams = {}, []
+    for i in range(n_teams):
+        sport, league = rng.choice(SPORTS)
+        city, nick = rng.choice(CITIES), rng.choice(NICKNAMES)
+        canonical = f"{city} {nick} {i}" if rng.random() < 0.5 else f"{city} {nick}{i}"
+        path = {'team': True, 'canonical_name': canonical, 'sport': sport, 'league': league}
+        teams.append((canonical, sport, league))
+        for alias in {canonical.lower(), f"{city} {nick}".lower() + f" {i}", f"{city[:3]} {nick}{i}".lower(),
+                      f"{nick}{i}".lower()}:
+            cache.setdefault(alias, path)
+    # Non-team entries and entries without a canonical name (the legacy code returns None for some of these)
+    for sport, league in SPORTS:
+        cache[league.lower()] = {'canonical_name': league, 'sport': sport}
+    cache['ghost fc'] = {'team': True, 'sport': 'Soccer', 'league': 'EPL'}
+    return cache, teams
+
+
+def make_names(teams, n: int, seed: int = 5):
+    rng = random.Random(seed)
+    names = []
+    for _ in range(n):
+        canonical, sport, league = rng.choice(teams)
+        city, rest = canonical.split(' ', 1)
+        kind = rng.randrange(7)
+        if kind == 0:
+            name = canonical
+        elif kind == 1:
+            name = canonical.upper().replace(' ', '  ') + '.'
+        elif kind == 2:
+            name = f"{rng.choice(CITIES)} {rest.split()[0]}"        # nickname with the wrong city
+        elif kind == 3:
+            name = f"{rng.choice(['FC', 'SC', 'AC'])} {rest.split()[-1]}"  # trailing number/suffix token
+        elif kind == 4:
+            name = f"{rng.choice(CITIES)} Unknowns {rng.randrange(10 ** 6)}"
+        elif kind == 5:
+            name = "Ghost FC"
+        else:
+            name = rest
+        label = rng.choice([league, sport, league.lower(), None])
+        names.append((name, label))
+    return names
+
+
+def best_of(fn, repeat: int):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Team name index benchmark')
+    parser.add_argument('--teams', type=int, default=3000)
+    parser.add_argument('--names', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', type=str, default=None, help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    cache, teams = make_cache(args.teams)
+    names = make_names(teams, args.names)
+
+    build_legacy_s, legacy = best_of(lambda: LegacyNormalizer(cache), 1)
+    build_index_s, index = best_of(lambda: TeamNameIndex(cache), 1)
+
+    legacy_s, legacy_out = best_of(lambda: [legacy.normalize_team_name(n, s) for n, s in names], args.repeat)
+    index_s, index_out = best_of(lambda: [index.normalize(n, s) for n, s in names], args.repeat)
+    mismatches = [(names[i], a, b) for i, (a, b) in enumerate(zip(legacy_out, index_out)) if a != b]
+    if mismatches:
+        print(f"[WARN] {len(mismatches)} mismatches, first: {mismatches[:3]}")
+        sys.exit(1)
+
+    result = {
+        'aliases': len(cache), 'names': len(names),
+        'build_ms': {'legacy': round(build_legacy_s * 1000, 1), 'index': round(build_index_s * 1000, 1)},
+        'normalize_ms': {'legacy': round(legacy_s * 1000, 2), 'index': round(index_s * 1000, 2)},
+        'per_name_us': {'legacy': round(legacy_s / len(names) * 1e6, 2), 'index': round(index_s / len(names) * 1e6, 2)},
+        'speedup': round(legacy_s / index_s, 1),
+        'identical': True,
+        'unchanged_names': sum(1 for (n, _), out in zip(names, index_out) if out == n),
+    }
+
+    print("=" * 60)
+    print(f"TEAM NAME INDEX BENCHMARK ({result['aliases']} aliases, {result['names']} names)")
+    print("=" * 60)
+    print(f"  build:     legacy {result['build_ms']['legacy']:8.1f} ms | index {result['build_ms']['index']:8.1f} ms")
+    print(f"  normalize: legacy {result['normalize_ms']['legacy']:8.2f} ms | index {result['normalize_ms']['index']:8.2f} ms "
+          f"(x{result['speedup']})")
+    print(f"  per name:  legacy {result['per_name_us']['legacy']:8.2f} us | index {result['per_name_us']['index']:8.2f} us")
+    print(f"  [OK] results identical for all {result['names']} names ({result['unchanged_names']} left unchanged)")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        print(f"[OK] Results written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
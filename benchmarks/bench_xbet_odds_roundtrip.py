@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+1xBet Odds Round-Trip Benchmark
+Cost of carrying 1xBet pregame odds as a JSON string (json.dumps in
+parse_match, json.loads in upsert_match) against carrying the dict, over a
+full pregame collection's worth of matches, plus the merge-side odds read
+(extract_1xbet_odds) on dict records and on legacy string records.
+
+File I/O is left out: both variants write the same readable dicts.
+
+Usage:
+    python benchmarks/bench_xbet_odds_roundtrip.py [--matches 3000] [--repeat 5] [--json out.json]
+"""
+
+import argparse
+import importlib.util
+import json
+import logging
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.unified_odds_collector import UnifiedOddsCollector
+
+# (group, type) pairs 1xBet returns for a typical pregame line
+ODDS_CODES = [(1, 1), (1, 2), (1, 3), (2, 7), (2, 8), (15, 11), (15, 12), (17, 9), (17, 10), (62, 13), (62, 14)]
+
+
+def load_pregame_module():
+    """Import 1xbet_pregame.py (it opens its log file in the current directory)"""
+    spec = importlib.util.spec_from_file_location(
+        "xbet_pregame", Path(__file__).parent.parent / "bookmakers" / "1xbet" / "1xbet_pregame.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.logger.setLevel('WARNING')
+    return module
+
+
+def make_raw_matches(n: int, seed: int = 42) -> list:
+    rng = random.Random(seed)
+    return [{
+        'I': 600000000 + i, 'LI': rng.randrange(5000), 'L': f"League {rng.randrange(300)}",
+        'O1': f"Home {i}", 'O1I': i * 2, 'O2': f"Away {i}", 'O2I': i * 2 + 1,
+        'S': 1790000000 + i * 60, 'CN': 'World', 'COI': 225,
+        'E': [{'G': g, 'T': t, 'C': round(rng.uniform(1.1, 9.0), 2), 'CV': f"+{rng.randrange(100, 900)}",
+               'P': round(rng.uniform(0.5, 4.5) * 2) / 2 if g != 1 else None}
+              for g, t in ODDS_CODES],
+    } for i in range(n)]
+
+
+def upsert_odds_step(db, match) -> dict:
+    """The odds handling of JsonDataManager.upsert_match, without the file I/O"""
+    match_dict = match.to_dict()
+    if isinstance(match_dict.get('odds_data'), str):
+        match_dict['odds_data'] = db._convert_odds_to_readable(json.loads(match_dict['odds_data']))
+    elif isinstance(match_dict.get('odds_data'), dict):
+        match_dict['odds_data'] = db._convert_odds_to_readable(match_dict['odds_data'])
+    return match_dict
+
+
+def collect(collector, db, raw_matches, as_string: bool) -> list:
+    records = []
+    for raw in raw_matches:
+        match = collector.parse_match(raw, 1, 'Football')
+        if as_string:
+            match.odds_data = json.dumps(match.odds_data)   # what parse_match used to do
+        records.append(upsert_odds_step(db, match))
+    return records
+
+
+def best_of(fn, repeat: int):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(n_matches: int, repeat: int) -> dict:
+    raw_matches = make_raw_matches(n_matches)
+
+    # The collector creates its data/log files in the working directory
+    tmp = Path(tempfile.mkdtemp())
+    cwd = os.getcwd()
+    os.chdir(tmp)
+    try:
+        collector = load_pregame_module().XBetCollector()
+        db = collector.db
+
+        legacy_s, legacy_records = best_of(lambda: collect(collector, db, raw_matches, True), repeat)
+        native_s, native_records = best_of(lambda: collect(collector, db, raw_matches, False), repeat)
+        assert [r['odds_data'] for r in legacy_records] == [r['odds_data'] for r in native_records]
+
+        # Merge side: readable dict records vs legacy records with string odds_data
+        unified = UnifiedOddsCollector(base_dir=str(tmp))
+        legacy_file_records = [dict(r, odds_data=json.dumps(r['odds_data'])) for r in native_records]
+        dict_s, dict_odds = best_of(lambda: [unified.extract_1xbet_odds(r) for r in native_records], repeat)
+        str_s, str_odds = best_of(lambda: [unified.extract_1xbet_odds(r) for r in legacy_file_records], repeat)
+        assert dict_odds == str_odds
+    finally:
+        os.chdir(cwd)
+        logging.shutdown()
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    return {
+        'matches': n_matches,
+        'collection': {
+            'string_roundtrip_ms': round(legacy_s * 1000, 2),
+            'structured_ms': round(native_s * 1000, 2),
+            'saved_ms': round((legacy_s - native_s) * 1000, 2),
+            'saved_pct': round((legacy_s - native_s) / legacy_s * 100, 1),
+            'per_match_us_saved': round((legacy_s - native_s) / n_matches * 1e6, 2),
+        },
+        'merge_extract': {
+            'dict_records_ms': round(dict_s * 1000, 2),
+            'legacy_string_records_ms': round(str_s * 1000, 2),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='1xBet odds JSON round-trip benchmark')
+    parser.add_argument('--matches', type=int, default=3000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', type=str, default=None, help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    result = run(args.matches, args.repeat)
+    c, m = result['collection'], result['merge_extract']
+
+    print("=" * 60)
+    print(f"1XBET ODDS ROUND-TRIP BENCHMARK ({result['matches']} matches)")
+    print("=" * 60)
+    print(f"  parse + upsert odds, JSON string: {c['string_roundtrip_ms']:9.2f} ms")
+    print(f"  parse + upsert odds, structured:  {c['structured_ms']:9.2f} ms")
+    print(f"  saved: {c['saved_ms']:.2f} ms ({c['saved_pct']}%), {c['per_match_us_saved']} us/match")
+    print(f"  extract_1xbet_odds: dict records {m['dict_records_ms']:.2f} ms | "
+          f"legacy string records {m['legacy_string_records_ms']:.2f} ms")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        print(f"[OK] Results written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Synthetic Bookmaker Feeds
+Seeded generator of realistic 1xBet, FanDuel, bet365 and OddPortal output
+files (the exact JSON layouts the unified collector's loaders read), for
+offline benchmarks.
+
+Every bookmaker lists ~70% of a shared set of events under its own spelling
+of the team names:
+  - bet365: city abbreviations ("LA Lakers", "NY Rangers")
+  - 1xBet:  club suffixes/prefixes ("Lakers FC"), occasional one-letter typos
+  - FanDuel: full names; OddPortal: full names with "St."/"Saint" swaps
+Women's and youth teams ("Arsenal Women", "Arsenal U21", "Arsenal (W)")
+are separate teams that must NOT be merged with the senior side.
+
+The same (n, seed) always yields byte-identical files.
+
+Usage as a module:
+    from benchmarks.synthetic_feeds import generate_feeds, write_feeds
+    feeds = generate_feeds(5000, seed=42)      # {filename: dict}
+    write_feeds(feeds, tmp_dir)
+"""
+
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from utils.helpers.odds_model import quotes_from_odds, pack_quotes
+
+CITIES = ['Los Angeles', 'New York', 'Boston', 'Chicago', 'Dallas', 'Denver', 'Miami', 'Phoenix',
+          'Seattle', 'Atlanta', 'Houston', 'Detroit', 'Toronto', 'Portland', 'Orlando', 'Memphis',
+          'St. Louis', 'San Antonio', 'New Orleans', 'Kansas City', 'Las Vegas', 'Salt Lake']
+NICKNAMES = ['Lions', 'Tigers', 'Bears', 'Hawks', 'Eagles', 'Sharks', 'Wolves', 'Kings', 'Giants',
+             'Rangers', 'Rockets', 'Comets', 'Storm', 'Thunder', 'Falcons', 'Pirates', 'Knights',
+             'United', 'City', 'Rovers', 'Athletic', 'Wanderers']
+SQUAD_SUFFIXES = ['Women', 'U21', 'U19', '(W)', 'II']
+
+# (1xBet sport_name, FanDuel sport, bet365 sports_data key, bet365 live sport, OddPortal sport, weight)
+SPORTS = [
+    ('Football', 'soccer', 'Soccer', 'Soccer', 'football', 4),
+    ('Basketball', 'basketball', 'NBA', 'Basketball', 'basketball', 2),
+    ('Ice Hockey', 'hockey', 'NHL', 'Ice Hockey', 'hockey', 1),
+    ('Tennis', 'tennis', 'Tennis', 'Tennis', 'tennis', 1),
+    ('American Football', 'football', 'NFL', 'American Football', 'american-football', 1),
+    ('Baseball', 'baseball', 'MLB', 'Baseball', 'baseball', 1),
+]
+
+FILES = {
+    'bet365_pregame': 'bet365_current_pregame.json',
+    'bet365_live': 'bet365_live_current.json',
+    'fanduel_pregame': 'fanduel_pregame.json',
+    'fanduel_live': 'fanduel_live.json',
+    '1xbet_pregame': '1xbet_pregame.json',
+    '1xbet_live': '1xbet_live.json',
+    'oddportal': 'oddportal_unified.json',
+}
+
+OVERLAP = 0.7        # share of events each bookmaker lists
+LIVE_SHARE = 0.25    # share of events in progress
+BASE_TIME = datetime(2025, 11, 3, 12, 0, tzinfo=timezone.utc)   # fixed, so output is reproducible
+
+
+def _american(rng: random.Random) -> str:
+    value = rng.choice([rng.randint(-400, -101), rng.randint(100, 450)])
+    return f"+{value}" if value > 0 else str(value)
+
+
+def _typo(rng: random.Random, name: str) -> str:
+    """Swap two adjacent letters inside one word longer than 4 characters"""
+    words = name.split()
+    candidates = [i for i, w in enumerate(words) if len(w) > 4 and w.isalpha()]
+    if not candidates:
+        return name
+    i = rng.choice(candidates)
+    w = words[i]
+    j = rng.randrange(1, len(w) - 2)
+    words[i] = w[:j] + w[j + 1] + w[j] + w[j + 2:]
+    return ' '.join(words)
+
+
+def _spelling(rng: random.Random, team: Tuple[str, str, str], book: str) -> str:
+    """One bookmaker's rendering of a team"""
+    city, nickname, squad = team
+    suffix = f" {squad}" if squad else ''
+    if book == 'bet365':
+        short = ''.join(w[0] for w in city.replace('.', '').split()) if ' ' in city else city
+        return f"{short} {nickname}{suffix}"
+    if book == '1xbet':
+        name = f"{city} {nickname}"
+        if nickname in ('United', 'City', 'Rovers', 'Athletic', 'Wanderers'):
+            name = f"{name} FC"
+        if rng.random() < 0.05:
+            name = _typo(rng, name)
+        return name + suffix
+    if book == 'oddportal':
+        return f"{city.replace('St. ', 'Saint ')} {nickname}{suffix}"
+    return f"{city} {nickname}{suffix}"
+
+
+def _events(n_events: int, rng: random.Random) -> List[dict]:
+    weights = [s[5] for s in SPORTS]
+    teams_by_sport = {}
+    for sport in SPORTS:
+        pool = []
+        for generation in range(max(1, n_events // 150)):
+            for city in CITIES:
+                for nickname in NICKNAMES:
+                    tag = '' if generation == 0 else f" {generation + 1}"
+                    pool.append((city + tag, nickname, ''))
+        rng.shuffle(pool)
+        # ~8% of teams also exist as a women's/youth side
+        squads = [(c, nn, rng.choice(SQUAD_SUFFIXES)) for c, nn, _ in pool[:len(pool) // 12]]
+        teams_by_sport[sport[0]] = pool[len(pool) // 12:] + squads
+
+    events = []
+    for e in range(n_events):
+        sport = rng.choices(SPORTS, weights=weights)[0]
+        home, away = rng.sample(teams_by_sport[sport[0]], 2)
+        start = BASE_TIME + timedelta(minutes=15 * rng.randrange(4 * 24 * 7))
+        events.append({
+            'id': e, 'sport': sport, 'home': home, 'away': away, 'start': start,
+            'live': rng.random() < LIVE_SHARE, 'league': f"League {rng.randrange(120)}",
+            'country': rng.choice(['USA', 'England', 'Spain', 'Germany', 'Canada', 'Italy']),
+        })
+    return events
+
+
+def _book_events(events: List[dict], rng: random.Random) -> List[dict]:
+    return [ev for ev in events if rng.random() < OVERLAP]
+
+
+def generate_feeds(n_matches: int, seed: int = 42) -> Dict[str, dict]:
+    """
+    Build every bookmaker's output file for roughly n_matches matches in total
+
+    Args:
+        n_matches: Target match count summed over all files
+        seed: RNG seed (same seed -> identical feeds)
+
+    Returns:
+        {FILES key: JSON-ready dict in that bookmaker's on-disk layout}
+    """
+    rng = random.Random(seed)
+    # 7 files, each listing OVERLAP of the events (pregame/live split by LIVE_SHARE)
+    n_events = max(10, int(n_matches / (OVERLAP * 4)))
+    events = _events(n_events, rng)
+
+    feeds = {}
+
+    # bet365 pregame: sports_data -> games
+    sports_data = {}
+    for ev in _book_events([e for e in events if not e['live']], rng):
+        game = {
+            'sport': ev['sport'][2], 'team1': _spelling(rng, ev['home'], 'bet365'),
+            'team2': _spelling(rng, ev['away'], 'bet365'),
+            'date': ev['start'].strftime('%a %b %d'), 'time': ev['start'].strftime('%I:%M %p').lstrip('0'),
+            'game_id': f"b365-{ev['id']}", 'fixture_id': f"F{ev['id']}",
+            'odds': {'moneyline': [_american(rng), _american(rng)],
+                     'spread': [f"-1.5 {_american(rng)}", f"+1.5 {_american(rng)}"],
+                     'total': [f"O 2.5 {_american(rng)}", f"U 2.5 {_american(rng)}"]},
+        }
+        sports_data.setdefault(ev['sport'][2], {'games': []})['games'].append(game)
+    feeds['bet365_pregame'] = {'extraction_info': {'source': 'synthetic'}, 'sports_data': sports_data}
+
+    # bet365 live: matches with teams/markets
+    feeds['bet365_live'] = {'matches': [{
+        'sport': ev['sport'][3],
+        'teams': {'home': _spelling(rng, ev['home'], 'bet365'), 'away': _spelling(rng, ev['away'], 'bet365')},
+        'scores': {'home': rng.randint(0, 4), 'away': rng.randint(0, 4)},
+        'markets': {'moneyline': {'home': {'odds': _american(rng)}, 'away': {'odds': _american(rng)}},
+                    'total': {'over': {'line': '2.5', 'odds': _american(rng)},
+                              'under': {'line': '2.5', 'odds': _american(rng)}}},
+    } for ev in _book_events([e for e in events if e['live']], rng)]}
+
+    # FanDuel pregame: data.matches
+    feeds['fanduel_pregame'] = {'metadata': {'data_type': 'pregame'}, 'data': {'matches': [{
+        'sport': ev['sport'][1], 'home_team': _spelling(rng, ev['home'], 'fanduel'),
+        'away_team': _spelling(rng, ev['away'], 'fanduel'),
+        'scheduled_time': ev['start'].strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+        'game_id': f"fd-{ev['id']}", 'match_id': f"fd-{ev['id']}", 'status': 'scheduled',
+        'odds': {'moneyline_home': _american(rng), 'moneyline_away': _american(rng),
+                 'spread_home_line': '-1.5', 'spread_home_odds': _american(rng),
+                 'spread_away_line': '+1.5', 'spread_away_odds': _american(rng)},
+    } for ev in _book_events([e for e in events if not e['live']], rng)]}}
+
+    # FanDuel live: root matches with odds_data markets
+    feeds['fanduel_live'] = {'matches': [{
+        'sport': ev['sport'][1], 'home_team': _spelling(rng, ev['home'], 'fanduel'),
+        'away_team': _spelling(rng, ev['away'], 'fanduel'), 'game_id': f"fd-{ev['id']}",
+        'event_id': 30000000 + ev['id'],
+        'odds_data': {'Moneyline': {'odds': {
+            '1': {'name': _spelling(rng, ev['home'], 'fanduel'), 'american_odds': _american(rng)},
+            '2': {'name': _spelling(rng, ev['away'], 'fanduel'), 'american_odds': _american(rng)}}}},
+    } for ev in _book_events([e for e in events if e['live']], rng)]}
+
+    # 1xBet pregame: data.matches with odds_data
+    def xbet_match(ev, live):
+        match = {
+            'match_id': 500000000 + ev['id'], 'sport_name': ev['sport'][0],
+            'league_name': ev['league'], 'country': ev['country'],
+            'team1': _spelling(rng, ev['home'], '1xbet'), 'team2': _spelling(rng, ev['away'], '1xbet'),
+            'start_time': int(ev['start'].timestamp()),
+            'scheduled_time': ev['start'].strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+            'odds_data': {'moneyline_home': _american(rng), 'moneyline_draw': _american(rng),
+                          'moneyline_away': _american(rng), 'total_over': _american(rng),
+                          'total_under': _american(rng)},
+        }
+        if live:
+            match['score'] = f"{rng.randint(0, 4)}:{rng.randint(0, 4)}"
+            match['start_time_readable'] = ev['start'].strftime('%H:%M')
+        return match
+
+    feeds['1xbet_pregame'] = {'metadata': {'data_type': 'pregame', 'source': '1xbet'}, 'data': {'matches': [
+        xbet_match(ev, False) for ev in _book_events([e for e in events if not e['live']], rng)]}}
+    feeds['1xbet_live'] = {'matches': [
+        xbet_match(ev, True) for ev in _book_events([e for e in events if e['live']], rng)]}
+
+    # OddPortal: root matches with markets
+    feeds['oddportal'] = {'matches': [{
+        'sport': ev['sport'][4], 'home_team': _spelling(rng, ev['home'], 'oddportal'),
+        'away_team': _spelling(rng, ev['away'], 'oddportal'),
+        'datetime': ev['start'].strftime('%Y-%m-%d %H:%M'), 'league': ev['league'], 'country': ev['country'],
+        'match_url': f"https://www.oddsportal.com/m/{ev['id']}",
+        'markets': {'1x2': {'home': _american(rng), 'away': _american(rng)}},
+    } for ev in _book_events([e for e in events if not e['live']], rng)]}
+
+    return feeds
+
+
+def write_feeds(feeds: Dict[str, dict], directory: Path) -> Dict[str, Path]:
+    """Write feeds as JSON files; returns {FILES key: path}"""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = {}
+    for key, data in feeds.items():
+        path = directory / FILES[key]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        paths[key] = path
+    return paths
+
+
+def generate_unified(n_matches: int, seed: int = 42) -> Dict[str, list]:
+    """
+    Unified-collector-shaped output (pregame_matches/live_matches with per-book
+    odds and packed quotes) for benchmarking the format converters without a merge
+    """
+    rng = random.Random(seed)
+    events = _events(max(10, n_matches), rng)[:n_matches]
+    unified = {'pregame_matches': [], 'live_matches': []}
+    for ev in events:
+        match = {
+            'match_id': f"m{ev['id']}", 'sport': ev['sport'][1], 'league': ev['league'],
+            'home_team': _spelling(rng, ev['home'], 'fanduel'), 'away_team': _spelling(rng, ev['away'], 'fanduel'),
+            'start_time': ev['start'].strftime('%Y-%m-%d %H:%M:%S'),
+        }
+        for book in ('1xbet', 'fanduel', 'bet365'):
+            if rng.random() >= OVERLAP:
+                match[book] = {'available': False}
+                continue
+            odds = {'moneyline_home': _american(rng), 'moneyline_away': _american(rng),
+                    'spread_home_line': '-1.5', 'spread_home_odds': _american(rng),
+                    'spread_away_line': '+1.5', 'spread_away_odds': _american(rng),
+                    'total_line': '2.5', 'total_over_odds': _american(rng), 'total_under_odds': _american(rng)}
+            match[book] = {'available': True, 'odds': odds, 'quotes': pack_quotes(quotes_from_odds(odds)),
+                           'url': f"https://example.com/{book}/{ev['id']}"}
+        unified['live_matches' if ev['live'] else 'pregame_matches'].append(match)
+    return unified
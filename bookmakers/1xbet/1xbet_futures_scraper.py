@@ -7,9 +7,12 @@ import asyncio
 import aiohttp
 import json
 import gzip
+import hashlib
+import os
+import sys
 import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass, asdict
 import logging
@@ -67,6 +70,120 @@ class FutureEvent:
             'last_updated': self.last_updated
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'FutureEvent':
+        """Rebuild an event from its saved to_dict() form"""
+        return cls(
+            event_id=data.get('event_id', 0),
+            sport_id=data.get('sport_id', 2999),
+            sport_name=data.get('sport_name', 'Long-term bets'),
+            league_id=data.get('league_id', 0),
+            league_name=data.get('league_name', ''),
+            event_name=data.get('event_name', ''),
+            country=data.get('country', ''),
+            country_id=data.get('country_id', 0),
+            start_time=data.get('start_time', 0),
+            market_type=data.get('market_type', 'Winner'),
+            selections=data.get('selections', []),
+            total_selections=data.get('total_selections', 0),
+            last_updated=data.get('last_updated', 0)
+        )
+
+
+def fingerprint(data) -> str:
+    """Stable short hash of JSON-serializable data"""
+    encoded = json.dumps(data, sort_keys=True, separators=(',', ':'), default=str).encode('utf-8')
+    return hashlib.blake2b(encoded, digest_size=12).hexdigest()
+
+
+def event_fingerprint(event: FutureEvent) -> str:
+    """Fingerprint of everything a consumer sees except the last_updated stamp"""
+    data = event.to_dict()
+    data.pop('last_updated', None)
+    return fingerprint(data)
+
+
+class FuturesRefreshState:
+    """
+    Per-event fingerprints and poll schedule, persisted between runs
+
+    An event's GetGameZip line is re-polled when it is new, when its entry in
+    the futures list changed, or when its poll interval has elapsed. The
+    interval starts at hot_interval, doubles every time a poll finds the
+    event unchanged (up to cold_interval), and drops back to hot_interval
+    when it changes. Events starting within soon_window are kept hot.
+    """
+
+    def __init__(self, path: Path, hot_interval: float = 300, cold_interval: float = 6 * 3600,
+                 soon_window: float = 24 * 3600):
+        self.path = Path(path)
+        self.hot_interval = hot_interval
+        self.cold_interval = cold_interval
+        self.soon_window = soon_window
+        self.events: Dict[str, Dict] = {}
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.events = json.load(f).get('events', {})
+        except (OSError, ValueError):
+            self.events = {}
+
+    def save(self):
+        tmp = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'saved_at': datetime.now().isoformat(), 'events': self.events}, f)
+        os.replace(tmp, self.path)
+
+    def is_due(self, event_id: int, list_fp: str, start_time: int, now: float) -> bool:
+        entry = self.events.get(str(event_id))
+        if entry is None or entry.get('list_fp') != list_fp:
+            return True
+        interval = entry.get('interval', self.hot_interval)
+        if start_time and start_time - now < self.soon_window:
+            interval = min(interval, self.hot_interval)
+        return now - entry.get('last_polled', 0) >= interval
+
+    def record_poll(self, event_id: int, list_fp: str, event_fp: Optional[str], now: float) -> bool:
+        """
+        Store a poll result
+
+        Args:
+            event_fp: Fingerprint of the parsed event, or None if the line fetch failed
+
+        Returns:
+            True if the event changed since the previous poll
+        """
+        key = str(event_id)
+        entry = self.events.get(key)
+        if event_fp is None:
+            # Failed fetch: keep the old fingerprint and retry soon
+            if entry is not None:
+                entry['list_fp'] = list_fp
+                entry['last_polled'] = now
+                entry['interval'] = self.hot_interval
+            return False
+
+        changed = entry is None or entry.get('event_fp') != event_fp
+        if changed:
+            interval = self.hot_interval
+            last_changed = now
+        else:
+            interval = min(entry.get('interval', self.hot_interval) * 2, self.cold_interval)
+            last_changed = entry.get('last_changed', now)
+        self.events[key] = {
+            'list_fp': list_fp,
+            'event_fp': event_fp,
+            'last_polled': now,
+            'last_changed': last_changed,
+            'interval': interval,
+        }
+        return changed
+
+    def forget(self, event_ids):
+        for event_id in event_ids:
+            self.events.pop(str(event_id), None)
+
 
 class FuturesScraper:
     """Scraper for 1xBet futures/outright markets"""
@@ -77,6 +194,11 @@ class FuturesScraper:
         self.futures_file = self.data_dir / "1xbet_future.json"
         self.session: Optional[aiohttp.ClientSession] = None
         self.semaphore = asyncio.Semaphore(5)  # Limit concurrent requests
+
+        # Incremental refresh: fingerprints and poll schedule survive restarts
+        self.refresh_state = FuturesRefreshState(self.data_dir / "1xbet_future_state.json")
+        self.clock = time.time
+        self.request_count = 0
         
     async def init_session(self):
         """Initialize aiohttp session"""
@@ -132,6 +254,7 @@ class FuturesScraper:
             
             try:
                 logger.info(f"Fetching futures list for sport_id {sport_id}...")
+                self.request_count += 1
                 async with self.session.get(url, params=params) as response:
                     if response.status == 200:
                         raw_data = await response.read()
@@ -165,6 +288,7 @@ class FuturesScraper:
             }
             
             try:
+                self.request_count += 1
                 async with self.session.get(url, params=params) as response:
                     if response.status == 200:
                         raw_data = await response.read()
@@ -319,7 +443,105 @@ class FuturesScraper:
         
         return futures_data
     
-    def save_futures(self, futures: List[FutureEvent]):
+    def load_saved_events(self) -> Dict[int, FutureEvent]:
+        """Events from the last saved futures file, by event_id"""
+        try:
+            with open(self.futures_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        events = {}
+        for item in data.get('data', {}).get('events', []):
+            if item.get('event_id'):
+                events[item['event_id']] = FutureEvent.from_dict(item)
+        return events
+
+    async def refresh_futures(self, force_full: bool = False) -> Tuple[List[FutureEvent], Dict]:
+        """
+        Incremental collection: one futures-list request, then GetGameZip only
+        for events that are due (see FuturesRefreshState)
+
+        Events that are not due, or whose line fetch failed, are carried over
+        from the saved file unchanged, including their last_updated stamp.
+
+        Args:
+            force_full: Poll every event regardless of schedule
+
+        Returns:
+            (events in list order, change report with added/changed/removed ids)
+        """
+        start = time.time()
+        requests_before = self.request_count
+        now = self.clock()
+        self.refresh_state.load()
+        saved = self.load_saved_events()
+
+        futures_list = await self.fetch_sport_futures(sport_id=2999)
+        report = {'added': [], 'changed': [], 'removed': [], 'polled': 0, 'carried': 0,
+                  'listed': len(futures_list), 'requests': 0, 'seconds': 0.0}
+        if not futures_list:
+            logger.warning("No futures events found")
+            return [], report
+
+        listed = []
+        due = []
+        for event in futures_list:
+            event_id = event.get('I', 0)
+            if not event_id:
+                continue
+            list_fp = fingerprint(event)
+            listed.append((event, event_id, list_fp))
+            if force_full or event_id not in saved or \
+                    self.refresh_state.is_due(event_id, list_fp, event.get('S', 0), now):
+                due.append(event_id)
+
+        logger.info(f"Polling {len(due)} of {len(listed)} futures events "
+                    f"({len(listed) - len(due)} not due)")
+        line_results = await asyncio.gather(*(self.fetch_event_line(event_id) for event_id in due),
+                                            return_exceptions=True)
+        lines = dict(zip(due, line_results))
+
+        futures_data = []
+        for event, event_id, list_fp in listed:
+            previous = saved.get(event_id)
+            if event_id not in lines:
+                futures_data.append(previous)
+                report['carried'] += 1
+                continue
+
+            report['polled'] += 1
+            line_data = lines[event_id]
+            if isinstance(line_data, Exception):
+                line_data = None
+            if line_data is None and previous is not None:
+                # Keep the last good selections rather than the list's bare odds
+                self.refresh_state.record_poll(event_id, list_fp, None, now)
+                futures_data.append(previous)
+                continue
+
+            future_event = self.parse_future_event(event, line_data)
+            if future_event is None:
+                continue
+            if self.refresh_state.record_poll(event_id, list_fp, event_fingerprint(future_event), now) \
+                    or previous is None:
+                report['added' if previous is None else 'changed'].append(event_id)
+            else:
+                future_event.last_updated = previous.last_updated
+            futures_data.append(future_event)
+
+        listed_ids = {event_id for _, event_id, _ in listed}
+        report['removed'] = [event_id for event_id in saved if event_id not in listed_ids]
+        self.refresh_state.forget(report['removed'])
+        self.refresh_state.save()
+
+        report['requests'] = self.request_count - requests_before
+        report['seconds'] = round(time.time() - start, 3)
+        logger.info(f"✓ {len(futures_data)} futures events: {len(report['added'])} new, "
+                    f"{len(report['changed'])} changed, {len(report['removed'])} removed, "
+                    f"{report['carried']} carried over ({report['requests']} requests)")
+        return futures_data, report
+
+    def save_futures(self, futures: List[FutureEvent], report: Optional[Dict] = None):
         """Save futures data to JSON file"""
         data = {
             'metadata': {
@@ -334,13 +556,40 @@ class FuturesScraper:
                 'events': [f.to_dict() for f in futures]
             }
         }
+        if report is not None:
+            data['metadata']['changes'] = {
+                'added': report['added'],
+                'changed': report['changed'],
+                'removed': report['removed'],
+            }
         
-        with open(self.futures_file, 'w', encoding='utf-8') as f:
+        # Atomic replace so readers never see a half-written file
+        tmp = self.futures_file.with_name(self.futures_file.name + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp, self.futures_file)
         
         logger.info(f"✓ Saved to {self.futures_file}")
     
-    async def run(self):
+    async def refresh_and_save(self, force_full: bool = False) -> Tuple[List[FutureEvent], Dict]:
+        """One incremental refresh; the file is rewritten only if something changed"""
+        futures, report = await self.refresh_futures(force_full=force_full)
+        if not futures:
+            logger.warning("No futures data collected")
+        elif report['added'] or report['changed'] or report['removed'] or not self.futures_file.exists():
+            self.save_futures(futures, report)
+        else:
+            logger.info("No futures changed - file left untouched")
+        return futures, report
+
+    async def monitor(self, tick_seconds: int = 60, force_full: bool = False):
+        """Refresh every tick; each tick only polls events whose interval elapsed"""
+        while True:
+            await self.refresh_and_save(force_full=force_full)
+            force_full = False
+            await asyncio.sleep(tick_seconds)
+
+    async def run(self, force_full: bool = False, monitor: bool = False):
         """Main execution method"""
         try:
             await self.init_session()
@@ -349,16 +598,14 @@ class FuturesScraper:
             logger.info("1xBet Futures Scraper - Starting Collection")
             logger.info("=" * 60)
             
+            if monitor:
+                await self.monitor(force_full=force_full)
+                return
+
             start_time = time.time()
             
-            # Collect futures with odds
-            futures = await self.collect_futures()
-            
-            # Save to file
-            if futures:
-                self.save_futures(futures)
-            else:
-                logger.warning("No futures data collected")
+            # Collect futures with odds (only events that are due) and save if changed
+            futures, _ = await self.refresh_and_save(force_full=force_full)
             
             elapsed = time.time() - start_time
             
@@ -392,9 +639,9 @@ class FuturesScraper:
 
 
 async def main():
-    """Entry point"""
+    """Entry point (--full polls every event, --monitor keeps refreshing)"""
     scraper = FuturesScraper()
-    await scraper.run()
+    await scraper.run(force_full='--full' in sys.argv, monitor='--monitor' in sys.argv)
 
 
 if __name__ == "__main__":
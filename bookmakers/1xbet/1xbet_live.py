@@ -7,11 +7,12 @@ Features realtime monitoring with 1-second intervals
 
 import asyncio
 import aiohttp
+import hashlib
 import json
 import zlib
 import time
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set
 import logging
 from pathlib import Path
 import sys
@@ -22,6 +23,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+try:
+    from utils.helpers.data_sidecar import write_sidecar, count_by_sport
+    SIDECAR_AVAILABLE = True
+except ImportError:
+    SIDECAR_AVAILABLE = False
+try:
+    from utils.helpers.metrics import REGISTRY as METRICS, timed_stage
+except ImportError:
+    METRICS = None
+    def timed_stage(stage):
+        return lambda func: func
+try:
+    from utils.helpers.odds_model import quotes_from_xbet, pack_quotes
+    ODDS_MODEL_AVAILABLE = True
+except ImportError:
+    ODDS_MODEL_AVAILABLE = False
+
 try:
     import zstandard
     HAS_ZSTD = True
@@ -43,7 +62,17 @@ class LiveCollector:
         self.data_file = self.data_dir / "1xbet_live.json"
         self.history_file = self.data_dir / "1xbet_history.json"  # Unified history file
         self.matches = {}  # Store matches by ID
-        self.previous_match_ids = set()  # Track matches from previous collection
+
+        # Change tracking: per-match fingerprints of info, score and each odds market
+        self.fingerprints: Dict[Any, Dict[str, str]] = {}
+        self.missing_since: Dict[Any, float] = {}  # when a tracked match was first not returned
+        self.removal_grace = 60                    # seconds a match may be missing before it counts as finished
+        self.clock_write_interval = 30            # seconds a clock-only change may wait for a write
+        self.cycle = 0
+        self.last_changes: Dict[str, Any] = {}
+        self.last_write_time = 0.0
+        self._last_live_stats: Optional[dict] = None
+        self.write_stats = {'written': 0, 'skipped': 0}
     
     async def init(self):
         timeout = aiohttp.ClientTimeout(total=30)
@@ -67,6 +96,7 @@ class LiveCollector:
         if self.session:
             await self.session.close()
     
+    @timed_stage('decompress_response')
     def decompress(self, data: bytes) -> Dict:
         """Decompress VZip response with gzip/zstd support"""
         try:
@@ -179,6 +209,7 @@ class LiveCollector:
                 
         return readable_odds
     
+    @timed_stage('fetch')
     async def get_live_sports(self) -> List[Dict]:
         """Get all sports that have live matches"""
         try:
@@ -217,8 +248,9 @@ class LiveCollector:
         
         return []
     
-    async def get_matches_for_sport(self, sport_id: int, sport_name: str) -> List[Dict]:
-        """Get all live matches for a specific sport"""
+    @timed_stage('fetch')
+    async def get_matches_for_sport(self, sport_id: int, sport_name: str) -> Optional[List[Dict]]:
+        """Get all live matches for a specific sport (None if the request failed)"""
         try:
             # Use the exact endpoint format from working URL
             url = f"{self.base_url}/service-api/LiveFeed/Get1x2_VZip"
@@ -243,10 +275,10 @@ class LiveCollector:
                         data = self.decompress(raw_data)
                         
                         if data.get('Success'):
-                            matches = data.get('Value', [])
+                            matches = data.get('Value', []) or []
                             if matches:
                                 logger.info(f"  ✓ {sport_name}: {len(matches)} matches")
-                                return matches
+                            return matches
                     except Exception as json_err:
                         logger.debug(f"JSON decode error for {sport_name}: {json_err}")
                 else:
@@ -254,8 +286,9 @@ class LiveCollector:
         except Exception as e:
             logger.debug(f"Error getting matches for {sport_name}: {e}")
         
-        return []
+        return None
     
+    @timed_stage('fetch')
     async def get_all_matches_fallback(self) -> List[Dict]:
         """Fallback method: get matches with high count limit"""
         try:
@@ -439,6 +472,9 @@ class LiveCollector:
             'odds': odds,
             'last_updated': int(time.time())
         }
+        if ODDS_MODEL_AVAILABLE:
+            # Typed quotes from the raw numbers, so the collector never parses the readable strings
+            match['quotes'] = pack_quotes(quotes_from_xbet(raw_odds))
 
         # Convert start_time from Unix timestamp to readable date/time format like bet365
         start_time_unix = match_data.get('S', 0)
@@ -467,28 +503,172 @@ class LiveCollector:
         
         return match
     
+    @staticmethod
+    def _fingerprint(value) -> str:
+        encoded = json.dumps(value, sort_keys=True, separators=(',', ':'), default=str).encode('utf-8')
+        return hashlib.blake2b(encoded, digest_size=8).hexdigest()
+
+    def match_fingerprints(self, match: Dict) -> Dict[str, str]:
+        """
+        Fingerprints of a parsed match, one per part that consumers care about
+
+        Returns:
+            {'info': ..., 'score': ..., 'odds:<market>': ...} where market is the
+            readable key prefix (moneyline, spread, total, sets, points) or the raw
+            group for unrecognised codes. The match clock ('time') is not included.
+        """
+        fingerprints = {
+            'info': self._fingerprint((match.get('sport_name'), match.get('league'), match.get('team1'),
+                                       match.get('team2'), match.get('start_time'))),
+            'score': self._fingerprint((match.get('score1'), match.get('score2'), match.get('period'),
+                                        match.get('detailed_score'))),
+        }
+        markets: Dict[str, list] = {}
+        for key, value in match.get('odds', {}).items():
+            markets.setdefault(key.split('_', 1)[0], []).append((key, value))
+        for market, items in markets.items():
+            fingerprints[f"odds:{market}"] = self._fingerprint(sorted(items, key=lambda item: item[0]))
+        return fingerprints
+
+    def apply_cycle(self, parsed_matches: List[Dict], failed_sports: Optional[Set[Any]] = None,
+                    complete: bool = True, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Merge one cycle's parsed matches into self.matches and diff them
+
+        Unchanged matches keep their stored dict (and last_updated); a change in
+        the match clock alone only refreshes 'time'. A match only counts as
+        missing when its sport was fetched successfully this cycle; matches
+        missing for removal_grace seconds are removed (and go to history).
+
+        Args:
+            parsed_matches: This cycle's parsed matches
+            failed_sports: Sport ids whose fetch failed (their matches are not counted missing)
+            complete: False when the cycle could not list every live sport (no misses counted)
+            now: Epoch time of the cycle (defaults to time.time())
+
+        Returns:
+            Change set: {'cycle', 'timestamp', 'added': [ids], 'changed': {id: [parts]},
+            'removed': [ids], 'clock_only': count}
+        """
+        self.cycle += 1
+        added: List[Any] = []
+        changed: Dict[Any, List[str]] = {}
+        clock_only = 0
+        seen = set()
+
+        for match in parsed_matches:
+            match_id = match['match_id']
+            seen.add(match_id)
+            fingerprints = self.match_fingerprints(match)
+            previous = self.fingerprints.get(match_id)
+            self.fingerprints[match_id] = fingerprints
+
+            if previous is None or match_id not in self.matches:
+                added.append(match_id)
+                self.matches[match_id] = match
+                continue
+
+            parts = sorted(part for part in previous.keys() | fingerprints.keys()
+                           if previous.get(part) != fingerprints.get(part))
+            if parts:
+                changed[match_id] = parts
+                self.matches[match_id] = match
+            elif self.matches[match_id].get('time') != match.get('time'):
+                self.matches[match_id]['time'] = match.get('time')
+                clock_only += 1
+
+        now = time.time() if now is None else now
+        failed_sports = failed_sports or set()
+        removed = []
+        for match_id, match in list(self.matches.items()):
+            if match_id in seen:
+                self.missing_since.pop(match_id, None)
+                continue
+            if not complete or match.get('sport_id') in failed_sports:
+                continue  # not fetched this cycle - neither missing nor seen
+            missing_since = self.missing_since.setdefault(match_id, now)
+            if now - missing_since >= self.removal_grace:
+                removed.append(match_id)
+
+        if removed:
+            self._save_removed_matches_to_history(set(removed))
+            for match_id in removed:
+                self.matches.pop(match_id, None)
+                self.fingerprints.pop(match_id, None)
+                self.missing_since.pop(match_id, None)
+
+        self.last_changes = {
+            'cycle': self.cycle,
+            'timestamp': datetime.now().isoformat(),
+            'added': added,
+            'changed': changed,
+            'removed': removed,
+            'clock_only': clock_only,
+        }
+        if METRICS is not None:
+            counter = METRICS.counter('odds_live_match_changes_total',
+                                      'Live matches added/changed/removed per collector', ('kind',))
+            counter.inc(len(added), kind='added')
+            counter.inc(len(changed), kind='changed')
+            counter.inc(len(removed), kind='removed')
+        return self.last_changes
+
+    @timed_stage('save_data')
     def save_data(self):
         """Save collected data to JSON and update statistics"""
+        changes = self.last_changes
         data = {
             'metadata': {
                 'timestamp': datetime.now().isoformat(),
                 'total_matches': len(self.matches),
                 'total_sports': self.stats['sports'],
-                'collection_time': self.stats.get('time', 0)
+                'collection_time': self.stats.get('time', 0),
+                # What changed since the previous cycle, so readers can skip the rest
+                'changes': {
+                    'cycle': changes.get('cycle', 0),
+                    'added': changes.get('added', []),
+                    'changed': {str(k): v for k, v in changes.get('changed', {}).items()},
+                    'removed': changes.get('removed', []),
+                }
             },
             'matches': list(self.matches.values())
         }
 
+        content = json.dumps(data, indent=2, ensure_ascii=False)
         with open(self.data_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write(content)
+        self.last_write_time = time.time()
+        self.write_stats['written'] += 1
+        
+        # Counts/hash sidecar for monitors (they never parse the data file)
+        if SIDECAR_AVAILABLE:
+            write_sidecar(self.data_file, count_by_sport(data['matches'], ('sport_name',)),
+                          content, writer='1xbet_live',
+                          extra={'changes': {'cycle': changes.get('cycle', 0),
+                                             'added': len(changes.get('added', [])),
+                                             'changed': len(changes.get('changed', {})),
+                                             'removed': len(changes.get('removed', []))}})
 
         logger.info(f"✓ Data saved to {self.data_file}")
 
         # Update statistics file with live data
         self._update_statistics_file()
 
+    def _should_write(self, changes: Dict[str, Any]) -> bool:
+        """Write on real changes; clock-only cycles at most every clock_write_interval"""
+        if changes['added'] or changes['changed'] or changes['removed']:
+            return True
+        if changes['clock_only'] and time.time() - self.last_write_time >= self.clock_write_interval:
+            return True
+        return not self.data_file.exists()
+
     def _update_statistics_file(self):
-        """Update the statistics.json file with live match statistics"""
+        """Update the statistics.json file with live match statistics (only if they changed)"""
+        live_stats = self._generate_live_stats()
+        if live_stats == self._last_live_stats:
+            return
+        self._last_live_stats = live_stats
+
         stats_file = self.data_dir / "1xbet_statistics.json"
 
         # Load existing stats to preserve pregame data
@@ -500,9 +680,6 @@ class LiveCollector:
             except:
                 existing_stats = {}
 
-        # Generate live statistics
-        live_stats = self._generate_live_stats()
-
         # Preserve pregame stats if they exist
         pregame_stats = existing_stats.get('pregame', {})
 
@@ -597,6 +774,7 @@ class LiveCollector:
             
             logger.info(f"✓ Saved {len(removed_matches)} completed live matches to history")
     
+    @timed_stage('collection_cycle')
     async def collect_all(self):
         """Collect all live matches from all sports"""
         start = time.time()
@@ -611,6 +789,8 @@ class LiveCollector:
         
         all_matches = []
         sport_ids = set()
+        failed_sports = set()
+        complete = True
         
         if sports and len(sports) > 0:
             logger.info(f"Found {len(sports)} sports with live matches")
@@ -625,13 +805,16 @@ class LiveCollector:
                 if visible_count > 0:
                     # Fetch matches for this sport
                     matches = await self.get_matches_for_sport(sport_id, sport_name)
-                    if matches:
+                    if matches is None:
+                        failed_sports.add(sport_id)
+                    elif matches:
                         all_matches.extend(matches)
                         sport_ids.add(sport_id)
         else:
-            # Fallback: Use simple high-count query
+            # Fallback: Use simple high-count query (capped, so absent matches prove nothing)
             logger.info("Using fallback method to get all live matches...")
             all_matches = await self.get_all_matches_fallback()
+            complete = False
         
         if not all_matches:
             logger.warning("No live matches found")
@@ -639,48 +822,43 @@ class LiveCollector:
         
         logger.info(f"\n✓ Total matches collected: {len(all_matches)}")
         
-        # Step 3: Process all collected matches
+        # Step 3: Process all collected matches (parse time recorded per batch, not per call)
+        parse_seconds = 0.0
+        parsed = []
         for match_data in all_matches:
             try:
                 # Extract sport info from match data
                 sport_id = match_data.get('SI', 0)  # Sport ID
                 sport_name = match_data.get('SN', 'Unknown')  # Sport Name
                 
-                match = self.parse_match(match_data, sport_id, sport_name)
-                match_id = match['match_id']
+                parse_start = time.perf_counter()
+                parsed.append(self.parse_match(match_data, sport_id, sport_name))
+                parse_seconds += time.perf_counter() - parse_start
                 
                 sport_ids.add(sport_id)
-                
-                if match_id in self.matches:
-                    # Check if updated
-                    if match != self.matches[match_id]:
-                        self.stats['updated'] += 1
-                        self.matches[match_id] = match
-                else:
-                    self.stats['new'] += 1
-                    self.matches[match_id] = match
-                
                 self.stats['total'] += 1
                 
             except Exception as e:
                 logger.error(f"Error parsing match: {e}")
         
-        self.stats['sports'] = len(sport_ids)
-        
-        # Track removed matches and save to history
-        current_match_ids = set(self.matches.keys())
-        removed_match_ids = self.previous_match_ids - current_match_ids
+        if METRICS is not None:
+            METRICS.record_stage('parse_match', parse_seconds, items=len(all_matches))
         
-        if removed_match_ids:
-            self._save_removed_matches_to_history(removed_match_ids)
-            logger.info(f"📋 Moved {len(removed_match_ids)} completed matches to history")
+        self.stats['sports'] = len(sport_ids)
         
-        # Update previous match IDs for next collection
-        self.previous_match_ids = current_match_ids.copy()
+        # Step 4: Diff against the previous cycle (fingerprints per match and market)
+        changes = self.apply_cycle(parsed, failed_sports=failed_sports, complete=complete)
+        self.stats['new'] = len(changes['added'])
+        self.stats['updated'] = len(changes['changed'])
+        if changes['removed']:
+            logger.info(f"📋 Moved {len(changes['removed'])} completed matches to history")
         
-        # Save data
-        if self.matches:
+        # Save data only when something a consumer can see changed
+        if self.matches and self._should_write(changes):
             self.save_data()
+        else:
+            self.write_stats['skipped'] += 1
+            logger.info("No odds/score changes - live file left untouched")
         
         # Print summary
         duration = time.time() - start
@@ -693,6 +871,8 @@ class LiveCollector:
         logger.info(f"Live Matches Found:  {self.stats['total']}")
         logger.info(f"New Matches:         {self.stats['new']}")
         logger.info(f"Updated Matches:     {self.stats['updated']}")
+        logger.info(f"Removed Matches:     {len(changes['removed'])}")
+        logger.info(f"File Writes:         {self.write_stats['written']} written, {self.write_stats['skipped']} skipped")
         logger.info(f"Time:                {duration:.2f}s")
         logger.info("="*70)
     
@@ -733,6 +913,8 @@ async def main():
     single_mode = len(sys.argv) > 1 and sys.argv[1] == "--single"
 
     collector = LiveCollector()
+    if METRICS is not None:
+        METRICS.configure('1xbet_live')
     await collector.init()
 
     try:
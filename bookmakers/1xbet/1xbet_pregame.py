@@ -13,14 +13,37 @@ Features:
 import asyncio
 import aiohttp
 import json
+import os
 import zlib
 import base64
 from datetime import datetime
 from typing import Dict, List, Set, Any
 import logging
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 import time
+import sys
+
+# Pipeline stage metrics (project root on path for utils)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+try:
+    from utils.helpers.metrics import REGISTRY as METRICS, timed_stage
+except ImportError:
+    METRICS = None
+    def timed_stage(stage):
+        return lambda func: func
+
+try:
+    from utils.helpers.payload_codec import PayloadDecoder
+    PAYLOAD_CODEC_AVAILABLE = True
+except ImportError:
+    PAYLOAD_CODEC_AVAILABLE = False
+
+try:
+    from utils.helpers.odds_model import quotes_from_xbet, pack_quotes
+    ODDS_MODEL_AVAILABLE = True
+except ImportError:
+    ODDS_MODEL_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(
@@ -57,11 +80,12 @@ class Match:
     start_time: int
     country: str
     country_id: int
-    odds_data: str  # JSON string of all odds
+    odds_data: Dict  # Raw odds by 'group_type' key: {'1_1': {'coefficient', 'american_odds', 'param'}}
     last_updated: int
     
     def to_dict(self):
-        return asdict(self)
+        # Shallow: asdict() would deep-copy odds_data, which parse_match builds fresh per match
+        return dict(vars(self))
 
 
 class JsonDataManager:
@@ -95,6 +119,7 @@ class JsonDataManager:
         except (FileNotFoundError, json.JSONDecodeError):
             return {}
     
+    @timed_stage('save_json')
     def _save_json(self, file_path: Path, data: dict):
         """Save data to JSON file with atomic write"""
         import tempfile
@@ -281,7 +306,8 @@ class JsonDataManager:
         now = int(time.time())
         match_dict['last_updated'] = now
 
-        # Parse odds_data from JSON string to object and convert to readable format
+        # Convert raw odds to readable format (JSON strings come from older Match objects)
+        raw_odds = {}
         if isinstance(match_dict.get('odds_data'), str):
             try:
                 raw_odds = json.loads(match_dict['odds_data'])
@@ -289,7 +315,12 @@ class JsonDataManager:
             except json.JSONDecodeError:
                 match_dict['odds_data'] = {}
         elif isinstance(match_dict.get('odds_data'), dict):
-            match_dict['odds_data'] = self._convert_odds_to_readable(match_dict['odds_data'])
+            raw_odds = match_dict['odds_data']
+            match_dict['odds_data'] = self._convert_odds_to_readable(raw_odds)
+
+        # Typed quotes from the raw numbers, so the collector never parses the readable strings
+        if ODDS_MODEL_AVAILABLE:
+            match_dict['quotes'] = pack_quotes(quotes_from_xbet(raw_odds))
 
         # Convert start_time from Unix timestamp to readable date/time format like bet365
         if isinstance(match_dict.get('start_time'), (int, float)):
@@ -471,6 +502,19 @@ class XBetCollector:
         self.db = JsonDataManager()
         self.session = None
         self.semaphore = asyncio.Semaphore(10)  # Limit to 10 concurrent requests
+
+        # Sniffs each body's codec once and reuses zstd contexts across requests;
+        # XBET_ZSTD_DICT optionally names a trained zstd dictionary file
+        self.decoder = None
+        if PAYLOAD_CODEC_AVAILABLE:
+            zstd_dict = None
+            dict_path = os.environ.get('XBET_ZSTD_DICT')
+            if dict_path:
+                try:
+                    zstd_dict = Path(dict_path).read_bytes()
+                except OSError as e:
+                    logger.warning(f"Could not read zstd dictionary {dict_path}: {e}")
+            self.decoder = PayloadDecoder(zstd_dict=zstd_dict, metrics=METRICS)
         self.current_match_ids = set()  # Track current match IDs for history management
         self.stats = {
             'new_matches': 0,
@@ -517,8 +561,19 @@ class XBetCollector:
         if self.session:
             await self.session.close()
     
+    @timed_stage('decompress_response')
     def decompress_response(self, data: bytes) -> Dict:
         """Decompress VZip response with support for gzip, zstd, and zlib"""
+        if self.decoder is not None:
+            try:
+                return self.decoder.decode_json(data)
+            except Exception as e:
+                logger.error(f"Decompression error: {e}")
+                return {}
+        return self._decompress_response_fallback(data)
+
+    def _decompress_response_fallback(self, data: bytes) -> Dict:
+        """Trial-and-error decoding, used when utils.helpers.payload_codec is unavailable"""
         try:
             logger.debug(f"Decompressing data, length: {len(data)}")
             
@@ -569,6 +624,7 @@ class XBetCollector:
             logger.error(f"Decompression error: {e}")
             return {}
     
+    @timed_stage('fetch')
     async def fetch_sports_list(self) -> List[Dict]:
         """Fetch list of all available sports with pregame matches"""
         async with self.semaphore:
@@ -604,6 +660,7 @@ class XBetCollector:
             
             return []
     
+    @timed_stage('fetch')
     async def fetch_sport_data(self, sport_id: int) -> Dict:
         """Fetch all pregame matches for a specific sport"""
         async with self.semaphore:
@@ -662,10 +719,11 @@ class XBetCollector:
             start_time=match_data.get('S', 0),
             country=match_data.get('CN', ''),
             country_id=match_data.get('COI', 0),
-            odds_data=json.dumps(odds),
+            odds_data=odds,
             last_updated=int(time.time())
         )
     
+    @timed_stage('collection_cycle')
     async def collect_all_sports(self):
         """Collect pregame data from all available sports"""
         start_time = time.time()
@@ -766,10 +824,13 @@ class XBetCollector:
             'count': match_count
         }
 
-        # Process each match
+        # Process each match (parse time is recorded per sport batch, not per call)
+        parse_seconds = 0.0
         for match_data in matches:
             try:
+                parse_start = time.perf_counter()
                 match = self.parse_match(match_data, sport_id, sport_name)
+                parse_seconds += time.perf_counter() - parse_start
 
                 # Track current match ID for history management
                 self.current_match_ids.add(match.match_id)
@@ -799,6 +860,9 @@ class XBetCollector:
 
             except Exception as e:
                 logger.error(f"Error processing match: {e}")
+        
+        if METRICS is not None:
+            METRICS.record_stage('parse_match', parse_seconds, items=match_count)
     
     def print_summary(self):
         """Print collection summary"""
@@ -811,6 +875,11 @@ class XBetCollector:
         logger.info(f"New Matches:         {self.stats['new_matches']}")
         logger.info(f"Updated Matches:     {self.stats['updated_matches']}")
         logger.info(f"Collection Time:     {self.stats['collection_time']:.2f} seconds")
+        if self.decoder is not None:
+            for codec, entry in self.decoder.summary().items():
+                logger.info(f"Decoded {codec:<8}     {entry['count']} bodies, "
+                            f"{entry['bytes_in'] / 1e6:.2f} MB -> {entry['bytes_out'] / 1e6:.2f} MB "
+                            f"in {entry['seconds']:.2f}s ({entry['errors']} errors)")
         logger.info("=" * 70)
     
     async def monitor_realtime(self, interval_seconds: int = 30):
@@ -839,6 +908,8 @@ async def main():
     monitor_mode = len(sys.argv) > 1 and sys.argv[1] == "--monitor"
     
     collector = XBetCollector()
+    if METRICS is not None:
+        METRICS.configure('1xbet_pregame')
     
     try:
         await collector.init_session()
@@ -11,11 +11,11 @@ import asyncio
 import json
 import logging
 import os
-import re
 import subprocess
 import time
 import psutil
 import argparse
+import sys
 from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
@@ -35,6 +35,26 @@ except ImportError:
         pass
     print("Warning: Dashboard not available. Install FastAPI and uvicorn for live UI support.")
 
+# Odds movement time-series store (project root on path for utils)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from utils.helpers.team_name_index import load_team_name_index
+try:
+    from utils.helpers.odds_timeseries import OddsTimeSeriesStore, make_match_key, load_team_canonicalizer, ticks_from_markets
+    TIMESERIES_AVAILABLE = True
+except ImportError:
+    TIMESERIES_AVAILABLE = False
+try:
+    from utils.helpers.match_journal import MatchJournal
+    JOURNAL_AVAILABLE = True
+except ImportError:
+    JOURNAL_AVAILABLE = False
+try:
+    from utils.helpers.metrics import REGISTRY as METRICS, timed_stage
+except ImportError:
+    METRICS = None
+    def timed_stage(stage):
+        return lambda func: func
+
 class UltimateLiveScraper:
     """
     Advanced live betting data scraper for bet365.ca with comprehensive sport support.
@@ -82,7 +102,8 @@ class UltimateLiveScraper:
         # File paths - save to parent folder with clear bet365 naming
         parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "."))
         self.current_data_file = os.path.join(parent_dir, "bet365_live_current.json")
-        self.history_data_file = os.path.join(parent_dir, "bet365_live_history.json")
+        self.history_data_file = os.path.join(parent_dir, "bet365_live_history.json")  # legacy, imported once
+        self.history_journal_file = os.path.join(parent_dir, "bet365_live_history.jsonl")
         self.statistics_file = os.path.join(parent_dir, "bet365_live_statistics.json")
 
         self.setup_logging()
@@ -102,7 +123,20 @@ class UltimateLiveScraper:
         self.selector_database = self.load_selector_database()
         self.current_matches = {}
         self.match_history = self.load_match_history()
+        self.session_stats = {'total_completed': 0}
         self.data_changes_log = []
+
+        # Line-movement history (every price change, not just finished matches)
+        self.odds_series = None
+        if TIMESERIES_AVAILABLE:
+            try:
+                self.odds_series = OddsTimeSeriesStore()
+                self.series_team_name = load_team_canonicalizer()
+                self.odds_series.prime('bet365')
+                self.odds_series.start()
+            except Exception as e:
+                self.logger.warning("Odds time-series store unavailable: %s", e)
+                self.odds_series = None
         
         # Session tracking
         self.session_start_time = datetime.now().isoformat()
@@ -142,15 +176,14 @@ class UltimateLiveScraper:
     def load_hierarchical_cache(self):
         """Load hierarchical cache for team name normalization with O(1) indices"""
         self.hierarchical_cache = {}
+        self.team_index = None
         self.nickname_index = {}  # O(1) lookup by nickname
         self.sport_team_index = {}  # O(1) lookup by sport -> teams
         
         try:
-            cache_file = Path("cache_data.json")
-            if cache_file.exists():
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.hierarchical_cache = data.get('alias_lookup', {})
+            self.team_index = load_team_name_index(Path("cache_data.json"))
+            if self.team_index is not None:
+                self.hierarchical_cache = self.team_index.alias_lookup
                 
                 # Build O(1) lookup indices
                 self._build_lookup_indices()
@@ -162,130 +195,17 @@ class UltimateLiveScraper:
             self.logger.warning(f"Could not load hierarchical cache: {e}")
     
     def _build_lookup_indices(self):
-        """Build O(1) lookup indices for fast team name normalization"""
-        for alias, path in self.hierarchical_cache.items():
-            # Build nickname index (last word of alias)
-            words = alias.split()
-            if len(words) >= 2 and path.get('team'):
-                nickname = words[-1]
-                if nickname not in self.nickname_index:
-                    self.nickname_index[nickname] = []
-                self.nickname_index[nickname].append((alias, path))
-            
-            # Build sport/league index
-            team = path.get('team')
-            if team:
-                sport = path.get('sport', '')
-                league = path.get('league', '')
-                
-                # Index by sport
-                if sport:
-                    if sport not in self.sport_team_index:
-                        self.sport_team_index[sport] = {}
-                    canonical = path.get('canonical_name')
-                    if canonical:
-                        self.sport_team_index[sport][alias] = canonical
-                
-                # Index by league
-                if league:
-                    if league not in self.sport_team_index:
-                        self.sport_team_index[league] = {}
-                    canonical = path.get('canonical_name')
-                    if canonical:
-                        self.sport_team_index[league][alias] = canonical
+        """Expose the shared index's lookup tables (built once per process)"""
+        self.nickname_index = self.team_index.nickname_index
+        self.sport_team_index = self.team_index.sport_team_index
         
         self.logger.info(f"Built lookup indices: {len(self.nickname_index)} nicknames, {len(self.sport_team_index)} sports/leagues")
     
     def normalize_team_name(self, team_name: str, sport: Optional[str] = None) -> str:
-        """Normalize team name using hierarchical cache with O(1) lookups"""
-        if not team_name or not self.hierarchical_cache:
+        """Normalize team name using the shared hierarchical-cache index (see utils/helpers/team_name_index.py)"""
+        if not team_name or self.team_index is None:
             return team_name
-
-        team_lower = team_name.lower().strip()
-        
-        # Remove common punctuation and extra spaces
-        team_cleaned = re.sub(r'[^\w\s]', '', team_lower)
-        team_cleaned = re.sub(r'\s+', ' ', team_cleaned).strip()
-
-        # Stage 1: Direct exact match - O(1)
-        if team_lower in self.hierarchical_cache:
-            path = self.hierarchical_cache[team_lower]
-            canonical = path.get('canonical_name')
-            if canonical:
-                return canonical
-        
-        # Stage 2: Try cleaned version - O(1)
-        if team_cleaned != team_lower and team_cleaned in self.hierarchical_cache:
-            path = self.hierarchical_cache[team_cleaned]
-            canonical = path.get('canonical_name')
-            if canonical:
-                return canonical
-
-        # Stage 3: Try without spaces - O(1)
-        team_no_space = team_cleaned.replace(' ', '')
-        if team_no_space != team_cleaned and team_no_space in self.hierarchical_cache:
-            path = self.hierarchical_cache[team_no_space]
-            canonical = path.get('canonical_name')
-            if canonical:
-                return canonical
-
-        # Stage 4: Nickname matching using pre-built index - O(1)
-        words = team_cleaned.split()
-        if len(words) >= 2:
-            nickname = words[-1]
-            
-            # O(1) lookup in nickname index
-            if nickname in self.nickname_index:
-                candidates = self.nickname_index[nickname]
-                
-                # Check sport match if provided
-                for alias, path in candidates:
-                    if sport:
-                        cache_sport = path.get('sport', '')
-                        cache_league = path.get('league', '')
-                        # Match either sport or league
-                        if cache_sport and sport.upper() == cache_sport.upper():
-                            return path.get('canonical_name')
-                        if cache_league and sport.upper() == cache_league.upper():
-                            return path.get('canonical_name')
-                    else:
-                        # No sport filter, return first match
-                        return path.get('canonical_name')
-
-        # Stage 5: Sport-specific lookup - O(1)
-        if sport:
-            # Check if sport has an index
-            sport_index = self.sport_team_index.get(sport, {})
-            
-            # Try various formats
-            for variant in [team_lower, team_cleaned, team_no_space]:
-                if variant in sport_index:
-                    return sport_index[variant]
-            
-            # Try with nickname if available
-            if len(words) >= 2:
-                nickname = words[-1]
-                # Look for any alias ending with this nickname in this sport
-                for alias, canonical in sport_index.items():
-                    if alias.endswith(nickname):
-                        return canonical
-
-        # Stage 6: Fallback - Check if any word matches (still faster than full iteration)
-        # Only do this for very short lookups to avoid performance issues
-        if len(team_words := team_cleaned.split()) <= 3:
-            # Try combining words in different ways
-            for i in range(len(team_words)):
-                for j in range(i + 1, len(team_words) + 1):
-                    subset = ' '.join(team_words[i:j])
-                    if subset in self.hierarchical_cache:
-                        path = self.hierarchical_cache[subset]
-                        if path.get('team'):  # Only return if it's a team
-                            canonical = path.get('canonical_name')
-                            if canonical:
-                                return canonical
-
-        # Return original if no match found
-        return team_name
+        return self.team_index.normalize(team_name, sport)
 
     def load_selector_database(self):
         """Load the detailed selector database - disabled to avoid extra files"""
@@ -314,6 +234,46 @@ class UltimateLiveScraper:
         pass
 
     def load_match_history(self):
+        """
+        Open the append-only match history journal
+
+        The legacy single-document history file is imported into a new journal
+        once. Without the journal module the legacy file is used as before.
+        """
+        if JOURNAL_AVAILABLE:
+            try:
+                is_new = not os.path.exists(self.history_journal_file)
+                journal = MatchJournal(self.history_journal_file, metrics=METRICS)
+                if is_new and os.path.exists(self.history_data_file):
+                    self._import_legacy_history(journal)
+                self.logger.info("Opened match history journal with %d completed matches",
+                                 journal.completed_count())
+                return journal
+            except Exception as e:
+                self.logger.warning("Match history journal unavailable, using %s: %s", self.history_data_file, e)
+        return self._load_legacy_history()
+
+    def _import_legacy_history(self, journal):
+        """Copy completed matches from the old bet365_live_history.json into the journal"""
+        try:
+            with open(self.history_data_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            self.logger.debug("Legacy history not imported: %s", e)
+            return
+        for match_key, match in data.get('completed_matches', {}).items():
+            completed_at = match.get('completed_at')
+            try:
+                timestamp = datetime.fromisoformat(completed_at).timestamp() if completed_at else None
+            except ValueError:
+                timestamp = None
+            journal.append(match_key, 'completed', match, timestamp)
+        journal.flush()
+        journal.save_index()
+        self.logger.info("Imported %d completed matches from %s",
+                         len(data.get('completed_matches', {})), self.history_data_file)
+
+    def _load_legacy_history(self):
         """Load match history data"""
         try:
             if os.path.exists(self.history_data_file):
@@ -409,9 +369,36 @@ class UltimateLiveScraper:
             if match_key not in current_keys:
                 changes['removed'].append(match)
 
+        self.record_odds_movement(new_matches, changes['removed'])
+
         self.current_matches = new_match_dict
         return changes
 
+    def _series_key(self, match):
+        teams = match.get('teams', {})
+        if not isinstance(teams, dict):
+            return None
+        return make_match_key(match.get('sport'), teams.get('home'), teams.get('away'), self.series_team_name)
+
+    def record_odds_movement(self, matches, removed=()):
+        """Feed price changes into the odds time-series store (unchanged prices are skipped there)"""
+        if self.odds_series is None:
+            return
+        now = time.time()
+        changed = 0
+        for match in matches:
+            if isinstance(match, dict):
+                key = self._series_key(match)
+                if key:
+                    changed += self.odds_series.record_match(key, 'bet365', ticks_from_markets(match.get('markets')), now)
+        for match in removed:
+            if isinstance(match, dict):
+                key = self._series_key(match)
+                if key:
+                    self.odds_series.forget(key)
+        if changed:
+            self.logger.debug("Recorded %d price changes", changed)
+
     def compare_match_data(self, old_match, new_match):
         """Compare two match data objects and return list of changes"""
         changes = []
@@ -445,12 +432,16 @@ class UltimateLiveScraper:
         """Process detected data changes and update history"""
         timestamp = datetime.now().isoformat()
 
+        journal = self.match_history if not isinstance(self.match_history, dict) else None
+
         for match in changes['new']:
             if isinstance(match, dict):
                 # Normalize team names before storing
                 self._normalize_match_teams(match)
                 match_key = self.generate_match_key(match)
                 self.current_matches[match_key] = match
+                if journal is not None:
+                    journal.record_new(match_key, match)
 
         for update in changes['updated']:
             match_key = update['match_key']
@@ -459,6 +450,9 @@ class UltimateLiveScraper:
                 self._normalize_match_teams(update['new_data'])
                 self.current_matches[match_key].update(update['new_data'])
                 self.current_matches[match_key]['last_updated'] = timestamp
+                # Clock ticks alone are not history; the next real change carries the time
+                if journal is not None and set(update['changes']) - {'time'}:
+                    journal.record_update(match_key, self.current_matches[match_key], update['changes'])
 
         for match in changes['removed']:
             match_key = self.generate_match_key(match)
@@ -466,11 +460,19 @@ class UltimateLiveScraper:
                 del self.current_matches[match_key]
 
             match['completed_at'] = timestamp
-            self.match_history['completed_matches'][match_key] = match
-            self.match_history['session_stats']['total_completed'] += 1
+            self.session_stats['total_completed'] += 1
+            if journal is not None:
+                journal.record_completed(match_key, match)
+            else:
+                self.match_history['completed_matches'][match_key] = match
+                self.match_history['session_stats']['total_completed'] += 1
 
         self.save_current_data()
-        self.save_match_history(self.match_history)
+        if journal is not None:
+            # One appended line per change; no rewrite of the accumulated history
+            journal.flush()
+        elif changes['removed']:
+            self.save_match_history(self.match_history)
     
     def _normalize_match_teams(self, match: Dict):
         """Normalize team names in a match dictionary in-place"""
@@ -492,6 +494,7 @@ class UltimateLiveScraper:
                 teams['team1'] = self.normalize_team_name(teams['team1'], sport)
             if 'team2' in teams and teams['team2']:
                 teams['team2'] = self.normalize_team_name(teams['team2'], sport)
+    @timed_stage('save_current_data')
     def save_current_data(self):
         """Save current live matches data"""
         try:
@@ -674,6 +677,7 @@ class UltimateLiveScraper:
         except Exception as e:
             self.logger.error(f"Error during cleanup: {e}")
 
+    @timed_stage('extract_live_betting_data')
     async def extract_live_betting_data(self, page, sport_code='B1'):
         """Extract live betting data using comprehensive extraction script"""
 
@@ -796,6 +800,7 @@ class UltimateLiveScraper:
 
         return result
 
+    @timed_stage('save_live_results')
     def save_live_results(self, results: Dict):
         """Save live extraction results to JSON file"""
         # Use processed matches from self.current_matches instead of raw results
@@ -923,6 +928,10 @@ class UltimateLiveScraper:
 
         finally:
             await self.cleanup_isolated_browser()
+            if self.odds_series is not None:
+                self.odds_series.close()
+            if not isinstance(self.match_history, dict):
+                self.match_history.close()
 
     async def launch_manual_browser(self, browser_type='chrome'):
         """Guide user through manual browser setup"""
@@ -1187,6 +1196,8 @@ async def main():
 
     args = parser.parse_args()
 
+    if METRICS is not None:
+        METRICS.configure('bet365_live')
     scraper = UltimateLiveScraper()
 
     sport_codes = None
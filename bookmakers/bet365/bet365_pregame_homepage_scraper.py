@@ -26,6 +26,21 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple, Set
 from patchright.async_api import async_playwright
 
+# Pipeline stage metrics (project root on path for utils)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+try:
+    from utils.helpers.metrics import REGISTRY as METRICS, timed_stage
+except ImportError:
+    METRICS = None
+    def timed_stage(stage):
+        return lambda func: func
+
+# In-page extraction scripts, installed once per page and called by name
+sys.path.insert(0, str(Path(__file__).parent))
+from utils.helpers.page_scripts import PageScriptRegistry
+from utils.helpers.team_name_index import load_team_name_index
+from bet365_pregame_scripts import NAMESPACE as SCRIPT_NAMESPACE, HELPERS as SCRIPT_HELPERS, EXTRACTORS, SECTION_CONFIGS
+
 
 # ----------------------------- Data Structures ----------------------------- #
 
@@ -86,7 +101,8 @@ class Game:
 # ----------------------------- Enhanced Scraper Class ----------------------------- #
 
 class EnhancedIntelligentScraper:
-    def __init__(self, headless: bool = True, load_wait: int = 2000, max_scrolls: int = 15, scroll_pause: int = 300, email: str = None, password: str = None):
+    def __init__(self, headless: bool = True, load_wait: int = 2000, max_scrolls: int = 15, scroll_pause: int = 300, email: str = None, password: str = None,
+                 script_mode: str = 'library'):
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.headless = headless
         self.load_wait = load_wait
@@ -98,6 +114,10 @@ class EnhancedIntelligentScraper:
         self.password = password
         self.setup_logging()
         
+        # Extraction scripts: 'library' installs them once per page, 'inline' sends the source every call
+        self.scripts = PageScriptRegistry(SCRIPT_NAMESPACE, SCRIPT_HELPERS, EXTRACTORS,
+                                          mode=script_mode, metrics=METRICS)
+        
         # Enhanced sport detection patterns
         self.sport_patterns = {
             "MLB": {
@@ -282,14 +302,13 @@ class EnhancedIntelligentScraper:
 
         # Load hierarchical cache for team name normalization
         self.hierarchical_cache = {}
+        self.team_index = None
         self.nickname_index = {}  # O(1) lookup by nickname
         self.sport_team_index = {}  # O(1) lookup by sport -> teams
         try:
-            cache_file = Path("cache_data.json")
-            if cache_file.exists():
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.hierarchical_cache = data.get('alias_lookup', {})
+            self.team_index = load_team_name_index(Path("cache_data.json"))
+            if self.team_index is not None:
+                self.hierarchical_cache = self.team_index.alias_lookup
                 
                 # Build O(1) lookup indices
                 self._build_lookup_indices()
@@ -301,40 +320,9 @@ class EnhancedIntelligentScraper:
             self.logger.warning(f"Could not load hierarchical cache: {e}")
     
     def _build_lookup_indices(self):
-        """Build O(1) lookup indices for fast team name normalization"""
-        self.nickname_index = {}  # nickname -> list of (alias, path)
-        self.sport_team_index = {}  # sport -> list of team canonical names
-        
-        for alias, path in self.hierarchical_cache.items():
-            # Build nickname index (last word of alias)
-            words = alias.split()
-            if len(words) >= 2 and path.get('team'):
-                nickname = words[-1]
-                if nickname not in self.nickname_index:
-                    self.nickname_index[nickname] = []
-                self.nickname_index[nickname].append((alias, path))
-            
-            # Build sport/league index
-            team = path.get('team')
-            if team:
-                sport = path.get('sport', '')
-                league = path.get('league', '')
-                
-                # Index by sport
-                if sport:
-                    if sport not in self.sport_team_index:
-                        self.sport_team_index[sport] = {}
-                    canonical = path.get('canonical_name')
-                    if canonical:
-                        self.sport_team_index[sport][alias] = canonical
-                
-                # Index by league
-                if league:
-                    if league not in self.sport_team_index:
-                        self.sport_team_index[league] = {}
-                    canonical = path.get('canonical_name')
-                    if canonical:
-                        self.sport_team_index[league][alias] = canonical
+        """Expose the shared index's lookup tables (built once per process)"""
+        self.nickname_index = self.team_index.nickname_index
+        self.sport_team_index = self.team_index.sport_team_index
         
         self.logger.info(f"Built lookup indices: {len(self.nickname_index)} nicknames, {len(self.sport_team_index)} sports/leagues")
     
@@ -478,95 +466,10 @@ class EnhancedIntelligentScraper:
         return False
 
     def normalize_team_name(self, team_name: str, sport: Optional[str] = None) -> str:
-        """Normalize team name using hierarchical cache with O(1) lookups"""
-        if not team_name or not self.hierarchical_cache:
+        """Normalize team name using the shared hierarchical-cache index (see utils/helpers/team_name_index.py)"""
+        if not team_name or self.team_index is None:
             return team_name
-
-        team_lower = team_name.lower().strip()
-        
-        # Remove common punctuation and extra spaces
-        team_cleaned = re.sub(r'[^\w\s]', '', team_lower)
-        team_cleaned = re.sub(r'\s+', ' ', team_cleaned).strip()
-
-        # Stage 1: Direct exact match - O(1)
-        if team_lower in self.hierarchical_cache:
-            path = self.hierarchical_cache[team_lower]
-            canonical = path.get('canonical_name')
-            if canonical:
-                return canonical
-        
-        # Stage 2: Try cleaned version - O(1)
-        if team_cleaned != team_lower and team_cleaned in self.hierarchical_cache:
-            path = self.hierarchical_cache[team_cleaned]
-            canonical = path.get('canonical_name')
-            if canonical:
-                return canonical
-
-        # Stage 3: Try without spaces - O(1)
-        team_no_space = team_cleaned.replace(' ', '')
-        if team_no_space != team_cleaned and team_no_space in self.hierarchical_cache:
-            path = self.hierarchical_cache[team_no_space]
-            canonical = path.get('canonical_name')
-            if canonical:
-                return canonical
-
-        # Stage 4: Nickname matching using pre-built index - O(1)
-        words = team_cleaned.split()
-        if len(words) >= 2:
-            nickname = words[-1]
-            
-            # O(1) lookup in nickname index
-            if nickname in self.nickname_index:
-                candidates = self.nickname_index[nickname]
-                
-                # Check sport match if provided
-                for alias, path in candidates:
-                    if sport:
-                        cache_sport = path.get('sport', '')
-                        cache_league = path.get('league', '')
-                        # Match either sport or league
-                        if cache_sport and sport.upper() == cache_sport.upper():
-                            return path.get('canonical_name')
-                        if cache_league and sport.upper() == cache_league.upper():
-                            return path.get('canonical_name')
-                    else:
-                        # No sport filter, return first match
-                        return path.get('canonical_name')
-
-        # Stage 5: Sport-specific lookup - O(1)
-        if sport:
-            # Check if sport has an index
-            sport_index = self.sport_team_index.get(sport, {})
-            
-            # Try various formats
-            for variant in [team_lower, team_cleaned, team_no_space]:
-                if variant in sport_index:
-                    return sport_index[variant]
-            
-            # Try with nickname if available
-            if len(words) >= 2:
-                nickname = words[-1]
-                # Look for any alias ending with this nickname in this sport
-                for alias, canonical in sport_index.items():
-                    if alias.endswith(nickname):
-                        return canonical
-
-        # Stage 6: Fallback - Check if any word matches (still faster than full iteration)
-        # Only do this for very short lookups to avoid performance issues
-        if len(team_words := team_cleaned.split()) <= 3:
-            # Try combining words in different ways
-            for i in range(len(team_words)):
-                for j in range(i + 1, len(team_words) + 1):
-                    subset = ' '.join(team_words[i:j])
-                    if subset in self.hierarchical_cache:
-                        path = self.hierarchical_cache[subset]
-                        if path.get('team'):  # Only return if it's a team
-                            canonical = path.get('canonical_name')
-                            if canonical:
-                                return canonical
-
-        # Return original if no match found
-        return team_name
+        return self.team_index.normalize(team_name, sport)
 
     def normalize_game_teams(self, game: Game) -> Game:
         """Normalize both team names in a game using hierarchical cache"""
@@ -841,6 +744,7 @@ class EnhancedIntelligentScraper:
 
     # ----------------------------- Enhanced Extraction Engine ----------------------------- #
 
+    @timed_stage('extract_sport_games')
     async def extract_sport_games(self, page, sport: str) -> List[Game]:
         """Enhanced sport-specific game extraction"""
         self.logger.info(f"Starting extraction for {sport}")
@@ -910,101 +814,7 @@ class EnhancedIntelligentScraper:
         
         try:
             # Execute specialized JavaScript for MLB
-            extraction_result = await grid.evaluate("""
-                (grid) => {
-                    const results = [];
-                    const fixtures = Array.from(grid.querySelectorAll('div.cpm-MarketFixture'));
-                    
-                    for (const fixture of fixtures) {
-                        // Find visible baseball fixture details
-                        const details = Array.from(fixture.querySelectorAll('div[class*="cpm-ParticipantFixtureDetailsBaseball"], div[class*="cpm-ParticipantFixtureDetails120"]'))
-                            .find(d => !d.className.includes('Hidden'));
-                        
-                        if (!details) continue;
-                        
-                        // Extract teams from team containers
-                        const teamContainers = Array.from(details.querySelectorAll('div[class*="_TeamContainer"]'));
-                        const teamNodes = [];
-                        
-                        for (const container of teamContainers) {
-                            const teamEl = container.querySelector('div[class*="_Team"]');
-                            if (teamEl) {
-                                const teamText = teamEl.textContent.trim();
-                                if (teamText && teamText.length > 1) {
-                                    teamNodes.push(teamText);
-                                }
-                            }
-                        }
-                        
-                        if (teamNodes.length < 2) continue;
-                        
-                        // Extract time
-                        const timeEl = details.querySelector('div[class*="_BookCloses"]');
-                        const gameTime = timeEl ? timeEl.textContent.trim() : null;
-                        
-                        // Extract date
-                        const dateEl = fixture.querySelector('div.cpm-MarketFixtureDateHeader');
-                        const gameDate = dateEl ? dateEl.textContent.trim() : null;
-                        
-                        // Extract odds from sibling elements
-                        const odds = {};
-                        let sibling = fixture.nextElementSibling;
-                        
-                        while (sibling && !sibling.className.includes('cpm-MarketFixture')) {
-                            if (sibling.className.includes('cpm-MarketOdds')) {
-                                const header = sibling.querySelector('.cpm-MarketOddsHeader');
-                                const headerText = header ? header.textContent.trim().toLowerCase() : '';
-                                
-                                let category = null;
-                                if (headerText.includes('run line') || headerText.includes('runline')) {
-                                    category = 'runline';
-                                } else if (headerText === 'money' || headerText.includes('moneyline')) {
-                                    category = 'moneyline';
-                                } else if (headerText.includes('total')) {
-                                    category = 'total';
-                                }
-                                
-                                if (category) {
-                                    const oddsElements = Array.from(sibling.querySelectorAll('.cpm-ParticipantOdds'));
-                                    const oddsValues = [];
-                                    
-                                    for (const el of oddsElements) {
-                                        const handicap = el.querySelector('.cpm-ParticipantOdds_Handicap');
-                                        const price = el.querySelector('.cpm-ParticipantOdds_Odds');
-                                        
-                                        const hText = handicap ? handicap.textContent.trim() : '';
-                                        const pText = price ? price.textContent.trim() : '';
-                                        
-                                        if (pText && /^[+-]\\d{2,4}$/.test(pText)) {
-                                            if (hText && category !== 'moneyline') {
-                                                oddsValues.push(`${hText} (${pText})`);
-                                            } else {
-                                                oddsValues.push(pText);
-                                            }
-                                        }
-                                    }
-                                    
-                                    if (oddsValues.length > 0) {
-                                        odds[category] = oddsValues.slice(0, 2);
-                                    }
-                                }
-                            }
-                            sibling = sibling.nextElementSibling;
-                        }
-                        
-                        results.push({
-                            team1: teamNodes[0],
-                            team2: teamNodes[1], 
-                            time: gameTime,
-                            date: gameDate,
-                            odds: odds,
-                            fixture_id: `mlb_${results.length}`
-                        });
-                    }
-                    
-                    return results;
-                }
-            """)
+            extraction_result = await self.scripts.run(grid, 'mlb', label=sport)
             
             # Process results
             for idx, result in enumerate(extraction_result):
@@ -1049,191 +859,7 @@ class EnhancedIntelligentScraper:
             self.logger.info("🏀 Starting NBA extraction with proper NBA vs NBA2K detection...")
             
             # NBA extraction using section-based detection to avoid NBA2K confusion
-            extraction_result = await page.evaluate("""
-                () => {
-                    const results = [];
-                    
-                    console.log('🔍 Looking for NBA section by SVG logo...');
-                    
-                    // Step 1: Find REAL NBA section by NBA logo (not eSports logo)
-                    let nbaSection = null;
-                    
-                    // Look for NBA section by NBA-specific SVG logo
-                    const nbaLogos = document.querySelectorAll('.nba-NBALeagueLogo, .nba-NBALeagueLogo_SVG');
-                    for (const logo of nbaLogos) {
-                        const section = logo.closest('.cpm-CouponPodModule, .ss-HomepageSpotlight');
-                        if (section) {
-                            // Verify this is NOT eSports by checking for eSports indicators
-                            const sectionHTML = section.innerHTML;
-                            
-                            // eSports sections have zClass_ESports.svg, NBA has nba-NBALeagueLogo
-                            if (!sectionHTML.includes('zClass_ESports.svg') && sectionHTML.includes('nba-NBALeagueLogo')) {
-                                nbaSection = section;
-                                console.log('✅ Found REAL NBA section (not eSports)');
-                                break;
-                            }
-                        }
-                    }
-                    
-                    // Fallback: Look for NBA title with NBA logo wrapper
-                    if (!nbaSection) {
-                        const headers = document.querySelectorAll('.cpm-Header_Title, .ss-HomeSpotlightHeader_Title');
-                        for (const header of headers) {
-                            if (header.textContent.trim() === 'NBA') {
-                                const section = header.closest('.cpm-CouponPodModule, .ss-HomepageSpotlight');
-                                if (section) {
-                                    const sectionHTML = section.innerHTML;
-                                    // Double check it's not eSports
-                                    if (!sectionHTML.includes('zClass_ESports.svg')) {
-                                        nbaSection = section;
-                                        console.log('✅ Found NBA section by title (verified not eSports)');
-                                        break;
-                                    }
-                                }
-                            }
-                        }
-                    }
-                    
-                    if (!nbaSection) {
-                        console.log('❌ REAL NBA section not found (may have found eSports instead)');
-                        return [];
-                    }
-                    
-                    // Step 2: Extract NBA fixtures from verified NBA section only
-                    const fixtures = Array.from(nbaSection.querySelectorAll('div.cpm-ParticipantFixtureDetailsBasketball'))
-                        .filter(fixture => !fixture.className.includes('Hidden'));
-                    
-                    console.log(`📋 Found ${fixtures.length} NBA fixtures in verified NBA section`);
-                    
-                    // Step 3: Extract odds columns from NBA section
-                    const oddsColumns = {};
-                    
-                    const marketOdds = Array.from(nbaSection.querySelectorAll('div.cpm-MarketOdds'));
-                    for (const section of marketOdds) {
-                        const header = section.querySelector('div.cpm-MarketOddsHeader');
-                        if (header) {
-                            const headerText = header.textContent;
-                            if (headerText) {
-                                const headerName = headerText.trim();
-                                if (["Spread", "Total", "Money"].includes(headerName)) {
-                                    const columnOdds = [];
-                                    
-                                    // Enhanced: Get both handicap and odds for Spread/Total, just odds for Money
-                                    const participantOdds = section.querySelectorAll('.cpm-ParticipantOdds');
-                                    for (const participantOdd of participantOdds) {
-                                        const handicap = participantOdd.querySelector('.cpm-ParticipantOdds_Handicap');
-                                        const oddsValue = participantOdd.querySelector('.cpm-ParticipantOdds_Odds');
-                                        
-                                        if (headerName === 'Money') {
-                                            // Moneyline: just the odds value
-                                            if (oddsValue) {
-                                                columnOdds.push(oddsValue.textContent.trim());
-                                            }
-                                        } else {
-                                            // Spread/Total: include handicap + odds (clean format like NCAAF)
-                                            if (handicap && oddsValue) {
-                                                columnOdds.push(`${handicap.textContent.trim()} ${oddsValue.textContent.trim()}`);
-                                            }
-                                        }
-                                    }
-                                    
-                                    oddsColumns[headerName] = columnOdds;
-                                }
-                            }
-                        }
-                    }
-                    
-                    // Extract game date with fallback for pregame
-                    const dateHeader = nbaSection.querySelector('div.cpm-MarketFixtureDateHeader');
-                    let gameDate = dateHeader ? dateHeader.textContent.trim() : null;
-                    
-                    // Fallback to today's date for pregame if no date found
-                    if (!gameDate || gameDate === null) {
-                        const today = new Date();
-                        const options = { weekday: 'short', month: 'short', day: 'numeric' };
-                        gameDate = today.toLocaleDateString('en-US', options);
-                    }
-                    
-                    // Step 4: Process fixtures and validate they're REAL NBA (no gamer tags)
-                    for (let i = 0; i < fixtures.length; i++) {
-                        const fixture = fixtures[i];
-                        
-                        // Extract team names
-                        const teamElems = fixture.querySelectorAll('div.cpm-ParticipantFixtureDetailsBasketball_Team');
-                        
-                        let team1, team2;
-                        if (teamElems.length >= 2) {
-                            team1 = teamElems[0].textContent.trim();
-                            team2 = teamElems[1].textContent.trim();
-                        } else {
-                            // Fallback to team containers
-                            const teamContainers = fixture.querySelectorAll('div.cpm-ParticipantFixtureDetailsBasketball_TeamContainer');
-                            if (teamContainers.length >= 2) {
-                                const t1 = teamContainers[0].querySelector('div.cpm-ParticipantFixtureDetailsBasketball_Team');
-                                const t2 = teamContainers[1].querySelector('div.cpm-ParticipantFixtureDetailsBasketball_Team');
-                                team1 = t1 ? t1.textContent.trim() : '';
-                                team2 = t2 ? t2.textContent.trim() : '';
-                            }
-                        }
-                        
-                        // CRITICAL: Validate this is REAL NBA, not NBA2K eSports
-                        // NBA2K teams have gamer tags in parentheses like "OKC Thunder (JD)"
-                        const nba2kTags = ['(JD)', '(HYPER)', '(CARNAGE)', '(OUTLAW)', '(RIDER)', '(UNBREAKABLE)', '(PRODIGY)', '(SCORCH)', '(DECOY)', '(FENRIR)', '(HAWK)', '(COMBO)', '(GRAVITY)', '(PUNISHER)', '(CRUCIAL)'];
-                        const hasNba2kTag = nba2kTags.some(tag => team1.includes(tag) || team2.includes(tag));
-                        
-                        if (!team1 || !team2 || hasNba2kTag) {
-                            console.log(`❌ Filtered out eSports/invalid team: ${team1} vs ${team2}`);
-                            continue;
-                        }
-                        
-                        console.log(`✅ Valid NBA teams: ${team1} vs ${team2}`);
-                        
-                        // Extract time
-                        const timeElem = fixture.querySelector('div.cpm-ParticipantFixtureDetailsBasketball_BookCloses');
-                        const gameTime = timeElem ? timeElem.textContent.trim() : "TBD";
-                        
-                        // Map odds correctly (each game gets 2 odds per column - team1 and team2)
-                        const spreadOdds = [];
-                        const totalOdds = [];
-                        const moneylineOdds = [];
-                        
-                        const gameIndex = i * 2; // Each game has 2 odds entries
-                        
-                        // Spread odds (2 per game)
-                        if (oddsColumns["Spread"] && oddsColumns["Spread"].length > gameIndex + 1) {
-                            spreadOdds.push(oddsColumns["Spread"][gameIndex]);
-                            spreadOdds.push(oddsColumns["Spread"][gameIndex + 1]);
-                        }
-                        
-                        // Total odds (2 per game)
-                        if (oddsColumns["Total"] && oddsColumns["Total"].length > gameIndex + 1) {
-                            totalOdds.push(oddsColumns["Total"][gameIndex]);
-                            totalOdds.push(oddsColumns["Total"][gameIndex + 1]);
-                        }
-                        
-                        // Money odds (2 per game)
-                        if (oddsColumns["Money"] && oddsColumns["Money"].length > gameIndex + 1) {
-                            moneylineOdds.push(oddsColumns["Money"][gameIndex]);
-                            moneylineOdds.push(oddsColumns["Money"][gameIndex + 1]);
-                        }
-                        
-                        // Create game object
-                        results.push({
-                            team1: team1,
-                            team2: team2,
-                            date: gameDate,
-                            time: gameTime,
-                            spread: spreadOdds,
-                            total: totalOdds,
-                            moneyline: moneylineOdds,
-                            fixture_id: `nba_real_${i}`
-                        });
-                    }
-                    
-                    console.log(`🏀 Total REAL NBA games extracted: ${results.length}`);
-                    return results;
-                }
-            """)
+            extraction_result = await self.scripts.run(page, 'basketball_section', SECTION_CONFIGS['NBA'], label=sport)
             
             # Process results into Game objects
             for result in extraction_result:
@@ -1276,158 +902,7 @@ class EnhancedIntelligentScraper:
             self.logger.info("🏀 Starting NBA2K extraction...")
 
             # NBA2K extraction using direct selectors
-            extraction_result = await page.evaluate("""
-                () => {
-                    const results = [];
-
-                    console.log('🎮 Starting NBA2K extraction...');
-                    
-                    // Step 1: Find NBA2K/eSports section by eSports SVG logo
-                    let nba2kSection = null;
-                    
-                    // Look for eSports logo in header images
-                    const headerImages = document.querySelectorAll('.ss-HomeSpotlightHeader_HeaderImage, .cpm-Header_HeaderImage');
-                    for (const img of headerImages) {
-                        const style = img.getAttribute('style') || '';
-                        if (style.includes('zClass_ESports.svg')) {
-                            nba2kSection = img.closest('.ss-HomepageSpotlight, .cpm-CouponPodModule');
-                            console.log('✅ Found NBA2K/eSports section by eSports SVG');
-                            break;
-                        }
-                    }
-                    
-                    // Fallback: Look for NBA2K title
-                    if (!nba2kSection) {
-                        const headers = document.querySelectorAll('.ss-HomeSpotlightHeader_Title, .cpm-Header_Title');
-                        for (const header of headers) {
-                            if (header.textContent.trim() === 'NBA2K') {
-                                nba2kSection = header.closest('.ss-HomepageSpotlight, .cpm-CouponPodModule');
-                                console.log('✅ Found NBA2K section by title');
-                                break;
-                            }
-                        }
-                    }
-                    
-                    if (!nba2kSection) {
-                        console.log('❌ NBA2K/eSports section not found');
-                        return [];
-                    }
-                    
-                    // Step 2: Extract odds columns data from NBA2K section
-                    const oddsColumns = {};
-
-                    const marketOdds = Array.from(nba2kSection.querySelectorAll('div.cpm-MarketOdds'));
-                    for (const section of marketOdds) {
-                        const header = section.querySelector('div.cpm-MarketOddsHeader');
-                        if (header) {
-                            const headerText = header.textContent;
-                            if (headerText) {
-                                const headerName = headerText.trim();
-                                if (["Spread", "Total", "Money"].includes(headerName)) {
-                                    const columnOdds = [];
-
-                                    // Extract odds elements correctly
-                                    const oddsElems = section.querySelectorAll('span.cpm-ParticipantOdds_Odds');
-                                    for (const oddsElem of oddsElems) {
-                                        const oddsText = oddsElem.textContent;
-                                        if (oddsText && oddsText.trim()) {
-                                            columnOdds.push(oddsText.trim());
-                                        }
-                                    }
-
-                                    oddsColumns[headerName] = columnOdds;
-                                }
-                            }
-                        }
-                    }
-
-                    // Step 3: Process fixtures and map odds correctly
-                    const fixtures = Array.from(nba2kSection.querySelectorAll('div.cpm-ParticipantFixtureDetailsBasketball'))
-                        .filter(fixture => !fixture.className.includes('Hidden'));
-
-                    // Extract game date with fallback for pregame
-                    const dateHeader = nba2kSection.querySelector('div.cpm-MarketFixtureDateHeader');
-                    let gameDate = dateHeader ? dateHeader.textContent.trim() : null;
-                    
-                    // Fallback to today's date for pregame if no date found
-                    if (!gameDate || gameDate === null) {
-                        const today = new Date();
-                        const options = { weekday: 'short', month: 'short', day: 'numeric' };
-                        gameDate = today.toLocaleDateString('en-US', options);
-                    }
-
-                    for (let i = 0; i < fixtures.length; i++) {
-                        const fixture = fixtures[i];
-
-                        // Extract team names (NBA2K has team names with player tags like "JD", "HYPER")
-                        const teamElems = fixture.querySelectorAll('div.cpm-ParticipantFixtureDetailsBasketball_Team');
-
-                        let team1, team2;
-                        if (teamElems.length >= 2) {
-                            team1 = teamElems[0].textContent.trim();
-                            team2 = teamElems[1].textContent.trim();
-                        } else {
-                            // Fallback to team containers
-                            const teamContainers = fixture.querySelectorAll('div.cpm-ParticipantFixtureDetailsBasketball_TeamContainer');
-                            if (teamContainers.length >= 2) {
-                                const t1 = teamContainers[0].querySelector('div.cpm-ParticipantFixtureDetailsBasketball_Team');
-                                const t2 = teamContainers[1].querySelector('div.cpm-ParticipantFixtureDetailsBasketball_Team');
-                                team1 = t1 ? t1.textContent.trim() : '';
-                                team2 = t2 ? t2.textContent.trim() : '';
-                            }
-                        }
-
-                        // Validate NBA2K teams (must contain player tags)
-                        const nba2kTags = ['JD', 'HYPER', 'CARNAGE', 'OUTLAW', 'RIDER', 'UNBREAKABLE', 'PRODIGY', 'SCORCH', 'DECOY', 'FENRIR', 'HAWK'];
-                        const hasNba2kTag = nba2kTags.some(tag => team1.includes(tag) || team2.includes(tag));
-
-                        if (!team1 || !team2 || !hasNba2kTag) continue;
-
-                        // Extract time
-                        const timeElem = fixture.querySelector('div.cpm-ParticipantFixtureDetailsBasketball_BookCloses');
-                        const gameTime = timeElem ? timeElem.textContent.trim() : "TBD";
-
-                        // Map odds correctly (each game gets 2 odds per column - team1 and team2)
-                        const spreadOdds = [];
-                        const totalOdds = [];
-                        const moneylineOdds = [];
-
-                        const gameIndex = i * 2; // Each game has 2 odds entries
-
-                        // Spread odds (2 per game)
-                        if (oddsColumns["Spread"] && oddsColumns["Spread"].length > gameIndex + 1) {
-                            spreadOdds.push(oddsColumns["Spread"][gameIndex]);
-                            spreadOdds.push(oddsColumns["Spread"][gameIndex + 1]);
-                        }
-
-                        // Total odds (2 per game)
-                        if (oddsColumns["Total"] && oddsColumns["Total"].length > gameIndex + 1) {
-                            totalOdds.push(oddsColumns["Total"][gameIndex]);
-                            totalOdds.push(oddsColumns["Total"][gameIndex + 1]);
-                        }
-
-                        // Money odds (2 per game)
-                        if (oddsColumns["Money"] && oddsColumns["Money"].length > gameIndex + 1) {
-                            moneylineOdds.push(oddsColumns["Money"][gameIndex]);
-                            moneylineOdds.push(oddsColumns["Money"][gameIndex + 1]);
-                        }
-
-                        // Create game object
-                        results.push({
-                            team1: team1,
-                            team2: team2,
-                            date: gameDate,
-                            time: gameTime,
-                            spread: spreadOdds,
-                            total: totalOdds,
-                            moneyline: moneylineOdds,
-                            fixture_id: `nba2k_${i}`
-                        });
-                    }
-
-                    return results;
-                }
-            """)
+            extraction_result = await self.scripts.run(page, 'nba2k', label=sport)
 
             # Process results into Game objects
             for result in extraction_result:
@@ -1470,183 +945,7 @@ class EnhancedIntelligentScraper:
             self.logger.info("🏀 Starting NCAAB extraction...")
             
             # NCAAB extraction using spotlight section detection
-            extraction_result = await page.evaluate("""
-                () => {
-                    const results = [];
-                    
-                    console.log('🏀 Looking for NCAAB section by SVG logo...');
-                    
-                    // Step 1: Find NCAAB section by NCAAB logo
-                    let ncaabSection = null;
-                    
-                    // Look for NCAAB section by NCAAB-specific SVG logo
-                    const headerImages = document.querySelectorAll('.ss-HomeSpotlightHeader_HeaderImage, .cpm-Header_HeaderImage');
-                    for (const img of headerImages) {
-                        const style = img.getAttribute('style') || '';
-                        if (style.includes('zlogo_ncaab_official.svg')) {
-                            ncaabSection = img.closest('.ss-HomepageSpotlight, .cpm-CouponPodModule');
-                            console.log('✅ Found NCAAB section by NCAAB logo');
-                            break;
-                        }
-                    }
-                    
-                    // Fallback: Look for NCAAB or College Basketball title
-                    if (!ncaabSection) {
-                        const headers = document.querySelectorAll('.ss-HomeSpotlightHeader_Title, .cpm-Header_Title');
-                        for (const header of headers) {
-                            const titleText = header.textContent.trim();
-                            if (titleText === 'NCAAB' || titleText === 'College Basketball') {
-                                ncaabSection = header.closest('.ss-HomepageSpotlight, .cpm-CouponPodModule');
-                                console.log(`✅ Found NCAAB section by title: ${titleText}`);
-                                break;
-                            }
-                        }
-                    }
-                    
-                    if (!ncaabSection) {
-                        console.log('❌ NCAAB section not found');
-                        return [];
-                    }
-                    
-                    // Step 2: Extract fixtures from NCAAB section only
-                    const fixtures = Array.from(ncaabSection.querySelectorAll('div.cpm-ParticipantFixtureDetailsBasketball'))
-                        .filter(fixture => !fixture.className.includes('Hidden'));
-                    
-                    console.log(`📋 Found ${fixtures.length} NCAAB fixtures in verified NCAAB section`);
-                    
-                    // Step 3: Extract odds columns from NCAAB section
-                    const oddsColumns = {};
-                    
-                    const marketOdds = Array.from(ncaabSection.querySelectorAll('div.cpm-MarketOdds'));
-                    for (const section of marketOdds) {
-                        const header = section.querySelector('div.cpm-MarketOddsHeader');
-                        if (header) {
-                            const headerText = header.textContent;
-                            if (headerText) {
-                                const headerName = headerText.trim();
-                                if (["Spread", "Total", "Money"].includes(headerName)) {
-                                    const columnOdds = [];
-                                    
-                                    // Enhanced: Get both handicap and odds for Spread/Total, just odds for Money
-                                    const participantOdds = section.querySelectorAll('.cpm-ParticipantOdds');
-                                    for (const participantOdd of participantOdds) {
-                                        const handicap = participantOdd.querySelector('.cpm-ParticipantOdds_Handicap');
-                                        const oddsValue = participantOdd.querySelector('.cpm-ParticipantOdds_Odds');
-                                        
-                                        if (headerName === 'Money') {
-                                            // Moneyline: just the odds value
-                                            if (oddsValue) {
-                                                columnOdds.push(oddsValue.textContent.trim());
-                                            }
-                                        } else {
-                                            // Spread/Total: include handicap + odds
-                                            if (handicap && oddsValue) {
-                                                columnOdds.push(`${handicap.textContent.trim()} ${oddsValue.textContent.trim()}`);
-                                            }
-                                        }
-                                    }
-                                    
-                                    oddsColumns[headerName] = columnOdds;
-                                }
-                            }
-                        }
-                    }
-                    
-                    // Extract game date with fallback for pregame
-                    const dateHeader = ncaabSection.querySelector('div.cpm-MarketFixtureDateHeader');
-                    let gameDate = dateHeader ? dateHeader.textContent.trim() : null;
-                    
-                    // Fallback to today's date for pregame if no date found
-                    if (!gameDate || gameDate === null) {
-                        const today = new Date();
-                        const options = { weekday: 'short', month: 'short', day: 'numeric' };
-                        gameDate = today.toLocaleDateString('en-US', options);
-                    }
-                    
-                    // Step 4: Process fixtures and validate they're college basketball teams
-                    for (let i = 0; i < fixtures.length; i++) {
-                        const fixture = fixtures[i];
-                        
-                        // Extract team names
-                        const teamElems = fixture.querySelectorAll('div.cpm-ParticipantFixtureDetailsBasketball_Team');
-                        
-                        let team1, team2;
-                        if (teamElems.length >= 2) {
-                            team1 = teamElems[0].textContent.trim();
-                            team2 = teamElems[1].textContent.trim();
-                        } else {
-                            // Fallback to team containers
-                            const teamContainers = fixture.querySelectorAll('div.cpm-ParticipantFixtureDetailsBasketball_TeamContainer');
-                            if (teamContainers.length >= 2) {
-                                const t1 = teamContainers[0].querySelector('div.cpm-ParticipantFixtureDetailsBasketball_Team');
-                                const t2 = teamContainers[1].querySelector('div.cpm-ParticipantFixtureDetailsBasketball_Team');
-                                team1 = t1 ? t1.textContent.trim() : '';
-                                team2 = t2 ? t2.textContent.trim() : '';
-                            }
-                        }
-                        
-                        // Validate teams (skip if missing or NBA pro teams)
-                        const nbaTeams = ['Lakers', 'Celtics', 'Warriors', 'Heat', 'Bucks', 'Nets', 'Clippers', 'Mavericks', 
-                                         'Nuggets', '76ers', 'Suns', 'Grizzlies', 'Cavaliers', 'Knicks', 'Thunder'];
-                        const hasNBATeam = nbaTeams.some(nba => team1.includes(nba) || team2.includes(nba));
-                        
-                        // Skip NBA2K gamer tags
-                        const nba2kTags = ['(JD)', '(HYPER)', '(CARNAGE)', '(OUTLAW)', '(RIDER)', '(UNBREAKABLE)'];
-                        const hasNba2kTag = nba2kTags.some(tag => team1.includes(tag) || team2.includes(tag));
-                        
-                        if (!team1 || !team2 || hasNBATeam || hasNba2kTag) {
-                            console.log(`❌ Filtered out invalid/NBA team: ${team1} vs ${team2}`);
-                            continue;
-                        }
-                        
-                        console.log(`✅ Valid NCAAB teams: ${team1} vs ${team2}`);
-                        
-                        // Extract time
-                        const timeElem = fixture.querySelector('div.cpm-ParticipantFixtureDetailsBasketball_BookCloses');
-                        const gameTime = timeElem ? timeElem.textContent.trim() : "TBD";
-                        
-                        // Map odds correctly (each game gets 2 odds per column - team1 and team2)
-                        const spreadOdds = [];
-                        const totalOdds = [];
-                        const moneylineOdds = [];
-                        
-                        const gameIndex = i * 2; // Each game has 2 odds entries
-                        
-                        // Spread odds (2 per game)
-                        if (oddsColumns["Spread"] && oddsColumns["Spread"].length > gameIndex + 1) {
-                            spreadOdds.push(oddsColumns["Spread"][gameIndex]);
-                            spreadOdds.push(oddsColumns["Spread"][gameIndex + 1]);
-                        }
-                        
-                        // Total odds (2 per game)
-                        if (oddsColumns["Total"] && oddsColumns["Total"].length > gameIndex + 1) {
-                            totalOdds.push(oddsColumns["Total"][gameIndex]);
-                            totalOdds.push(oddsColumns["Total"][gameIndex + 1]);
-                        }
-                        
-                        // Money odds (2 per game)
-                        if (oddsColumns["Money"] && oddsColumns["Money"].length > gameIndex + 1) {
-                            moneylineOdds.push(oddsColumns["Money"][gameIndex]);
-                            moneylineOdds.push(oddsColumns["Money"][gameIndex + 1]);
-                        }
-                        
-                        // Create game object
-                        results.push({
-                            team1: team1,
-                            team2: team2,
-                            date: gameDate,
-                            time: gameTime,
-                            spread: spreadOdds,
-                            total: totalOdds,
-                            moneyline: moneylineOdds,
-                            fixture_id: `ncaab_${i}`
-                        });
-                    }
-                    
-                    console.log(`🏀 Total NCAAB games extracted: ${results.length}`);
-                    return results;
-                }
-            """)
+            extraction_result = await self.scripts.run(page, 'basketball_section', SECTION_CONFIGS['NCAAB'], label=sport)
             
             # Process results into Game objects
             for result in extraction_result:
@@ -1686,123 +985,7 @@ class EnhancedIntelligentScraper:
         games = []
         
         try:
-            extraction_result = await grid.evaluate("""
-                (grid) => {
-                    const results = [];
-                    
-                    // Find all unique team pairs first
-                    const gameFixtures = Array.from(grid.querySelectorAll('div[class*="cpm-ParticipantFixtureDetailsIceHockey"]'))
-                        .filter(d => !d.className.includes('Hidden'));
-                    
-                    // Extract date with fallback for pregame
-                    const dateEl = grid.querySelector('div.cpm-MarketFixtureDateHeader');
-                    let gameDate = dateEl ? dateEl.textContent.trim() : null;
-                    
-                    // Fallback to today's date for pregame if no date found  
-                    if (!gameDate || gameDate === null) {
-                        const today = new Date();
-                        const options = { weekday: 'short', month: 'short', day: 'numeric' };
-                        gameDate = today.toLocaleDateString('en-US', options);
-                    }
-                    
-                    const seenGames = new Set();
-                    
-                    for (const fixture of gameFixtures) {
-                        // Extract teams
-                        const teamContainers = Array.from(fixture.querySelectorAll('div.cpm-ParticipantFixtureDetailsIceHockey_TeamContainer'));
-                        const teams = [];
-                        
-                        for (const container of teamContainers) {
-                            const teamEl = container.querySelector('div.cpm-ParticipantFixtureDetailsIceHockey_Team');
-                            if (teamEl) {
-                                teams.push(teamEl.textContent.trim());
-                            }
-                        }
-                        
-                        if (teams.length < 2) continue;
-                        
-                        // Create unique game signature to avoid duplicates
-                        const gameSignature = `${teams[0]} vs ${teams[1]}`;
-                        if (seenGames.has(gameSignature)) continue;
-                        seenGames.add(gameSignature);
-                        
-                        // Extract time
-                        const timeEl = fixture.querySelector('div.cpm-ParticipantFixtureDetailsIceHockey_BookCloses');
-                        const gameTime = timeEl ? timeEl.textContent.trim() : null;
-                        
-                        // NHL: Extract spread, total, AND moneyline odds (user wants all three)
-                        const odds = {};
-                        const oddsColumns = Array.from(grid.querySelectorAll('div.cpm-MarketOdds'));
-                        
-                        if (oddsColumns.length > 0) {
-                            // Extract ALL odds types: spread, total, and moneyline
-                            for (const column of oddsColumns) {
-                                const header = column.querySelector('.cpm-MarketOddsHeader');
-                                if (header) {
-                                    const headerText = header.textContent.toLowerCase().trim();
-                                    
-                                    // Map header text to odds type
-                                    let oddsType = null;
-                                    if (headerText === 'money' || headerText === 'moneyline') {
-                                        oddsType = 'moneyline';
-                                    } else if (headerText.includes('spread') || headerText.includes('puck') || headerText.includes('handicap')) {
-                                        oddsType = 'spread';
-                                    } else if (headerText.includes('total') || headerText.includes('over') || headerText.includes('under')) {
-                                        oddsType = 'total';
-                                    }
-                                    
-                                    if (oddsType) {
-                                        const columnOdds = Array.from(column.querySelectorAll('.cpm-ParticipantOdds'));
-                                        const gameIndex = results.length;
-                                        const startIndex = gameIndex * 2;
-                                        
-                                        if (columnOdds.length > startIndex + 1) {
-                                            const odds1 = columnOdds[startIndex];
-                                            const odds2 = columnOdds[startIndex + 1];
-                                            
-                                            let p1, p2;
-                                            
-                                            if (oddsType === 'moneyline') {
-                                                // Moneyline: just odds values
-                                                p1 = odds1?.querySelector('.cpm-ParticipantOdds_Odds')?.textContent?.trim();
-                                                p2 = odds2?.querySelector('.cpm-ParticipantOdds_Odds')?.textContent?.trim();
-                                            } else {
-                                                // Spread/Total: include handicap + odds (clean format like NCAAF)
-                                                const h1 = odds1?.querySelector('.cpm-ParticipantOdds_Handicap')?.textContent?.trim();
-                                                const o1 = odds1?.querySelector('.cpm-ParticipantOdds_Odds')?.textContent?.trim();
-                                                const h2 = odds2?.querySelector('.cpm-ParticipantOdds_Handicap')?.textContent?.trim();
-                                                const o2 = odds2?.querySelector('.cpm-ParticipantOdds_Odds')?.textContent?.trim();
-                                                
-                                                p1 = (h1 && o1) ? `${h1} ${o1}` : o1;
-                                                p2 = (h2 && o2) ? `${h2} ${o2}` : o2;
-                                            }
-                                            
-                                            if (p1 && p2) {
-                                                odds[oddsType] = [p1, p2];
-                                                console.log(`NHL: Extracted ${oddsType} odds: [${p1}, ${p2}]`);
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                        
-                        const game = {
-                            teams: teams,
-                            time: gameTime,
-                            date: gameDate,  // Add date field
-                            league: 'NHL',
-                            odds: Object.keys(odds).length > 0 ? odds : null,
-                            confidence: teams.length > 1 ? 0.9 : 0.5
-                        };
-                        
-                        results.push(game);
-                        console.log('Extracted NHL game:', teams.join(' vs '));
-                    }
-                    
-                    return results;
-                }
-            """)
+            extraction_result = await self.scripts.run(grid, 'nhl', label=sport)
             
             # Process results
             for idx, result in enumerate(extraction_result):
@@ -1850,241 +1033,7 @@ class EnhancedIntelligentScraper:
         games = []
         
         try:
-            extraction_result = await grid.evaluate("""
-                (grid) => {
-                    const results = [];
-                    const seenGames = new Set();
-                    
-                    console.log('🏈 Starting football extraction...');
-                    
-                    // Enhanced search for football fixtures with multiple approaches
-                    let gameFixtures = [];
-                    
-                    // Primary: Exact American Football class
-                    gameFixtures = Array.from(grid.querySelectorAll('div.cpm-ParticipantFixtureDetailsAmericanFootball'))
-                        .filter(d => !d.className.includes('Hidden'));
-                    console.log(`Primary search: Found ${gameFixtures.length} American Football fixtures`);
-                    
-                    // Secondary: Look for any football/sport fixtures in the entire page
-                    if (gameFixtures.length === 0) {
-                        console.log('Expanding search to entire document...');
-                        gameFixtures = Array.from(document.querySelectorAll('div.cpm-ParticipantFixtureDetailsAmericanFootball'))
-                            .filter(d => !d.className.includes('Hidden'));
-                        console.log(`Document-wide search: Found ${gameFixtures.length} American Football fixtures`);
-                    }
-                    
-                    // Tertiary: Look for spotlight sections that might contain college games
-                    if (gameFixtures.length === 0) {
-                        console.log('Searching spotlight sections for college games...');
-                        const spotlights = Array.from(document.querySelectorAll('div.ss-HomepageSpotlight'));
-                        console.log(`Found ${spotlights.length} spotlight sections`);
-                        
-                        for (const spotlight of spotlights) {
-                            const text = spotlight.textContent.toLowerCase();
-                            // Look for college/NCAAF indicators
-                            if (text.includes('week') || text.includes('colorado') || text.includes('utah') || 
-                                text.includes('college') || text.includes('ncaa')) {
-                                console.log('Found potential college spotlight:', text.substring(0, 100));
-                                const spotlightFixtures = Array.from(spotlight.querySelectorAll('div[class*="ParticipantFixture"]'));
-                                gameFixtures.push(...spotlightFixtures);
-                            }
-                        }
-                        console.log(`After spotlight search: Found ${gameFixtures.length} potential fixtures`);
-                    }
-                    
-                    // Final fallback: Any fixture details that might be football
-                    if (gameFixtures.length === 0) {
-                        const allFixtures = Array.from(grid.querySelectorAll('div[class*="cpm-ParticipantFixtureDetails"]'))
-                            .filter(d => !d.className.includes('Hidden'));
-                        console.log(`Final fallback: Found ${allFixtures.length} total fixtures`);
-                        
-                        // Filter for likely football fixtures by checking content
-                        for (const fixture of allFixtures) {
-                            const text = fixture.textContent.toLowerCase();
-                            // Look for typical football indicators or specific teams we know about
-                            if (text.includes('spread') || text.includes('total') || text.includes('moneyline') || 
-                                text.includes('vs') || text.includes(' - ') || text.includes('colorado') || text.includes('utah')) {
-                                gameFixtures.push(fixture);
-                            }
-                        }
-                        console.log(`After final filtering: Found ${gameFixtures.length} potential football fixtures`);
-                    }
-                    
-                    for (let i = 0; i < gameFixtures.length; i++) {
-                        const fixture = gameFixtures[i];
-                        
-                        // Enhanced team extraction with multiple fallback approaches
-                        let teams = [];
-                        
-                        // Approach 1: Exact American Football class names
-                        const exactContainers = Array.from(fixture.querySelectorAll('div.cpm-ParticipantFixtureDetailsAmericanFootball_TeamContainer'));
-                        console.log(`Fixture ${i}: Found ${exactContainers.length} exact team containers`);
-                        
-                        for (const container of exactContainers) {
-                            const teamEl = container.querySelector('div.cpm-ParticipantFixtureDetailsAmericanFootball_Team');
-                            if (teamEl) {
-                                const teamText = teamEl.textContent.trim();
-                                console.log(`  Exact method team: "${teamText}"`);
-                                if (teamText && teamText.length > 1) {
-                                    teams.push(teamText);
-                                }
-                            }
-                        }
-                        
-                        // Approach 2: Generic team container patterns
-                        if (teams.length < 2) {
-                            console.log(`  Trying wildcard approach for fixture ${i}...`);
-                            const wildcardContainers = Array.from(fixture.querySelectorAll('div[class*="_TeamContainer"]'));
-                            console.log(`  Found ${wildcardContainers.length} wildcard containers`);
-                            
-                            for (const container of wildcardContainers) {
-                                const teamEl = container.querySelector('div[class*="_Team"]');
-                                if (teamEl) {
-                                    const teamText = teamEl.textContent.trim();
-                                    console.log(`  Wildcard method team: "${teamText}"`);
-                                    if (teamText && teamText.length > 1 && !teams.includes(teamText)) {
-                                        teams.push(teamText);
-                                    }
-                                }
-                            }
-                        }
-                        
-                        // Approach 3: Look for any text elements that might be team names
-                        if (teams.length < 2) {
-                            console.log(`  Trying text-based team extraction for fixture ${i}...`);
-                            const allDivs = Array.from(fixture.querySelectorAll('div'));
-                            for (const div of allDivs) {
-                                const text = div.textContent.trim();
-                                const directChildren = div.children.length;
-                                
-                                // Look for divs with text but few children (likely team names)
-                                if (text && text.length > 2 && text.length < 50 && directChildren < 3) {
-                                    // Filter out obvious non-team elements
-                                    if (!text.includes(':') && !text.includes('+') && !text.includes('-') && 
-                                        !text.includes('PM') && !text.includes('AM') && !text.includes('View') &&
-                                        !text.match(/^\\d+$/) && !teams.includes(text)) {
-                                        console.log(`  Text-based method found potential team: "${text}"`);
-                                        teams.push(text);
-                                        if (teams.length >= 2) break;
-                                    }
-                                }
-                            }
-                        }
-                        
-                        // Approach 4: Specific search for known college teams (Colorado, Utah)
-                        if (teams.length < 2) {
-                            console.log(`  Searching specifically for Colorado/Utah...`);
-                            const allText = fixture.textContent.toLowerCase();
-                            const knownTeams = ['colorado', 'utah', 'buffaloes', 'utes', 'cu', 'colorado state'];
-                            
-                            for (const teamName of knownTeams) {
-                                if (allText.includes(teamName)) {
-                                    console.log(`  Found potential college team: ${teamName}`);
-                                    // Try to extract the actual display name
-                                    const textNodes = fixture.querySelectorAll('*');
-                                    for (const node of textNodes) {
-                                        const nodeText = node.textContent.trim();
-                                        if (nodeText.toLowerCase().includes(teamName) && nodeText.length < 30) {
-                                            teams.push(nodeText);
-                                            console.log(`  Added college team: "${nodeText}"`);
-                                            break;
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                        
-                        if (teams.length < 2) {
-                            console.log(`Skipping fixture - only found ${teams.length} teams:`, teams);
-                            continue;
-                        }
-                        
-                        // Create unique game signature to avoid duplicates
-                        const gameSignature = `${teams[0]} vs ${teams[1]}`;
-                        if seenGames.has(gameSignature) continue;
-                        seenGames.add(gameSignature);
-                        
-                        // Extract time
-                        const timeEl = fixture.querySelector('div.cpm-ParticipantFixtureDetailsAmericanFootball_BookCloses');
-                        const gameTime = timeEl ? timeEl.textContent.trim() : null;
-                        
-                        // Extract odds from parent grid structure  
-                        const odds = {};
-                        
-                        // Find all odds columns in the same container
-                        const parentGrid = fixture.closest('div[class*="cpm-CouponPodMarketGrid"]');
-                        
-                        if (parentGrid) {
-                            const oddsColumns = Array.from(parentGrid.querySelectorAll('div.cpm-MarketOdds'));
-                            
-                            // Process each column to extract different odds types
-                            for (const column of oddsColumns) {
-                                const header = column.querySelector('.cpm-MarketOddsHeader');
-                                const headerText = header ? header.textContent.trim().toLowerCase() : '';
-                                
-                                let category = null;
-                                if (headerText === 'money' || headerText.includes('moneyline')) {
-                                    category = 'moneyline';
-                                } else if (headerText.includes('spread') || headerText.includes('handicap')) {
-                                    category = 'spread';
-                                } else if (headerText.includes('total') || headerText.includes('over/under')) {
-                                    category = 'total';
-                                }
-                                
-                                if (category) {
-                                    const columnOdds = Array.from(column.querySelectorAll('.cpm-ParticipantOdds'));
-                                    
-                                    // Calculate which odds belong to this game (each game = 2 odds rows)
-                                    const gameIndex = results.length;
-                                    const startIndex = gameIndex * 2;
-                                    
-                                    if (columnOdds.length > startIndex + 1) {
-                                        const odds1 = columnOdds[startIndex];
-                                        const odds2 = columnOdds[startIndex + 1];
-                                        
-                                        const h1 = odds1?.querySelector('.cpm-ParticipantOdds_Handicap')?.textContent?.trim() || '';
-                                        const p1 = odds1?.querySelector('.cpm-ParticipantOdds_Odds')?.textContent?.trim() || '';
-                                        const h2 = odds2?.querySelector('.cpm-ParticipantOdds_Handicap')?.textContent?.trim() || '';
-                                        const p2 = odds2?.querySelector('.cpm-ParticipantOdds_Odds')?.textContent?.trim() || '';
-                                        
-                                        // Validate that we have actual odds values
-                                        if (p1 && p2 && (p1.includes('+') || p1.includes('-')) && (p2.includes('+') || p2.includes('-'))) {
-                                            if (category === 'moneyline') {
-                                                odds[category] = [p1, p2];
-                                            } else {
-                                                // ENHANCED: Include handicap (+/-) and odds values for spread/total
-                                                odds[category] = [
-                                                    h1 ? `${h1} (${p1})` : p1,
-                                                    h2 ? `${h2} (${p2})` : p2
-                                                ];
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                        
-                        // Get current date as fallback for pregame
-                        const today = new Date();
-                        const options = { weekday: 'short', month: 'short', day: 'numeric' };
-                        const gameDate = today.toLocaleDateString('en-US', options);
-                        
-                        const game = {
-                            teams: teams,
-                            time: gameTime,
-                            date: gameDate,  // Add date field
-                            league: 'NCAAF',
-                            odds: odds,
-                            confidence: teams.length > 1 ? 0.9 : 0.5
-                        };
-                        
-                        results.push(game);
-                    }
-                    
-                    console.log(`Total NCAAF/NFL games extracted: ${results.length}`);
-                    return results;
-                }
-            """)
+            extraction_result = await self.scripts.run(grid, 'football', label=sport)
             
             # Process results with enhanced logging and flexible filtering
             self.logger.info(f"🏈 Processing {len(extraction_result)} {sport} extraction results...")
@@ -2181,200 +1130,7 @@ class EnhancedIntelligentScraper:
             self.logger.info("🏈 Starting NCAAF extraction from spotlight sections...")
             
             # Look for NCAAF spotlight sections specifically
-            extraction_result = await page.evaluate("""
-                () => {
-                    const results = [];
-                    
-                    console.log('🏈 Searching for NCAAF spotlight sections...');
-                    
-                    // NFL teams to filter out - comprehensive list
-                    const nflTeams = new Set([
-                        'Arizona Cardinals', 'Atlanta Falcons', 'Baltimore Ravens', 'Buffalo Bills',
-                        'Carolina Panthers', 'Chicago Bears', 'Cincinnati Bengals', 'Cleveland Browns',
-                        'Dallas Cowboys', 'Denver Broncos', 'Detroit Lions', 'Green Bay Packers',
-                        'Houston Texans', 'Indianapolis Colts', 'Jacksonville Jaguars', 'Kansas City Chiefs',
-                        'Las Vegas Raiders', 'Los Angeles Chargers', 'Los Angeles Rams', 'Miami Dolphins',
-                        'Minnesota Vikings', 'New England Patriots', 'New Orleans Saints', 'New York Giants',
-                        'New York Jets', 'Philadelphia Eagles', 'Pittsburgh Steelers', 'San Francisco 49ers',
-                        'Seattle Seahawks', 'Tampa Bay Buccaneers', 'Tennessee Titans', 'Washington Commanders',
-                        // Abbreviated versions
-                        'ARI Cardinals', 'ATL Falcons', 'BAL Ravens', 'BUF Bills', 'CAR Panthers', 
-                        'CHI Bears', 'CIN Bengals', 'CLE Browns', 'DAL Cowboys', 'DEN Broncos',
-                        'DET Lions', 'GB Packers', 'HOU Texans', 'IND Colts', 'JAX Jaguars', 'KC Chiefs',
-                        'LV Raiders', 'LAC Chargers', 'LAR Rams', 'MIA Dolphins', 'MIN Vikings',
-                        'NE Patriots', 'NO Saints', 'NY Giants', 'NY Jets', 'PHI Eagles', 'PIT Steelers',
-                        'SF 49ers', 'SEA Seahawks', 'TB Buccaneers', 'TEN Titans', 'WAS Commanders'
-                    ]);
-                    
-                    // Function to check if team name contains NFL teams
-                    function isNFLTeam(teamName) {
-                        const cleanTeam = teamName.trim();
-                        return nflTeams.has(cleanTeam) || 
-                               Array.from(nflTeams).some(nflTeam => 
-                                   cleanTeam.includes(nflTeam) || nflTeam.includes(cleanTeam.split(' ')[0])
-                               );
-                    }
-                    
-                    // Find all spotlight sections
-                    const spotlights = Array.from(document.querySelectorAll('div.ss-HomepageSpotlight'));
-                    console.log(`Found ${spotlights.length} total spotlight sections`);
-                    
-                    for (const spotlight of spotlights) {
-                        // Look for NCAAF logo indicator - must be very specific
-                        const headerImages = spotlight.querySelectorAll('div[style*="zlogo_ncaaf_official.svg"]');
-                        const headerTitles = spotlight.querySelectorAll('div.ss-HomeSpotlightHeader_Title, div.cpm-Header_Title');
-                        
-                        let isNCAA = false;
-                        let weekInfo = null;
-                        
-                        // Check for NCAAF logo - this is the most reliable indicator
-                        if (headerImages.length > 0) {
-                            console.log('Found NCAAF logo in spotlight section');
-                            isNCAA = true;
-                        }
-                        
-                        // Check for week header (Week X) - but only if we also have NCAAF logo
-                        for (const title of headerTitles) {
-                            const titleText = title.textContent.trim();
-                            if (titleText.match(/Week \\d+/i) && headerImages.length > 0) {
-                                console.log(`Found week header with NCAAF logo: ${titleText}`);
-                                weekInfo = titleText;
-                            }
-                        }
-                        
-                        // Only proceed if we found NCAAF logo
-                        if (!isNCAA) continue;
-                        
-                        console.log(`Processing NCAAF spotlight section with ${weekInfo || 'unknown week'}`);
-                        
-                        // Extract games from this NCAAF section - but only within this specific section
-                        const gameFixtures = Array.from(spotlight.querySelectorAll('div.cpm-ParticipantFixtureDetailsAmericanFootball'))
-                            .filter(d => !d.className.includes('Hidden'));
-                        
-                        console.log(`Found ${gameFixtures.length} fixtures in NCAAF section`);
-                        
-                        for (let i = 0; i < gameFixtures.length; i++) {
-                            const fixture = gameFixtures[i];
-                            
-                            // Extract teams using NCAAF-specific structure
-                            let teams = [];
-                            
-                            const teamContainers = Array.from(fixture.querySelectorAll('div.cpm-ParticipantFixtureDetailsAmericanFootball_TeamContainer'));
-                            console.log(`Fixture ${i}: Found ${teamContainers.length} team containers`);
-                            
-                            for (const container of teamContainers) {
-                                const teamEl = container.querySelector('div.cpm-ParticipantFixtureDetailsAmericanFootball_Team');
-                                if (teamEl) {
-                                    const teamText = teamEl.textContent.trim();
-                                    console.log(`  Found team: "${teamText}"`);
-                                    if (teamText && teamText.length > 1) {
-                                        teams.push(teamText);
-                                    }
-                                }
-                            }
-                            
-                            if (teams.length < 2) {
-                                console.log(`Skipping fixture - only found ${teams.length} teams`);
-                                continue;
-                            }
-                            
-                            // Critical: Filter out NFL teams - this is the key fix
-                            const isNFL1 = isNFLTeam(teams[0]);
-                            const isNFL2 = isNFLTeam(teams[1]);
-                            
-                            if (isNFL1 || isNFL2) {
-                                console.log(`🚫 Skipping NFL teams: ${teams[0]} vs ${teams[1]}`);
-                                continue;
-                            }
-                            
-                            console.log(`✅ Valid NCAAF teams: ${teams[0]} vs ${teams[1]}`);
-                            
-                            
-                            // Extract time/clock info
-                            let gameTime = null;
-                            const clockEl = fixture.querySelector('div.cpm-ParticipantFixtureDetailsAmericanFootball_Clock, div.cpm-ParticipantFixtureDetailsAmericanFootball_BookCloses');
-                            if (clockEl) {
-                                gameTime = clockEl.textContent.trim();
-                            }
-                            
-                            // Extract date
-                            let gameDate = null;
-                            const dateEl = fixture.closest('div.gl-MarketGroup')?.querySelector('div.cpm-MarketFixtureDateHeader');
-                            if (dateEl) {
-                                gameDate = dateEl.textContent.trim();
-                            }
-                            
-                            // Extract odds from the odds columns - but only within this spotlight section
-                            const odds = {};
-                            
-                            // Make sure we stay within the current spotlight section for odds extraction
-                            const parentGrid = fixture.closest('div.cpm-CouponPodMarketGrid');
-                            
-                            // Double-check that this odds grid is still within our NCAAF spotlight section
-                            if (parentGrid && spotlight.contains(parentGrid)) {
-                                const oddsColumns = Array.from(parentGrid.querySelectorAll('div.cpm-MarketOdds'));
-                                
-                                for (const column of oddsColumns) {
-                                    const header = column.querySelector('.cpm-MarketOddsHeader');
-                                    const headerText = header ? header.textContent.trim().toLowerCase() : '';
-                                    
-                                    let category = null;
-                                    if (headerText === 'money' || headerText.includes('moneyline')) {
-                                        category = 'moneyline';
-                                    } else if (headerText.includes('spread') || headerText.includes('handicap')) {
-                                        category = 'spread';
-                                    } else if (headerText.includes('total') || headerText.includes('over/under')) {
-                                        category = 'total';
-                                    }
-                                    
-                                    if (category) {
-                                        const columnOdds = Array.from(column.querySelectorAll('.cpm-ParticipantOdds'));
-                                        
-                                        if (columnOdds.length >= 2) {
-                                            const odds1 = columnOdds[0];
-                                            const odds2 = columnOdds[1];
-                                            
-                                            const h1 = odds1?.querySelector('.cpm-ParticipantOdds_Handicap')?.textContent?.trim() || '';
-                                            const p1 = odds1?.querySelector('.cpm-ParticipantOdds_Odds')?.textContent?.trim() || '';
-                                            const h2 = odds2?.querySelector('.cpm-ParticipantOdds_Handicap')?.textContent?.trim() || '';
-                                            const p2 = odds2?.querySelector('.cpm-ParticipantOdds_Odds')?.textContent?.trim() || '';
-                                            
-                                            // Format odds properly
-                                            if (p1 && p2) {
-                                                if (category === 'moneyline') {
-                                                    odds[category] = [p1, p2];
-                                                } else {
-                                                    // Include handicap values for spread/total
-                                                    odds[category] = [
-                                                        h1 ? `${h1} ${p1}` : p1,
-                                                        h2 ? `${h2} ${p2}` : p2
-                                                    ];
-                                                }
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                            
-                            const game = {
-                                teams: teams,
-                                time: gameTime,
-                                date: gameDate,
-                                week: weekInfo,
-                                league: 'NCAAF',
-                                odds: odds,
-                                confidence: 0.95
-                            };
-                            
-                            results.push(game);
-                            console.log(`Added NCAAF game: ${teams[0]} vs ${teams[1]}`);
-                        }
-                    }
-                    
-                    console.log(`Total NCAAF games extracted: ${results.length}`);
-                    return results;
-                }
-            """)
+            extraction_result = await self.scripts.run(page, 'ncaaf', label=sport)
             
             # Process results
             for idx, result in enumerate(extraction_result):
@@ -2498,161 +1254,7 @@ class EnhancedIntelligentScraper:
             self.logger.info("🎾 Starting fast Tennis extraction...")
             
             # Fast Tennis extraction using ATP/WTA section detection
-            extraction_result = await grid.evaluate("""
-                (grid) => {
-                    const results = [];
-                    
-                    console.log('🎾 Starting Tennis extraction...');
-                    
-                    // Step 1: Find Tennis section by icon
-                    let tennisSection = null;
-                    
-                    // Method 1: Look for Tennis SVG logo in header images
-                    const headerImages = document.querySelectorAll('.ss-HomeSpotlightHeader_HeaderImage, .cpm-Header_HeaderImage');
-                    for (const img of headerImages) {
-                        const style = img.getAttribute('style') || '';
-                        if (style.includes('zClass_Tennis.svg')) {
-                            tennisSection = img.closest('.ss-HomepageSpotlight, .cpm-CouponPodModule');
-                            console.log('✅ Found Tennis section by Tennis SVG');
-                            break;
-                        }
-                    }
-                    
-                    // Method 2: Look for tennis class or text as backup
-                    if (!tennisSection) {
-                        const headers = document.querySelectorAll('.cpm-Header_Title, .ss-HomeSpotlightHeader_Title');
-                        for (const header of headers) {
-                            if (header.textContent.trim().includes('ATP') || header.textContent.trim().includes('WTA') || header.textContent.trim().includes('Tennis')) {
-                                tennisSection = header.closest('.cpm-CouponPodModule, .ss-HomepageSpotlight');
-                                console.log('✅ Found Tennis section by title text');
-                                break;
-                            }
-                        }
-                    }
-                    
-                    if (!tennisSection) {
-                        console.log('❌ Tennis section not found by icon/text detection');
-                        return [];
-                    }
-                    
-                    console.log('Found Tennis section');
-                    
-                    // Step 2: Extract fixtures from tennis section only
-                    const fixtures = Array.from(tennisSection.querySelectorAll('div.cpm-ParticipantFixtureDetails'))
-                        .filter(fixture => !fixture.className.includes('Hidden'));
-                    
-                    console.log(`Found ${fixtures.length} tennis fixtures`);
-                    
-                    // Step 3: Extract odds columns data from tennis section
-                    const oddsColumns = {};
-                    
-                    // Find column "1" odds within tennis section
-                    const col1Section = tennisSection.querySelector('div.cpm-MarketOdds');
-                    if (col1Section) {
-                        const col1Header = col1Section.querySelector('div.cpm-MarketOddsHeader');
-                        if (col1Header && col1Header.textContent.trim() === "1") {
-                            const col1Odds = [];
-                            const oddsElems = col1Section.querySelectorAll('span.cpm-ParticipantOdds_Odds');
-                            for (const oddsElem of oddsElems) {
-                                const oddsText = oddsElem.textContent;
-                                if (oddsText) {
-                                    col1Odds.push(oddsText.trim());
-                                }
-                            }
-                            oddsColumns["1"] = col1Odds;
-                        }
-                    }
-                    
-                    // Find column "2" odds within tennis section
-                    const col2Sections = Array.from(tennisSection.querySelectorAll('div.cpm-MarketOdds'));
-                    for (const section of col2Sections) {
-                        const header = section.querySelector('div.cpm-MarketOddsHeader');
-                        if (header && header.textContent.trim() === "2") {
-                            const col2Odds = [];
-                            const oddsElems = section.querySelectorAll('span.cpm-ParticipantOdds_Odds');
-                            for (const oddsElem of oddsElems) {
-                                const oddsText = oddsElem.textContent;
-                                if (oddsText) {
-                                    col2Odds.push(oddsText.trim());
-                                }
-                            }
-                            oddsColumns["2"] = col2Odds;
-                            break;
-                        }
-                    }
-                    
-                    // Extract game date with fallback for pregame
-                    const dateHeader = grid.querySelector('div.cpm-MarketFixtureDateHeader');
-                    let gameDate = dateHeader ? dateHeader.textContent.trim() : null;
-                    
-                    // Fallback to today's date for pregame if no date found
-                    if (!gameDate || gameDate === null) {
-                        const today = new Date();
-                        const options = { weekday: 'short', month: 'short', day: 'numeric' };
-                        gameDate = today.toLocaleDateString('en-US', options);
-                    }
-                    
-                    // Step 3: Process fixtures and map odds correctly
-                    for (let i = 0; i < fixtures.length; i++) {
-                        const fixture = fixtures[i];
-                        
-                        // Extract player names using multiple methods
-                        const teamElems = fixture.querySelectorAll('div.cpm-ParticipantFixtureDetails_Team');
-                        
-                        let player1, player2;
-                        
-                        if (teamElems.length >= 2) {
-                            // Method 1: Direct team elements
-                            player1 = teamElems[0].textContent;
-                            player2 = teamElems[1].textContent;
-                        } else {
-                            // Method 2: Parse from fixture text
-                            const fixtureText = fixture.textContent;
-                            if (!fixtureText.includes(' v ')) continue;
-                            
-                            const players = fixtureText.split(' v ');
-                            if (players.length < 2) continue;
-                            
-                            player1 = players[0].trim();
-                            player2 = players[1].trim();
-                        }
-                        
-                        player1 = player1.trim();
-                        player2 = player2.trim();
-                        
-                        // Validate tennis match (relaxed validation)
-                        if (!player1 || !player2 || player1.length < 3 || player2.length < 3) continue;
-                        
-                        // Extract time
-                        const timeElem = fixture.querySelector('div.cpm-ParticipantFixtureDetails_BookCloses, [class*="BookCloses"], [class*="Time"]');
-                        const gameTime = timeElem ? timeElem.textContent : "TBD";
-                        
-                        // Map odds correctly to players
-                        const moneylineOdds = [];
-                        
-                        // Player 1 gets odds from column "1", Player 2 gets odds from column "2"
-                        if (oddsColumns["1"] && oddsColumns["1"].length > i) {
-                            moneylineOdds.push(oddsColumns["1"][i]);  // Player 1 odds
-                        }
-                        
-                        if (oddsColumns["2"] && oddsColumns["2"].length > i) {
-                            moneylineOdds.push(oddsColumns["2"][i]);  // Player 2 odds
-                        }
-                        
-                        // Create game object
-                        results.push({
-                            team1: player1,
-                            team2: player2,
-                            date: gameDate,
-                            time: gameTime.trim(),
-                            moneyline: moneylineOdds,
-                            fixture_id: `tennis_${i}`
-                        });
-                    }
-                    
-                    return results;
-                }
-            """)
+            extraction_result = await self.scripts.run(grid, 'tennis', label=sport)
             
             # Process results into Game objects
             for result in extraction_result:
@@ -2687,118 +1289,7 @@ class EnhancedIntelligentScraper:
         
         try:
             # Use JavaScript to extract NFL data directly
-            nfl_data = await page.evaluate("""
-                () => {
-                    const games = [];
-                    
-                    // Find NFL section by looking for NFL logo icon
-                    let nflSection = null;
-                    
-                    // Method 1: Look for NFL logo class
-                    const nflLogos = document.querySelectorAll('.afl-NFLLeagueLogo, .afl-NFLLeagueLogo_SVG');
-                    for (const logo of nflLogos) {
-                        nflSection = logo.closest('.cpm-CouponPodModule, .ss-HomepageSpotlight');
-                        if (nflSection) break;
-                    }
-                    
-                    // Method 2: Look for NFL logo wrapper if method 1 fails
-                    if (!nflSection) {
-                        const logoWrappers = document.querySelectorAll('.cpm-Header_Logo, .ss-HomeSpotlightHeader_Logo');
-                        for (const wrapper of logoWrappers) {
-                            if (wrapper.querySelector('.afl-NFLLeagueLogo')) {
-                                nflSection = wrapper.closest('.cpm-CouponPodModule, .ss-HomepageSpotlight');
-                                break;
-                            }
-                        }
-                    }
-                    
-                    if (!nflSection) {
-                        console.log('NFL section not found by logo detection');
-                        return { games: [], spreadOdds: [], totalOdds: [], moneylineOdds: [] };
-                    }
-                    
-                    console.log('Found NFL section by logo detection');
-                    
-                    // Find NFL fixtures within the Week 8 section (use AmericanFootball class)
-                    const fixtures = nflSection.querySelectorAll('.cpm-ParticipantFixtureDetailsAmericanFootball');
-                    
-                    fixtures.forEach((fixture, index) => {
-                        try {
-                            const teamElements = fixture.querySelectorAll('.cpm-ParticipantFixtureDetailsAmericanFootball_Team');
-                            if (teamElements.length >= 2) {
-                                const team1 = teamElements[0].textContent.trim();
-                                const team2 = teamElements[1].textContent.trim();
-                                
-                                // Get game time
-                                const timeElement = fixture.querySelector('.cpm-ParticipantFixtureDetailsAmericanFootball_BookCloses');
-                                const gameTime = timeElement ? timeElement.textContent.trim() : 'TBD';
-                                
-                                games.push({
-                                    team1: team1,
-                                    team2: team2,
-                                    date: new Date().toISOString().split('T')[0],  // Add date field
-                                    time: gameTime,
-                                    index: index
-                                });
-                            }
-                        } catch (e) {
-                            console.log('Error processing NFL fixture:', e);
-                        }
-                    });
-                    
-                    // Find odds columns within NFL section (Spread, Total, Money)
-                    const spreadOdds = [];
-                    const totalOdds = [];
-                    const moneylineOdds = [];
-                    
-                    // ENHANCED: Get Spread column odds with +/- values (clean format like NCAAF)
-                    const spreadHeaders = Array.from(nflSection.querySelectorAll('.cpm-MarketOddsHeader')).filter(h => h.textContent.trim() === 'Spread');
-                    if (spreadHeaders.length > 0) {
-                        const spreadContainer = spreadHeaders[0].parentElement;
-                        const spreadElements = spreadContainer.querySelectorAll('.cpm-ParticipantOdds');
-                        spreadElements.forEach(odds => {
-                            const handicap = odds.querySelector('.cpm-ParticipantOdds_Handicap');
-                            const oddsValue = odds.querySelector('.cpm-ParticipantOdds_Odds');
-                            if (handicap && oddsValue) {
-                                // Clean format: "+7.0 -105" (no parentheses)
-                                spreadOdds.push(`${handicap.textContent.trim()} ${oddsValue.textContent.trim()}`);
-                            }
-                        });
-                    }
-                    
-                    // ENHANCED: Get Total column odds with Over/Under values (clean format like NCAAF)
-                    const totalHeaders = Array.from(nflSection.querySelectorAll('.cpm-MarketOddsHeader')).filter(h => h.textContent.trim() === 'Total');
-                    if (totalHeaders.length > 0) {
-                        const totalContainer = totalHeaders[0].parentElement;
-                        const totalElements = totalContainer.querySelectorAll('.cpm-ParticipantOdds');
-                        totalElements.forEach(odds => {
-                            const handicap = odds.querySelector('.cpm-ParticipantOdds_Handicap');
-                            const oddsValue = odds.querySelector('.cpm-ParticipantOdds_Odds');
-                            if (handicap && oddsValue) {
-                                // Clean format: "O 44.0 -110" (no parentheses)
-                                totalOdds.push(`${handicap.textContent.trim()} ${oddsValue.textContent.trim()}`);
-                            }
-                        });
-                    }
-                    
-                    // Get Money column odds
-                    const moneyHeaders = Array.from(nflSection.querySelectorAll('.cpm-MarketOddsHeader')).filter(h => h.textContent.trim() === 'Money');
-                    if (moneyHeaders.length > 0) {
-                        const moneyContainer = moneyHeaders[0].parentElement;
-                        const moneyElements = moneyContainer.querySelectorAll('.cpm-ParticipantOdds_Odds');
-                        moneyElements.forEach(odds => {
-                            moneylineOdds.push(odds.textContent.trim());
-                        });
-                    }
-                    
-                    return {
-                        games: games,
-                        spreadOdds: spreadOdds,
-                        totalOdds: totalOdds,
-                        moneylineOdds: moneylineOdds
-                    };
-                }
-            """)
+            nfl_data = await self.scripts.run(page, 'nfl', label=sport)
             
             games = []
             
@@ -2878,146 +1369,7 @@ class EnhancedIntelligentScraper:
             self.logger.info("🏈 Starting fast CFL extraction...")
 
             # Enhanced CFL extraction with proper validation
-            extraction_result = await grid.evaluate("""
-                (grid) => {
-                    const results = [];
-
-                    console.log('Starting CFL extraction with section validation');
-
-                    // Step 1: Find proper CFL section by looking for CFL-specific indicators
-                    let cflSection = null;
-
-                    // Look for CFL section by header text + American Football icon
-                    const headers = document.querySelectorAll('.cpm-Header_Title, .ss-HomeSpotlightHeader_Title');
-                    for (const header of headers) {
-                        if (header.textContent.trim() === 'CFL') {
-                            // Verify this is the CFL section with American Football icon
-                            const headerImage = header.parentElement.querySelector('.cpm-Header_HeaderImage, .ss-HomeSpotlightHeader_HeaderImage');
-                            if (headerImage) {
-                                const style = headerImage.getAttribute('style') || '';
-                                if (style.includes('zClass_AmericanFootball.svg')) {
-                                    cflSection = header.closest('.cpm-CouponPodModule, .ss-HomepageSpotlight');
-                                    console.log('Found CFL section with proper AmericanFootball icon validation');
-                                    break;
-                                }
-                            }
-                        }
-                    }
-
-                    if (!cflSection) {
-                        console.log('CFL section not found with proper validation - may be on wrong page');
-                        return [];
-                    }
-
-                    // Step 2: Look for CFL fixtures within the verified CFL section
-                    const fixtures = Array.from(cflSection.querySelectorAll('.cpm-ParticipantFixtureDetailsAmericanFootball'));
-
-                    console.log(`Found ${fixtures.length} CFL fixtures in validated CFL section`);
-
-                    // Each CFL fixture contains multiple teams within TeamNames div
-                    // We need to group them into pairs for matchups
-                    for (let i = 0; i < fixtures.length; i++) {
-                        const fixtureElement = fixtures[i];
-
-                        console.log(`Processing CFL fixture ${i + 1} of ${fixtures.length}`);
-
-                        // Get all team containers within this fixture
-                        const teamContainers = fixtureElement.querySelectorAll('.cpm-ParticipantFixtureDetailsAmericanFootball_TeamContainer');
-
-                        console.log(`Found ${teamContainers.length} teams in fixture ${i + 1}`);
-
-                        // CFL fixtures should have exactly 2 teams per matchup
-                        if (teamContainers.length >= 2) {
-                            // Process teams in pairs (assuming they're arranged as matchups)
-                            for (let j = 0; j < teamContainers.length; j += 2) {
-                                const team1Container = teamContainers[j];
-                                const team2Container = teamContainers[j + 1];
-
-                                if (!team1Container || !team2Container) {
-                                    console.log(`Incomplete team pair at index ${j}, skipping`);
-                                    continue;
-                                }
-
-                                // Extract team names
-                                const team1NameElement = team1Container.querySelector('.cpm-ParticipantFixtureDetailsAmericanFootball_Team');
-                                const team2NameElement = team2Container.querySelector('.cpm-ParticipantFixtureDetailsAmericanFootball_Team');
-
-                                if (!team1NameElement || !team2NameElement) {
-                                    console.log(`Missing team names in pair ${j/2 + 1}, skipping`);
-                                    continue;
-                                }
-
-                                const team1 = team1NameElement.textContent.trim();
-                                const team2 = team2NameElement.textContent.trim();
-
-                                console.log(`Processing CFL game ${j/2 + 1}: ${team1} vs ${team2}`);
-
-                                // Extract game time from the fixture details section
-                                const timeElement = fixtureElement.querySelector('.cpm-ParticipantFixtureDetailsAmericanFootball_BookCloses');
-                                const time = timeElement ? timeElement.textContent.trim() : '';
-
-                                // Find the market group container that contains odds
-                                const gameRow = fixtureElement.closest('.gl-MarketGroup');
-                                if (!gameRow) {
-                                    console.log(`No market group found for ${team1} vs ${team2}`);
-                                    // Still create the game entry without odds
-                                }
-
-                                // Initialize odds arrays
-                                let spreadOdds = [];
-                                let totalOdds = [];
-                                let moneylineOdds = [];
-
-                                if (gameRow) {
-                                    // Get all odds elements in the market group
-                                    const allOddsElements = gameRow.querySelectorAll('.cpm-ParticipantOdds_Odds');
-                                    const handicapElements = gameRow.querySelectorAll('.cpm-ParticipantOdds_Handicap');
-
-                                    console.log(`Found ${allOddsElements.length} odds elements and ${handicapElements.length} handicap elements for CFL game`);
-
-                                    // Extract spread and total odds (with handicaps)
-                                    for (let k = 0; k < handicapElements.length && k < allOddsElements.length; k++) {
-                                        const handicap = handicapElements[k] ? handicapElements[k].textContent.trim() : '';
-                                        const odds = allOddsElements[k] ? allOddsElements[k].textContent.trim() : '';
-
-                                        if (handicap && odds) {
-                                            if (handicap.startsWith('O ') || handicap.startsWith('U ')) {
-                                                totalOdds.push(`${handicap} ${odds}`);
-                                            } else if (handicap.startsWith('+') || handicap.startsWith('-')) {
-                                                spreadOdds.push(`${handicap} ${odds}`);
-                                            }
-                                        }
-                                    }
-
-                                    // Extract moneyline odds (odds-only, no handicaps)
-                                    const moneylineElements = gameRow.querySelectorAll('.cpm-ParticipantOddsOnly50 .cpm-ParticipantOdds_Odds');
-                                    for (const oddsElem of moneylineElements) {
-                                        const odds = oddsElem.textContent.trim();
-                                        if (odds && (odds.startsWith('+') || odds.startsWith('-'))) {
-                                            moneylineOdds.push(odds);
-                                        }
-                                    }
-                                }
-
-                                results.push({
-                                    team1: team1,
-                                    team2: team2,
-                                    date: new Date().toISOString().split('T')[0],
-                                    time: time,
-                                    spread_odds: spreadOdds,
-                                    total_odds: totalOdds,
-                                    moneyline_odds: moneylineOdds,
-                                    fixture_id: `cfl_${i}_${j/2}`
-                                });
-                            }
-                        } else {
-                            console.log(`Fixture ${i + 1} has ${teamContainers.length} teams, not enough for CFL matchups`);
-                        }
-                    }
-
-                    return results;
-                }
-            """)
+            extraction_result = await self.scripts.run(grid, 'cfl', label=sport)
 
             # Process results into Game objects
             for result in extraction_result:
@@ -3057,119 +1409,7 @@ class EnhancedIntelligentScraper:
         try:
             self.logger.info("🏌️ Starting unified PGA extraction...")
 
-            extraction_result = await page.evaluate("""
-                () => {
-                    const results = [];
-
-                    // Step 1: Find PGA section by looking for PGA logo
-                    let pgaSection = null;
-                    const headerImages = document.querySelectorAll('.cpm-Header_HeaderImage, .ss-HomeSpotlightHeader_HeaderImage');
-                    for (const img of headerImages) {
-                        const style = img.getAttribute('style') || '';
-                        if (style.includes('zlogo_pga_official.svg') || style.includes('pga')) {
-                            pgaSection = img.closest('.cpm-CouponPodModule, .ss-HomepageSpotlight');
-                            console.log('Found PGA section by logo');
-                            break;
-                        }
-                    }
-
-                    // Fallback: Look for tournament/golf text
-                    if (!pgaSection) {
-                        const headers = document.querySelectorAll('.cpm-Header_Title, .ss-HomeSpotlightHeader_Title');
-                        for (const header of headers) {
-                            const headerText = header.textContent.toLowerCase();
-                            if (headerText.includes('championship') || headerText.includes('tour') || headerText.includes('golf')) {
-                                pgaSection = header.closest('.cpm-CouponPodModule, .ss-HomepageSpotlight');
-                                console.log('Found PGA section by text');
-                                break;
-                            }
-                        }
-                    }
-
-                    if (!pgaSection) {
-                        console.log('❌ PGA section not found');
-                        return [];
-                    }
-
-                    // Step 2: Extract tournament name
-                    const tournamentElement = pgaSection.querySelector('.cpm-Header_Title, .ss-HomeSpotlightHeader_Title');
-                    const tournamentName = tournamentElement ? tournamentElement.textContent.trim() : 'PGA Tournament';
-                    console.log(`Tournament: ${tournamentName}`);
-
-                    // Step 3: Extract player names
-                    const playerElements = Array.from(pgaSection.querySelectorAll('.cpm-ParticipantLabelGolfScore_Name'));
-                    console.log(`Found ${playerElements.length} golfers`);
-
-                    // Step 4: Dynamically detect and extract odds columns
-                    const oddsColumns = {};
-                    
-                    // Method 1: Try multi-column format (.cpm-HScrollPlaceColumnMarketGolf with headers)
-                    const marketColumns = Array.from(pgaSection.querySelectorAll('.cpm-HScrollPlaceColumnMarketGolf'));
-                    if (marketColumns.length > 0) {
-                        console.log(`Found ${marketColumns.length} market columns (multi-column format)`);
-                        for (const column of marketColumns) {
-                            const header = column.querySelector('.gl-MarketColumnHeader');
-                            if (header) {
-                                const headerText = header.textContent.trim();
-                                const columnOdds = [];
-                                const oddsElems = column.querySelectorAll('.cpm-ParticipantOdds_Odds');
-                                for (const oddsElem of oddsElems) {
-                                    const oddsText = oddsElem.textContent;
-                                    if (oddsText) {
-                                        columnOdds.push(oddsText.trim());
-                                    }
-                                }
-                                oddsColumns[headerText] = columnOdds;
-                                console.log(`Column "${headerText}": ${columnOdds.length} odds`);
-                            }
-                        }
-                    }
-                    
-                    // Method 2: Single column format (just one odds container)
-                    if (Object.keys(oddsColumns).length === 0) {
-                        console.log('Trying single-column format');
-                        const oddsContainer = pgaSection.querySelector('.cpm-HScrollPlaceColumnMarketGolf');
-                        if (oddsContainer) {
-                            const columnOdds = [];
-                            const oddsElems = oddsContainer.querySelectorAll('.cpm-ParticipantOdds_Odds');
-                            for (const oddsElem of oddsElems) {
-                                const oddsText = oddsElem.textContent;
-                                if (oddsText) {
-                                    columnOdds.push(oddsText.trim());
-                                }
-                            }
-                            oddsColumns['Win Only'] = columnOdds;
-                            console.log(`Single column "Win Only": ${columnOdds.length} odds`);
-                        }
-                    }
-
-                    // Step 5: Map players to odds
-                    for (let i = 0; i < playerElements.length; i++) {
-                        const playerName = playerElements[i].textContent.trim();
-                        
-                        if (!playerName || playerName.length < 3) continue;
-
-                        // Extract odds for each available column
-                        const winOnlyOdds = oddsColumns['Win Only'] && oddsColumns['Win Only'][i] ? [oddsColumns['Win Only'][i]] : [];
-                        const top5Odds = oddsColumns['Top 5 (Inc Ties)'] && oddsColumns['Top 5 (Inc Ties)'][i] ? [oddsColumns['Top 5 (Inc Ties)'][i]] : [];
-                        const top10Odds = oddsColumns['Top 10 (Inc Ties)'] && oddsColumns['Top 10 (Inc Ties)'][i] ? [oddsColumns['Top 10 (Inc Ties)'][i]] : [];
-
-                        results.push({
-                            player: playerName,
-                            tournament: tournamentName,
-                            date: new Date().toISOString().split('T')[0],
-                            time: 'Tournament',
-                            to_win: winOnlyOdds,
-                            top_5: top5Odds,
-                            top_10: top10Odds,
-                            fixture_id: `pga_${i}`
-                        });
-                    }
-
-                    console.log(`✅ Processed ${results.length} golfers with odds`);
-                    return results;
-                }
-            """)
+            extraction_result = await self.scripts.run(page, 'pga', label=sport)
 
             # Process results into Game objects
             for result in extraction_result:
@@ -3206,234 +1446,7 @@ class EnhancedIntelligentScraper:
             self.logger.info("🥊 Starting UFC extraction...")
 
             # UFC extraction using direct page extraction after navigation
-            extraction_result = await page.evaluate("""
-                () => {
-                    const results = [];
-                    const seenFights = new Set(); // Track unique fights within UFC extraction
-
-                    console.log('🥊 Starting UFC extraction...');
-
-                    // Step 1: Find ALL UFC fixtures on the page (more comprehensive approach)
-                    let allFixtures = [];
-
-                    // Method 1: Direct UFC fixture elements (most reliable)
-                    const ufcFixtures = document.querySelectorAll('div.cpm-ParticipantFixtureDetails100');
-                    console.log(`🥊 Found ${ufcFixtures.length} UFC fixtures using direct selector`);
-
-                    for (const fixture of ufcFixtures) {
-                        // Skip hidden fixtures
-                        if (fixture.className.includes('Hidden') || fixture.offsetParent === null) {
-                            continue;
-                        }
-                        allFixtures.push(fixture);
-                    }
-
-                    // Method 2: Look for fixtures in UFC sections (backup)
-                    if (allFixtures.length === 0) {
-                        // Find UFC sections first
-                        let ufcSections = [];
-
-                        // Look for UFC logo in style background-image
-                        const headerImages = document.querySelectorAll('.cpm-Header_HeaderImage, .ss-HomeSpotlightHeader_HeaderImage');
-                        for (const img of headerImages) {
-                            const style = img.getAttribute('style') || '';
-                            if (style.includes('ufcofficialwhite.svg') || style.includes('ufc')) {
-                                const section = img.closest('.cpm-CouponPodModule, .ss-HomepageSpotlight');
-                                if (section && !ufcSections.includes(section)) {
-                                    ufcSections.push(section);
-                                }
-                            }
-                        }
-
-                        // Extract fixtures from UFC sections
-                        for (const ufcSection of ufcSections) {
-                            const fixtureSelectors = [
-                                'div.cpm-ParticipantFixtureDetails100',
-                                'div[class*="ParticipantFixture"]',
-                                'div.gl-MarketFixture',
-                                'div.rcl-MarketFixtureDetailsLabelBase'
-                            ];
-
-                            for (const selector of fixtureSelectors) {
-                                const fixtures = Array.from(ufcSection.querySelectorAll(selector))
-                                    .filter(fixture => !fixture.className.includes('Hidden') && fixture.offsetParent !== null);
-                                allFixtures = allFixtures.concat(fixtures);
-                            }
-                        }
-                    }
-
-                    // Remove duplicates based on content
-                    const uniqueFixtures = [];
-                    const seenFixtureTexts = new Set();
-                    for (const fixture of allFixtures) {
-                        const fixtureText = fixture.textContent.trim();
-                        if (!seenFixtureTexts.has(fixtureText)) {
-                            seenFixtureTexts.add(fixtureText);
-                            uniqueFixtures.push(fixture);
-                        }
-                    }
-
-                    console.log(`🥊 Found ${uniqueFixtures.length} unique UFC fixtures`);
-
-                    // Step 2: Extract fight date with fallback for pregame
-                    const dateHeaders = document.querySelectorAll('div.cpm-MarketFixtureDateHeader');
-                    let fightDate = dateHeaders.length > 0 ? dateHeaders[0].textContent.trim() : null;
-
-                    // Fallback to today's date for pregame if no date found
-                    if (!fightDate || fightDate === null) {
-                        const today = new Date();
-                        const options = { weekday: 'short', month: 'short', day: 'numeric' };
-                        fightDate = today.toLocaleDateString('en-US', options);
-                    }
-
-                    // Step 3: Extract odds columns from the page (enhanced for spread and total)
-                    const oddsColumns = {};
-                    const marketOdds = document.querySelectorAll('div.cpm-MarketOdds');
-
-                    for (const section of marketOdds) {
-                        const header = section.querySelector('div.cpm-MarketOddsHeader');
-                        if (header) {
-                            const headerText = header.textContent.trim();
-                            // Look for moneyline, spread, and total columns
-                            if (headerText === 'To Win' || headerText === 'Money' || headerText === '1' ||
-                                headerText.includes('Spread') || headerText.includes('Handicap') ||
-                                headerText.includes('Total') || headerText.includes('Over/Under') ||
-                                headerText === 'O/U' || headerText === 'Line') {
-                                const columnOdds = [];
-                                const oddsElems = section.querySelectorAll('span.cpm-ParticipantOdds_Odds');
-                                for (const oddsElem of oddsElems) {
-                                    const oddsText = oddsElem.textContent;
-                                    if (oddsText && oddsText.trim()) {
-                                        columnOdds.push(oddsText.trim());
-                                    }
-                                }
-                                oddsColumns[headerText] = columnOdds;
-                            }
-                        }
-                    }
-
-                    console.log(`🥊 Odds columns found: ${Object.keys(oddsColumns).join(', ')}`);
-
-                    // Step 4: Process ALL fixtures and extract fighter information
-                    for (let i = 0; i < uniqueFixtures.length; i++) {
-                        const fixture = uniqueFixtures[i];
-
-                        // Extract fighter names using multiple approaches
-                        let fighter1, fighter2;
-
-                        // Method 1: Look for specific UFC team elements
-                        const teamElems = fixture.querySelectorAll('div.cpm-ParticipantFixtureDetails100_Team');
-                        if (teamElems.length >= 2) {
-                            fighter1 = teamElems[0].textContent.trim();
-                            fighter2 = teamElems[1].textContent.trim();
-                        } else {
-                            // Method 2: Look for general team containers
-                            const teamContainers = fixture.querySelectorAll('div.cpm-ParticipantFixtureDetails100_TeamContainer');
-                            if (teamContainers.length >= 2) {
-                                const t1 = teamContainers[0].querySelector('div.cpm-ParticipantFixtureDetails100_Team, div[class*="_Team"]');
-                                const t2 = teamContainers[1].querySelector('div.cpm-ParticipantFixtureDetails100_Team, div[class*="_Team"]');
-                                fighter1 = t1 ? t1.textContent.trim() : '';
-                                fighter2 = t2 ? t2.textContent.trim() : '';
-                            } else {
-                                // Method 3: Parse fixture text for UFC fights (format: Fighter1 v Fighter2)
-                                const fixtureText = fixture.textContent;
-                                if (fixtureText.includes(' v ')) {
-                                    const fighters = fixtureText.split(' v ');
-                                    if (fighters.length >= 2) {
-                                        fighter1 = fighters[0].trim();
-                                        fighter2 = fighters[1].trim();
-                                    }
-                                } else if (fixtureText.includes(' vs ')) {
-                                    const fighters = fixtureText.split(' vs ');
-                                    if (fighters.length >= 2) {
-                                        fighter1 = fighters[0].trim();
-                                        fighter2 = fighters[1].trim();
-                                    }
-                                }
-                            }
-                        }
-
-                        if (!fighter1 || !fighter2 || fighter1.length < 3 || fighter2.length < 3) {
-                            console.log(`❌ Invalid UFC fighters: ${fighter1} vs ${fighter2}`);
-                            continue;
-                        }
-
-                        // Create unique fight signature to avoid duplicates within UFC extraction
-                        const fightSignature = `${fighter1.toLowerCase().trim()} vs ${fighter2.toLowerCase().trim()}`;
-                        if (seenFights.has(fightSignature)) {
-                            console.log(`⚠️ Skipping duplicate UFC fight: ${fightSignature}`);
-                            continue;
-                        }
-                        seenFights.add(fightSignature);
-
-                        console.log(`✅ UFC Fight: ${fighter1} vs ${fighter2}`);
-
-                        // Extract fight time
-                        const timeElem = fixture.querySelector('div[class*="BookCloses"], div[class*="Clock"]');
-                        const fightTime = timeElem ? timeElem.textContent.trim() : "TBD";
-
-                        // Extract odds for moneyline, spread, and total
-                        const moneylineOdds = [];
-                        const spreadOdds = [];
-                        const totalOdds = [];
-
-                        // FIXED: Correctly map odds to individual fights
-                        // Each fight gets its own set of odds from the fixtures and columns
-
-                        // Moneyline odds (To Win) - Map correctly with actual HTML structure
-                        const moneylineKey = oddsColumns['To Win'] ? 'To Win' : (oddsColumns['Money'] ? 'Money' : null);
-                        if (moneylineKey && oddsColumns[moneylineKey] && oddsColumns[moneylineKey].length > i * 2 + 1) {
-                            moneylineOdds.push(oddsColumns[moneylineKey][i * 2]);     // Fighter 1 moneyline
-                            moneylineOdds.push(oddsColumns[moneylineKey][i * 2 + 1]); // Fighter 2 moneyline
-                        }
-
-                        // FIXED: Extract spread odds correctly from the odds columns
-                        // Find spread column odds for this specific fight (index i)
-                        const spreadColumnKey = Object.keys(oddsColumns).find(key => key.includes('Spread') || key.includes('Handicap'));
-                        if (spreadColumnKey && oddsColumns[spreadColumnKey] && oddsColumns[spreadColumnKey].length > i * 2 + 1) {
-                            // Each fight has 2 spread odds (fighter1 spread, fighter2 spread)
-                            const spread1 = oddsColumns[spreadColumnKey][i * 2] || '';
-                            const spread2 = oddsColumns[spreadColumnKey][i * 2 + 1] || '';
-                            if (spread1 && spread2) {
-                                spreadOdds.push(spread1);
-                                spreadOdds.push(spread2);
-                            }
-                        }
-
-                        // FIXED: Extract total odds correctly from the odds columns
-                        // Find total column odds for this specific fight (index i) 
-                        const totalColumnKey = Object.keys(oddsColumns).find(key => key.includes('Total') || key.includes('O/U') || key.includes('Over'));
-                        if (totalColumnKey && oddsColumns[totalColumnKey] && oddsColumns[totalColumnKey].length > i * 2 + 1) {
-                            // Each fight has 2 total odds (Over, Under)
-                            const total1 = oddsColumns[totalColumnKey][i * 2] || '';
-                            const total2 = oddsColumns[totalColumnKey][i * 2 + 1] || '';
-                            if (total1 && total2) {
-                                totalOdds.push(total1);
-                                totalOdds.push(total2);
-                            }
-                        }
-
-                        console.log(`🥊 Moneyline for ${fighter1} vs ${fighter2}: [${moneylineOdds.join(', ')}]`);
-                        console.log(`🥊 Spread for ${fighter1} vs ${fighter2}: [${spreadOdds.join(', ')}]`);
-                        console.log(`🥊 Total for ${fighter1} vs ${fighter2}: [${totalOdds.join(', ')}]`);
-
-                        // Create fight entry
-                        results.push({
-                            fighter1: fighter1,
-                            fighter2: fighter2,
-                            date: fightDate,
-                            time: fightTime,
-                            moneyline_odds: moneylineOdds,
-                            spread_odds: spreadOdds,
-                            total_odds: totalOdds,
-                            fixture_id: `ufc_${results.length}`
-                        });
-                    }
-
-                    console.log(`🥊 Total unique UFC fights extracted: ${results.length}`);
-                    return results;
-                }
-            """)
+            extraction_result = await self.scripts.run(page, 'ufc', label=sport)
 
             # Process results into Game objects
             for result in extraction_result:
@@ -3470,233 +1483,7 @@ class EnhancedIntelligentScraper:
             self.logger.info("⚽ Starting Soccer extraction...")
 
             # Soccer extraction using section-based detection to avoid UCL/EPL/MLS conflicts
-            extraction_result = await page.evaluate("""
-                () => {
-                    const results = [];
-                    const seenMatches = new Set();
-
-                    console.log('⚽ Starting Soccer extraction...');
-
-                    // Step 1: Find generic Soccer section (excluding UCL, EPL, MLS, and eSoccer)
-                    let soccerSection = null;
-                    
-                    // Method 1: Look for "Featured Matches" header (common for generic soccer)
-                    const headers = document.querySelectorAll('.cpm-Header_Title, .ss-HomeSpotlightHeader_Title');
-                    for (const header of headers) {
-                        const headerText = header.textContent.trim();
-                        // Match generic soccer headers, excluding specific leagues
-                        if ((headerText === 'Featured Matches' || headerText === 'Soccer' || headerText === 'Football') &&
-                            !headerText.includes('UEFA') && !headerText.includes('Champions League') &&
-                            !headerText.includes('Premier League') && !headerText.includes('EPL') &&
-                            !headerText.includes('MLS') && !headerText.includes('Major League Soccer')) {
-                            soccerSection = header.closest('.cpm-CouponPodModule, .ss-HomepageSpotlight');
-                            console.log(`Found generic Soccer section by header: "${headerText}"`);
-                            break;
-                        }
-                    }
-                    
-                    // Method 2: Look for generic soccer icon (zClass_Soccer.svg) without specific league identifiers
-                    if (!soccerSection) {
-                        const headerImages = document.querySelectorAll('.cpm-Header_HeaderImage, .ss-HomeSpotlightHeader_HeaderImage');
-                        for (const img of headerImages) {
-                            const style = img.getAttribute('style') || '';
-                            // Must have generic soccer icon, but NOT UCL, EPL, MLS, or eSports icons
-                            if (style.includes('zClass_Soccer.svg') &&
-                                !style.includes('zlogo_UCL_Official.svg') &&
-                                !style.includes('zlogo_MLS_Official.svg') &&
-                                !style.includes('zClass_ESports.svg')) {
-                                
-                                const section = img.closest('.cpm-CouponPodModule, .ss-HomepageSpotlight');
-                                if (section) {
-                                    // Double-check the section title doesn't contain specific league names
-                                    const sectionTitle = section.querySelector('.cpm-Header_Title, .ss-HomeSpotlightHeader_Title');
-                                    const titleText = sectionTitle ? sectionTitle.textContent.trim() : '';
-                                    
-                                    if (!titleText.includes('UEFA') && !titleText.includes('Champions League') &&
-                                        !titleText.includes('Premier League') && !titleText.includes('EPL') &&
-                                        !titleText.includes('MLS') && !titleText.includes('eSoccer') &&
-                                        !titleText.includes('e-soccer')) {
-                                        soccerSection = section;
-                                        console.log(`Found generic Soccer section by icon, title: "${titleText}"`);
-                                        break;
-                                    }
-                                }
-                            }
-                        }
-                    }
-
-                    if (!soccerSection) {
-                        console.log('Generic Soccer section not found (this is OK if UCL/EPL/MLS are being used)');
-                        return [];
-                    }
-
-                    // Step 2: Extract fixtures ONLY from the generic soccer section
-                    const allFixtures = Array.from(soccerSection.querySelectorAll('div.cpm-ParticipantFixtureDetailsSoccer'))
-                        .filter(fixture => !fixture.className.includes('Hidden'));
-
-                    console.log(`Found ${allFixtures.length} soccer fixtures in generic soccer section`);
-
-                    // Step 3: Extract odds columns from the soccer section
-                    const oddsColumns = {};
-                    const marketOdds = Array.from(soccerSection.querySelectorAll('div.cpm-MarketOdds'));
-                    
-                    for (const section of marketOdds) {
-                        const header = section.querySelector('div.cpm-MarketOddsHeader');
-                        if (header) {
-                            const headerText = header.textContent.trim();
-                            if (['1', 'X', '2', 'Money', 'Spread', 'Total'].includes(headerText)) {
-                                const columnOdds = [];
-                                const oddsElems = section.querySelectorAll('span.cpm-ParticipantOdds_Odds');
-                                for (const oddsElem of oddsElems) {
-                                    const oddsText = oddsElem.textContent;
-                                    if (oddsText) {
-                                        columnOdds.push(oddsText.trim());
-                                    }
-                                }
-                                oddsColumns[headerText] = columnOdds;
-                            }
-                        }
-                    }
-
-                    // Step 4: Extract game date
-                    const dateHeader = soccerSection.querySelector('div.cpm-MarketFixtureDateHeader');
-                    let gameDate = dateHeader ? dateHeader.textContent.trim() : null;
-                    if (!gameDate) {
-                        const today = new Date();
-                        const options = { weekday: 'short', month: 'short', day: 'numeric' };
-                        gameDate = today.toLocaleDateString('en-US', options);
-                    }
-
-                    // Step 5: Extract odds columns from the scoped section
-                    const oddsColumns = {};
-                    const marketOdds = soccerSection.querySelectorAll('div.cpm-MarketOdds');
-
-                    for (const section of marketOdds) {
-                        const header = section.querySelector('div.cpm-MarketOddsHeader');
-                        if (header) {
-                            const headerText = header.textContent.trim();
-                            if (headerText === '1' || headerText === 'X' || headerText === '2' || 
-                                headerText === 'Money' || headerText === '1X2' || headerText === 'Match Winner') {
-                                const columnOdds = [];
-                                const oddsElems = section.querySelectorAll('span.cpm-ParticipantOdds_Odds');
-                                for (const oddsElem of oddsElems) {
-                                    const oddsText = oddsElem.textContent;
-                                    if (oddsText && oddsText.trim()) {
-                                        columnOdds.push(oddsText.trim());
-                                    }
-                                }
-                                oddsColumns[headerText] = columnOdds;
-                            }
-                        }
-                    }
-
-                    console.log(`📊 Soccer Odds columns found: ${Object.keys(oddsColumns).join(', ')}`);
-
-                    // Step 6: Process fixtures from the scoped soccer section
-                    for (let i = 0; i < allFixtures.length; i++) {
-                        const fixture = allFixtures[i];
-
-                        // Extract team names using soccer-specific selectors
-                        let team1, team2;
-
-                        // Method 1: Direct soccer team elements
-                        const teamElems = fixture.querySelectorAll('div.cpm-ParticipantFixtureDetailsSoccer_Team');
-                        if (teamElems.length >= 2) {
-                            team1 = teamElems[0].textContent.trim();
-                            team2 = teamElems[1].textContent.trim();
-                        } else {
-                            // Method 2: Parse fixture text for soccer matches
-                            const fixtureText = fixture.textContent;
-                            if (fixtureText.includes(' v ')) {
-                                const teams = fixtureText.split(' v ');
-                                if (teams.length >= 2) {
-                                    team1 = teams[0].trim();
-                                    team2 = teams[1].trim();
-                                }
-                            }
-                        }
-
-                        if (!team1 || !team2 || team1.length < 3 || team2.length < 3) {
-                            console.log(`❌ Invalid soccer teams: ${team1} vs ${team2}`);
-                            continue;
-                        }
-
-                        // Additional eSoccer filtering (double-check)
-                        const combinedText = `${team1} ${team2}`.toLowerCase();
-                        if (combinedText.includes('esoccer') || combinedText.includes('e-soccer') ||
-                            combinedText.includes('virtual') || combinedText.includes('simulated')) {
-                            console.log(`⚠️ Skipping esoccer match: ${team1} vs ${team2}`);
-                            continue;
-                        }
-
-                        // Check for eSoccer nickname pattern
-                        const team1HasNickname = team1.includes('(') && team1.includes(')') &&
-                            !team1.toLowerCase().includes('youth') && !team1.toLowerCase().includes('u21');
-                        const team2HasNickname = team2.includes('(') && team2.includes(')') &&
-                            !team2.toLowerCase().includes('youth') && !team2.toLowerCase().includes('u21');
-
-                        if (team1HasNickname || team2HasNickname) {
-                            console.log(`⚠️ Skipping potential esoccer match with nicknames: ${team1} vs ${team2}`);
-                            continue;
-                        }
-
-                        // Create unique match signature to avoid duplicates
-                        const matchSignature = `${team1.toLowerCase().trim()} vs ${team2.toLowerCase().trim()}`;
-                        if (seenMatches.has(matchSignature)) {
-                            console.log(`⚠️ Skipping duplicate soccer match: ${matchSignature}`);
-                            continue;
-                        }
-                        seenMatches.add(matchSignature);
-
-                        console.log(`✅ Soccer Match: ${team1} vs ${team2}`);
-
-                        // Extract match time
-                        const timeElem = fixture.querySelector('div.cpm-ParticipantFixtureDetailsSoccer_BookCloses');
-                        const matchTime = timeElem ? timeElem.textContent.trim() : "TBD";
-
-                        // Map odds to teams (1X2 format: 1=home, X=draw, 2=away)
-                        const moneylineOdds = [];
-
-                        // Use '1', 'X', '2' columns for soccer 1X2 betting
-                        if (oddsColumns['1'] && oddsColumns['1'].length > i) {
-                            moneylineOdds.push(oddsColumns['1'][i]);  // Home team odds
-                        }
-
-                        if (oddsColumns['X'] && oddsColumns['X'].length > i) {
-                            moneylineOdds.push(oddsColumns['X'][i]);  // Draw odds
-                        }
-
-                        if (oddsColumns['2'] && oddsColumns['2'].length > i) {
-                            moneylineOdds.push(oddsColumns['2'][i]);  // Away team odds
-                        }
-
-                        // Fallback to other formats if 1X2 not available
-                        if (moneylineOdds.length === 0) {
-                            const oddsKey = oddsColumns['Money'] ? 'Money' : (oddsColumns['1X2'] ? '1X2' : 'Match Winner');
-                            if (oddsColumns[oddsKey] && oddsColumns[oddsKey].length > i * 3 + 2) {
-                                moneylineOdds.push(oddsColumns[oddsKey][i * 3]);     // Home team odds
-                                moneylineOdds.push(oddsColumns[oddsKey][i * 3 + 1]); // Draw odds
-                                moneylineOdds.push(oddsColumns[oddsKey][i * 3 + 2]); // Away team odds
-                            }
-                        }
-
-                        console.log(`⚽ Odds for ${team1} vs ${team2}: [${moneylineOdds.join(', ')}]`);
-
-                        // Create match entry
-                        results.push({
-                            team1: team1,
-                            team2: team2,
-                            date: matchDate,
-                            time: matchTime,
-                            moneyline_odds: moneylineOdds,
-                            fixture_id: `soccer_${results.length}`
-                        });
-                    }
-
-                    console.log(`⚽ Total unique REAL soccer matches extracted: ${results.length}`);
-                    return results;
-                }
-            """)
+            extraction_result = await self.scripts.run(page, 'soccer', label=sport)
 
             # Process results into Game objects
             for result in extraction_result:
@@ -3864,6 +1651,7 @@ class EnhancedIntelligentScraper:
 
     # ----------------------------- Main Orchestration ----------------------------- #
 
+    @timed_stage('collection_cycle')
     async def scrape_all_sports(self) -> Dict[str, Any]:
         """Enhanced orchestration with improved error handling"""
         start_time = datetime.now()
@@ -3912,6 +1700,7 @@ class EnhancedIntelligentScraper:
                 
                 # Fast selector waiting like test scraper
                 await page.wait_for_selector('.ss-HomepageSpotlight', timeout=self.timeout)
+                await self.scripts.install(page)
                 
                 # Detect available sport tabs
                 sport_tabs = await self.detect_sport_tabs(page)
@@ -4002,9 +1791,21 @@ class EnhancedIntelligentScraper:
                 self.logger.info(f"{sport}: {count} games")
         else:
             self.logger.warning("Extraction failed or incomplete - no games extracted")
-            
+        
+        self.log_script_summary()
         return result
 
+    def log_script_summary(self):
+        """Per-sport in-page extraction latency and bytes sent per call"""
+        summary = self.scripts.summary()
+        if not summary:
+            return
+        self.logger.info(f"Extraction scripts ({self.scripts.mode} mode):")
+        for label, row in summary.items():
+            self.logger.info(f"  {label:<8} {row['calls']:3d} calls | mean {row['mean_ms']:7.1f} ms | "
+                             f"max {row['max_ms']:7.1f} ms | {row['bytes_per_call']:6d} B/call | "
+                             f"{row['installs']} installs | {row['errors']} errors")
+
     async def extract_single_sport_realtime(self, sport: str) -> Dict[str, Any]:
         """FAST real-time extraction using existing browser session with minimal overhead"""
         try:
@@ -4114,6 +1915,7 @@ class EnhancedIntelligentScraper:
                 args=['--no-sandbox', '--disable-dev-shm-usage']
             )
             self.page = await self.browser.new_page()
+            await self.scripts.install(self.page)
             self.logger.info("✅ Enhanced scraper initialized successfully")
         except Exception as e:
             self.logger.error(f"❌ Failed to initialize scraper: {e}")
@@ -4363,111 +2165,7 @@ class EnhancedIntelligentScraper:
         try:
             self.logger.info("⚽ Starting EPL extraction...")
 
-            extraction_result = await page.evaluate("""
-                () => {
-                    const results = [];
-
-                    // Step 1: Find EPL section by Premier League header
-                    let eplSection = null;
-                    const headers = document.querySelectorAll('.cpm-Header_Title, .ss-HomeSpotlightHeader_Title');
-                    for (const header of headers) {
-                        if (header.textContent.trim() === 'Premier League') {
-                            eplSection = header.closest('.cpm-CouponPodModule, .ss-HomepageSpotlight');
-                            console.log('Found EPL section by Premier League title');
-                            break;
-                        }
-                    }
-
-                    if (!eplSection) {
-                        console.log('EPL section not found');
-                        return [];
-                    }
-
-                    // Step 2: Extract fixtures from EPL section
-                    const fixtures = Array.from(eplSection.querySelectorAll('div.cpm-ParticipantFixtureDetailsSoccer'))
-                        .filter(fixture => !fixture.className.includes('Hidden'));
-
-                    console.log(`Found ${fixtures.length} EPL fixtures`);
-
-                    // Step 3: Extract odds columns (1, X, 2 format for soccer)
-                    const oddsColumns = {};
-                    const marketOdds = Array.from(eplSection.querySelectorAll('div.cpm-MarketOdds'));
-                    
-                    for (const section of marketOdds) {
-                        const header = section.querySelector('div.cpm-MarketOddsHeader');
-                        if (header) {
-                            const headerText = header.textContent.trim();
-                            if (['1', 'X', '2'].includes(headerText)) {
-                                const columnOdds = [];
-                                const oddsElems = section.querySelectorAll('span.cpm-ParticipantOdds_Odds');
-                                for (const oddsElem of oddsElems) {
-                                    const oddsText = oddsElem.textContent;
-                                    if (oddsText) {
-                                        columnOdds.push(oddsText.trim());
-                                    }
-                                }
-                                oddsColumns[headerText] = columnOdds;
-                            }
-                        }
-                    }
-
-                    // Step 4: Extract game date
-                    const dateHeader = eplSection.querySelector('div.cpm-MarketFixtureDateHeader');
-                    let gameDate = dateHeader ? dateHeader.textContent.trim() : null;
-                    if (!gameDate) {
-                        const today = new Date();
-                        const options = { weekday: 'short', month: 'short', day: 'numeric' };
-                        gameDate = today.toLocaleDateString('en-US', options);
-                    }
-
-                    // Step 5: Process fixtures
-                    for (let i = 0; i < fixtures.length; i++) {
-                        const fixture = fixtures[i];
-
-                        // Extract team names
-                        const teamElements = fixture.querySelectorAll('div.cpm-ParticipantFixtureDetailsSoccer_Team');
-                        if (teamElements.length < 2) continue;
-
-                        const team1 = teamElements[0].textContent.trim();
-                        const team2 = teamElements[1].textContent.trim();
-
-                        // Extract time
-                        const timeElement = fixture.querySelector('div.cpm-ParticipantFixtureDetailsSoccer_BookCloses');
-                        const gameTime = timeElement ? timeElement.textContent.trim() : "TBD";
-
-                        // Map odds for soccer (1=home win, X=draw, 2=away win)
-                        const moneylineOdds = [];
-                        
-                        // Team 1 (Home) odds from column "1"
-                        if (oddsColumns["1"] && oddsColumns["1"].length > i) {
-                            moneylineOdds.push(oddsColumns["1"][i]);
-                        }
-                        
-                        // Draw odds from column "X" (we'll include this as additional info)
-                        let drawOdds = null;
-                        if (oddsColumns["X"] && oddsColumns["X"].length > i) {
-                            drawOdds = oddsColumns["X"][i];
-                        }
-                        
-                        // Team 2 (Away) odds from column "2"
-                        if (oddsColumns["2"] && oddsColumns["2"].length > i) {
-                            moneylineOdds.push(oddsColumns["2"][i]);
-                        }
-
-                        results.push({
-                            team1: team1,
-                            team2: team2,
-                            date: gameDate,
-                            time: gameTime,
-                            moneyline: moneylineOdds,
-                            draw_odds: drawOdds, // EPL specific - draw option
-                            fixture_id: `epl_${i}`
-                        });
-                    }
-
-                    return results;
-                }
-            """)
+            extraction_result = await self.scripts.run(page, 'soccer_section', SECTION_CONFIGS['EPL'], label=sport)
 
             # Process results into Game objects
             for result in extraction_result:
@@ -4508,126 +2206,7 @@ class EnhancedIntelligentScraper:
         try:
             self.logger.info("⚽ Starting UCL extraction...")
 
-            extraction_result = await page.evaluate("""
-                () => {
-                    const results = [];
-
-                    // Step 1: Find UCL section by UEFA Champions League header or logo
-                    let uclSection = null;
-                    
-                    // Method 1: Look for UCL logo
-                    const headerImages = document.querySelectorAll('.cpm-Header_HeaderImage, .ss-HomeSpotlightHeader_HeaderImage');
-                    for (const img of headerImages) {
-                        const style = img.getAttribute('style') || '';
-                        if (style.includes('zlogo_UCL_Official.svg')) {
-                            uclSection = img.closest('.cpm-CouponPodModule, .ss-HomepageSpotlight');
-                            console.log('Found UCL section by UCL logo');
-                            break;
-                        }
-                    }
-                    
-                    // Method 2: Look for "UEFA Champions League" text
-                    if (!uclSection) {
-                        const headers = document.querySelectorAll('.cpm-Header_Title, .ss-HomeSpotlightHeader_Title');
-                        for (const header of headers) {
-                            if (header.textContent.includes('UEFA Champions League') || header.textContent.includes('Champions League')) {
-                                uclSection = header.closest('.cpm-CouponPodModule, .ss-HomepageSpotlight');
-                                console.log('Found UCL section by title');
-                                break;
-                            }
-                        }
-                    }
-
-                    if (!uclSection) {
-                        console.log('UCL section not found');
-                        return [];
-                    }
-
-                    // Step 2: Extract fixtures from UCL section
-                    const fixtures = Array.from(uclSection.querySelectorAll('div.cpm-ParticipantFixtureDetailsSoccer'))
-                        .filter(fixture => !fixture.className.includes('Hidden'));
-
-                    console.log(`Found ${fixtures.length} UCL fixtures`);
-
-                    // Step 3: Extract odds columns (1, X, 2 format for soccer)
-                    const oddsColumns = {};
-                    const marketOdds = Array.from(uclSection.querySelectorAll('div.cpm-MarketOdds'));
-                    
-                    for (const section of marketOdds) {
-                        const header = section.querySelector('div.cpm-MarketOddsHeader');
-                        if (header) {
-                            const headerText = header.textContent.trim();
-                            if (['1', 'X', '2'].includes(headerText)) {
-                                const columnOdds = [];
-                                const oddsElems = section.querySelectorAll('span.cpm-ParticipantOdds_Odds');
-                                for (const oddsElem of oddsElems) {
-                                    const oddsText = oddsElem.textContent;
-                                    if (oddsText) {
-                                        columnOdds.push(oddsText.trim());
-                                    }
-                                }
-                                oddsColumns[headerText] = columnOdds;
-                            }
-                        }
-                    }
-
-                    // Step 4: Extract game date
-                    const dateHeader = uclSection.querySelector('div.cpm-MarketFixtureDateHeader');
-                    let gameDate = dateHeader ? dateHeader.textContent.trim() : null;
-                    if (!gameDate) {
-                        const today = new Date();
-                        const options = { weekday: 'short', month: 'short', day: 'numeric' };
-                        gameDate = today.toLocaleDateString('en-US', options);
-                    }
-
-                    // Step 5: Process fixtures
-                    for (let i = 0; i < fixtures.length; i++) {
-                        const fixture = fixtures[i];
-
-                        // Extract team names
-                        const teamElements = fixture.querySelectorAll('div.cpm-ParticipantFixtureDetailsSoccer_Team');
-                        if (teamElements.length < 2) continue;
-
-                        const team1 = teamElements[0].textContent.trim();
-                        const team2 = teamElements[1].textContent.trim();
-
-                        // Extract time
-                        const timeElement = fixture.querySelector('div.cpm-ParticipantFixtureDetailsSoccer_BookCloses');
-                        const gameTime = timeElement ? timeElement.textContent.trim() : "TBD";
-
-                        // Map odds for soccer (1=home win, X=draw, 2=away win)
-                        const moneylineOdds = [];
-                        
-                        // Team 1 (Home) odds from column "1"
-                        if (oddsColumns["1"] && oddsColumns["1"].length > i) {
-                            moneylineOdds.push(oddsColumns["1"][i]);
-                        }
-                        
-                        // Draw odds from column "X"
-                        let drawOdds = null;
-                        if (oddsColumns["X"] && oddsColumns["X"].length > i) {
-                            drawOdds = oddsColumns["X"][i];
-                        }
-                        
-                        // Team 2 (Away) odds from column "2"
-                        if (oddsColumns["2"] && oddsColumns["2"].length > i) {
-                            moneylineOdds.push(oddsColumns["2"][i]);
-                        }
-
-                        results.push({
-                            team1: team1,
-                            team2: team2,
-                            date: gameDate,
-                            time: gameTime,
-                            moneyline: moneylineOdds,
-                            draw_odds: drawOdds,
-                            fixture_id: `ucl_${i}`
-                        });
-                    }
-
-                    return results;
-                }
-            """)
+            extraction_result = await self.scripts.run(page, 'soccer_section', SECTION_CONFIGS['UCL'], label=sport)
 
             # Process results into Game objects
             for result in extraction_result:
@@ -4668,126 +2247,7 @@ class EnhancedIntelligentScraper:
         try:
             self.logger.info("⚽ Starting MLS extraction...")
 
-            extraction_result = await page.evaluate("""
-                () => {
-                    const results = [];
-
-                    // Step 1: Find MLS section by Round 1 header or MLS logo
-                    let mlsSection = null;
-                    
-                    // Method 1: Look for MLS logo
-                    const headerImages = document.querySelectorAll('.cpm-Header_HeaderImage, .ss-HomeSpotlightHeader_HeaderImage');
-                    for (const img of headerImages) {
-                        const style = img.getAttribute('style') || '';
-                        if (style.includes('zlogo_MLS_Official.svg')) {
-                            mlsSection = img.closest('.cpm-CouponPodModule, .ss-HomepageSpotlight');
-                            console.log('Found MLS section by MLS logo');
-                            break;
-                        }
-                    }
-
-                    // Method 2: Look for Round 1 title as backup
-                    if (!mlsSection) {
-                        const headers = document.querySelectorAll('.cpm-Header_Title, .ss-HomeSpotlightHeader_Title');
-                        for (const header of headers) {
-                            if (header.textContent.trim() === 'Round 1') {
-                                mlsSection = header.closest('.cpm-CouponPodModule, .ss-HomepageSpotlight');
-                                console.log('Found MLS section by Round 1 title');
-                                break;
-                            }
-                        }
-                    }
-
-                    if (!mlsSection) {
-                        console.log('MLS section not found');
-                        return [];
-                    }
-
-                    // Step 2: Extract fixtures from MLS section
-                    const fixtures = Array.from(mlsSection.querySelectorAll('div.cpm-ParticipantFixtureDetailsSoccer'))
-                        .filter(fixture => !fixture.className.includes('Hidden'));
-
-                    console.log(`Found ${fixtures.length} MLS fixtures`);
-
-                    // Step 3: Extract odds columns (1, X, 2 format for soccer)
-                    const oddsColumns = {};
-                    const marketOdds = Array.from(mlsSection.querySelectorAll('div.cpm-MarketOdds'));
-                    
-                    for (const section of marketOdds) {
-                        const header = section.querySelector('div.cpm-MarketOddsHeader');
-                        if (header) {
-                            const headerText = header.textContent.trim();
-                            if (['1', 'X', '2'].includes(headerText)) {
-                                const columnOdds = [];
-                                const oddsElems = section.querySelectorAll('span.cpm-ParticipantOdds_Odds');
-                                for (const oddsElem of oddsElems) {
-                                    const oddsText = oddsElem.textContent;
-                                    if (oddsText) {
-                                        columnOdds.push(oddsText.trim());
-                                    }
-                                }
-                                oddsColumns[headerText] = columnOdds;
-                            }
-                        }
-                    }
-
-                    // Step 4: Extract game dates for each date section
-                    const dateHeaders = mlsSection.querySelectorAll('div.cpm-MarketFixtureDateHeader');
-                    let gameDate = dateHeaders.length > 0 ? dateHeaders[0].textContent.trim() : null;
-                    if (!gameDate) {
-                        const today = new Date();
-                        const options = { weekday: 'short', month: 'short', day: 'numeric' };
-                        gameDate = today.toLocaleDateString('en-US', options);
-                    }
-
-                    // Step 5: Process fixtures
-                    for (let i = 0; i < fixtures.length; i++) {
-                        const fixture = fixtures[i];
-
-                        // Extract team names
-                        const teamElements = fixture.querySelectorAll('div.cpm-ParticipantFixtureDetailsSoccer_Team');
-                        if (teamElements.length < 2) continue;
-
-                        const team1 = teamElements[0].textContent.trim();
-                        const team2 = teamElements[1].textContent.trim();
-
-                        // Extract time
-                        const timeElement = fixture.querySelector('div.cpm-ParticipantFixtureDetailsSoccer_BookCloses');
-                        const gameTime = timeElement ? timeElement.textContent.trim() : "TBD";
-
-                        // Map odds for soccer (1=home win, X=draw, 2=away win)
-                        const moneylineOdds = [];
-                        
-                        // Team 1 (Home) odds from column "1"
-                        if (oddsColumns["1"] && oddsColumns["1"].length > i) {
-                            moneylineOdds.push(oddsColumns["1"][i]);
-                        }
-                        
-                        // Draw odds from column "X"
-                        let drawOdds = null;
-                        if (oddsColumns["X"] && oddsColumns["X"].length > i) {
-                            drawOdds = oddsColumns["X"][i];
-                        }
-                        
-                        // Team 2 (Away) odds from column "2"
-                        if (oddsColumns["2"] && oddsColumns["2"].length > i) {
-                            moneylineOdds.push(oddsColumns["2"][i]);
-                        }
-
-                        results.push({
-                            team1: team1,
-                            team2: team2,
-                            date: gameDate,
-                            time: gameTime,
-                            moneyline: moneylineOdds,
-                            draw_odds: drawOdds, // MLS specific - draw option
-                            fixture_id: `mls_${i}`
-                        });
-                    }
-
-                    return results;
-                }
-            """)
+            extraction_result = await self.scripts.run(page, 'soccer_section', SECTION_CONFIGS['MLS'], label=sport)
 
             # Process results into Game objects
             for result in extraction_result:
@@ -4911,14 +2371,19 @@ async def main():
     parser.add_argument("--wait", type=int, default=4000, help="Wait time after tab clicks (ms)")
     parser.add_argument("--scrolls", type=int, default=15, help="Maximum scroll iterations")
     parser.add_argument("--scroll-pause", type=int, default=500, help="Pause between scrolls (ms)")
+    parser.add_argument("--scripts", choices=['library', 'inline'], default='library',
+                        help="Extraction scripts installed once per page (library) or sent with every call (inline)")
     
     args = parser.parse_args()
 
+    if METRICS is not None:
+        METRICS.configure('bet365_pregame')
     scraper = EnhancedIntelligentScraper(
         headless=args.headless,
         load_wait=args.wait,
         max_scrolls=args.scrolls,
         scroll_pause=args.scroll_pause,
+        script_mode=args.scripts,
     )
     
     await scraper.scrape_all_sports()
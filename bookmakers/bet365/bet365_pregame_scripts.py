@@ -0,0 +1,2094 @@
+#!/usr/bin/env python3
+"""
+Bet365 Pregame Extraction Scripts
+In-page JavaScript used by EnhancedIntelligentScraper, registered with a
+PageScriptRegistry (utils/helpers/page_scripts.py) so each page compiles
+them once and every extraction call only sends a name and a config.
+
+EXTRACTORS: name -> JS function expression fn(root, cfg, helpers).
+The league-section extractors (basketball_section, soccer_section) are shared
+by several sports and take their selectors from SECTION_CONFIGS; the others
+are sport-specific and ignore cfg.
+"""
+
+from typing import Any, Dict
+
+NAMESPACE = '__b365x'
+
+HELPERS = """
+{
+    // Competition section on the homepage: logo element, header image or header title
+    findSection(cfg) {
+        const containers = '.cpm-CouponPodModule, .ss-HomepageSpotlight';
+        const accepted = (section) => section && !(cfg.excludeHtml && section.innerHTML.includes(cfg.excludeHtml));
+
+        if (cfg.logoSelector) {
+            for (const logo of document.querySelectorAll(cfg.logoSelector)) {
+                const section = logo.closest(containers);
+                if (accepted(section) && (!cfg.requireHtml || section.innerHTML.includes(cfg.requireHtml))) {
+                    return section;
+                }
+            }
+        }
+
+        if (cfg.headerLogos && cfg.headerLogos.length) {
+            const headerImages = document.querySelectorAll('.cpm-Header_HeaderImage, .ss-HomeSpotlightHeader_HeaderImage');
+            for (const img of headerImages) {
+                const style = img.getAttribute('style') || '';
+                if (cfg.headerLogos.some(logo => style.includes(logo))) {
+                    const section = img.closest(containers);
+                    if (accepted(section)) return section;
+                }
+            }
+        }
+
+        const exact = cfg.titlesExact || [];
+        const partial = cfg.titlesContains || [];
+        if (exact.length || partial.length) {
+            const headers = document.querySelectorAll('.cpm-Header_Title, .ss-HomeSpotlightHeader_Title');
+            for (const header of headers) {
+                const text = header.textContent;
+                if (exact.includes(text.trim()) || partial.some(title => text.includes(title))) {
+                    const section = header.closest(containers);
+                    if (accepted(section)) return section;
+                }
+            }
+        }
+        return null;
+    },
+
+    // Fixture date header of a section, today's date for pregame pages without one
+    sectionDate(section) {
+        const dateHeader = section.querySelector('div.cpm-MarketFixtureDateHeader');
+        const gameDate = dateHeader ? dateHeader.textContent.trim() : null;
+        if (gameDate) return gameDate;
+        const options = { weekday: 'short', month: 'short', day: 'numeric' };
+        return new Date().toLocaleDateString('en-US', options);
+    }
+}
+"""
+
+EXTRACTORS: Dict[str, str] = {
+    # Grid-scoped: root is the sport grid element (the page document if called with a page)
+    'mlb': """
+(grid) => {
+    const results = [];
+    const fixtures = Array.from(grid.querySelectorAll('div.cpm-MarketFixture'));
+
+    for (const fixture of fixtures) {
+        // Find visible baseball fixture details
+        const details = Array.from(fixture.querySelectorAll('div[class*="cpm-ParticipantFixtureDetailsBaseball"], div[class*="cpm-ParticipantFixtureDetails120"]'))
+            .find(d => !d.className.includes('Hidden'));
+
+        if (!details) continue;
+
+        // Extract teams from team containers
+        const teamContainers = Array.from(details.querySelectorAll('div[class*="_TeamContainer"]'));
+        const teamNodes = [];
+
+        for (const container of teamContainers) {
+            const teamEl = container.querySelector('div[class*="_Team"]');
+            if (teamEl) {
+                const teamText = teamEl.textContent.trim();
+                if (teamText && teamText.length > 1) {
+                    teamNodes.push(teamText);
+                }
+            }
+        }
+
+        if (teamNodes.length < 2) continue;
+
+        // Extract time
+        const timeEl = details.querySelector('div[class*="_BookCloses"]');
+        const gameTime = timeEl ? timeEl.textContent.trim() : null;
+
+        // Extract date
+        const dateEl = fixture.querySelector('div.cpm-MarketFixtureDateHeader');
+        const gameDate = dateEl ? dateEl.textContent.trim() : null;
+
+        // Extract odds from sibling elements
+        const odds = {};
+        let sibling = fixture.nextElementSibling;
+
+        while (sibling && !sibling.className.includes('cpm-MarketFixture')) {
+            if (sibling.className.includes('cpm-MarketOdds')) {
+                const header = sibling.querySelector('.cpm-MarketOddsHeader');
+                const headerText = header ? header.textContent.trim().toLowerCase() : '';
+
+                let category = null;
+                if (headerText.includes('run line') || headerText.includes('runline')) {
+                    category = 'runline';
+                } else if (headerText === 'money' || headerText.includes('moneyline')) {
+                    category = 'moneyline';
+                } else if (headerText.includes('total')) {
+                    category = 'total';
+                }
+
+                if (category) {
+                    const oddsElements = Array.from(sibling.querySelectorAll('.cpm-ParticipantOdds'));
+                    const oddsValues = [];
+
+                    for (const el of oddsElements) {
+                        const handicap = el.querySelector('.cpm-ParticipantOdds_Handicap');
+                        const price = el.querySelector('.cpm-ParticipantOdds_Odds');
+
+                        const hText = handicap ? handicap.textContent.trim() : '';
+                        const pText = price ? price.textContent.trim() : '';
+
+                        if (pText && /^[+-]\\d{2,4}$/.test(pText)) {
+                            if (hText && category !== 'moneyline') {
+                                oddsValues.push(`${hText} (${pText})`);
+                            } else {
+                                oddsValues.push(pText);
+                            }
+                        }
+                    }
+
+                    if (oddsValues.length > 0) {
+                        odds[category] = oddsValues.slice(0, 2);
+                    }
+                }
+            }
+            sibling = sibling.nextElementSibling;
+        }
+
+        results.push({
+            team1: teamNodes[0],
+            team2: teamNodes[1], 
+            time: gameTime,
+            date: gameDate,
+            odds: odds,
+            fixture_id: `mlb_${results.length}`
+        });
+    }
+
+    return results;
+}
+""",
+    'nhl': """
+(grid) => {
+    const results = [];
+
+    // Find all unique team pairs first
+    const gameFixtures = Array.from(grid.querySelectorAll('div[class*="cpm-ParticipantFixtureDetailsIceHockey"]'))
+        .filter(d => !d.className.includes('Hidden'));
+
+    // Extract date with fallback for pregame
+    const dateEl = grid.querySelector('div.cpm-MarketFixtureDateHeader');
+    let gameDate = dateEl ? dateEl.textContent.trim() : null;
+
+    // Fallback to today's date for pregame if no date found  
+    if (!gameDate || gameDate === null) {
+        const today = new Date();
+        const options = { weekday: 'short', month: 'short', day: 'numeric' };
+        gameDate = today.toLocaleDateString('en-US', options);
+    }
+
+    const seenGames = new Set();
+
+    for (const fixture of gameFixtures) {
+        // Extract teams
+        const teamContainers = Array.from(fixture.querySelectorAll('div.cpm-ParticipantFixtureDetailsIceHockey_TeamContainer'));
+        const teams = [];
+
+        for (const container of teamContainers) {
+            const teamEl = container.querySelector('div.cpm-ParticipantFixtureDetailsIceHockey_Team');
+            if (teamEl) {
+                teams.push(teamEl.textContent.trim());
+            }
+        }
+
+        if (teams.length < 2) continue;
+
+        // Create unique game signature to avoid duplicates
+        const gameSignature = `${teams[0]} vs ${teams[1]}`;
+        if (seenGames.has(gameSignature)) continue;
+        seenGames.add(gameSignature);
+
+        // Extract time
+        const timeEl = fixture.querySelector('div.cpm-ParticipantFixtureDetailsIceHockey_BookCloses');
+        const gameTime = timeEl ? timeEl.textContent.trim() : null;
+
+        // NHL: Extract spread, total, AND moneyline odds (user wants all three)
+        const odds = {};
+        const oddsColumns = Array.from(grid.querySelectorAll('div.cpm-MarketOdds'));
+
+        if (oddsColumns.length > 0) {
+            // Extract ALL odds types: spread, total, and moneyline
+            for (const column of oddsColumns) {
+                const header = column.querySelector('.cpm-MarketOddsHeader');
+                if (header) {
+                    const headerText = header.textContent.toLowerCase().trim();
+
+                    // Map header text to odds type
+                    let oddsType = null;
+                    if (headerText === 'money' || headerText === 'moneyline') {
+                        oddsType = 'moneyline';
+                    } else if (headerText.includes('spread') || headerText.includes('puck') || headerText.includes('handicap')) {
+                        oddsType = 'spread';
+                    } else if (headerText.includes('total') || headerText.includes('over') || headerText.includes('under')) {
+                        oddsType = 'total';
+                    }
+
+                    if (oddsType) {
+                        const columnOdds = Array.from(column.querySelectorAll('.cpm-ParticipantOdds'));
+                        const gameIndex = results.length;
+                        const startIndex = gameIndex * 2;
+
+                        if (columnOdds.length > startIndex + 1) {
+                            const odds1 = columnOdds[startIndex];
+                            const odds2 = columnOdds[startIndex + 1];
+
+                            let p1, p2;
+
+                            if (oddsType === 'moneyline') {
+                                // Moneyline: just odds values
+                                p1 = odds1?.querySelector('.cpm-ParticipantOdds_Odds')?.textContent?.trim();
+                                p2 = odds2?.querySelector('.cpm-ParticipantOdds_Odds')?.textContent?.trim();
+                            } else {
+                                // Spread/Total: include handicap + odds (clean format like NCAAF)
+                                const h1 = odds1?.querySelector('.cpm-ParticipantOdds_Handicap')?.textContent?.trim();
+                                const o1 = odds1?.querySelector('.cpm-ParticipantOdds_Odds')?.textContent?.trim();
+                                const h2 = odds2?.querySelector('.cpm-ParticipantOdds_Handicap')?.textContent?.trim();
+                                const o2 = odds2?.querySelector('.cpm-ParticipantOdds_Odds')?.textContent?.trim();
+
+                                p1 = (h1 && o1) ? `${h1} ${o1}` : o1;
+                                p2 = (h2 && o2) ? `${h2} ${o2}` : o2;
+                            }
+
+                            if (p1 && p2) {
+                                odds[oddsType] = [p1, p2];
+                                console.log(`NHL: Extracted ${oddsType} odds: [${p1}, ${p2}]`);
+                            }
+                        }
+                    }
+                }
+            }
+        }
+
+        const game = {
+            teams: teams,
+            time: gameTime,
+            date: gameDate,  // Add date field
+            league: 'NHL',
+            odds: Object.keys(odds).length > 0 ? odds : null,
+            confidence: teams.length > 1 ? 0.9 : 0.5
+        };
+
+        results.push(game);
+        console.log('Extracted NHL game:', teams.join(' vs '));
+    }
+
+    return results;
+}
+""",
+    'football': """
+(grid) => {
+    const results = [];
+    const seenGames = new Set();
+
+    console.log('🏈 Starting football extraction...');
+
+    // Enhanced search for football fixtures with multiple approaches
+    let gameFixtures = [];
+
+    // Primary: Exact American Football class
+    gameFixtures = Array.from(grid.querySelectorAll('div.cpm-ParticipantFixtureDetailsAmericanFootball'))
+        .filter(d => !d.className.includes('Hidden'));
+    console.log(`Primary search: Found ${gameFixtures.length} American Football fixtures`);
+
+    // Secondary: Look for any football/sport fixtures in the entire page
+    if (gameFixtures.length === 0) {
+        console.log('Expanding search to entire document...');
+        gameFixtures = Array.from(document.querySelectorAll('div.cpm-ParticipantFixtureDetailsAmericanFootball'))
+            .filter(d => !d.className.includes('Hidden'));
+        console.log(`Document-wide search: Found ${gameFixtures.length} American Football fixtures`);
+    }
+
+    // Tertiary: Look for spotlight sections that might contain college games
+    if (gameFixtures.length === 0) {
+        console.log('Searching spotlight sections for college games...');
+        const spotlights = Array.from(document.querySelectorAll('div.ss-HomepageSpotlight'));
+        console.log(`Found ${spotlights.length} spotlight sections`);
+
+        for (const spotlight of spotlights) {
+            const text = spotlight.textContent.toLowerCase();
+            // Look for college/NCAAF indicators
+            if (text.includes('week') || text.includes('colorado') || text.includes('utah') || 
+                text.includes('college') || text.includes('ncaa')) {
+                console.log('Found potential college spotlight:', text.substring(0, 100));
+                const spotlightFixtures = Array.from(spotlight.querySelectorAll('div[class*="ParticipantFixture"]'));
+                gameFixtures.push(...spotlightFixtures);
+            }
+        }
+        console.log(`After spotlight search: Found ${gameFixtures.length} potential fixtures`);
+    }
+
+    // Final fallback: Any fixture details that might be football
+    if (gameFixtures.length === 0) {
+        const allFixtures = Array.from(grid.querySelectorAll('div[class*="cpm-ParticipantFixtureDetails"]'))
+            .filter(d => !d.className.includes('Hidden'));
+        console.log(`Final fallback: Found ${allFixtures.length} total fixtures`);
+
+        // Filter for likely football fixtures by checking content
+        for (const fixture of allFixtures) {
+            const text = fixture.textContent.toLowerCase();
+            // Look for typical football indicators or specific teams we know about
+            if (text.includes('spread') || text.includes('total') || text.includes('moneyline') || 
+                text.includes('vs') || text.includes(' - ') || text.includes('colorado') || text.includes('utah')) {
+                gameFixtures.push(fixture);
+            }
+        }
+        console.log(`After final filtering: Found ${gameFixtures.length} potential football fixtures`);
+    }
+
+    for (let i = 0; i < gameFixtures.length; i++) {
+        const fixture = gameFixtures[i];
+
+        // Enhanced team extraction with multiple fallback approaches
+        let teams = [];
+
+        // Approach 1: Exact American Football class names
+        const exactContainers = Array.from(fixture.querySelectorAll('div.cpm-ParticipantFixtureDetailsAmericanFootball_TeamContainer'));
+        console.log(`Fixture ${i}: Found ${exactContainers.length} exact team containers`);
+
+        for (const container of exactContainers) {
+            const teamEl = container.querySelector('div.cpm-ParticipantFixtureDetailsAmericanFootball_Team');
+            if (teamEl) {
+                const teamText = teamEl.textContent.trim();
+                console.log(`  Exact method team: "${teamText}"`);
+                if (teamText && teamText.length > 1) {
+                    teams.push(teamText);
+                }
+            }
+        }
+
+        // Approach 2: Generic team container patterns
+        if (teams.length < 2) {
+            console.log(`  Trying wildcard approach for fixture ${i}...`);
+            const wildcardContainers = Array.from(fixture.querySelectorAll('div[class*="_TeamContainer"]'));
+            console.log(`  Found ${wildcardContainers.length} wildcard containers`);
+
+            for (const container of wildcardContainers) {
+                const teamEl = container.querySelector('div[class*="_Team"]');
+                if (teamEl) {
+                    const teamText = teamEl.textContent.trim();
+                    console.log(`  Wildcard method team: "${teamText}"`);
+                    if (teamText && teamText.length > 1 && !teams.includes(teamText)) {
+                        teams.push(teamText);
+                    }
+                }
+            }
+        }
+
+        // Approach 3: Look for any text elements that might be team names
+        if (teams.length < 2) {
+            console.log(`  Trying text-based team extraction for fixture ${i}...`);
+            const allDivs = Array.from(fixture.querySelectorAll('div'));
+            for (const div of allDivs) {
+                const text = div.textContent.trim();
+                const directChildren = div.children.length;
+
+                // Look for divs with text but few children (likely team names)
+                if (text && text.length > 2 && text.length < 50 && directChildren < 3) {
+                    // Filter out obvious non-team elements
+                    if (!text.includes(':') && !text.includes('+') && !text.includes('-') && 
+                        !text.includes('PM') && !text.includes('AM') && !text.includes('View') &&
+                        !text.match(/^\\d+$/) && !teams.includes(text)) {
+                        console.log(`  Text-based method found potential team: "${text}"`);
+                        teams.push(text);
+                        if (teams.length >= 2) break;
+                    }
+                }
+            }
+        }
+
+        // Approach 4: Specific search for known college teams (Colorado, Utah)
+        if (teams.length < 2) {
+            console.log(`  Searching specifically for Colorado/Utah...`);
+            const allText = fixture.textContent.toLowerCase();
+            const knownTeams = ['colorado', 'utah', 'buffaloes', 'utes', 'cu', 'colorado state'];
+
+            for (const teamName of knownTeams) {
+                if (allText.includes(teamName)) {
+                    console.log(`  Found potential college team: ${teamName}`);
+                    // Try to extract the actual display name
+                    const textNodes = fixture.querySelectorAll('*');
+                    for (const node of textNodes) {
+                        const nodeText = node.textContent.trim();
+                        if (nodeText.toLowerCase().includes(teamName) && nodeText.length < 30) {
+                            teams.push(nodeText);
+                            console.log(`  Added college team: "${nodeText}"`);
+                            break;
+                        }
+                    }
+                }
+            }
+        }
+
+        if (teams.length < 2) {
+            console.log(`Skipping fixture - only found ${teams.length} teams:`, teams);
+            continue;
+        }
+
+        // Create unique game signature to avoid duplicates
+        const gameSignature = `${teams[0]} vs ${teams[1]}`;
+        if (seenGames.has(gameSignature)) continue;
+        seenGames.add(gameSignature);
+
+        // Extract time
+        const timeEl = fixture.querySelector('div.cpm-ParticipantFixtureDetailsAmericanFootball_BookCloses');
+        const gameTime = timeEl ? timeEl.textContent.trim() : null;
+
+        // Extract odds from parent grid structure  
+        const odds = {};
+
+        // Find all odds columns in the same container
+        const parentGrid = fixture.closest('div[class*="cpm-CouponPodMarketGrid"]');
+
+        if (parentGrid) {
+            const oddsColumns = Array.from(parentGrid.querySelectorAll('div.cpm-MarketOdds'));
+
+            // Process each column to extract different odds types
+            for (const column of oddsColumns) {
+                const header = column.querySelector('.cpm-MarketOddsHeader');
+                const headerText = header ? header.textContent.trim().toLowerCase() : '';
+
+                let category = null;
+                if (headerText === 'money' || headerText.includes('moneyline')) {
+                    category = 'moneyline';
+                } else if (headerText.includes('spread') || headerText.includes('handicap')) {
+                    category = 'spread';
+                } else if (headerText.includes('total') || headerText.includes('over/under')) {
+                    category = 'total';
+                }
+
+                if (category) {
+                    const columnOdds = Array.from(column.querySelectorAll('.cpm-ParticipantOdds'));
+
+                    // Calculate which odds belong to this game (each game = 2 odds rows)
+                    const gameIndex = results.length;
+                    const startIndex = gameIndex * 2;
+
+                    if (columnOdds.length > startIndex + 1) {
+                        const odds1 = columnOdds[startIndex];
+                        const odds2 = columnOdds[startIndex + 1];
+
+                        const h1 = odds1?.querySelector('.cpm-ParticipantOdds_Handicap')?.textContent?.trim() || '';
+                        const p1 = odds1?.querySelector('.cpm-ParticipantOdds_Odds')?.textContent?.trim() || '';
+                        const h2 = odds2?.querySelector('.cpm-ParticipantOdds_Handicap')?.textContent?.trim() || '';
+                        const p2 = odds2?.querySelector('.cpm-ParticipantOdds_Odds')?.textContent?.trim() || '';
+
+                        // Validate that we have actual odds values
+                        if (p1 && p2 && (p1.includes('+') || p1.includes('-')) && (p2.includes('+') || p2.includes('-'))) {
+                            if (category === 'moneyline') {
+                                odds[category] = [p1, p2];
+                            } else {
+                                // ENHANCED: Include handicap (+/-) and odds values for spread/total
+                                odds[category] = [
+                                    h1 ? `${h1} (${p1})` : p1,
+                                    h2 ? `${h2} (${p2})` : p2
+                                ];
+                            }
+                        }
+                    }
+                }
+            }
+        }
+
+        // Get current date as fallback for pregame
+        const today = new Date();
+        const options = { weekday: 'short', month: 'short', day: 'numeric' };
+        const gameDate = today.toLocaleDateString('en-US', options);
+
+        const game = {
+            teams: teams,
+            time: gameTime,
+            date: gameDate,  // Add date field
+            league: 'NCAAF',
+            odds: odds,
+            confidence: teams.length > 1 ? 0.9 : 0.5
+        };
+
+        results.push(game);
+    }
+
+    console.log(`Total NCAAF/NFL games extracted: ${results.length}`);
+    return results;
+}
+""",
+    'tennis': """
+(grid) => {
+    const results = [];
+
+    console.log('🎾 Starting Tennis extraction...');
+
+    // Step 1: Find Tennis section by icon
+    let tennisSection = null;
+
+    // Method 1: Look for Tennis SVG logo in header images
+    const headerImages = document.querySelectorAll('.ss-HomeSpotlightHeader_HeaderImage, .cpm-Header_HeaderImage');
+    for (const img of headerImages) {
+        const style = img.getAttribute('style') || '';
+        if (style.includes('zClass_Tennis.svg')) {
+            tennisSection = img.closest('.ss-HomepageSpotlight, .cpm-CouponPodModule');
+            console.log('✅ Found Tennis section by Tennis SVG');
+            break;
+        }
+    }
+
+    // Method 2: Look for tennis class or text as backup
+    if (!tennisSection) {
+        const headers = document.querySelectorAll('.cpm-Header_Title, .ss-HomeSpotlightHeader_Title');
+        for (const header of headers) {
+            if (header.textContent.trim().includes('ATP') || header.textContent.trim().includes('WTA') || header.textContent.trim().includes('Tennis')) {
+                tennisSection = header.closest('.cpm-CouponPodModule, .ss-HomepageSpotlight');
+                console.log('✅ Found Tennis section by title text');
+                break;
+            }
+        }
+    }
+
+    if (!tennisSection) {
+        console.log('❌ Tennis section not found by icon/text detection');
+        return [];
+    }
+
+    console.log('Found Tennis section');
+
+    // Step 2: Extract fixtures from tennis section only
+    const fixtures = Array.from(tennisSection.querySelectorAll('div.cpm-ParticipantFixtureDetails'))
+        .filter(fixture => !fixture.className.includes('Hidden'));
+
+    console.log(`Found ${fixtures.length} tennis fixtures`);
+
+    // Step 3: Extract odds columns data from tennis section
+    const oddsColumns = {};
+
+    // Find column "1" odds within tennis section
+    const col1Section = tennisSection.querySelector('div.cpm-MarketOdds');
+    if (col1Section) {
+        const col1Header = col1Section.querySelector('div.cpm-MarketOddsHeader');
+        if (col1Header && col1Header.textContent.trim() === "1") {
+            const col1Odds = [];
+            const oddsElems = col1Section.querySelectorAll('span.cpm-ParticipantOdds_Odds');
+            for (const oddsElem of oddsElems) {
+                const oddsText = oddsElem.textContent;
+                if (oddsText) {
+                    col1Odds.push(oddsText.trim());
+                }
+            }
+            oddsColumns["1"] = col1Odds;
+        }
+    }
+
+    // Find column "2" odds within tennis section
+    const col2Sections = Array.from(tennisSection.querySelectorAll('div.cpm-MarketOdds'));
+    for (const section of col2Sections) {
+        const header = section.querySelector('div.cpm-MarketOddsHeader');
+        if (header && header.textContent.trim() === "2") {
+            const col2Odds = [];
+            const oddsElems = section.querySelectorAll('span.cpm-ParticipantOdds_Odds');
+            for (const oddsElem of oddsElems) {
+                const oddsText = oddsElem.textContent;
+                if (oddsText) {
+                    col2Odds.push(oddsText.trim());
+                }
+            }
+            oddsColumns["2"] = col2Odds;
+            break;
+        }
+    }
+
+    // Extract game date with fallback for pregame
+    const dateHeader = grid.querySelector('div.cpm-MarketFixtureDateHeader');
+    let gameDate = dateHeader ? dateHeader.textContent.trim() : null;
+
+    // Fallback to today's date for pregame if no date found
+    if (!gameDate || gameDate === null) {
+        const today = new Date();
+        const options = { weekday: 'short', month: 'short', day: 'numeric' };
+        gameDate = today.toLocaleDateString('en-US', options);
+    }
+
+    // Step 3: Process fixtures and map odds correctly
+    for (let i = 0; i < fixtures.length; i++) {
+        const fixture = fixtures[i];
+
+        // Extract player names using multiple methods
+        const teamElems = fixture.querySelectorAll('div.cpm-ParticipantFixtureDetails_Team');
+
+        let player1, player2;
+
+        if (teamElems.length >= 2) {
+            // Method 1: Direct team elements
+            player1 = teamElems[0].textContent;
+            player2 = teamElems[1].textContent;
+        } else {
+            // Method 2: Parse from fixture text
+            const fixtureText = fixture.textContent;
+            if (!fixtureText.includes(' v ')) continue;
+
+            const players = fixtureText.split(' v ');
+            if (players.length < 2) continue;
+
+            player1 = players[0].trim();
+            player2 = players[1].trim();
+        }
+
+        player1 = player1.trim();
+        player2 = player2.trim();
+
+        // Validate tennis match (relaxed validation)
+        if (!player1 || !player2 || player1.length < 3 || player2.length < 3) continue;
+
+        // Extract time
+        const timeElem = fixture.querySelector('div.cpm-ParticipantFixtureDetails_BookCloses, [class*="BookCloses"], [class*="Time"]');
+        const gameTime = timeElem ? timeElem.textContent : "TBD";
+
+        // Map odds correctly to players
+        const moneylineOdds = [];
+
+        // Player 1 gets odds from column "1", Player 2 gets odds from column "2"
+        if (oddsColumns["1"] && oddsColumns["1"].length > i) {
+            moneylineOdds.push(oddsColumns["1"][i]);  // Player 1 odds
+        }
+
+        if (oddsColumns["2"] && oddsColumns["2"].length > i) {
+            moneylineOdds.push(oddsColumns["2"][i]);  // Player 2 odds
+        }
+
+        // Create game object
+        results.push({
+            team1: player1,
+            team2: player2,
+            date: gameDate,
+            time: gameTime.trim(),
+            moneyline: moneylineOdds,
+            fixture_id: `tennis_${i}`
+        });
+    }
+
+    return results;
+}
+""",
+    'cfl': """
+(grid) => {
+    const results = [];
+
+    console.log('Starting CFL extraction with section validation');
+
+    // Step 1: Find proper CFL section by looking for CFL-specific indicators
+    let cflSection = null;
+
+    // Look for CFL section by header text + American Football icon
+    const headers = document.querySelectorAll('.cpm-Header_Title, .ss-HomeSpotlightHeader_Title');
+    for (const header of headers) {
+        if (header.textContent.trim() === 'CFL') {
+            // Verify this is the CFL section with American Football icon
+            const headerImage = header.parentElement.querySelector('.cpm-Header_HeaderImage, .ss-HomeSpotlightHeader_HeaderImage');
+            if (headerImage) {
+                const style = headerImage.getAttribute('style') || '';
+                if (style.includes('zClass_AmericanFootball.svg')) {
+                    cflSection = header.closest('.cpm-CouponPodModule, .ss-HomepageSpotlight');
+                    console.log('Found CFL section with proper AmericanFootball icon validation');
+                    break;
+                }
+            }
+        }
+    }
+
+    if (!cflSection) {
+        console.log('CFL section not found with proper validation - may be on wrong page');
+        return [];
+    }
+
+    // Step 2: Look for CFL fixtures within the verified CFL section
+    const fixtures = Array.from(cflSection.querySelectorAll('.cpm-ParticipantFixtureDetailsAmericanFootball'));
+
+    console.log(`Found ${fixtures.length} CFL fixtures in validated CFL section`);
+
+    // Each CFL fixture contains multiple teams within TeamNames div
+    // We need to group them into pairs for matchups
+    for (let i = 0; i < fixtures.length; i++) {
+        const fixtureElement = fixtures[i];
+
+        console.log(`Processing CFL fixture ${i + 1} of ${fixtures.length}`);
+
+        // Get all team containers within this fixture
+        const teamContainers = fixtureElement.querySelectorAll('.cpm-ParticipantFixtureDetailsAmericanFootball_TeamContainer');
+
+        console.log(`Found ${teamContainers.length} teams in fixture ${i + 1}`);
+
+        // CFL fixtures should have exactly 2 teams per matchup
+        if (teamContainers.length >= 2) {
+            // Process teams in pairs (assuming they're arranged as matchups)
+            for (let j = 0; j < teamContainers.length; j += 2) {
+                const team1Container = teamContainers[j];
+                const team2Container = teamContainers[j + 1];
+
+                if (!team1Container || !team2Container) {
+                    console.log(`Incomplete team pair at index ${j}, skipping`);
+                    continue;
+                }
+
+                // Extract team names
+                const team1NameElement = team1Container.querySelector('.cpm-ParticipantFixtureDetailsAmericanFootball_Team');
+                const team2NameElement = team2Container.querySelector('.cpm-ParticipantFixtureDetailsAmericanFootball_Team');
+
+                if (!team1NameElement || !team2NameElement) {
+                    console.log(`Missing team names in pair ${j/2 + 1}, skipping`);
+                    continue;
+                }
+
+                const team1 = team1NameElement.textContent.trim();
+                const team2 = team2NameElement.textContent.trim();
+
+                console.log(`Processing CFL game ${j/2 + 1}: ${team1} vs ${team2}`);
+
+                // Extract game time from the fixture details section
+                const timeElement = fixtureElement.querySelector('.cpm-ParticipantFixtureDetailsAmericanFootball_BookCloses');
+                const time = timeElement ? timeElement.textContent.trim() : '';
+
+                // Find the market group container that contains odds
+                const gameRow = fixtureElement.closest('.gl-MarketGroup');
+                if (!gameRow) {
+                    console.log(`No market group found for ${team1} vs ${team2}`);
+                    // Still create the game entry without odds
+                }
+
+                // Initialize odds arrays
+                let spreadOdds = [];
+                let totalOdds = [];
+                let moneylineOdds = [];
+
+                if (gameRow) {
+                    // Get all odds elements in the market group
+                    const allOddsElements = gameRow.querySelectorAll('.cpm-ParticipantOdds_Odds');
+                    const handicapElements = gameRow.querySelectorAll('.cpm-ParticipantOdds_Handicap');
+
+                    console.log(`Found ${allOddsElements.length} odds elements and ${handicapElements.length} handicap elements for CFL game`);
+
+                    // Extract spread and total odds (with handicaps)
+                    for (let k = 0; k < handicapElements.length && k < allOddsElements.length; k++) {
+                        const handicap = handicapElements[k] ? handicapElements[k].textContent.trim() : '';
+                        const odds = allOddsElements[k] ? allOddsElements[k].textContent.trim() : '';
+
+                        if (handicap && odds) {
+                            if (handicap.startsWith('O ') || handicap.startsWith('U ')) {
+                                totalOdds.push(`${handicap} ${odds}`);
+                            } else if (handicap.startsWith('+') || handicap.startsWith('-')) {
+                                spreadOdds.push(`${handicap} ${odds}`);
+                            }
+                        }
+                    }
+
+                    // Extract moneyline odds (odds-only, no handicaps)
+                    const moneylineElements = gameRow.querySelectorAll('.cpm-ParticipantOddsOnly50 .cpm-ParticipantOdds_Odds');
+                    for (const oddsElem of moneylineElements) {
+                        const odds = oddsElem.textContent.trim();
+                        if (odds && (odds.startsWith('+') || odds.startsWith('-'))) {
+                            moneylineOdds.push(odds);
+                        }
+                    }
+                }
+
+                results.push({
+                    team1: team1,
+                    team2: team2,
+                    date: new Date().toISOString().split('T')[0],
+                    time: time,
+                    spread_odds: spreadOdds,
+                    total_odds: totalOdds,
+                    moneyline_odds: moneylineOdds,
+                    fixture_id: `cfl_${i}_${j/2}`
+                });
+            }
+        } else {
+            console.log(`Fixture ${i + 1} has ${teamContainers.length} teams, not enough for CFL matchups`);
+        }
+    }
+
+    return results;
+}
+""",
+
+    # Document-scoped
+    'nba2k': """
+() => {
+    const results = [];
+
+    console.log('🎮 Starting NBA2K extraction...');
+
+    // Step 1: Find NBA2K/eSports section by eSports SVG logo
+    let nba2kSection = null;
+
+    // Look for eSports logo in header images
+    const headerImages = document.querySelectorAll('.ss-HomeSpotlightHeader_HeaderImage, .cpm-Header_HeaderImage');
+    for (const img of headerImages) {
+        const style = img.getAttribute('style') || '';
+        if (style.includes('zClass_ESports.svg')) {
+            nba2kSection = img.closest('.ss-HomepageSpotlight, .cpm-CouponPodModule');
+            console.log('✅ Found NBA2K/eSports section by eSports SVG');
+            break;
+        }
+    }
+
+    // Fallback: Look for NBA2K title
+    if (!nba2kSection) {
+        const headers = document.querySelectorAll('.ss-HomeSpotlightHeader_Title, .cpm-Header_Title');
+        for (const header of headers) {
+            if (header.textContent.trim() === 'NBA2K') {
+                nba2kSection = header.closest('.ss-HomepageSpotlight, .cpm-CouponPodModule');
+                console.log('✅ Found NBA2K section by title');
+                break;
+            }
+        }
+    }
+
+    if (!nba2kSection) {
+        console.log('❌ NBA2K/eSports section not found');
+        return [];
+    }
+
+    // Step 2: Extract odds columns data from NBA2K section
+    const oddsColumns = {};
+
+    const marketOdds = Array.from(nba2kSection.querySelectorAll('div.cpm-MarketOdds'));
+    for (const section of marketOdds) {
+        const header = section.querySelector('div.cpm-MarketOddsHeader');
+        if (header) {
+            const headerText = header.textContent;
+            if (headerText) {
+                const headerName = headerText.trim();
+                if (["Spread", "Total", "Money"].includes(headerName)) {
+                    const columnOdds = [];
+
+                    // Extract odds elements correctly
+                    const oddsElems = section.querySelectorAll('span.cpm-ParticipantOdds_Odds');
+                    for (const oddsElem of oddsElems) {
+                        const oddsText = oddsElem.textContent;
+                        if (oddsText && oddsText.trim()) {
+                            columnOdds.push(oddsText.trim());
+                        }
+                    }
+
+                    oddsColumns[headerName] = columnOdds;
+                }
+            }
+        }
+    }
+
+    // Step 3: Process fixtures and map odds correctly
+    const fixtures = Array.from(nba2kSection.querySelectorAll('div.cpm-ParticipantFixtureDetailsBasketball'))
+        .filter(fixture => !fixture.className.includes('Hidden'));
+
+    // Extract game date with fallback for pregame
+    const dateHeader = nba2kSection.querySelector('div.cpm-MarketFixtureDateHeader');
+    let gameDate = dateHeader ? dateHeader.textContent.trim() : null;
+
+    // Fallback to today's date for pregame if no date found
+    if (!gameDate || gameDate === null) {
+        const today = new Date();
+        const options = { weekday: 'short', month: 'short', day: 'numeric' };
+        gameDate = today.toLocaleDateString('en-US', options);
+    }
+
+    for (let i = 0; i < fixtures.length; i++) {
+        const fixture = fixtures[i];
+
+        // Extract team names (NBA2K has team names with player tags like "JD", "HYPER")
+        const teamElems = fixture.querySelectorAll('div.cpm-ParticipantFixtureDetailsBasketball_Team');
+
+        let team1, team2;
+        if (teamElems.length >= 2) {
+            team1 = teamElems[0].textContent.trim();
+            team2 = teamElems[1].textContent.trim();
+        } else {
+            // Fallback to team containers
+            const teamContainers = fixture.querySelectorAll('div.cpm-ParticipantFixtureDetailsBasketball_TeamContainer');
+            if (teamContainers.length >= 2) {
+                const t1 = teamContainers[0].querySelector('div.cpm-ParticipantFixtureDetailsBasketball_Team');
+                const t2 = teamContainers[1].querySelector('div.cpm-ParticipantFixtureDetailsBasketball_Team');
+                team1 = t1 ? t1.textContent.trim() : '';
+                team2 = t2 ? t2.textContent.trim() : '';
+            }
+        }
+
+        // Validate NBA2K teams (must contain player tags)
+        const nba2kTags = ['JD', 'HYPER', 'CARNAGE', 'OUTLAW', 'RIDER', 'UNBREAKABLE', 'PRODIGY', 'SCORCH', 'DECOY', 'FENRIR', 'HAWK'];
+        const hasNba2kTag = nba2kTags.some(tag => team1.includes(tag) || team2.includes(tag));
+
+        if (!team1 || !team2 || !hasNba2kTag) continue;
+
+        // Extract time
+        const timeElem = fixture.querySelector('div.cpm-ParticipantFixtureDetailsBasketball_BookCloses');
+        const gameTime = timeElem ? timeElem.textContent.trim() : "TBD";
+
+        // Map odds correctly (each game gets 2 odds per column - team1 and team2)
+        const spreadOdds = [];
+        const totalOdds = [];
+        const moneylineOdds = [];
+
+        const gameIndex = i * 2; // Each game has 2 odds entries
+
+        // Spread odds (2 per game)
+        if (oddsColumns["Spread"] && oddsColumns["Spread"].length > gameIndex + 1) {
+            spreadOdds.push(oddsColumns["Spread"][gameIndex]);
+            spreadOdds.push(oddsColumns["Spread"][gameIndex + 1]);
+        }
+
+        // Total odds (2 per game)
+        if (oddsColumns["Total"] && oddsColumns["Total"].length > gameIndex + 1) {
+            totalOdds.push(oddsColumns["Total"][gameIndex]);
+            totalOdds.push(oddsColumns["Total"][gameIndex + 1]);
+        }
+
+        // Money odds (2 per game)
+        if (oddsColumns["Money"] && oddsColumns["Money"].length > gameIndex + 1) {
+            moneylineOdds.push(oddsColumns["Money"][gameIndex]);
+            moneylineOdds.push(oddsColumns["Money"][gameIndex + 1]);
+        }
+
+        // Create game object
+        results.push({
+            team1: team1,
+            team2: team2,
+            date: gameDate,
+            time: gameTime,
+            spread: spreadOdds,
+            total: totalOdds,
+            moneyline: moneylineOdds,
+            fixture_id: `nba2k_${i}`
+        });
+    }
+
+    return results;
+}
+""",
+    'ncaaf': """
+() => {
+    const results = [];
+
+    console.log('🏈 Searching for NCAAF spotlight sections...');
+
+    // NFL teams to filter out - comprehensive list
+    const nflTeams = new Set([
+        'Arizona Cardinals', 'Atlanta Falcons', 'Baltimore Ravens', 'Buffalo Bills',
+        'Carolina Panthers', 'Chicago Bears', 'Cincinnati Bengals', 'Cleveland Browns',
+        'Dallas Cowboys', 'Denver Broncos', 'Detroit Lions', 'Green Bay Packers',
+        'Houston Texans', 'Indianapolis Colts', 'Jacksonville Jaguars', 'Kansas City Chiefs',
+        'Las Vegas Raiders', 'Los Angeles Chargers', 'Los Angeles Rams', 'Miami Dolphins',
+        'Minnesota Vikings', 'New England Patriots', 'New Orleans Saints', 'New York Giants',
+        'New York Jets', 'Philadelphia Eagles', 'Pittsburgh Steelers', 'San Francisco 49ers',
+        'Seattle Seahawks', 'Tampa Bay Buccaneers', 'Tennessee Titans', 'Washington Commanders',
+        // Abbreviated versions
+        'ARI Cardinals', 'ATL Falcons', 'BAL Ravens', 'BUF Bills', 'CAR Panthers', 
+        'CHI Bears', 'CIN Bengals', 'CLE Browns', 'DAL Cowboys', 'DEN Broncos',
+        'DET Lions', 'GB Packers', 'HOU Texans', 'IND Colts', 'JAX Jaguars', 'KC Chiefs',
+        'LV Raiders', 'LAC Chargers', 'LAR Rams', 'MIA Dolphins', 'MIN Vikings',
+        'NE Patriots', 'NO Saints', 'NY Giants', 'NY Jets', 'PHI Eagles', 'PIT Steelers',
+        'SF 49ers', 'SEA Seahawks', 'TB Buccaneers', 'TEN Titans', 'WAS Commanders'
+    ]);
+
+    // Function to check if team name contains NFL teams
+    function isNFLTeam(teamName) {
+        const cleanTeam = teamName.trim();
+        return nflTeams.has(cleanTeam) || 
+               Array.from(nflTeams).some(nflTeam => 
+                   cleanTeam.includes(nflTeam) || nflTeam.includes(cleanTeam.split(' ')[0])
+               );
+    }
+
+    // Find all spotlight sections
+    const spotlights = Array.from(document.querySelectorAll('div.ss-HomepageSpotlight'));
+    console.log(`Found ${spotlights.length} total spotlight sections`);
+
+    for (const spotlight of spotlights) {
+        // Look for NCAAF logo indicator - must be very specific
+        const headerImages = spotlight.querySelectorAll('div[style*="zlogo_ncaaf_official.svg"]');
+        const headerTitles = spotlight.querySelectorAll('div.ss-HomeSpotlightHeader_Title, div.cpm-Header_Title');
+
+        let isNCAA = false;
+        let weekInfo = null;
+
+        // Check for NCAAF logo - this is the most reliable indicator
+        if (headerImages.length > 0) {
+            console.log('Found NCAAF logo in spotlight section');
+            isNCAA = true;
+        }
+
+        // Check for week header (Week X) - but only if we also have NCAAF logo
+        for (const title of headerTitles) {
+            const titleText = title.textContent.trim();
+            if (titleText.match(/Week \\d+/i) && headerImages.length > 0) {
+                console.log(`Found week header with NCAAF logo: ${titleText}`);
+                weekInfo = titleText;
+            }
+        }
+
+        // Only proceed if we found NCAAF logo
+        if (!isNCAA) continue;
+
+        console.log(`Processing NCAAF spotlight section with ${weekInfo || 'unknown week'}`);
+
+        // Extract games from this NCAAF section - but only within this specific section
+        const gameFixtures = Array.from(spotlight.querySelectorAll('div.cpm-ParticipantFixtureDetailsAmericanFootball'))
+            .filter(d => !d.className.includes('Hidden'));
+
+        console.log(`Found ${gameFixtures.length} fixtures in NCAAF section`);
+
+        for (let i = 0; i < gameFixtures.length; i++) {
+            const fixture = gameFixtures[i];
+
+            // Extract teams using NCAAF-specific structure
+            let teams = [];
+
+            const teamContainers = Array.from(fixture.querySelectorAll('div.cpm-ParticipantFixtureDetailsAmericanFootball_TeamContainer'));
+            console.log(`Fixture ${i}: Found ${teamContainers.length} team containers`);
+
+            for (const container of teamContainers) {
+                const teamEl = container.querySelector('div.cpm-ParticipantFixtureDetailsAmericanFootball_Team');
+                if (teamEl) {
+                    const teamText = teamEl.textContent.trim();
+                    console.log(`  Found team: "${teamText}"`);
+                    if (teamText && teamText.length > 1) {
+                        teams.push(teamText);
+                    }
+                }
+            }
+
+            if (teams.length < 2) {
+                console.log(`Skipping fixture - only found ${teams.length} teams`);
+                continue;
+            }
+
+            // Critical: Filter out NFL teams - this is the key fix
+            const isNFL1 = isNFLTeam(teams[0]);
+            const isNFL2 = isNFLTeam(teams[1]);
+
+            if (isNFL1 || isNFL2) {
+                console.log(`🚫 Skipping NFL teams: ${teams[0]} vs ${teams[1]}`);
+                continue;
+            }
+
+            console.log(`✅ Valid NCAAF teams: ${teams[0]} vs ${teams[1]}`);
+
+
+            // Extract time/clock info
+            let gameTime = null;
+            const clockEl = fixture.querySelector('div.cpm-ParticipantFixtureDetailsAmericanFootball_Clock, div.cpm-ParticipantFixtureDetailsAmericanFootball_BookCloses');
+            if (clockEl) {
+                gameTime = clockEl.textContent.trim();
+            }
+
+            // Extract date
+            let gameDate = null;
+            const dateEl = fixture.closest('div.gl-MarketGroup')?.querySelector('div.cpm-MarketFixtureDateHeader');
+            if (dateEl) {
+                gameDate = dateEl.textContent.trim();
+            }
+
+            // Extract odds from the odds columns - but only within this spotlight section
+            const odds = {};
+
+            // Make sure we stay within the current spotlight section for odds extraction
+            const parentGrid = fixture.closest('div.cpm-CouponPodMarketGrid');
+
+            // Double-check that this odds grid is still within our NCAAF spotlight section
+            if (parentGrid && spotlight.contains(parentGrid)) {
+                const oddsColumns = Array.from(parentGrid.querySelectorAll('div.cpm-MarketOdds'));
+
+                for (const column of oddsColumns) {
+                    const header = column.querySelector('.cpm-MarketOddsHeader');
+                    const headerText = header ? header.textContent.trim().toLowerCase() : '';
+
+                    let category = null;
+                    if (headerText === 'money' || headerText.includes('moneyline')) {
+                        category = 'moneyline';
+                    } else if (headerText.includes('spread') || headerText.includes('handicap')) {
+                        category = 'spread';
+                    } else if (headerText.includes('total') || headerText.includes('over/under')) {
+                        category = 'total';
+                    }
+
+                    if (category) {
+                        const columnOdds = Array.from(column.querySelectorAll('.cpm-ParticipantOdds'));
+
+                        if (columnOdds.length >= 2) {
+                            const odds1 = columnOdds[0];
+                            const odds2 = columnOdds[1];
+
+                            const h1 = odds1?.querySelector('.cpm-ParticipantOdds_Handicap')?.textContent?.trim() || '';
+                            const p1 = odds1?.querySelector('.cpm-ParticipantOdds_Odds')?.textContent?.trim() || '';
+                            const h2 = odds2?.querySelector('.cpm-ParticipantOdds_Handicap')?.textContent?.trim() || '';
+                            const p2 = odds2?.querySelector('.cpm-ParticipantOdds_Odds')?.textContent?.trim() || '';
+
+                            // Format odds properly
+                            if (p1 && p2) {
+                                if (category === 'moneyline') {
+                                    odds[category] = [p1, p2];
+                                } else {
+                                    // Include handicap values for spread/total
+                                    odds[category] = [
+                                        h1 ? `${h1} ${p1}` : p1,
+                                        h2 ? `${h2} ${p2}` : p2
+                                    ];
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+
+            const game = {
+                teams: teams,
+                time: gameTime,
+                date: gameDate,
+                week: weekInfo,
+                league: 'NCAAF',
+                odds: odds,
+                confidence: 0.95
+            };
+
+            results.push(game);
+            console.log(`Added NCAAF game: ${teams[0]} vs ${teams[1]}`);
+        }
+    }
+
+    console.log(`Total NCAAF games extracted: ${results.length}`);
+    return results;
+}
+""",
+    'nfl': """
+() => {
+    const games = [];
+
+    // Find NFL section by looking for NFL logo icon
+    let nflSection = null;
+
+    // Method 1: Look for NFL logo class
+    const nflLogos = document.querySelectorAll('.afl-NFLLeagueLogo, .afl-NFLLeagueLogo_SVG');
+    for (const logo of nflLogos) {
+        nflSection = logo.closest('.cpm-CouponPodModule, .ss-HomepageSpotlight');
+        if (nflSection) break;
+    }
+
+    // Method 2: Look for NFL logo wrapper if method 1 fails
+    if (!nflSection) {
+        const logoWrappers = document.querySelectorAll('.cpm-Header_Logo, .ss-HomeSpotlightHeader_Logo');
+        for (const wrapper of logoWrappers) {
+            if (wrapper.querySelector('.afl-NFLLeagueLogo')) {
+                nflSection = wrapper.closest('.cpm-CouponPodModule, .ss-HomepageSpotlight');
+                break;
+            }
+        }
+    }
+
+    if (!nflSection) {
+        console.log('NFL section not found by logo detection');
+        return { games: [], spreadOdds: [], totalOdds: [], moneylineOdds: [] };
+    }
+
+    console.log('Found NFL section by logo detection');
+
+    // Find NFL fixtures within the Week 8 section (use AmericanFootball class)
+    const fixtures = nflSection.querySelectorAll('.cpm-ParticipantFixtureDetailsAmericanFootball');
+
+    fixtures.forEach((fixture, index) => {
+        try {
+            const teamElements = fixture.querySelectorAll('.cpm-ParticipantFixtureDetailsAmericanFootball_Team');
+            if (teamElements.length >= 2) {
+                const team1 = teamElements[0].textContent.trim();
+                const team2 = teamElements[1].textContent.trim();
+
+                // Get game time
+                const timeElement = fixture.querySelector('.cpm-ParticipantFixtureDetailsAmericanFootball_BookCloses');
+                const gameTime = timeElement ? timeElement.textContent.trim() : 'TBD';
+
+                games.push({
+                    team1: team1,
+                    team2: team2,
+                    date: new Date().toISOString().split('T')[0],  // Add date field
+                    time: gameTime,
+                    index: index
+                });
+            }
+        } catch (e) {
+            console.log('Error processing NFL fixture:', e);
+        }
+    });
+
+    // Find odds columns within NFL section (Spread, Total, Money)
+    const spreadOdds = [];
+    const totalOdds = [];
+    const moneylineOdds = [];
+
+    // ENHANCED: Get Spread column odds with +/- values (clean format like NCAAF)
+    const spreadHeaders = Array.from(nflSection.querySelectorAll('.cpm-MarketOddsHeader')).filter(h => h.textContent.trim() === 'Spread');
+    if (spreadHeaders.length > 0) {
+        const spreadContainer = spreadHeaders[0].parentElement;
+        const spreadElements = spreadContainer.querySelectorAll('.cpm-ParticipantOdds');
+        spreadElements.forEach(odds => {
+            const handicap = odds.querySelector('.cpm-ParticipantOdds_Handicap');
+            const oddsValue = odds.querySelector('.cpm-ParticipantOdds_Odds');
+            if (handicap && oddsValue) {
+                // Clean format: "+7.0 -105" (no parentheses)
+                spreadOdds.push(`${handicap.textContent.trim()} ${oddsValue.textContent.trim()}`);
+            }
+        });
+    }
+
+    // ENHANCED: Get Total column odds with Over/Under values (clean format like NCAAF)
+    const totalHeaders = Array.from(nflSection.querySelectorAll('.cpm-MarketOddsHeader')).filter(h => h.textContent.trim() === 'Total');
+    if (totalHeaders.length > 0) {
+        const totalContainer = totalHeaders[0].parentElement;
+        const totalElements = totalContainer.querySelectorAll('.cpm-ParticipantOdds');
+        totalElements.forEach(odds => {
+            const handicap = odds.querySelector('.cpm-ParticipantOdds_Handicap');
+            const oddsValue = odds.querySelector('.cpm-ParticipantOdds_Odds');
+            if (handicap && oddsValue) {
+                // Clean format: "O 44.0 -110" (no parentheses)
+                totalOdds.push(`${handicap.textContent.trim()} ${oddsValue.textContent.trim()}`);
+            }
+        });
+    }
+
+    // Get Money column odds
+    const moneyHeaders = Array.from(nflSection.querySelectorAll('.cpm-MarketOddsHeader')).filter(h => h.textContent.trim() === 'Money');
+    if (moneyHeaders.length > 0) {
+        const moneyContainer = moneyHeaders[0].parentElement;
+        const moneyElements = moneyContainer.querySelectorAll('.cpm-ParticipantOdds_Odds');
+        moneyElements.forEach(odds => {
+            moneylineOdds.push(odds.textContent.trim());
+        });
+    }
+
+    return {
+        games: games,
+        spreadOdds: spreadOdds,
+        totalOdds: totalOdds,
+        moneylineOdds: moneylineOdds
+    };
+}
+""",
+    'pga': """
+() => {
+    const results = [];
+
+    // Step 1: Find PGA section by looking for PGA logo
+    let pgaSection = null;
+    const headerImages = document.querySelectorAll('.cpm-Header_HeaderImage, .ss-HomeSpotlightHeader_HeaderImage');
+    for (const img of headerImages) {
+        const style = img.getAttribute('style') || '';
+        if (style.includes('zlogo_pga_official.svg') || style.includes('pga')) {
+            pgaSection = img.closest('.cpm-CouponPodModule, .ss-HomepageSpotlight');
+            console.log('Found PGA section by logo');
+            break;
+        }
+    }
+
+    // Fallback: Look for tournament/golf text
+    if (!pgaSection) {
+        const headers = document.querySelectorAll('.cpm-Header_Title, .ss-HomeSpotlightHeader_Title');
+        for (const header of headers) {
+            const headerText = header.textContent.toLowerCase();
+            if (headerText.includes('championship') || headerText.includes('tour') || headerText.includes('golf')) {
+                pgaSection = header.closest('.cpm-CouponPodModule, .ss-HomepageSpotlight');
+                console.log('Found PGA section by text');
+                break;
+            }
+        }
+    }
+
+    if (!pgaSection) {
+        console.log('❌ PGA section not found');
+        return [];
+    }
+
+    // Step 2: Extract tournament name
+    const tournamentElement = pgaSection.querySelector('.cpm-Header_Title, .ss-HomeSpotlightHeader_Title');
+    const tournamentName = tournamentElement ? tournamentElement.textContent.trim() : 'PGA Tournament';
+    console.log(`Tournament: ${tournamentName}`);
+
+    // Step 3: Extract player names
+    const playerElements = Array.from(pgaSection.querySelectorAll('.cpm-ParticipantLabelGolfScore_Name'));
+    console.log(`Found ${playerElements.length} golfers`);
+
+    // Step 4: Dynamically detect and extract odds columns
+    const oddsColumns = {};
+
+    // Method 1: Try multi-column format (.cpm-HScrollPlaceColumnMarketGolf with headers)
+    const marketColumns = Array.from(pgaSection.querySelectorAll('.cpm-HScrollPlaceColumnMarketGolf'));
+    if (marketColumns.length > 0) {
+        console.log(`Found ${marketColumns.length} market columns (multi-column format)`);
+        for (const column of marketColumns) {
+            const header = column.querySelector('.gl-MarketColumnHeader');
+            if (header) {
+                const headerText = header.textContent.trim();
+                const columnOdds = [];
+                const oddsElems = column.querySelectorAll('.cpm-ParticipantOdds_Odds');
+                for (const oddsElem of oddsElems) {
+                    const oddsText = oddsElem.textContent;
+                    if (oddsText) {
+                        columnOdds.push(oddsText.trim());
+                    }
+                }
+                oddsColumns[headerText] = columnOdds;
+                console.log(`Column "${headerText}": ${columnOdds.length} odds`);
+            }
+        }
+    }
+
+    // Method 2: Single column format (just one odds container)
+    if (Object.keys(oddsColumns).length === 0) {
+        console.log('Trying single-column format');
+        const oddsContainer = pgaSection.querySelector('.cpm-HScrollPlaceColumnMarketGolf');
+        if (oddsContainer) {
+            const columnOdds = [];
+            const oddsElems = oddsContainer.querySelectorAll('.cpm-ParticipantOdds_Odds');
+            for (const oddsElem of oddsElems) {
+                const oddsText = oddsElem.textContent;
+                if (oddsText) {
+                    columnOdds.push(oddsText.trim());
+                }
+            }
+            oddsColumns['Win Only'] = columnOdds;
+            console.log(`Single column "Win Only": ${columnOdds.length} odds`);
+        }
+    }
+
+    // Step 5: Map players to odds
+    for (let i = 0; i < playerElements.length; i++) {
+        const playerName = playerElements[i].textContent.trim();
+
+        if (!playerName || playerName.length < 3) continue;
+
+        // Extract odds for each available column
+        const winOnlyOdds = oddsColumns['Win Only'] && oddsColumns['Win Only'][i] ? [oddsColumns['Win Only'][i]] : [];
+        const top5Odds = oddsColumns['Top 5 (Inc Ties)'] && oddsColumns['Top 5 (Inc Ties)'][i] ? [oddsColumns['Top 5 (Inc Ties)'][i]] : [];
+        const top10Odds = oddsColumns['Top 10 (Inc Ties)'] && oddsColumns['Top 10 (Inc Ties)'][i] ? [oddsColumns['Top 10 (Inc Ties)'][i]] : [];
+
+        results.push({
+            player: playerName,
+            tournament: tournamentName,
+            date: new Date().toISOString().split('T')[0],
+            time: 'Tournament',
+            to_win: winOnlyOdds,
+            top_5: top5Odds,
+            top_10: top10Odds,
+            fixture_id: `pga_${i}`
+        });
+    }
+
+    console.log(`✅ Processed ${results.length} golfers with odds`);
+    return results;
+}
+""",
+    'ufc': """
+() => {
+    const results = [];
+    const seenFights = new Set(); // Track unique fights within UFC extraction
+
+    console.log('🥊 Starting UFC extraction...');
+
+    // Step 1: Find ALL UFC fixtures on the page (more comprehensive approach)
+    let allFixtures = [];
+
+    // Method 1: Direct UFC fixture elements (most reliable)
+    const ufcFixtures = document.querySelectorAll('div.cpm-ParticipantFixtureDetails100');
+    console.log(`🥊 Found ${ufcFixtures.length} UFC fixtures using direct selector`);
+
+    for (const fixture of ufcFixtures) {
+        // Skip hidden fixtures
+        if (fixture.className.includes('Hidden') || fixture.offsetParent === null) {
+            continue;
+        }
+        allFixtures.push(fixture);
+    }
+
+    // Method 2: Look for fixtures in UFC sections (backup)
+    if (allFixtures.length === 0) {
+        // Find UFC sections first
+        let ufcSections = [];
+
+        // Look for UFC logo in style background-image
+        const headerImages = document.querySelectorAll('.cpm-Header_HeaderImage, .ss-HomeSpotlightHeader_HeaderImage');
+        for (const img of headerImages) {
+            const style = img.getAttribute('style') || '';
+            if (style.includes('ufcofficialwhite.svg') || style.includes('ufc')) {
+                const section = img.closest('.cpm-CouponPodModule, .ss-HomepageSpotlight');
+                if (section && !ufcSections.includes(section)) {
+                    ufcSections.push(section);
+                }
+            }
+        }
+
+        // Extract fixtures from UFC sections
+        for (const ufcSection of ufcSections) {
+            const fixtureSelectors = [
+                'div.cpm-ParticipantFixtureDetails100',
+                'div[class*="ParticipantFixture"]',
+                'div.gl-MarketFixture',
+                'div.rcl-MarketFixtureDetailsLabelBase'
+            ];
+
+            for (const selector of fixtureSelectors) {
+                const fixtures = Array.from(ufcSection.querySelectorAll(selector))
+                    .filter(fixture => !fixture.className.includes('Hidden') && fixture.offsetParent !== null);
+                allFixtures = allFixtures.concat(fixtures);
+            }
+        }
+    }
+
+    // Remove duplicates based on content
+    const uniqueFixtures = [];
+    const seenFixtureTexts = new Set();
+    for (const fixture of allFixtures) {
+        const fixtureText = fixture.textContent.trim();
+        if (!seenFixtureTexts.has(fixtureText)) {
+            seenFixtureTexts.add(fixtureText);
+            uniqueFixtures.push(fixture);
+        }
+    }
+
+    console.log(`🥊 Found ${uniqueFixtures.length} unique UFC fixtures`);
+
+    // Step 2: Extract fight date with fallback for pregame
+    const dateHeaders = document.querySelectorAll('div.cpm-MarketFixtureDateHeader');
+    let fightDate = dateHeaders.length > 0 ? dateHeaders[0].textContent.trim() : null;
+
+    // Fallback to today's date for pregame if no date found
+    if (!fightDate || fightDate === null) {
+        const today = new Date();
+        const options = { weekday: 'short', month: 'short', day: 'numeric' };
+        fightDate = today.toLocaleDateString('en-US', options);
+    }
+
+    // Step 3: Extract odds columns from the page (enhanced for spread and total)
+    const oddsColumns = {};
+    const marketOdds = document.querySelectorAll('div.cpm-MarketOdds');
+
+    for (const section of marketOdds) {
+        const header = section.querySelector('div.cpm-MarketOddsHeader');
+        if (header) {
+            const headerText = header.textContent.trim();
+            // Look for moneyline, spread, and total columns
+            if (headerText === 'To Win' || headerText === 'Money' || headerText === '1' ||
+                headerText.includes('Spread') || headerText.includes('Handicap') ||
+                headerText.includes('Total') || headerText.includes('Over/Under') ||
+                headerText === 'O/U' || headerText === 'Line') {
+                const columnOdds = [];
+                const oddsElems = section.querySelectorAll('span.cpm-ParticipantOdds_Odds');
+                for (const oddsElem of oddsElems) {
+                    const oddsText = oddsElem.textContent;
+                    if (oddsText && oddsText.trim()) {
+                        columnOdds.push(oddsText.trim());
+                    }
+                }
+                oddsColumns[headerText] = columnOdds;
+            }
+        }
+    }
+
+    console.log(`🥊 Odds columns found: ${Object.keys(oddsColumns).join(', ')}`);
+
+    // Step 4: Process ALL fixtures and extract fighter information
+    for (let i = 0; i < uniqueFixtures.length; i++) {
+        const fixture = uniqueFixtures[i];
+
+        // Extract fighter names using multiple approaches
+        let fighter1, fighter2;
+
+        // Method 1: Look for specific UFC team elements
+        const teamElems = fixture.querySelectorAll('div.cpm-ParticipantFixtureDetails100_Team');
+        if (teamElems.length >= 2) {
+            fighter1 = teamElems[0].textContent.trim();
+            fighter2 = teamElems[1].textContent.trim();
+        } else {
+            // Method 2: Look for general team containers
+            const teamContainers = fixture.querySelectorAll('div.cpm-ParticipantFixtureDetails100_TeamContainer');
+            if (teamContainers.length >= 2) {
+                const t1 = teamContainers[0].querySelector('div.cpm-ParticipantFixtureDetails100_Team, div[class*="_Team"]');
+                const t2 = teamContainers[1].querySelector('div.cpm-ParticipantFixtureDetails100_Team, div[class*="_Team"]');
+                fighter1 = t1 ? t1.textContent.trim() : '';
+                fighter2 = t2 ? t2.textContent.trim() : '';
+            } else {
+                // Method 3: Parse fixture text for UFC fights (format: Fighter1 v Fighter2)
+                const fixtureText = fixture.textContent;
+                if (fixtureText.includes(' v ')) {
+                    const fighters = fixtureText.split(' v ');
+                    if (fighters.length >= 2) {
+                        fighter1 = fighters[0].trim();
+                        fighter2 = fighters[1].trim();
+                    }
+                } else if (fixtureText.includes(' vs ')) {
+                    const fighters = fixtureText.split(' vs ');
+                    if (fighters.length >= 2) {
+                        fighter1 = fighters[0].trim();
+                        fighter2 = fighters[1].trim();
+                    }
+                }
+            }
+        }
+
+        if (!fighter1 || !fighter2 || fighter1.length < 3 || fighter2.length < 3) {
+            console.log(`❌ Invalid UFC fighters: ${fighter1} vs ${fighter2}`);
+            continue;
+        }
+
+        // Create unique fight signature to avoid duplicates within UFC extraction
+        const fightSignature = `${fighter1.toLowerCase().trim()} vs ${fighter2.toLowerCase().trim()}`;
+        if (seenFights.has(fightSignature)) {
+            console.log(`⚠️ Skipping duplicate UFC fight: ${fightSignature}`);
+            continue;
+        }
+        seenFights.add(fightSignature);
+
+        console.log(`✅ UFC Fight: ${fighter1} vs ${fighter2}`);
+
+        // Extract fight time
+        const timeElem = fixture.querySelector('div[class*="BookCloses"], div[class*="Clock"]');
+        const fightTime = timeElem ? timeElem.textContent.trim() : "TBD";
+
+        // Extract odds for moneyline, spread, and total
+        const moneylineOdds = [];
+        const spreadOdds = [];
+        const totalOdds = [];
+
+        // FIXED: Correctly map odds to individual fights
+        // Each fight gets its own set of odds from the fixtures and columns
+
+        // Moneyline odds (To Win) - Map correctly with actual HTML structure
+        const moneylineKey = oddsColumns['To Win'] ? 'To Win' : (oddsColumns['Money'] ? 'Money' : null);
+        if (moneylineKey && oddsColumns[moneylineKey] && oddsColumns[moneylineKey].length > i * 2 + 1) {
+            moneylineOdds.push(oddsColumns[moneylineKey][i * 2]);     // Fighter 1 moneyline
+            moneylineOdds.push(oddsColumns[moneylineKey][i * 2 + 1]); // Fighter 2 moneyline
+        }
+
+        // FIXED: Extract spread odds correctly from the odds columns
+        // Find spread column odds for this specific fight (index i)
+        const spreadColumnKey = Object.keys(oddsColumns).find(key => key.includes('Spread') || key.includes('Handicap'));
+        if (spreadColumnKey && oddsColumns[spreadColumnKey] && oddsColumns[spreadColumnKey].length > i * 2 + 1) {
+            // Each fight has 2 spread odds (fighter1 spread, fighter2 spread)
+            const spread1 = oddsColumns[spreadColumnKey][i * 2] || '';
+            const spread2 = oddsColumns[spreadColumnKey][i * 2 + 1] || '';
+            if (spread1 && spread2) {
+                spreadOdds.push(spread1);
+                spreadOdds.push(spread2);
+            }
+        }
+
+        // FIXED: Extract total odds correctly from the odds columns
+        // Find total column odds for this specific fight (index i) 
+        const totalColumnKey = Object.keys(oddsColumns).find(key => key.includes('Total') || key.includes('O/U') || key.includes('Over'));
+        if (totalColumnKey && oddsColumns[totalColumnKey] && oddsColumns[totalColumnKey].length > i * 2 + 1) {
+            // Each fight has 2 total odds (Over, Under)
+            const total1 = oddsColumns[totalColumnKey][i * 2] || '';
+            const total2 = oddsColumns[totalColumnKey][i * 2 + 1] || '';
+            if (total1 && total2) {
+                totalOdds.push(total1);
+                totalOdds.push(total2);
+            }
+        }
+
+        console.log(`🥊 Moneyline for ${fighter1} vs ${fighter2}: [${moneylineOdds.join(', ')}]`);
+        console.log(`🥊 Spread for ${fighter1} vs ${fighter2}: [${spreadOdds.join(', ')}]`);
+        console.log(`🥊 Total for ${fighter1} vs ${fighter2}: [${totalOdds.join(', ')}]`);
+
+        // Create fight entry
+        results.push({
+            fighter1: fighter1,
+            fighter2: fighter2,
+            date: fightDate,
+            time: fightTime,
+            moneyline_odds: moneylineOdds,
+            spread_odds: spreadOdds,
+            total_odds: totalOdds,
+            fixture_id: `ufc_${results.length}`
+        });
+    }
+
+    console.log(`🥊 Total unique UFC fights extracted: ${results.length}`);
+    return results;
+}
+""",
+    'soccer': """
+() => {
+    const results = [];
+    const seenMatches = new Set();
+
+    console.log('⚽ Starting Soccer extraction...');
+
+    // Step 1: Find generic Soccer section (excluding UCL, EPL, MLS, and eSoccer)
+    let soccerSection = null;
+
+    // Method 1: Look for "Featured Matches" header (common for generic soccer)
+    const headers = document.querySelectorAll('.cpm-Header_Title, .ss-HomeSpotlightHeader_Title');
+    for (const header of headers) {
+        const headerText = header.textContent.trim();
+        // Match generic soccer headers, excluding specific leagues
+        if ((headerText === 'Featured Matches' || headerText === 'Soccer' || headerText === 'Football') &&
+            !headerText.includes('UEFA') && !headerText.includes('Champions League') &&
+            !headerText.includes('Premier League') && !headerText.includes('EPL') &&
+            !headerText.includes('MLS') && !headerText.includes('Major League Soccer')) {
+            soccerSection = header.closest('.cpm-CouponPodModule, .ss-HomepageSpotlight');
+            console.log(`Found generic Soccer section by header: "${headerText}"`);
+            break;
+        }
+    }
+
+    // Method 2: Look for generic soccer icon (zClass_Soccer.svg) without specific league identifiers
+    if (!soccerSection) {
+        const headerImages = document.querySelectorAll('.cpm-Header_HeaderImage, .ss-HomeSpotlightHeader_HeaderImage');
+        for (const img of headerImages) {
+            const style = img.getAttribute('style') || '';
+            // Must have generic soccer icon, but NOT UCL, EPL, MLS, or eSports icons
+            if (style.includes('zClass_Soccer.svg') &&
+                !style.includes('zlogo_UCL_Official.svg') &&
+                !style.includes('zlogo_MLS_Official.svg') &&
+                !style.includes('zClass_ESports.svg')) {
+
+                const section = img.closest('.cpm-CouponPodModule, .ss-HomepageSpotlight');
+                if (section) {
+                    // Double-check the section title doesn't contain specific league names
+                    const sectionTitle = section.querySelector('.cpm-Header_Title, .ss-HomeSpotlightHeader_Title');
+                    const titleText = sectionTitle ? sectionTitle.textContent.trim() : '';
+
+                    if (!titleText.includes('UEFA') && !titleText.includes('Champions League') &&
+                        !titleText.includes('Premier League') && !titleText.includes('EPL') &&
+                        !titleText.includes('MLS') && !titleText.includes('eSoccer') &&
+                        !titleText.includes('e-soccer')) {
+                        soccerSection = section;
+                        console.log(`Found generic Soccer section by icon, title: "${titleText}"`);
+                        break;
+                    }
+                }
+            }
+        }
+    }
+
+    if (!soccerSection) {
+        console.log('Generic Soccer section not found (this is OK if UCL/EPL/MLS are being used)');
+        return [];
+    }
+
+    // Step 2: Extract fixtures ONLY from the generic soccer section
+    const allFixtures = Array.from(soccerSection.querySelectorAll('div.cpm-ParticipantFixtureDetailsSoccer'))
+        .filter(fixture => !fixture.className.includes('Hidden'));
+
+    console.log(`Found ${allFixtures.length} soccer fixtures in generic soccer section`);
+
+    // Step 3: Extract game date
+    const dateHeader = soccerSection.querySelector('div.cpm-MarketFixtureDateHeader');
+    let gameDate = dateHeader ? dateHeader.textContent.trim() : null;
+    if (!gameDate) {
+        const today = new Date();
+        const options = { weekday: 'short', month: 'short', day: 'numeric' };
+        gameDate = today.toLocaleDateString('en-US', options);
+    }
+
+    // Step 4: Extract odds columns from the scoped section
+    const oddsColumns = {};
+    const marketOdds = soccerSection.querySelectorAll('div.cpm-MarketOdds');
+
+    for (const section of marketOdds) {
+        const header = section.querySelector('div.cpm-MarketOddsHeader');
+        if (header) {
+            const headerText = header.textContent.trim();
+            if (headerText === '1' || headerText === 'X' || headerText === '2' || 
+                headerText === 'Money' || headerText === '1X2' || headerText === 'Match Winner') {
+                const columnOdds = [];
+                const oddsElems = section.querySelectorAll('span.cpm-ParticipantOdds_Odds');
+                for (const oddsElem of oddsElems) {
+                    const oddsText = oddsElem.textContent;
+                    if (oddsText && oddsText.trim()) {
+                        columnOdds.push(oddsText.trim());
+                    }
+                }
+                oddsColumns[headerText] = columnOdds;
+            }
+        }
+    }
+
+    console.log(`📊 Soccer Odds columns found: ${Object.keys(oddsColumns).join(', ')}`);
+
+    // Step 5: Process fixtures from the scoped soccer section
+    for (let i = 0; i < allFixtures.length; i++) {
+        const fixture = allFixtures[i];
+
+        // Extract team names using soccer-specific selectors
+        let team1, team2;
+
+        // Method 1: Direct soccer team elements
+        const teamElems = fixture.querySelectorAll('div.cpm-ParticipantFixtureDetailsSoccer_Team');
+        if (teamElems.length >= 2) {
+            team1 = teamElems[0].textContent.trim();
+            team2 = teamElems[1].textContent.trim();
+        } else {
+            // Method 2: Parse fixture text for soccer matches
+            const fixtureText = fixture.textContent;
+            if (fixtureText.includes(' v ')) {
+                const teams = fixtureText.split(' v ');
+                if (teams.length >= 2) {
+                    team1 = teams[0].trim();
+                    team2 = teams[1].trim();
+                }
+            }
+        }
+
+        if (!team1 || !team2 || team1.length < 3 || team2.length < 3) {
+            console.log(`❌ Invalid soccer teams: ${team1} vs ${team2}`);
+            continue;
+        }
+
+        // Additional eSoccer filtering (double-check)
+        const combinedText = `${team1} ${team2}`.toLowerCase();
+        if (combinedText.includes('esoccer') || combinedText.includes('e-soccer') ||
+            combinedText.includes('virtual') || combinedText.includes('simulated')) {
+            console.log(`⚠️ Skipping esoccer match: ${team1} vs ${team2}`);
+            continue;
+        }
+
+        // Check for eSoccer nickname pattern
+        const team1HasNickname = team1.includes('(') && team1.includes(')') &&
+            !team1.toLowerCase().includes('youth') && !team1.toLowerCase().includes('u21');
+        const team2HasNickname = team2.includes('(') && team2.includes(')') &&
+            !team2.toLowerCase().includes('youth') && !team2.toLowerCase().includes('u21');
+
+        if (team1HasNickname || team2HasNickname) {
+            console.log(`⚠️ Skipping potential esoccer match with nicknames: ${team1} vs ${team2}`);
+            continue;
+        }
+
+        // Create unique match signature to avoid duplicates
+        const matchSignature = `${team1.toLowerCase().trim()} vs ${team2.toLowerCase().trim()}`;
+        if (seenMatches.has(matchSignature)) {
+            console.log(`⚠️ Skipping duplicate soccer match: ${matchSignature}`);
+            continue;
+        }
+        seenMatches.add(matchSignature);
+
+        console.log(`✅ Soccer Match: ${team1} vs ${team2}`);
+
+        // Extract match time
+        const timeElem = fixture.querySelector('div.cpm-ParticipantFixtureDetailsSoccer_BookCloses');
+        const matchTime = timeElem ? timeElem.textContent.trim() : "TBD";
+
+        // Map odds to teams (1X2 format: 1=home, X=draw, 2=away)
+        const moneylineOdds = [];
+
+        // Use '1', 'X', '2' columns for soccer 1X2 betting
+        if (oddsColumns['1'] && oddsColumns['1'].length > i) {
+            moneylineOdds.push(oddsColumns['1'][i]);  // Home team odds
+        }
+
+        if (oddsColumns['X'] && oddsColumns['X'].length > i) {
+            moneylineOdds.push(oddsColumns['X'][i]);  // Draw odds
+        }
+
+        if (oddsColumns['2'] && oddsColumns['2'].length > i) {
+            moneylineOdds.push(oddsColumns['2'][i]);  // Away team odds
+        }
+
+        // Fallback to other formats if 1X2 not available
+        if (moneylineOdds.length === 0) {
+            const oddsKey = oddsColumns['Money'] ? 'Money' : (oddsColumns['1X2'] ? '1X2' : 'Match Winner');
+            if (oddsColumns[oddsKey] && oddsColumns[oddsKey].length > i * 3 + 2) {
+                moneylineOdds.push(oddsColumns[oddsKey][i * 3]);     // Home team odds
+                moneylineOdds.push(oddsColumns[oddsKey][i * 3 + 1]); // Draw odds
+                moneylineOdds.push(oddsColumns[oddsKey][i * 3 + 2]); // Away team odds
+            }
+        }
+
+        console.log(`⚽ Odds for ${team1} vs ${team2}: [${moneylineOdds.join(', ')}]`);
+
+        // Create match entry
+        results.push({
+            team1: team1,
+            team2: team2,
+            date: matchDate,
+            time: matchTime,
+            moneyline_odds: moneylineOdds,
+            fixture_id: `soccer_${results.length}`
+        });
+    }
+
+    console.log(`⚽ Total unique REAL soccer matches extracted: ${results.length}`);
+    return results;
+}
+""",
+
+    # Parameterised by SECTION_CONFIGS
+    'basketball_section': """
+(root, cfg, h) => {
+    const results = [];
+
+    console.log(`🔍 Looking for ${cfg.label} section...`);
+
+    // Step 1: Find the league section (logo, header image or title, see SECTION_CONFIGS);
+    // excludeHtml keeps eSports sections (NBA2K) out of the NBA pick
+    const section = h.findSection(cfg);
+    if (!section) {
+        console.log(`❌ ${cfg.label} section not found`);
+        return [];
+    }
+
+    // Step 2: Extract fixtures from the verified section only
+    const fixtures = Array.from(section.querySelectorAll('div.cpm-ParticipantFixtureDetailsBasketball'))
+        .filter(fixture => !fixture.className.includes('Hidden'));
+
+    console.log(`📋 Found ${fixtures.length} ${cfg.label} fixtures in verified ${cfg.label} section`);
+
+    // Step 3: Extract odds columns from the section
+    const oddsColumns = {};
+
+    const marketOdds = Array.from(section.querySelectorAll('div.cpm-MarketOdds'));
+    for (const market of marketOdds) {
+        const header = market.querySelector('div.cpm-MarketOddsHeader');
+        if (header) {
+            const headerText = header.textContent;
+            if (headerText) {
+                const headerName = headerText.trim();
+                if (["Spread", "Total", "Money"].includes(headerName)) {
+                    const columnOdds = [];
+
+                    // Enhanced: Get both handicap and odds for Spread/Total, just odds for Money
+                    const participantOdds = market.querySelectorAll('.cpm-ParticipantOdds');
+                    for (const participantOdd of participantOdds) {
+                        const handicap = participantOdd.querySelector('.cpm-ParticipantOdds_Handicap');
+                        const oddsValue = participantOdd.querySelector('.cpm-ParticipantOdds_Odds');
+
+                        if (headerName === 'Money') {
+                            // Moneyline: just the odds value
+                            if (oddsValue) {
+                                columnOdds.push(oddsValue.textContent.trim());
+                            }
+                        } else {
+                            // Spread/Total: include handicap + odds
+                            if (handicap && oddsValue) {
+                                columnOdds.push(`${handicap.textContent.trim()} ${oddsValue.textContent.trim()}`);
+                            }
+                        }
+                    }
+
+                    oddsColumns[headerName] = columnOdds;
+                }
+            }
+        }
+    }
+
+    // Extract game date with fallback for pregame
+    const gameDate = h.sectionDate(section);
+
+    // Step 4: Process fixtures and validate the teams
+    for (let i = 0; i < fixtures.length; i++) {
+        const fixture = fixtures[i];
+
+        // Extract team names
+        const teamElems = fixture.querySelectorAll('div.cpm-ParticipantFixtureDetailsBasketball_Team');
+
+        let team1, team2;
+        if (teamElems.length >= 2) {
+            team1 = teamElems[0].textContent.trim();
+            team2 = teamElems[1].textContent.trim();
+        } else {
+            // Fallback to team containers
+            const teamContainers = fixture.querySelectorAll('div.cpm-ParticipantFixtureDetailsBasketball_TeamContainer');
+            if (teamContainers.length >= 2) {
+                const t1 = teamContainers[0].querySelector('div.cpm-ParticipantFixtureDetailsBasketball_Team');
+                const t2 = teamContainers[1].querySelector('div.cpm-ParticipantFixtureDetailsBasketball_Team');
+                team1 = t1 ? t1.textContent.trim() : '';
+                team2 = t2 ? t2.textContent.trim() : '';
+            }
+        }
+
+        // Reject other competitions' teams (NBA2K gamer tags like "OKC Thunder (JD)", NBA teams in NCAAB)
+        const hasRejectedTag = (cfg.rejectTags || []).some(tag => team1.includes(tag) || team2.includes(tag));
+        const hasRejectedTeam = (cfg.rejectTeams || []).some(team => team1.includes(team) || team2.includes(team));
+
+        if (!team1 || !team2 || hasRejectedTeam || hasRejectedTag) {
+            console.log(`❌ Filtered out invalid/other-league team: ${team1} vs ${team2}`);
+            continue;
+        }
+
+        console.log(`✅ Valid ${cfg.label} teams: ${team1} vs ${team2}`);
+
+        // Extract time
+        const timeElem = fixture.querySelector('div.cpm-ParticipantFixtureDetailsBasketball_BookCloses');
+        const gameTime = timeElem ? timeElem.textContent.trim() : "TBD";
+
+        // Map odds correctly (each game gets 2 odds per column - team1 and team2)
+        const spreadOdds = [];
+        const totalOdds = [];
+        const moneylineOdds = [];
+
+        const gameIndex = i * 2; // Each game has 2 odds entries
+
+        // Spread odds (2 per game)
+        if (oddsColumns["Spread"] && oddsColumns["Spread"].length > gameIndex + 1) {
+            spreadOdds.push(oddsColumns["Spread"][gameIndex]);
+            spreadOdds.push(oddsColumns["Spread"][gameIndex + 1]);
+        }
+
+        // Total odds (2 per game)
+        if (oddsColumns["Total"] && oddsColumns["Total"].length > gameIndex + 1) {
+            totalOdds.push(oddsColumns["Total"][gameIndex]);
+            totalOdds.push(oddsColumns["Total"][gameIndex + 1]);
+        }
+
+        // Money odds (2 per game)
+        if (oddsColumns["Money"] && oddsColumns["Money"].length > gameIndex + 1) {
+            moneylineOdds.push(oddsColumns["Money"][gameIndex]);
+            moneylineOdds.push(oddsColumns["Money"][gameIndex + 1]);
+        }
+
+        // Create game object
+        results.push({
+            team1: team1,
+            team2: team2,
+            date: gameDate,
+            time: gameTime,
+            spread: spreadOdds,
+            total: totalOdds,
+            moneyline: moneylineOdds,
+            fixture_id: `${cfg.fixturePrefix}_${i}`
+        });
+    }
+
+    console.log(`🏀 Total ${cfg.label} games extracted: ${results.length}`);
+    return results;
+}
+""",
+    'soccer_section': """
+(root, cfg, h) => {
+    const results = [];
+
+    // Step 1: Find the competition section (header logo or title, see SECTION_CONFIGS)
+    const section = h.findSection(cfg);
+    if (!section) {
+        console.log(`${cfg.label} section not found`);
+        return [];
+    }
+
+    // Step 2: Extract fixtures from the section
+    const fixtures = Array.from(section.querySelectorAll('div.cpm-ParticipantFixtureDetailsSoccer'))
+        .filter(fixture => !fixture.className.includes('Hidden'));
+
+    console.log(`Found ${fixtures.length} ${cfg.label} fixtures`);
+
+    // Step 3: Extract odds columns (1, X, 2 format for soccer)
+    const oddsColumns = {};
+    const marketOdds = Array.from(section.querySelectorAll('div.cpm-MarketOdds'));
+
+    for (const market of marketOdds) {
+        const header = market.querySelector('div.cpm-MarketOddsHeader');
+        if (header) {
+            const headerText = header.textContent.trim();
+            if (['1', 'X', '2'].includes(headerText)) {
+                const columnOdds = [];
+                const oddsElems = market.querySelectorAll('span.cpm-ParticipantOdds_Odds');
+                for (const oddsElem of oddsElems) {
+                    const oddsText = oddsElem.textContent;
+                    if (oddsText) {
+                        columnOdds.push(oddsText.trim());
+                    }
+                }
+                oddsColumns[headerText] = columnOdds;
+            }
+        }
+    }
+
+    // Step 4: Extract game date
+    const gameDate = h.sectionDate(section);
+
+    // Step 5: Process fixtures
+    for (let i = 0; i < fixtures.length; i++) {
+        const fixture = fixtures[i];
+
+        // Extract team names
+        const teamElements = fixture.querySelectorAll('div.cpm-ParticipantFixtureDetailsSoccer_Team');
+        if (teamElements.length < 2) continue;
+
+        const team1 = teamElements[0].textContent.trim();
+        const team2 = teamElements[1].textContent.trim();
+
+        // Extract time
+        const timeElement = fixture.querySelector('div.cpm-ParticipantFixtureDetailsSoccer_BookCloses');
+        const gameTime = timeElement ? timeElement.textContent.trim() : "TBD";
+
+        // Map odds for soccer (1=home win, X=draw, 2=away win)
+        const moneylineOdds = [];
+
+        // Team 1 (Home) odds from column "1"
+        if (oddsColumns["1"] && oddsColumns["1"].length > i) {
+            moneylineOdds.push(oddsColumns["1"][i]);
+        }
+
+        // Draw odds from column "X"
+        let drawOdds = null;
+        if (oddsColumns["X"] && oddsColumns["X"].length > i) {
+            drawOdds = oddsColumns["X"][i];
+        }
+
+        // Team 2 (Away) odds from column "2"
+        if (oddsColumns["2"] && oddsColumns["2"].length > i) {
+            moneylineOdds.push(oddsColumns["2"][i]);
+        }
+
+        results.push({
+            team1: team1,
+            team2: team2,
+            date: gameDate,
+            time: gameTime,
+            moneyline: moneylineOdds,
+            draw_odds: drawOdds,
+            fixture_id: `${cfg.fixturePrefix}_${i}`
+        });
+    }
+
+    return results;
+}
+""",
+}
+
+# Where each league's section is found on the homepage and what its teams must not look like.
+# Lookup order: logoSelector (with requireHtml/excludeHtml checks), headerLogos, titlesExact/titlesContains.
+SECTION_CONFIGS: Dict[str, Dict[str, Any]] = {
+    'NBA': {
+        'label': 'NBA',
+        'logoSelector': '.nba-NBALeagueLogo, .nba-NBALeagueLogo_SVG',
+        'requireHtml': 'nba-NBALeagueLogo',
+        'excludeHtml': 'zClass_ESports.svg',  # NBA2K sections carry the eSports class logo
+        'titlesExact': ['NBA'],
+        'rejectTags': ['(JD)', '(HYPER)', '(CARNAGE)', '(OUTLAW)', '(RIDER)', '(UNBREAKABLE)', '(PRODIGY)',
+                       '(SCORCH)', '(DECOY)', '(FENRIR)', '(HAWK)', '(COMBO)', '(GRAVITY)', '(PUNISHER)', '(CRUCIAL)'],
+        'fixturePrefix': 'nba_real',
+    },
+    'NCAAB': {
+        'label': 'NCAAB',
+        'headerLogos': ['zlogo_ncaab_official.svg'],
+        'titlesExact': ['NCAAB', 'College Basketball'],
+        'rejectTeams': ['Lakers', 'Celtics', 'Warriors', 'Heat', 'Bucks', 'Nets', 'Clippers', 'Mavericks',
+                        'Nuggets', '76ers', 'Suns', 'Grizzlies', 'Cavaliers', 'Knicks', 'Thunder'],
+        'rejectTags': ['(JD)', '(HYPER)', '(CARNAGE)', '(OUTLAW)', '(RIDER)', '(UNBREAKABLE)'],
+        'fixturePrefix': 'ncaab',
+    },
+    'EPL': {
+        'label': 'EPL',
+        'titlesExact': ['Premier League'],
+        'fixturePrefix': 'epl',
+    },
+    'UCL': {
+        'label': 'UCL',
+        'headerLogos': ['zlogo_UCL_Official.svg'],
+        'titlesContains': ['UEFA Champions League', 'Champions League'],
+        'fixturePrefix': 'ucl',
+    },
+    'MLS': {
+        'label': 'MLS',
+        'headerLogos': ['zlogo_MLS_Official.svg'],
+        'titlesExact': ['Round 1'],
+        'fixturePrefix': 'mls',
+    },
+}
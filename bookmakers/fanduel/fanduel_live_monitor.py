@@ -7,10 +7,46 @@ import os
 import subprocess
 import tempfile
 import logging
+import sys
+from contextlib import nullcontext
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Dict, List, Any, Set
 from playwright.async_api import async_playwright
 
+# Odds movement time-series store (project root on path for utils)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+try:
+    from utils.helpers.odds_timeseries import OddsTimeSeriesStore, make_match_key, load_team_canonicalizer
+    TIMESERIES_AVAILABLE = True
+except ImportError:
+    TIMESERIES_AVAILABLE = False
+try:
+    from utils.helpers.data_sidecar import write_sidecar
+    SIDECAR_AVAILABLE = True
+except ImportError:
+    SIDECAR_AVAILABLE = False
+try:
+    from utils.helpers.metrics import REGISTRY as METRICS, stage_timer, timed_stage
+except ImportError:
+    METRICS = None
+    def timed_stage(stage):
+        return lambda func: func
+    def stage_timer(stage, items=0):
+        return nullcontext()
+
+# FanDuel market names -> time-series market keys
+FANDUEL_SERIES_MARKETS = {
+    'Moneyline': 'moneyline',
+    'Spread': 'spread',
+    'Run Line': 'spread',
+    'Puck Line': 'spread',
+    'Total Points': 'total',
+    'Total Runs': 'total',
+    'Total Goals': 'total',
+    'Total Match Goals': 'total',
+}
+
 class FanDuelLiveMonitor:
     
     def __init__(self):
@@ -38,6 +74,18 @@ class FanDuelLiveMonitor:
         self.data_lock = asyncio.Lock()
         self.setup_logging()
         
+        # Line-movement history fed from the poll hash checks
+        self.odds_series = None
+        if TIMESERIES_AVAILABLE:
+            try:
+                self.odds_series = OddsTimeSeriesStore()
+                self.series_team_name = load_team_canonicalizer()
+                self.odds_series.prime('fanduel')
+                self.odds_series.start()
+            except Exception as e:
+                self.logger.warning(f"Odds time-series store unavailable: {e}")
+                self.odds_series = None
+        
         print(f"[INIT] Real-Time Live Monitor - Session: {self.session_id}")
     
     def setup_logging(self):
@@ -158,6 +206,46 @@ class FanDuelLiveMonitor:
         
         self._merge_and_save()
     
+    def _selection_outcome(self, match: Dict, name: str) -> str:
+        """Map a runner name onto home/away/draw/over/under where possible"""
+        if name == match.get('home_team'):
+            return 'home'
+        if name == match.get('away_team'):
+            return 'away'
+        lowered = name.lower()
+        if lowered in ('draw', 'tie'):
+            return 'draw'
+        if lowered.startswith('over'):
+            return 'over'
+        if lowered.startswith('under'):
+            return 'under'
+        return name
+    
+    def _record_odds_movement(self, event_ids: Set[int]):
+        """Feed changed prices of the given events into the odds time-series store"""
+        if self.odds_series is None:
+            return
+        
+        now = time.time()
+        for event_id in event_ids:
+            match = self.live_matches.get(event_id)
+            if not match or not match.get('odds_data') or not match.get('home_team'):
+                continue
+            
+            ticks = []
+            for market_name, market in match['odds_data'].items():
+                market_key = FANDUEL_SERIES_MARKETS.get(market_name, market_name.lower())
+                for selection in market.get('odds', {}).values():
+                    price = selection.get('decimal_odds')
+                    if not price:
+                        continue
+                    line = selection.get('handicap') if market_key != 'moneyline' else None
+                    ticks.append((market_key, self._selection_outcome(match, selection.get('name', '')), price, line))
+            
+            key = make_match_key(match.get('sport'), match['home_team'], match['away_team'],
+                                 self.series_team_name)
+            self.odds_series.record_match(key, 'fanduel', ticks, now)
+    
     def _extract_event_ids(self, data: Any, event_ids: Set[int] = None) -> Set[int]:
         if event_ids is None:
             event_ids = set()
@@ -587,6 +675,7 @@ class FanDuelLiveMonitor:
         except Exception as e:
             self.logger.error(f"Error in async save: {e}")
     
+    @timed_stage('_save_all_data')
     def _save_all_data(self):
         try:
             script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -632,8 +721,13 @@ class FanDuelLiveMonitor:
                 'matches': list(self.live_matches.values())
             }
             
+            content = json.dumps(live_data, indent=2, ensure_ascii=False)
             with open(live_file, 'w', encoding='utf-8') as f:
-                json.dump(live_data, f, indent=2, ensure_ascii=False)
+                f.write(content)
+            if SIDECAR_AVAILABLE:
+                write_sidecar(live_file, dict(sorted(sports_stats.items())), content,
+                              writer='fanduel_live_monitor',
+                              extra={'matches_with_odds': live_data['matches_with_odds']})
             
             # Save statistics file separately for easy viewing
             stats_file = os.path.join(script_dir, "fanduel_live_statistics.json")
@@ -722,7 +816,8 @@ class FanDuelLiveMonitor:
                         continue
                     
                     # Use Playwright's request API which shares the browser context and cookies
-                    response = await self.context.request.get(api_url)
+                    with stage_timer('fetch'):
+                        response = await self.context.request.get(api_url)
                     
                     if response.ok:
                         data = await response.json()
@@ -742,7 +837,9 @@ class FanDuelLiveMonitor:
                             last_data_hash = current_hash
                             
                             async with self.data_lock:
-                                self._process_api_response(api_url, data)
+                                with stage_timer('process_api_response'):
+                                    self._process_api_response(api_url, data)
+                                self._record_odds_movement(self._extract_event_ids(data))
                         elif poll_count % 60 == 0:
                             self.logger.debug(f"Poll #{poll_count}: No change in data")
                     
@@ -1023,9 +1120,14 @@ class FanDuelLiveMonitor:
         except:
             pass
         
+        if self.odds_series is not None:
+            self.odds_series.close()
+        
         self.logger.info("Cleanup complete")
 
 async def main():
+    if METRICS is not None:
+        METRICS.configure('fanduel_live')
     monitor = FanDuelLiveMonitor()
     await monitor.run()
 
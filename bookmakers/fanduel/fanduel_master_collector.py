@@ -14,11 +14,28 @@ import logging
 import signal
 import atexit
 import psutil
+import sys
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 from playwright.async_api import async_playwright, Browser, Page, BrowserContext
 
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+try:
+    from utils.helpers.data_sidecar import write_sidecar, count_by_sport
+    SIDECAR_AVAILABLE = True
+except ImportError:
+    SIDECAR_AVAILABLE = False
+try:
+    from utils.helpers.metrics import REGISTRY as METRICS, stage_timer, timed_stage
+except ImportError:
+    METRICS = None
+    def timed_stage(stage):
+        return lambda func: func
+    def stage_timer(stage, items=0):
+        return nullcontext()
+
 # Lock file for single instance
 LOCK_FILE = Path('/tmp/fanduel_collector.lock')
 
@@ -1204,6 +1221,7 @@ class FanDuelMasterCollector:
     #     """Remove matches that appear in both live and pregame lists - DISABLED (no live matches)"""
     #     pass
 
+    @timed_stage('_save_all_data')
     def _save_all_data(self):
         """Save all data to JSON files with standardized schema"""
         try:
@@ -1243,8 +1261,12 @@ class FanDuelMasterCollector:
                     'total_pages': 1
                 }
             }
+            content = json.dumps(pregame_data, indent=2, ensure_ascii=False)
             with open(pregame_file, 'w', encoding='utf-8') as f:
-                json.dump(pregame_data, f, indent=2, ensure_ascii=False)
+                f.write(content)
+            if SIDECAR_AVAILABLE:
+                write_sidecar(pregame_file, count_by_sport(self.matches, ('sport',)),
+                              content, writer='fanduel_master_collector')
 
             # 2. LIVE MATCHES - DISABLED (dedicated script handles live matches)
             # live_file = os.path.join(script_dir, "fanduel_live.json")
@@ -1684,7 +1706,8 @@ class FanDuelMasterCollector:
             # Use browser context to fetch the API (bypasses CORS)
             if self.context is None:
                 raise Exception("Browser context not initialized")
-            response = await self.context.request.get(url)
+            with stage_timer('fetch'):
+                response = await self.context.request.get(url)
             if response.status == 200:
                 data = await response.json()
 
@@ -1698,7 +1721,8 @@ class FanDuelMasterCollector:
                         })
 
                         # Process the data IMMEDIATELY
-                        self._process_api_data(data, sport)
+                        with stage_timer('process_api_data'):
+                            self._process_api_data(data, sport)
 
                         # SAVE IMMEDIATELY after processing
                         self._save_all_data()
@@ -1984,6 +2008,8 @@ async def main():
         os.environ['PLAYWRIGHT_HEADLESS'] = '1'
 
     try:
+        if METRICS is not None:
+            METRICS.configure('fanduel_pregame')
         collector = FanDuelMasterCollector()
         await collector.run(monitoring_duration=args.duration)
     except Exception as e:
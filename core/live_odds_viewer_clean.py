@@ -10,6 +10,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel, EmailStr
 import json
+import os
 import asyncio
 import time
 import hashlib
@@ -29,39 +30,58 @@ sys.path.insert(0, str(PathlibPath(__file__).parent.parent))
 # Import format converters
 from utils.converters.odds_format_converters import OpticOddsConverter, EternityFormatConverter, filter_by_bookmaker
 from utils.helpers.history_manager import HistoryManager
+from utils.helpers.history_index import HistoryIndex, parse_timestamp
+from utils.helpers.unified_sections import read_sections, get_sections_path
+from utils.helpers.oddsmagnet_store import OddsMagnetStore, EncodedResponse, negotiate_encoding
+from utils.helpers.ws_fanout import FanoutHub
+from utils.helpers.file_notifier import FileChangeNotifier
+from utils.helpers.arbitrage_scanner import scan_matches, NUMPY_AVAILABLE
+from utils.helpers.odds_timeseries import OddsTimeSeriesStore, make_match_key, load_team_canonicalizer
+from utils.helpers.metrics import REGISTRY as METRICS, stage_timer, timed_stage, load_snapshots, render_prometheus
 from utils.security.secure_config import SecureConfig
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Handle application startup and shutdown events"""
     # Startup
+    file_notifier.start()
     asyncio.create_task(monitor_files())
     asyncio.create_task(push_oddsmagnet_updates())
     yield
-    # Shutdown - cleanup if needed
-    pass
+    # Shutdown
+    file_notifier.stop()
 
 app = FastAPI(title="Live Odds Viewer", lifespan=lifespan)
 
+# Shared file-change notifier for the push loops (watchdog events, polling fallback)
+file_notifier = FileChangeNotifier(poll_interval=5.0)
+
 # Add GZip compression middleware for better performance
 app.add_middleware(GZipMiddleware, minimum_size=1000)
 
 # Base directory - should be project root, not core/
 BASE_DIR = Path(__file__).parent.parent
 
-# In-memory cache for OddsMagnet data to avoid slow disk reads
-# Changed to per-sport caching for real-time updates
-oddsmagnet_cache = {
-    'football': {'data': None, 'timestamp': None, 'file_mtime': None, 'cache_key': None},
-    'basketball': {'data': None, 'timestamp': None, 'file_mtime': None, 'cache_key': None},
-    'tennis': {'data': None, 'timestamp': None, 'file_mtime': None, 'cache_key': None},
-    'cricket': {'data': None, 'timestamp': None, 'file_mtime': None, 'cache_key': None},
-    'americanfootball': {'data': None, 'timestamp': None, 'file_mtime': None, 'cache_key': None},
-    'baseball': {'data': None, 'timestamp': None, 'file_mtime': None, 'cache_key': None},
-    'tabletennis': {'data': None, 'timestamp': None, 'file_mtime': None, 'cache_key': None},
-    'boxing': {'data': None, 'timestamp': None, 'file_mtime': None, 'cache_key': None},
-    'volleyball': {'data': None, 'timestamp': None, 'file_mtime': None, 'cache_key': None},
-}
+# Root of the scraper/unified output files watched below; ODDS_DATA_DIR points
+# the viewer at a feed_replay sandbox for offline soak/load testing
+DATA_DIR = Path(os.environ.get('ODDS_DATA_DIR') or BASE_DIR)
+
+# Shared per-sport OddsMagnet store - each file is parsed once per change and
+# indexed by league/search, so paginated and filtered requests don't re-read it
+ODDSMAGNET_DIR = BASE_DIR / "bookmakers" / "oddsmagnet"
+oddsmagnet_store = OddsMagnetStore({
+    'football': [ODDSMAGNET_DIR / "oddsmagnet_realtime.json"],
+    'football_top10': [ODDSMAGNET_DIR / "oddsmagnet_top10.json", ODDSMAGNET_DIR / "oddsmagnet_realtime.json"],
+    'basketball': [ODDSMAGNET_DIR / "oddsmagnet_basketball.json"],
+    'nba_ncaa': [ODDSMAGNET_DIR / "oddsmagnet_nba_ncaa.json"],
+    'americanfootball': [ODDSMAGNET_DIR / "oddsmagnet_american_football.json"],
+    'cricket': [ODDSMAGNET_DIR / "oddsmagnet_cricket.json"],
+    'baseball': [ODDSMAGNET_DIR / "oddsmagnet_baseball.json"],
+    'tabletennis': [ODDSMAGNET_DIR / "oddsmagnet_table_tennis.json"],
+    'tennis': [ODDSMAGNET_DIR / "oddsmagnet_tennis.json"],
+    'boxing': [ODDSMAGNET_DIR / "oddsmagnet_boxing.json"],
+    'volleyball': [ODDSMAGNET_DIR / "oddsmagnet_volleyball.json"],
+})
 
 # Initialize history manager
 history_manager = HistoryManager(str(BASE_DIR))
@@ -133,13 +153,13 @@ def format_betlink(*, betlink=None, sportsbook=None, state_info=None):
 
 # Files to monitor
 FILES = {
-    'unified': BASE_DIR / "data" / "unified_odds.json",
-    'bet365_pregame': BASE_DIR / "bookmakers" / "bet365" / "bet365_current_pregame.json",
-    'bet365_live': BASE_DIR / "bookmakers" / "bet365" / "bet365_live_current.json",
-    'fanduel_pregame': BASE_DIR / "bookmakers" / "fanduel" / "fanduel_pregame.json",
-    'fanduel_live': BASE_DIR / "bookmakers" / "fanduel" / "fanduel_live.json",
-    '1xbet_pregame': BASE_DIR / "bookmakers" / "1xbet" / "1xbet_pregame.json",
-    '1xbet_live': BASE_DIR / "bookmakers" / "1xbet" / "1xbet_live.json"
+    'unified': DATA_DIR / "data" / "unified_odds.json",
+    'bet365_pregame': DATA_DIR / "bookmakers" / "bet365" / "bet365_current_pregame.json",
+    'bet365_live': DATA_DIR / "bookmakers" / "bet365" / "bet365_live_current.json",
+    'fanduel_pregame': DATA_DIR / "bookmakers" / "fanduel" / "fanduel_pregame.json",
+    'fanduel_live': DATA_DIR / "bookmakers" / "fanduel" / "fanduel_live.json",
+    '1xbet_pregame': DATA_DIR / "bookmakers" / "1xbet" / "1xbet_pregame.json",
+    '1xbet_live': DATA_DIR / "bookmakers" / "1xbet" / "1xbet_live.json"
 }
 
 # Track file modifications
@@ -354,8 +374,42 @@ def merge_individual_sources() -> Dict:
     }
 
 
-def load_unified_data() -> Dict:
-    """Load unified odds data, fallback to individual sources if unified doesn't exist"""
+def load_unified_sections(sections=None, sports=None) -> Optional[Dict]:
+    """Load only the requested pregame/live (and sport) sections from the indexed container
+    
+    Returns None when the container is missing or older than unified_odds.json,
+    so callers can fall back to the full file.
+    """
+    unified_file = FILES['unified']
+    sections_file = get_sections_path(unified_file)
+    try:
+        if not sections_file.exists() or not unified_file.exists():
+            return None
+        # Writer replaces unified_odds.json first, so a stale container is older
+        if sections_file.stat().st_mtime < unified_file.stat().st_mtime:
+            return None
+    except OSError:
+        return None
+    
+    data = read_sections(sections_file, kinds=sections, sports=sports)
+    if data is not None:
+        data['metadata'] = data.get('metadata', {})
+        data['metadata']['source'] = 'unified_sections'
+    return data
+
+
+def load_unified_data(sections=None, sports=None) -> Dict:
+    """Load unified odds data, fallback to individual sources if unified doesn't exist
+    
+    Args:
+        sections: Optional iterable of 'pregame'/'live' - only these sections are parsed
+        sports: Optional iterable of sport names - only these sports are parsed
+    """
+    if sections or sports:
+        data = load_unified_sections(sections, sports)
+        if data is not None:
+            return data
+    
     try:
         unified_file = FILES['unified']
         if unified_file.exists():
@@ -403,13 +457,16 @@ async def monitor_files():
     last_cleanup_time = 0
     cleanup_interval = 300  # Clean every 5 minutes
     
+    # Wake up on writes instead of polling every 5 seconds
+    changes = file_notifier.subscribe(FILES.values())
+    
     while True:
         try:
             # Periodic history cleanup
             current_time = time.time()
             if current_time - last_cleanup_time > cleanup_interval:
                 try:
-                    results = history_manager.clean_all()
+                    results = await asyncio.to_thread(history_manager.clean_all)
                     total_moved = sum(results.values())
                     if total_moved > 0:
                         print(f"🧹 Cleaned {total_moved} old/completed matches")
@@ -462,13 +519,15 @@ async def monitor_files():
             }
             await broadcast(status_message)
             
-            await asyncio.sleep(5)  # Check every 5 seconds (optimized)
+            # Sleep until a monitored file changes (periodic wake-up keeps cleanup/status running)
+            await changes.wait(timeout=min(file_notifier.idle_timeout, cleanup_interval))
             
         except Exception as e:
             print(f"Monitor error: {e}")
             await asyncio.sleep(5)
 
 
+@timed_stage('broadcast_legacy')
 async def broadcast(message: dict):
     """Broadcast message to all connected clients"""
     disconnected = []
@@ -612,18 +671,9 @@ async def websocket_endpoint(websocket: WebSocket):
             active_connections.remove(websocket)
 
 
-# Oddsmagnet WebSocket connections by sport
-oddsmagnet_connections: Dict[str, List[WebSocket]] = {
-    'football': [],
-    'basketball': [],
-    'cricket': [],
-    'americanfootball': [],
-    'baseball': [],
-    'tabletennis': [],
-    'tennis': [],
-    'boxing': [],
-    'volleyball': []
-}
+# Oddsmagnet WebSocket subscribers by sport - each update is encoded once and
+# delivered through bounded per-client queues so slow clients can't stall pushes
+oddsmagnet_hub = FanoutHub(max_queue=4, send_timeout=10.0, max_resyncs=5)
 
 
 @app.websocket("/ws/oddsmagnet")
@@ -634,8 +684,8 @@ async def oddsmagnet_websocket(websocket: WebSocket):
     
     try:
         # Add to connections
-        oddsmagnet_connections[current_sport].append(websocket)
-        print(f"🟢 WebSocket connected for {current_sport} (total: {len(oddsmagnet_connections[current_sport])})")
+        oddsmagnet_hub.add(current_sport, websocket)
+        print(f"🟢 WebSocket connected for {current_sport} (total: {oddsmagnet_hub.count(current_sport)})")
         
         # Send initial data based on default sport (football = oddsmagnet_football.json)
         data_file = BASE_DIR / "bookmakers" / "oddsmagnet" / "oddsmagnet_football.json"
@@ -643,7 +693,7 @@ async def oddsmagnet_websocket(websocket: WebSocket):
             async with aiofiles.open(data_file, 'r', encoding='utf-8') as f:
                 content = await f.read()
                 data = json.loads(content)
-                await websocket.send_json({
+                oddsmagnet_hub.send(websocket, {
                     'sport': current_sport,
                     'matches': data.get('matches', []),
                     'timestamp': data.get('timestamp'),
@@ -659,15 +709,9 @@ async def oddsmagnet_websocket(websocket: WebSocket):
             if message.get('action') == 'subscribe':
                 new_sport = message.get('sport', 'football')
                 
-                # Remove from old sport connections
-                if websocket in oddsmagnet_connections[current_sport]:
-                    oddsmagnet_connections[current_sport].remove(websocket)
-                
-                # Add to new sport connections
+                # Move to new sport connections (pending sends for the old sport stay ordered)
                 current_sport = new_sport
-                if current_sport not in oddsmagnet_connections:
-                    oddsmagnet_connections[current_sport] = []
-                oddsmagnet_connections[current_sport].append(websocket)
+                oddsmagnet_hub.move(websocket, current_sport)
                 
                 print(f"🔄 Client switched to {current_sport}")
                 
@@ -690,7 +734,7 @@ async def oddsmagnet_websocket(websocket: WebSocket):
                     async with aiofiles.open(data_file, 'r', encoding='utf-8') as f:
                         content = await f.read()
                         data = json.loads(content)
-                        await websocket.send_json({
+                        oddsmagnet_hub.send(websocket, {
                             'sport': current_sport,
                             'matches': data.get('matches', []),
                             'timestamp': data.get('timestamp'),
@@ -701,7 +745,7 @@ async def oddsmagnet_websocket(websocket: WebSocket):
                 else:
                     print(f"⚠️ Data file not found: {data_file}")
                     # Send empty response so client knows subscription succeeded but no data
-                    await websocket.send_json({
+                    oddsmagnet_hub.send(websocket, {
                         'sport': current_sport,
                         'matches': [],
                         'timestamp': datetime.now().isoformat(),
@@ -710,13 +754,11 @@ async def oddsmagnet_websocket(websocket: WebSocket):
                     })
             
     except WebSocketDisconnect:
-        if websocket in oddsmagnet_connections[current_sport]:
-            oddsmagnet_connections[current_sport].remove(websocket)
+        oddsmagnet_hub.remove(websocket)
         print(f"🔴 WebSocket disconnected from {current_sport}")
     except Exception as e:
         print(f"❌ WebSocket error: {e}")
-        if websocket in oddsmagnet_connections.get(current_sport, []):
-            oddsmagnet_connections[current_sport].remove(websocket)
+        oddsmagnet_hub.remove(websocket)
 
 
 # Background task to push updates to WebSocket clients
@@ -724,7 +766,7 @@ async def push_oddsmagnet_updates():
     """Monitor oddsmagnet files and push updates to connected clients - OPTIMIZED with reduced polling"""
     last_mtimes = {}
     
-    print("🔄 WebSocket monitor started - checking for data updates every 5s (optimized)")
+    print(f"🔄 WebSocket monitor started - file change notifications via {file_notifier.mode}")
     
     # Map sports to their data files
     sport_files = {
@@ -739,11 +781,16 @@ async def push_oddsmagnet_updates():
         'volleyball': BASE_DIR / "bookmakers" / "oddsmagnet" / "oddsmagnet_volleyball.json"
     }
     
+    # Wake up on writes to any sport file (or its .gz) instead of polling every 5 seconds
+    changes = file_notifier.subscribe(
+        [path for data_file in sport_files.values() for path in (data_file, Path(str(data_file) + '.gz'))]
+    )
+    
     while True:
         try:
             # Check each sport that has active connections
             for sport in ['football', 'basketball', 'cricket', 'americanfootball', 'baseball', 'tabletennis', 'tennis', 'boxing', 'volleyball']:
-                if not oddsmagnet_connections[sport]:
+                if not oddsmagnet_hub.count(sport):
                     continue  # Skip sports with no active connections - OPTIMIZATION
                 
                 data_file = sport_files.get(sport)
@@ -785,31 +832,14 @@ async def push_oddsmagnet_updates():
                         'etag': hashlib.md5(content.encode() if isinstance(content, str) else content).hexdigest()
                     }
                     
-                    print(f"📡 PUSHING {sport.upper()} UPDATE: {len(data.get('matches', []))} matches to {len(oddsmagnet_connections[sport])} clients")
-                    
-                    disconnected = []
-                    for ws in oddsmagnet_connections[sport]:
-                        try:
-                            await ws.send_json(message)
-                        except Exception as send_err:
-                            print(f"⚠️ Failed to send to client: {send_err}")
-                            disconnected.append(ws)
-                    
-                    # Clean up disconnected clients
-                    for ws in disconnected:
-                        oddsmagnet_connections[sport].remove(ws)
-                    
-                    if disconnected:
-                        print(f"🧹 Cleaned {len(disconnected)} disconnected clients from {sport}")
-                    
-                    # Invalidate cache for this sport so API serves fresh data immediately
-                    if sport in oddsmagnet_cache:
-                        oddsmagnet_cache[sport]['data'] = None
-                        oddsmagnet_cache[sport]['file_mtime'] = None
-                        print(f"🔄 Invalidated cache for {sport}")
-            
-            # OPTIMIZATION: Reduced from 2s to 5s - less CPU usage, still responsive
-            await asyncio.sleep(5)
+                    # Encoded once, queued to every client; senders run concurrently
+                    with stage_timer('broadcast') as timer:
+                        queued = oddsmagnet_hub.broadcast(sport, message)
+                        timer.items = queued
+                    print(f"📡 PUSHING {sport.upper()} UPDATE: {len(data.get('matches', []))} matches to {queued} clients")
+
+            # Sleep until a sport file is written (watchdog) or the fallback poll interval passes
+            await changes.wait(timeout=file_notifier.idle_timeout)
             
         except Exception as e:
             print(f"❌ Error in push_oddsmagnet_updates: {e}")
@@ -828,7 +858,7 @@ async def get_matches():
 @app.get("/api/matches/sport/{sport}")
 async def get_matches_by_sport(sport: str):
     """API endpoint to get matches for a specific sport"""
-    data = load_unified_data()
+    data = load_unified_data(sports=[sport])
     all_matches = data.get('pregame_matches', []) + data.get('live_matches', [])
 
     # Filter matches by sport (case insensitive)
@@ -868,7 +898,7 @@ async def get_matches_by_bookmaker(bookmaker: str):
 @app.get("/api/matches/live")
 async def get_live_matches():
     """API endpoint to get only live matches"""
-    data = load_unified_data()
+    data = load_unified_data(sections=('live',))
     live_matches = data.get('live_matches', [])
 
     return {
@@ -882,7 +912,7 @@ async def get_live_matches():
 @app.get("/api/matches/pregame")
 async def get_pregame_matches():
     """API endpoint to get only pregame matches"""
-    data = load_unified_data()
+    data = load_unified_data(sections=('pregame',))
     pregame_matches = data.get('pregame_matches', [])
 
     return {
@@ -911,6 +941,154 @@ async def get_status():
     return check_file_status()
 
 
+@app.get("/api/websocket/stats")
+async def get_websocket_stats():
+    """API endpoint for OddsMagnet WebSocket fan-out metrics (queue depth, send latency, drops)"""
+    return oddsmagnet_hub.metrics()
+
+
+def _fanout_families() -> Dict:
+    """OddsMagnet fan-out hub state as metric families (same shape as MetricsRegistry.collect)"""
+    hub = oddsmagnet_hub.metrics()
+    families = {}
+    for key in ('broadcasts', 'messages_sent', 'messages_dropped', 'snapshot_resyncs', 'clients_dropped'):
+        if key in hub:
+            families[f"odds_ws_{key}_total"] = {'type': 'counter', 'help': f"OddsMagnet WebSocket fan-out {key.replace('_', ' ')}",
+                                                'labelnames': [], 'samples': [[[], hub[key]]]}
+    for key, help_text in (('clients', 'Connected OddsMagnet WebSocket clients'),
+                           ('queue_depth_total', 'Messages waiting in client send queues'),
+                           ('queue_depth_max', 'Deepest client send queue')):
+        families[f"odds_ws_{key}"] = {'type': 'gauge', 'help': help_text, 'labelnames': ['group'],
+                                      'samples': [[[group], info[key]] for group, info in hub['groups'].items()]}
+    return families
+
+
+def _render_metrics() -> str:
+    sources = [('viewer', METRICS.collect()), ('viewer', _fanout_families())]
+    for snapshot in load_snapshots():
+        if snapshot.get('process') != 'viewer':
+            sources.append((snapshot['process'], snapshot['metrics']))
+    return render_prometheus(sources)
+
+
+@app.get("/metrics")
+async def get_metrics():
+    """Prometheus text-format metrics: viewer stages plus every scraper/collector snapshot (data/metrics)"""
+    text = await asyncio.to_thread(_render_metrics)
+    return Response(content=text, media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+# Arbitrage scan cache - one vectorized scan (layouts included) per unified file version (i.e. per merge cycle)
+arbitrage_cache = {'version': None, 'result': None}
+arbitrage_lock = asyncio.Lock()
+
+
+def _run_arbitrage_scan():
+    data = load_unified_data()
+    return scan_matches(data.get('pregame_matches', []) + data.get('live_matches', []))
+
+
+async def get_arbitrage_scan():
+    """Return the ScanResult for the current unified_odds.json, rescanning only when it changed"""
+    try:
+        st = FILES['unified'].stat()
+        version = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        version = None
+    
+    if arbitrage_cache['result'] is not None and arbitrage_cache['version'] == version:
+        return arbitrage_cache['result']
+    
+    async with arbitrage_lock:
+        if arbitrage_cache['result'] is None or arbitrage_cache['version'] != version:
+            arbitrage_cache['result'] = await asyncio.to_thread(_run_arbitrage_scan)
+            arbitrage_cache['version'] = version
+        return arbitrage_cache['result']
+
+
+@app.get("/api/arbitrage")
+async def get_arbitrage(limit: int = 100):
+    """Cross-book arbitrage opportunities (most profitable first) with scan summary
+    
+    Query Parameters:
+    - limit: Maximum opportunities to return (default: 100, max: 1000)
+    """
+    if not NUMPY_AVAILABLE:
+        return JSONResponse(content={'error': 'numpy not installed', 'opportunities': []}, status_code=503)
+    try:
+        scan = await get_arbitrage_scan()
+        return {
+            'summary': scan.summary(),
+            'opportunities': scan.opportunities(limit=min(max(1, limit), 1000))
+        }
+    except Exception as e:
+        return JSONResponse(content={'error': str(e), 'opportunities': []}, status_code=500)
+
+
+@app.get("/api/best-prices")
+async def get_best_prices(page: int = 1, page_size: int = 100, sport: str = None, market: str = None):
+    """Best available price per outcome with market and per-book margins
+    
+    Query Parameters:
+    - page: Page number (default: 1)
+    - page_size: Items per page (default: 100, max: 500)
+    - sport: Filter by sport name (exact, case-insensitive)
+    - market: Filter by market ('moneyline', 'spread', 'total')
+    """
+    if not NUMPY_AVAILABLE:
+        return JSONResponse(content={'error': 'numpy not installed', 'items': []}, status_code=503)
+    try:
+        page = max(1, page)
+        page_size = min(max(1, page_size), 500)
+        scan = await get_arbitrage_scan()
+        result = scan.best_prices(offset=(page - 1) * page_size, limit=page_size, sport=sport, market=market)
+        result['summary'] = scan.summary()
+        return result
+    except Exception as e:
+        return JSONResponse(content={'error': str(e), 'items': []}, status_code=500)
+
+
+# Odds movement store (written by the live scrapers, read-only here)
+odds_series = OddsTimeSeriesStore(BASE_DIR / "data" / "odds_timeseries.db")
+series_team_name = load_team_canonicalizer(BASE_DIR)   # same keys the scrapers write
+
+
+@app.get("/api/line-movement")
+async def get_line_movement(match_key: str = None, sport: str = None, home: str = None, away: str = None,
+                            book: str = None, market: str = None, minutes: int = None, max_points: int = 500):
+    """Line-movement series (price and line over time) for one match
+    
+    Query Parameters:
+    - match_key: Series key ('sport|home|away', see /api/line-movement/matches)
+    - sport, home, away: Alternative to match_key
+    - book: Filter by bookmaker ('bet365', 'fanduel')
+    - market: Filter by market ('moneyline', 'spread', 'total')
+    - minutes: Only return the last N minutes
+    - max_points: Maximum points per series (default: 500, max: 5000)
+    """
+    if not match_key:
+        if not (home and away):
+            return JSONResponse(content={'error': 'match_key or home and away required'}, status_code=400)
+        match_key = make_match_key(sport, home, away, series_team_name)
+    since = time.time() - minutes * 60 if minutes else None
+    try:
+        return await asyncio.to_thread(
+            odds_series.series, match_key, book, market, since, min(max(1, max_points), 5000)
+        )
+    except Exception as e:
+        return JSONResponse(content={'error': str(e), 'series': []}, status_code=500)
+
+
+@app.get("/api/line-movement/matches")
+async def get_line_movement_matches(search: str = None, limit: int = 50):
+    """Matches with recorded line movement (search by team or sport substring)"""
+    try:
+        matches = await asyncio.to_thread(odds_series.matches, search, min(max(1, limit), 500))
+        return {'matches': matches, 'disk_usage': odds_series.disk_usage()}
+    except Exception as e:
+        return JSONResponse(content={'error': str(e), 'matches': []}, status_code=500)
+
+
 @app.get("/api/monitoring")
 async def get_monitoring_status():
     """API endpoint to get monitoring system status"""
@@ -1045,105 +1223,155 @@ async def ask_llm_question(request: Request):
 # ==================== END LLM AGENT API ENDPOINTS ====================
 
 
-@app.get("/api/history")
-async def get_history():
-    """Get historical/completed matches from all sources"""
+XBET_HISTORY_FILE = BASE_DIR / "bookmakers" / "1xbet" / "1xbet_history.json"
+XBET_FUTURES_FILE = BASE_DIR / "bookmakers" / "1xbet" / "1xbet_future.json"
+XBET_FUTURES_LEGACY_FILE = BASE_DIR / "bookmakers" / "1xbet" / "1xbet_futures.json"
+
+
+def _read_json_file(path: Path) -> Optional[Dict]:
+    if not path.exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _parse_odds_data(odds_data) -> Dict:
+    """odds_data is stored as a JSON string by older scrapers"""
+    if isinstance(odds_data, str):
+        try:
+            return json.loads(odds_data)
+        except:
+            return {}
+    return odds_data or {}
+
+
+def _build_api_history() -> List[Dict]:
+    """Index entries for /api/history (1xBet completed matches, UI card format)"""
+    entries = []
+    xbet_data = _read_json_file(XBET_HISTORY_FILE) or {}
+    for phase in ('pregame', 'live'):
+        for match in xbet_data.get(phase, []):
+            record = {
+                'match_id': f"1xbet_{match.get('match_id')}",
+                'sport': match.get('sport_name', ''),
+                'league': match.get('league_name', ''),
+                'home_team': match.get('team1', ''),
+                'away_team': match.get('team2', ''),
+                'start_time': match.get('start_time'),
+                'removed_at': match.get('removed_at'),
+                'odds': _parse_odds_data(match.get('odds_data', {})),
+                'country': match.get('country', ''),
+                'is_live': phase == 'live',
+                'bookmakers': ['1xbet']
+            }
+            if match.get('final_score'):
+                record['final_score'] = match['final_score']
+            entries.append({
+                'record': record,
+                'sport': record['sport'],
+                'bookmaker': '1xbet',
+                'timestamp': parse_timestamp(match.get('start_time')) or parse_timestamp(match.get('removed_at')),
+                'id': record['match_id'],
+            })
+    return entries
+
+
+def _build_futures() -> List[Dict]:
+    """Index entries for /api/futures (1xBet long-term events with selections)"""
+    entries = []
+    xbet_data = _read_json_file(XBET_FUTURES_FILE)
+    if xbet_data is not None:
+        for event in xbet_data.get('data', {}).get('events', []):
+            selections = event.get('selections', [])
+            record = {
+                'match_id': f"1xbet_{event.get('event_id')}",
+                'sport': event.get('sport_name', 'Long-term bets'),
+                'league': event.get('league_name', ''),
+                'event_name': event.get('event_name', ''),
+                'home_team': event.get('event_name', ''),  # Event name as title
+                'away_team': '',  # Futures don't have away team
+                'start_time': event.get('start_time'),
+                'country': event.get('country', ''),
+                'market_type': event.get('market_type', 'Winner'),
+                'selections': selections[:10],  # Limit to top 10 for display
+                'total_selections': event.get('total_selections', len(selections)),
+                'bookmakers': ['1xbet']
+            }
+            entries.append({'record': record, 'sport': record['sport'], 'bookmaker': '1xbet',
+                            'timestamp': parse_timestamp(record['start_time']), 'id': record['match_id']})
+        return entries
+    
+    # Fallback to old format if new file doesn't exist
+    xbet_data = _read_json_file(XBET_FUTURES_LEGACY_FILE) or {}
+    for match in xbet_data.get('data', {}).get('matches', []):
+        record = {
+            'match_id': f"1xbet_{match.get('match_id')}",
+            'sport': match.get('sport_name', ''),
+            'league': match.get('league_name', ''),
+            'home_team': match.get('team1', ''),
+            'away_team': match.get('team2', ''),
+            'start_time': match.get('start_time'),
+            'country': match.get('country', ''),
+            'odds': _parse_odds_data(match.get('odds_data', '{}')),
+            'bookmakers': ['1xbet']
+        }
+        entries.append({'record': record, 'sport': record['sport'], 'bookmaker': '1xbet',
+                        'timestamp': parse_timestamp(record['start_time']), 'id': record['match_id']})
+    return entries
+
+
+def _build_merged_history():
+    """Index entries for /history (HistoryManager's merged history, one entry per match)"""
+    history = history_manager.load_history()
+    entries = []
+    for bookmaker, phases in history.get('matches', {}).items():
+        for phase, matches in phases.items():
+            for match in matches:
+                record = dict(match, bookmaker=bookmaker, phase=phase)
+                timestamp = None
+                for field in ('start_time', 'start_date', 'moved_to_history_at', 'removed_at'):
+                    timestamp = parse_timestamp(match.get(field))
+                    if timestamp is not None:
+                        break
+                entries.append({
+                    'record': record,
+                    'sport': match.get('sport_name') or match.get('sport') or '',
+                    'bookmaker': bookmaker,
+                    'timestamp': timestamp,
+                    'id': match.get('match_id') or match.get('event_id') or match.get('id') or '',
+                })
+    return entries, history.get('metadata', {})
+
+
+# Indexes are rebuilt only when their files change; queries run in a worker thread
+api_history_index = HistoryIndex('api_history', [XBET_HISTORY_FILE], _build_api_history)
+futures_index = HistoryIndex('futures', [XBET_FUTURES_FILE, XBET_FUTURES_LEGACY_FILE], _build_futures,
+                             newest_first=False)
+merged_history_index = HistoryIndex('history', [history_manager.history_file, history_manager.xbet_history_file],
+                                    _build_merged_history)
+
+
+async def _query_index(index: HistoryIndex, cursor, limit, sport, bookmaker, date_from, date_to):
     try:
-        history_matches = []
-        
-        # Load 1xBet history
-        xbet_history_file = BASE_DIR / "bookmakers" / "1xbet" / "1xbet_history.json"
-        if xbet_history_file.exists():
-            with open(xbet_history_file, 'r', encoding='utf-8') as f:
-                xbet_data = json.load(f)
-                for match in xbet_data.get('pregame', [])[:100]:  # Limit to 100 recent
-                    # Parse odds_data if it's a string
-                    odds_data = match.get('odds_data', {})
-                    if isinstance(odds_data, str):
-                        try:
-                            odds_data = json.loads(odds_data)
-                        except:
-                            odds_data = {}
-                    
-                    history_matches.append({
-                        'match_id': f"1xbet_{match.get('match_id')}",
-                        'sport': match.get('sport_name', ''),
-                        'league': match.get('league_name', ''),
-                        'home_team': match.get('team1', ''),
-                        'away_team': match.get('team2', ''),
-                        'start_time': match.get('start_time'),
-                        'removed_at': match.get('removed_at'),
-                        'odds': odds_data,
-                        'country': match.get('country', ''),
-                        'bookmakers': ['1xbet']
-                    })
-        
-        return {'matches': history_matches, 'total': len(history_matches)}
+        return await asyncio.to_thread(index.query, cursor, limit, sport, bookmaker, date_from, date_to)
+    except ValueError as e:
+        return JSONResponse(status_code=400, content={'matches': [], 'total': 0, 'error': str(e)})
     except Exception as e:
-        return {'matches': [], 'total': 0, 'error': str(e)}
+        return JSONResponse(status_code=500, content={'matches': [], 'total': 0, 'error': str(e)})
+
+
+@app.get("/api/history")
+async def get_history(cursor: str = None, limit: int = 100, sport: str = None, bookmaker: str = None,
+                      date_from: str = None, date_to: str = None):
+    """Get historical/completed matches, newest first (cursor-paginated, filterable)"""
+    return await _query_index(api_history_index, cursor, limit, sport, bookmaker, date_from, date_to)
 
 
 @app.get("/api/futures")
-async def get_futures():
-    """Get futures/long-term betting events with selections"""
-    try:
-        futures_matches = []
-        
-        # Load 1xBet futures from the proper scraper output
-        xbet_futures_file = BASE_DIR / "bookmakers" / "1xbet" / "1xbet_future.json"
-        if xbet_futures_file.exists():
-            with open(xbet_futures_file, 'r', encoding='utf-8') as f:
-                xbet_data = json.load(f)
-                
-                # This file has events with selections
-                for event in xbet_data.get('data', {}).get('events', []):
-                    # Extract selections for display
-                    selections = event.get('selections', [])
-                    
-                    # Format for UI display
-                    futures_matches.append({
-                        'match_id': f"1xbet_{event.get('event_id')}",
-                        'sport': event.get('sport_name', 'Long-term bets'),
-                        'league': event.get('league_name', ''),
-                        'event_name': event.get('event_name', ''),
-                        'home_team': event.get('event_name', ''),  # Event name as title
-                        'away_team': '',  # Futures don't have away team
-                        'start_time': event.get('start_time'),
-                        'country': event.get('country', ''),
-                        'market_type': event.get('market_type', 'Winner'),
-                        'selections': selections[:10],  # Limit to top 10 for display
-                        'total_selections': event.get('total_selections', len(selections)),
-                        'bookmakers': ['1xbet']
-                    })
-        else:
-            # Fallback to old format if new file doesn't exist
-            xbet_futures_old = BASE_DIR / "bookmakers" / "1xbet" / "1xbet_futures.json"
-            if xbet_futures_old.exists():
-                with open(xbet_futures_old, 'r', encoding='utf-8') as f:
-                    xbet_data = json.load(f)
-                    for match in xbet_data.get('data', {}).get('matches', []):
-                        odds_data = match.get('odds_data', '{}')
-                        if isinstance(odds_data, str):
-                            try:
-                                odds_data = json.loads(odds_data)
-                            except:
-                                odds_data = {}
-                        
-                        futures_matches.append({
-                            'match_id': f"1xbet_{match.get('match_id')}",
-                            'sport': match.get('sport_name', ''),
-                            'league': match.get('league_name', ''),
-                            'home_team': match.get('team1', ''),
-                            'away_team': match.get('team2', ''),
-                            'start_time': match.get('start_time'),
-                            'country': match.get('country', ''),
-                            'odds': odds_data,
-                            'bookmakers': ['1xbet']
-                        })
-        
-        return {'matches': futures_matches, 'total': len(futures_matches)}
-    except Exception as e:
-        return {'matches': [], 'total': 0, 'error': str(e)}
+async def get_futures(cursor: str = None, limit: int = 100, sport: str = None, bookmaker: str = None,
+                      date_from: str = None, date_to: str = None):
+    """Get futures/long-term betting events with selections, soonest first (cursor-paginated, filterable)"""
+    return await _query_index(futures_index, cursor, limit, sport, bookmaker, date_from, date_to)
 
 
 # ==================== OpticOdds Format API Endpoints (Default) ====================
@@ -1160,7 +1388,7 @@ async def get_1xbet_optic_odds():
 @app.get("/1xbet/pregame")
 async def get_1xbet_pregame_optic_odds():
     """Get 1xBet pregame odds in OpticOdds format (default)"""
-    data = load_unified_data()
+    data = load_unified_data(sections=('pregame',))
     
     # Filter for only pregame matches
     pregame_only = {
@@ -1177,7 +1405,7 @@ async def get_1xbet_pregame_optic_odds():
 @app.get("/1xbet/live")
 async def get_1xbet_live_optic_odds():
     """Get 1xBet live odds in OpticOdds format (default)"""
-    data = load_unified_data()
+    data = load_unified_data(sections=('live',))
     
     # Filter for only live matches
     live_only = {
@@ -1329,7 +1557,7 @@ async def get_fanduel_optic_odds():
 @app.get("/fanduel/pregame")
 async def get_fanduel_pregame_optic_odds():
     """Get FanDuel pregame odds in OpticOdds format (default)"""
-    data = load_unified_data()
+    data = load_unified_data(sections=('pregame',))
     
     # Filter for only pregame matches
     pregame_only = {
@@ -1346,7 +1574,7 @@ async def get_fanduel_pregame_optic_odds():
 @app.get("/fanduel/live")
 async def get_fanduel_live_optic_odds():
     """Get FanDuel live odds in OpticOdds format (default)"""
-    data = load_unified_data()
+    data = load_unified_data(sections=('live',))
     
     # Filter for only live matches
     live_only = {
@@ -1360,6 +1588,234 @@ async def get_fanduel_live_optic_odds():
     return optic_format
 
 
+# ==================== OddsMagnet API Endpoints ====================
+
+OM_START_HINT = 'Start with: python bookmakers/oddsmagnet/oddsmagnet_realtime_parallel.py --mode local'
+
+# Per-endpoint response configuration, all served from the shared oddsmagnet_store
+ODDSMAGNET_ENDPOINTS = {
+    'football': {
+        'dataset': 'football', 'source': 'oddsmagnet', 'label': 'Football',
+        'default_page_size': 50, 'max_page_size': 200, 'league_in_uri': False, 'etag': False,
+        'missing_error': 'OddsMagnet data not available',
+        'missing_message': 'Real-time collector not running',
+        'missing_status': None,
+    },
+    'football_top10': {
+        'dataset': 'football_top10', 'source': 'oddsmagnet_top10', 'label': 'Football',
+        'extra_fields': {'leagues_tracked': [], 'total_leagues': 10},
+        'missing_error': 'OddsMagnet Top 10 data not available',
+        'missing_message': f'OddsMagnet collector not running. {OM_START_HINT}',
+        'missing_status': None,
+    },
+    'basketball': {
+        'dataset': 'basketball', 'source': 'oddsmagnet_basketball', 'sport': 'basketball', 'label': 'Basketball',
+        'extra_fields': {'leagues_tracked': [], 'total_leagues': 0}, 'error_meta': True,
+    },
+    'basketball_nba': {
+        'dataset': 'basketball', 'source': 'oddsmagnet_basketball', 'sport': 'basketball', 'label': 'Basketball',
+        'labels': {'league': 'NBA'}, 'league_slug': 'usa-nba', 'filters': False,
+        'missing_message': 'Basketball collector not running',
+    },
+    'basketball_ncaa': {
+        'dataset': 'basketball', 'source': 'oddsmagnet_basketball', 'sport': 'basketball', 'label': 'Basketball',
+        'labels': {'league': 'NCAA'}, 'league_slug': 'usa-ncaa', 'filters': False,
+        'missing_message': 'Basketball collector not running',
+    },
+    'nba_ncaa': {
+        'dataset': 'nba_ncaa', 'source': 'oddsmagnet_nba_ncaa', 'sport': 'basketball', 'label': 'NBA/NCAA',
+        'labels': {'scope': 'nba_ncaa_only'}, 'filters': False,
+        'extra_fields': {'leagues_tracked': [], 'total_leagues': 0},
+        'missing_status': None,
+    },
+    'americanfootball': {
+        'dataset': 'americanfootball', 'source': 'oddsmagnet_americanfootball', 'sport': 'american-football',
+        'label': 'American Football', 'extra_fields': {'leagues_tracked': [], 'total_leagues': 0}, 'error_meta': True,
+    },
+    'cricket': {
+        'dataset': 'cricket', 'source': 'oddsmagnet_cricket', 'sport': 'cricket', 'label': 'Cricket',
+        'extra_fields': {'leagues_tracked': [], 'total_leagues': 0}, 'error_meta': True,
+    },
+    'baseball': {
+        'dataset': 'baseball', 'source': 'oddsmagnet_baseball', 'sport': 'baseball', 'label': 'Baseball',
+        'extra_fields': {'league_breakdown': {}}, 'error_meta': True,
+    },
+    'tabletennis': {
+        'dataset': 'tabletennis', 'source': 'oddsmagnet_tabletennis', 'sport': 'table-tennis', 'label': 'Table Tennis',
+        'extra_fields': {'league_breakdown': {}}, 'error_meta': True,
+    },
+    'tennis': {
+        'dataset': 'tennis', 'source': 'oddsmagnet_tennis', 'sport': 'tennis', 'label': 'Tennis',
+        'extra_fields': {'tournament_breakdown': {}}, 'error_meta': True,
+    },
+    'boxing': {
+        'dataset': 'boxing', 'source': 'oddsmagnet_boxing', 'sport': 'boxing', 'label': 'Boxing',
+        'extra_fields': {'event_breakdown': {}}, 'error_meta': True,
+    },
+    'volleyball': {
+        'dataset': 'volleyball', 'source': 'oddsmagnet_volleyball', 'sport': 'volleyball', 'label': 'Volleyball',
+        'extra_fields': {'league_breakdown': {}}, 'error_meta': True,
+    },
+}
+
+
+def _oddsmagnet_error(cfg: Dict, error: str, message: str, status_code: Optional[int]):
+    """Build an OddsMagnet error response in the endpoint's response style"""
+    content = {'error': error, 'message': message, 'matches': []}
+    if cfg.get('error_meta'):
+        content['timestamp'] = datetime.now().isoformat()
+        content['source'] = cfg['source']
+        content['sport'] = cfg.get('sport')
+    if not cfg.get('etag', True):
+        return content
+    if status_code is None:
+        return JSONResponse(content=content)
+    return JSONResponse(content=content, status_code=status_code)
+
+
+def build_oddsmagnet_payload(cfg: Dict, snapshot, page: int, page_size: int,
+                             league: Optional[str], search: Optional[str]) -> Dict:
+    """Build the paginated/filtered response body for an OddsMagnet endpoint"""
+    data = snapshot.data
+    
+    # Filtering uses the snapshot's precomputed lowercase columns and indexes
+    filtered_matches = snapshot.select(
+        league=league,
+        search=search,
+        league_slug=cfg.get('league_slug'),
+        league_in_uri=cfg.get('league_in_uri', True)
+    )
+    
+    # Calculate pagination
+    total_filtered = len(filtered_matches)
+    total_pages = (total_filtered + page_size - 1) // page_size if total_filtered > 0 else 1
+    start_idx = (page - 1) * page_size
+    end_idx = start_idx + page_size
+    
+    response_data = {'source': cfg['source']}
+    if cfg.get('sport'):
+        response_data['sport'] = cfg['sport']
+    response_data.update(cfg.get('labels', {}))
+    response_data['timestamp'] = data.get('timestamp')
+    response_data['iteration'] = data.get('iteration')
+    response_data['pagination'] = {
+        'page': page,
+        'page_size': page_size,
+        'total_items': total_filtered,
+        'total_pages': total_pages,
+        'has_next': page < total_pages,
+        'has_prev': page > 1
+    }
+    if cfg.get('filters', True):
+        response_data['filters'] = {
+            'league': league,
+            'search': search
+        }
+        response_data['total_matches'] = len(snapshot.matches)
+    else:
+        response_data['total_matches'] = total_filtered
+    for field, default in cfg.get('extra_fields', {}).items():
+        response_data[field] = data.get(field, default)
+    response_data['matches'] = filtered_matches[start_idx:end_idx]
+    return response_data
+
+
+async def serve_oddsmagnet(request: Optional[Request], endpoint: str, page: int, page_size: int,
+                           league: Optional[str] = None, search: Optional[str] = None):
+    """Serve a paginated/filtered OddsMagnet endpoint from the shared per-sport store"""
+    cfg = ODDSMAGNET_ENDPOINTS[endpoint]
+    label = cfg['label']
+    try:
+        # Validate pagination parameters
+        page = max(1, page)
+        page_size = min(max(1, page_size), cfg.get('max_page_size', 999))
+        
+        query = (endpoint, page, page_size, league, search)
+        use_etag = cfg.get('etag', True)
+        if_none_match = request.headers.get('if-none-match') if request is not None else None
+        
+        # Content-addressed ETag from the file version - a 304 costs one stat() call, no parsing
+        if use_etag and if_none_match:
+            current = oddsmagnet_store.current_version(cfg['dataset'])
+            if current is not None:
+                etag = oddsmagnet_store.make_etag(current[0], current[1], query)
+                if if_none_match == etag:
+                    return Response(
+                        status_code=304,
+                        headers={
+                            'ETag': etag,
+                            'Cache-Control': 'no-cache',  # Require revalidation
+                        }
+                    )
+        
+        try:
+            snapshot = await oddsmagnet_store.get(cfg['dataset'])
+        except asyncio.TimeoutError:
+            # File read timed out - likely file is being written or is very large
+            return _oddsmagnet_error(
+                cfg, 'Request timeout',
+                f'{label} data file is being updated. Please try again in a moment.', 504
+            )
+        except json.JSONDecodeError:
+            # Corrupted JSON - likely file is being written
+            return _oddsmagnet_error(
+                cfg, 'Data temporarily unavailable',
+                f'{label} data is being updated. Please try again in a moment.', 503
+            )
+        
+        if snapshot is None:
+            return _oddsmagnet_error(
+                cfg,
+                cfg.get('missing_error', f'OddsMagnet {label} data not available'),
+                cfg.get('missing_message', f'{label} collector not running. {OM_START_HINT}'),
+                cfg.get('missing_status', 503)
+            )
+        
+        # Served snapshot may be older than the file if it is mid-write, so tag what we serve
+        etag = oddsmagnet_store.make_etag(snapshot.path, snapshot.version, query) if use_etag else None
+        if etag is not None and if_none_match == etag:
+            return Response(
+                status_code=304,
+                headers={
+                    'ETag': etag,
+                    'Cache-Control': 'no-cache',  # Require revalidation
+                }
+            )
+        
+        # Pre-encoded body for this snapshot + query (built once per file version)
+        encoded = snapshot.get_response(query)
+        if encoded is None:
+            encoded = snapshot.put_response(
+                query,
+                EncodedResponse(etag, build_oddsmagnet_payload(cfg, snapshot, page, page_size, league, search), {
+                    'X-Data-Timestamp': str(snapshot.data.get('timestamp', '')),  # For debugging
+                    'X-Data-Iteration': str(snapshot.data.get('iteration', 0)),  # For debugging
+                })
+            )
+        
+        accept_encoding = request.headers.get('accept-encoding') if request is not None else None
+        body, content_encoding = encoded.variant(negotiate_encoding(accept_encoding))
+        
+        headers = {'Vary': 'Accept-Encoding'}
+        if content_encoding:
+            # GZipMiddleware leaves responses that already carry Content-Encoding alone
+            headers['Content-Encoding'] = content_encoding
+        if etag is not None:
+            headers['ETag'] = etag
+            headers['Cache-Control'] = 'no-cache'  # Force revalidation with server
+            headers.update(encoded.headers)
+        
+        return Response(content=body, media_type='application/json', headers=headers)
+        
+    except Exception as e:
+        return JSONResponse(
+            content={
+                'error': str(e),
+                'matches': []
+            }
+        )
+
+
 @app.get("/oddsmagnet/api/football")
 @app.get("/oddsmagnet/football")  # Keep for backward compatibility
 async def get_oddsmagnet_football(
@@ -1380,71 +1836,7 @@ async def get_oddsmagnet_football(
     - league: Filter by league name (partial match, case-insensitive)
     - search: Search in match name (partial match, case-insensitive)
     """
-    try:
-        # Validate pagination parameters
-        page = max(1, page)
-        page_size = min(max(1, page_size), 200)  # Max 200 per page
-        
-        oddsmagnet_file = BASE_DIR / "bookmakers" / "oddsmagnet" / "oddsmagnet_realtime.json"
-        if not oddsmagnet_file.exists():
-            return {
-                'error': 'OddsMagnet data not available',
-                'message': 'Real-time collector not running',
-                'matches': []
-            }
-        
-        with open(oddsmagnet_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        all_matches = data.get('matches', [])
-        
-        # Apply filters
-        filtered_matches = all_matches
-        if league:
-            league_lower = league.lower()
-            filtered_matches = [
-                m for m in filtered_matches 
-                if league_lower in m.get('league', '').lower()
-            ]
-        
-        if search:
-            search_lower = search.lower()
-            filtered_matches = [
-                m for m in filtered_matches 
-                if search_lower in m.get('match_name', '').lower()
-            ]
-        
-        # Calculate pagination
-        total_filtered = len(filtered_matches)
-        total_pages = (total_filtered + page_size - 1) // page_size if total_filtered > 0 else 1
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        paginated_matches = filtered_matches[start_idx:end_idx]
-        
-        return {
-            'source': 'oddsmagnet',
-            'timestamp': data.get('timestamp'),
-            'iteration': data.get('iteration'),
-            'pagination': {
-                'page': page,
-                'page_size': page_size,
-                'total_items': total_filtered,
-                'total_pages': total_pages,
-                'has_next': page < total_pages,
-                'has_prev': page > 1
-            },
-            'filters': {
-                'league': league,
-                'search': search
-            },
-            'total_matches': len(all_matches),
-            'matches': paginated_matches
-        }
-    except Exception as e:
-        return {
-            'error': str(e),
-            'matches': []
-        }
+    return await serve_oddsmagnet(None, 'football', page, page_size, league, search)
 
 
 @app.get("/oddsmagnet/api/football")
@@ -1475,167 +1867,7 @@ async def get_oddsmagnet_top10(
     - league: Filter by specific league from top 10 (partial match)
     - search: Search in match name (partial match, case-insensitive)
     """
-    try:
-        # Validate pagination parameters
-        page = max(1, page)
-        page_size = min(max(1, page_size), 999)
-        
-        # Read from dedicated top 10 leagues collector
-        # Try top10 file first, fall back to realtime file
-        oddsmagnet_top10_file = BASE_DIR / "bookmakers" / "oddsmagnet" / "oddsmagnet_top10.json"
-        oddsmagnet_realtime_file = BASE_DIR / "bookmakers" / "oddsmagnet" / "oddsmagnet_realtime.json"
-        
-        data_file = None
-        if oddsmagnet_top10_file.exists():
-            data_file = oddsmagnet_top10_file
-        elif oddsmagnet_realtime_file.exists():
-            data_file = oddsmagnet_realtime_file
-        
-        if not data_file:
-            return JSONResponse(
-                content={
-                    'error': 'OddsMagnet Top 10 data not available',
-                    'message': 'OddsMagnet collector not running. Start with: python bookmakers/oddsmagnet/oddsmagnet_realtime_parallel.py --mode local',
-                    'matches': []
-                }
-            )
-        
-        # Check file modification time for cache invalidation
-        current_mtime = data_file.stat().st_mtime
-        cache_key = str(data_file)
-        
-        # Use per-sport cache for real-time updates
-        sport_cache = oddsmagnet_cache.get('football', {})
-        
-        # Use cache if file hasn't changed
-        if (sport_cache.get('data') is not None and 
-            sport_cache.get('file_mtime') == current_mtime and
-            cache_key == sport_cache.get('cache_key')):
-            
-            data = sport_cache['data']
-            print(f"⚡ Using cached football data (mtime: {current_mtime})")
-        else:
-            # Read data asynchronously for better performance
-            try:
-                async with aiofiles.open(data_file, 'r', encoding='utf-8') as f:
-                    content = await f.read()
-                    data = json.loads(content)
-                
-                # Update per-sport cache
-                sport_cache['data'] = data
-                sport_cache['file_mtime'] = current_mtime
-                sport_cache['cache_key'] = cache_key
-                sport_cache['timestamp'] = time.time()
-                oddsmagnet_cache['football'] = sport_cache
-                
-                print(f"📁 Loaded fresh football data from {data_file.name} (mtime: {current_mtime})")
-                
-            except Exception as read_error:
-                print(f"❌ Error reading {data_file}: {read_error}")
-                return JSONResponse(
-                    status_code=500,
-                    content={
-                        'error': 'Failed to read data file',
-                        'message': str(read_error),
-                        'matches': []
-                    }
-                )
-        
-        # Generate ETag from actual data content (timestamp + iteration + query params)
-        # This ensures ETag changes when data actually changes
-        data_timestamp = data.get('timestamp', '')
-        data_iteration = data.get('iteration', 0)
-        etag_base = f"{data_timestamp}-{data_iteration}-{page}-{page_size}-{league}-{search}"
-        etag = f'"{hashlib.md5(etag_base.encode()).hexdigest()}"'  # Wrap in quotes per HTTP spec
-        
-        # Check if client has cached version
-        if_none_match = request.headers.get('if-none-match')
-        if if_none_match == etag:
-            # Return 304 with proper cache control headers
-            return Response(
-                status_code=304,
-                headers={
-                    'ETag': etag,
-                    'Cache-Control': 'no-cache',  # Require revalidation
-                }
-            )
-        
-        # Data is already filtered to top 10 leagues by dedicated collector
-        all_matches = data.get('matches', [])
-        
-        # Apply additional filters
-        filtered_matches = all_matches
-        if league:
-            league_lower = league.lower()
-            filtered_matches = [
-                m for m in filtered_matches 
-                if league_lower in m.get('league', '').lower() or 
-                   league_lower in m.get('match_uri', '').lower()
-            ]
-        
-        if search:
-            search_lower = search.lower()
-            filtered_matches = [
-                m for m in filtered_matches 
-                if search_lower in m.get('match_name', '').lower()
-            ]
-        
-        # Calculate pagination
-        total_filtered = len(filtered_matches)
-        total_pages = (total_filtered + page_size - 1) // page_size if total_filtered > 0 else 1
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        paginated_matches = filtered_matches[start_idx:end_idx]
-        
-        response_data = {
-            'source': 'oddsmagnet_top10',
-            'timestamp': data.get('timestamp'),
-            'iteration': data.get('iteration'),
-            'pagination': {
-                'page': page,
-                'page_size': page_size,
-                'total_items': total_filtered,
-                'total_pages': total_pages,
-                'has_next': page < total_pages,
-                'has_prev': page > 1
-            },
-            'filters': {
-                'league': league,
-                'search': search
-            },
-            'total_matches': len(all_matches),
-            'leagues_tracked': data.get('leagues_tracked', []),
-            'total_leagues': data.get('total_leagues', 10),
-            'matches': paginated_matches
-        }
-        
-        # Return with proper cache control headers and ETag
-        return JSONResponse(
-            content=response_data,
-            headers={
-                'ETag': etag,
-                'Cache-Control': 'no-cache',  # Force revalidation with server
-                'X-Data-Timestamp': data_timestamp,  # For debugging
-                'X-Data-Iteration': str(data_iteration),  # For debugging
-            }
-        )
-        
-        # Return response with ETag header
-        return JSONResponse(
-            content=response_data,
-            headers={
-                'ETag': etag,
-                'Cache-Control': 'no-cache',  # Force revalidation but allow caching
-            }
-        )
-        
-    except Exception as e:
-        return JSONResponse(
-            content={
-                'error': str(e),
-                'matches': []
-            }
-        )
+    return await serve_oddsmagnet(request, 'football_top10', page, page_size, league, search)
 
 
 @app.get("/oddsmagnet/api/basketball")
@@ -1662,156 +1894,7 @@ async def get_oddsmagnet_basketball(
     - league: Filter by specific league (partial match)
     - search: Search in match name (partial match, case-insensitive)
     """
-    try:
-        # Validate pagination parameters
-        page = max(1, page)
-        page_size = min(max(1, page_size), 999)
-        
-        # Read from basketball realtime collector
-        basketball_file = BASE_DIR / "bookmakers" / "oddsmagnet" / "oddsmagnet_basketball.json"
-        
-        if not basketball_file.exists():
-            return JSONResponse(
-                content={
-                    'error': 'OddsMagnet Basketball data not available',
-                    'message': 'Basketball collector not running. Start with: python bookmakers/oddsmagnet/oddsmagnet_realtime_parallel.py --mode local',
-                    'matches': [],
-                    'timestamp': datetime.now().isoformat(),
-                    'source': 'oddsmagnet_basketball',
-                    'sport': 'basketball'
-                },
-                status_code=503
-            )
-        
-        # Read data with timeout (5 seconds max)
-        try:
-            # Python 3.11+ has asyncio.timeout, for older versions use wait_for
-            try:
-                # Try Python 3.11+ syntax
-                async with asyncio.timeout(5.0):  # 5 second timeout
-                    async with aiofiles.open(basketball_file, 'r', encoding='utf-8') as f:
-                        content = await f.read()
-                        data = json.loads(content)
-            except AttributeError:
-                # Fallback for Python < 3.11
-                async def read_file():
-                    async with aiofiles.open(basketball_file, 'r', encoding='utf-8') as f:
-                        content = await f.read()
-                        return json.loads(content)
-                data = await asyncio.wait_for(read_file(), timeout=5.0)
-        except asyncio.TimeoutError:
-            # File read timed out - likely file is being written or is very large
-            return JSONResponse(
-                content={
-                    'error': 'Request timeout',
-                    'message': 'Basketball data file is being updated. Please try again in a moment.',
-                    'matches': [],
-                    'timestamp': datetime.now().isoformat(),
-                    'source': 'oddsmagnet_basketball',
-                    'sport': 'basketball'
-                },
-                status_code=504
-            )
-        except json.JSONDecodeError as e:
-            # Corrupted JSON - likely file is being written
-            return JSONResponse(
-                content={
-                    'error': 'Data temporarily unavailable',
-                    'message': 'Basketball data is being updated. Please try again in a moment.',
-                    'matches': [],
-                    'timestamp': datetime.now().isoformat(),
-                    'source': 'oddsmagnet_basketball',
-                    'sport': 'basketball'
-                },
-                status_code=503
-            )
-        
-        # Generate ETag from actual data content (timestamp + iteration + query params)
-        data_timestamp = data.get('timestamp', '')
-        data_iteration = data.get('iteration', 0)
-        etag_base = f"{data_timestamp}-{data_iteration}-{page}-{page_size}-{league}-{search}"
-        etag = f'"{hashlib.md5(etag_base.encode()).hexdigest()}"'  # Wrap in quotes per HTTP spec
-        
-        # Check if client has cached version
-        if_none_match = request.headers.get('if-none-match')
-        if if_none_match == etag:
-            # Return 304 with proper cache control headers
-            return Response(
-                status_code=304,
-                headers={
-                    'ETag': etag,
-                    'Cache-Control': 'no-cache',  # Require revalidation
-                }
-            )
-        
-        # Data is from real-time collector
-        all_matches = data.get('matches', [])
-        
-        # Apply additional filters
-        filtered_matches = all_matches
-        if league:
-            league_lower = league.lower()
-            filtered_matches = [
-                m for m in filtered_matches 
-                if league_lower in m.get('league', '').lower() or 
-                   league_lower in m.get('match_uri', '').lower()
-            ]
-        
-        if search:
-            search_lower = search.lower()
-            filtered_matches = [
-                m for m in filtered_matches 
-                if search_lower in m.get('match_name', '').lower()
-            ]
-        
-        # Calculate pagination
-        total_filtered = len(filtered_matches)
-        total_pages = (total_filtered + page_size - 1) // page_size if total_filtered > 0 else 1
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        paginated_matches = filtered_matches[start_idx:end_idx]
-        
-        response_data = {
-            'source': 'oddsmagnet_basketball',
-            'sport': 'basketball',
-            'timestamp': data.get('timestamp'),
-            'iteration': data.get('iteration'),
-            'pagination': {
-                'page': page,
-                'page_size': page_size,
-                'total_items': total_filtered,
-                'total_pages': total_pages,
-                'has_next': page < total_pages,
-                'has_prev': page > 1
-            },
-            'filters': {
-                'league': league,
-                'search': search
-            },
-            'total_matches': len(all_matches),
-            'leagues_tracked': data.get('leagues_tracked', []),
-            'total_leagues': data.get('total_leagues', 0),
-            'matches': paginated_matches
-        }
-        
-        # Return with proper cache control headers and ETag
-        return JSONResponse(
-            content=response_data,
-            headers={
-                'ETag': etag,
-                'Cache-Control': 'no-cache',  # Force revalidation with server
-                'X-Data-Timestamp': data_timestamp,  # For debugging
-                'X-Data-Iteration': str(data_iteration),  # For debugging
-            }
-        )
-        
-    except Exception as e:
-        return JSONResponse(
-            content={
-                'error': str(e),
-                'matches': []
-            }
-        )
+    return await serve_oddsmagnet(request, 'basketball', page, page_size, league, search)
 
 
 # Basketball NBA and NCAA endpoints (consolidated to avoid duplicates)
@@ -1833,115 +1916,7 @@ async def get_oddsmagnet_basketball_nba(
     - page_size: Items per page (default: 999 [all], max: 999)
     - search: Search in match name (partial match, case-insensitive)
     """
-    try:
-        # Validate pagination parameters
-        page = max(1, page)
-        page_size = min(max(1, page_size), 999)
-        
-        # Read from basketball realtime collector
-        basketball_file = BASE_DIR / "bookmakers" / "oddsmagnet" / "oddsmagnet_basketball.json"
-        
-        if not basketball_file.exists():
-            return JSONResponse(
-                content={
-                    'error': 'OddsMagnet Basketball data not available',
-                    'message': 'Basketball collector not running',
-                    'matches': [],
-                    'timestamp': datetime.now().isoformat()
-                },
-                status_code=503
-            )
-        
-        # Read data with timeout (5 seconds max)
-        try:
-            try:
-                async with asyncio.timeout(5.0):
-                    async with aiofiles.open(basketball_file, 'r', encoding='utf-8') as f:
-                        content = await f.read()
-                        data = json.loads(content)
-            except AttributeError:
-                async def read_file():
-                    async with aiofiles.open(basketball_file, 'r', encoding='utf-8') as f:
-                        content = await f.read()
-                        return json.loads(content)
-                data = await asyncio.wait_for(read_file(), timeout=5.0)
-        except asyncio.TimeoutError:
-            return JSONResponse(
-                content={'error': 'Request timeout', 'message': 'Basketball data is being updated.', 'matches': []},
-                status_code=504
-            )
-        except json.JSONDecodeError:
-            return JSONResponse(
-                content={'error': 'Data temporarily unavailable', 'message': 'Basketball data is being updated.', 'matches': []},
-                status_code=503
-            )
-        
-        # Generate ETag
-        data_timestamp = data.get('timestamp', '')
-        data_iteration = data.get('iteration', 0)
-        etag_base = f"{data_timestamp}-{data_iteration}-nba-{page}-{page_size}-{search}"
-        etag = f'"{hashlib.md5(etag_base.encode()).hexdigest()}"'
-        
-        # Check cache
-        if_none_match = request.headers.get('if-none-match')
-        if if_none_match == etag:
-            return Response(
-                status_code=304,
-                headers={'ETag': etag, 'Cache-Control': 'no-cache'}
-            )
-        
-        # Filter for NBA only
-        all_matches = data.get('matches', [])
-        nba_matches = [
-            m for m in all_matches 
-            if m.get('league_slug', '') == 'usa-nba'
-        ]
-        
-        # Apply search filter
-        if search:
-            search_lower = search.lower()
-            nba_matches = [
-                m for m in nba_matches 
-                if search_lower in m.get('match_name', '').lower()
-            ]
-        
-        # Pagination
-        total_matches = len(nba_matches)
-        total_pages = (total_matches + page_size - 1) // page_size if total_matches > 0 else 1
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        paginated_matches = nba_matches[start_idx:end_idx]
-        
-        response_data = {
-            'source': 'oddsmagnet_basketball',
-            'sport': 'basketball',
-            'league': 'NBA',
-            'timestamp': data_timestamp,
-            'iteration': data_iteration,
-            'pagination': {
-                'page': page,
-                'page_size': page_size,
-                'total_items': total_matches,
-                'total_pages': total_pages,
-                'has_next': page < total_pages,
-                'has_prev': page > 1
-            },
-            'total_matches': total_matches,
-            'matches': paginated_matches
-        }
-        
-        return JSONResponse(
-            content=response_data,
-            headers={
-                'ETag': etag,
-                'Cache-Control': 'no-cache',
-                'X-Data-Timestamp': data_timestamp,
-                'X-Data-Iteration': str(data_iteration),
-            }
-        )
-        
-    except Exception as e:
-        return JSONResponse(content={'error': str(e), 'matches': []})
+    return await serve_oddsmagnet(request, 'basketball_nba', page, page_size, search=search)
 
 
 @app.get("/oddsmagnet/api/basketball/ncaa")
@@ -1962,115 +1937,7 @@ async def get_oddsmagnet_basketball_ncaa(
     - page_size: Items per page (default: 999 [all], max: 999)
     - search: Search in match name (partial match, case-insensitive)
     """
-    try:
-        # Validate pagination parameters
-        page = max(1, page)
-        page_size = min(max(1, page_size), 999)
-        
-        # Read from basketball realtime collector
-        basketball_file = BASE_DIR / "bookmakers" / "oddsmagnet" / "oddsmagnet_basketball.json"
-        
-        if not basketball_file.exists():
-            return JSONResponse(
-                content={
-                    'error': 'OddsMagnet Basketball data not available',
-                    'message': 'Basketball collector not running',
-                    'matches': [],
-                    'timestamp': datetime.now().isoformat()
-                },
-                status_code=503
-            )
-        
-        # Read data with timeout (5 seconds max)
-        try:
-            try:
-                async with asyncio.timeout(5.0):
-                    async with aiofiles.open(basketball_file, 'r', encoding='utf-8') as f:
-                        content = await f.read()
-                        data = json.loads(content)
-            except AttributeError:
-                async def read_file():
-                    async with aiofiles.open(basketball_file, 'r', encoding='utf-8') as f:
-                        content = await f.read()
-                        return json.loads(content)
-                data = await asyncio.wait_for(read_file(), timeout=5.0)
-        except asyncio.TimeoutError:
-            return JSONResponse(
-                content={'error': 'Request timeout', 'message': 'Basketball data is being updated.', 'matches': []},
-                status_code=504
-            )
-        except json.JSONDecodeError:
-            return JSONResponse(
-                content={'error': 'Data temporarily unavailable', 'message': 'Basketball data is being updated.', 'matches': []},
-                status_code=503
-            )
-        
-        # Generate ETag
-        data_timestamp = data.get('timestamp', '')
-        data_iteration = data.get('iteration', 0)
-        etag_base = f"{data_timestamp}-{data_iteration}-ncaa-{page}-{page_size}-{search}"
-        etag = f'"{hashlib.md5(etag_base.encode()).hexdigest()}"'
-        
-        # Check cache
-        if_none_match = request.headers.get('if-none-match')
-        if if_none_match == etag:
-            return Response(
-                status_code=304,
-                headers={'ETag': etag, 'Cache-Control': 'no-cache'}
-            )
-        
-        # Filter for NCAA only
-        all_matches = data.get('matches', [])
-        ncaa_matches = [
-            m for m in all_matches 
-            if m.get('league_slug', '') == 'usa-ncaa'
-        ]
-        
-        # Apply search filter
-        if search:
-            search_lower = search.lower()
-            ncaa_matches = [
-                m for m in ncaa_matches 
-                if search_lower in m.get('match_name', '').lower()
-            ]
-        
-        # Pagination
-        total_matches = len(ncaa_matches)
-        total_pages = (total_matches + page_size - 1) // page_size if total_matches > 0 else 1
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        paginated_matches = ncaa_matches[start_idx:end_idx]
-        
-        response_data = {
-            'source': 'oddsmagnet_basketball',
-            'sport': 'basketball',
-            'league': 'NCAA',
-            'timestamp': data_timestamp,
-            'iteration': data_iteration,
-            'pagination': {
-                'page': page,
-                'page_size': page_size,
-                'total_items': total_matches,
-                'total_pages': total_pages,
-                'has_next': page < total_pages,
-                'has_prev': page > 1
-            },
-            'total_matches': total_matches,
-            'matches': paginated_matches
-        }
-        
-        return JSONResponse(
-            content=response_data,
-            headers={
-                'ETag': etag,
-                'Cache-Control': 'no-cache',
-                'X-Data-Timestamp': data_timestamp,
-                'X-Data-Iteration': str(data_iteration),
-            }
-        )
-        
-    except Exception as e:
-        return JSONResponse(content={'error': str(e), 'matches': []})
+    return await serve_oddsmagnet(request, 'basketball_ncaa', page, page_size, search=search)
 
 
 @app.get("/oddsmagnet/api/nba-ncaa")
@@ -2093,92 +1960,7 @@ async def get_oddsmagnet_nba_ncaa(
     - page: Page number (default: 1)
     - page_size: Items per page (default: 999 [all], max: 999)
     """
-    try:
-        # Validate pagination parameters
-        page = max(1, page)
-        page_size = min(max(1, page_size), 999)
-        
-        # Read from NBA/NCAA realtime collector
-        nba_ncaa_file = BASE_DIR / "bookmakers" / "oddsmagnet" / "oddsmagnet_nba_ncaa.json"
-        
-        if not nba_ncaa_file.exists():
-            return JSONResponse(
-                content={
-                    'error': 'OddsMagnet NBA/NCAA data not available',
-                    'message': 'NBA/NCAA collector not running. Start with: python bookmakers/oddsmagnet/oddsmagnet_realtime_parallel.py --mode local',
-                    'matches': []
-                }
-            )
-        
-        # Read data first to generate content-based ETag
-        with open(nba_ncaa_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Generate ETag from actual data content (timestamp + iteration + query params)
-        data_timestamp = data.get('timestamp', '')
-        data_iteration = data.get('iteration', 0)
-        etag_base = f"{data_timestamp}-{data_iteration}-{page}-{page_size}"
-        etag = f'"{hashlib.md5(etag_base.encode()).hexdigest()}"'
-        
-        # Check if client has cached version
-        if_none_match = request.headers.get('if-none-match')
-        if if_none_match == etag:
-            return Response(
-                status_code=304,
-                headers={
-                    'ETag': etag,
-                    'Cache-Control': 'no-cache',
-                }
-            )
-        
-        # Data is from real-time collector
-        all_matches = data.get('matches', [])
-        
-        # Calculate pagination
-        total_matches = len(all_matches)
-        total_pages = (total_matches + page_size - 1) // page_size if total_matches > 0 else 1
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        paginated_matches = all_matches[start_idx:end_idx]
-        
-        response_data = {
-            'source': 'oddsmagnet_nba_ncaa',
-            'sport': 'basketball',
-            'scope': 'nba_ncaa_only',
-            'timestamp': data.get('timestamp'),
-            'iteration': data.get('iteration'),
-            'pagination': {
-                'page': page,
-                'page_size': page_size,
-                'total_items': total_matches,
-                'total_pages': total_pages,
-                'has_next': page < total_pages,
-                'has_prev': page > 1
-            },
-            'total_matches': total_matches,
-            'leagues_tracked': data.get('leagues_tracked', []),
-            'total_leagues': data.get('total_leagues', 0),
-            'matches': paginated_matches
-        }
-        
-        # Return with proper cache control headers and ETag
-        return JSONResponse(
-            content=response_data,
-            headers={
-                'ETag': etag,
-                'Cache-Control': 'no-cache',
-                'X-Data-Timestamp': data_timestamp,
-                'X-Data-Iteration': str(data_iteration),
-            }
-        )
-        
-    except Exception as e:
-        return JSONResponse(
-            content={
-                'error': str(e),
-                'matches': []
-            }
-        )
+    return await serve_oddsmagnet(request, 'nba_ncaa', page, page_size)
 
 
 # American Football endpoints
@@ -2206,150 +1988,7 @@ async def get_oddsmagnet_americanfootball(
     - league: Filter by specific league (partial match)
     - search: Search in match name (partial match, case-insensitive)
     """
-    try:
-        # Validate pagination parameters
-        page = max(1, page)
-        page_size = min(max(1, page_size), 999)
-        
-        # Read from American Football realtime collector
-        af_file = BASE_DIR / "bookmakers" / "oddsmagnet" / "oddsmagnet_american_football.json"
-        
-        if not af_file.exists():
-            return JSONResponse(
-                content={
-                    'error': 'OddsMagnet American Football data not available',
-                    'message': 'American Football collector not running. Start with: python bookmakers/oddsmagnet/oddsmagnet_realtime_parallel.py --mode local',
-                    'matches': [],
-                    'timestamp': datetime.now().isoformat(),
-                    'source': 'oddsmagnet_americanfootball',
-                    'sport': 'american-football'
-                },
-                status_code=503
-            )
-        
-        # Read data with timeout (5 seconds max)
-        try:
-            try:
-                async with asyncio.timeout(5.0):
-                    async with aiofiles.open(af_file, 'r', encoding='utf-8') as f:
-                        content = await f.read()
-                        data = json.loads(content)
-            except AttributeError:
-                async def read_file():
-                    async with aiofiles.open(af_file, 'r', encoding='utf-8') as f:
-                        content = await f.read()
-                        return json.loads(content)
-                data = await asyncio.wait_for(read_file(), timeout=5.0)
-        except asyncio.TimeoutError:
-            return JSONResponse(
-                content={
-                    'error': 'Request timeout',
-                    'message': 'American Football data file is being updated. Please try again in a moment.',
-                    'matches': [],
-                    'timestamp': datetime.now().isoformat(),
-                    'source': 'oddsmagnet_americanfootball',
-                    'sport': 'american-football'
-                },
-                status_code=504
-            )
-        except json.JSONDecodeError:
-            return JSONResponse(
-                content={
-                    'error': 'Data temporarily unavailable',
-                    'message': 'American Football data is being updated. Please try again in a moment.',
-                    'matches': [],
-                    'timestamp': datetime.now().isoformat(),
-                    'source': 'oddsmagnet_americanfootball',
-                    'sport': 'american-football'
-                },
-                status_code=503
-            )
-        
-        # Generate ETag from actual data content (timestamp + iteration + query params)
-        data_timestamp = data.get('timestamp', '')
-        data_iteration = data.get('iteration', 0)
-        etag_base = f"{data_timestamp}-{data_iteration}-{page}-{page_size}-{league}-{search}"
-        etag = f'"{hashlib.md5(etag_base.encode()).hexdigest()}"'
-        
-        # Check if client has cached version
-        if_none_match = request.headers.get('if-none-match')
-        if if_none_match == etag:
-            return Response(
-                status_code=304,
-                headers={
-                    'ETag': etag,
-                    'Cache-Control': 'no-cache',
-                }
-            )
-        
-        # Data is from real-time collector
-        all_matches = data.get('matches', [])
-        
-        # Apply additional filters
-        filtered_matches = all_matches
-        if league:
-            league_lower = league.lower()
-            filtered_matches = [
-                m for m in filtered_matches 
-                if league_lower in m.get('league', '').lower() or 
-                   league_lower in m.get('match_uri', '').lower()
-            ]
-        
-        if search:
-            search_lower = search.lower()
-            filtered_matches = [
-                m for m in filtered_matches 
-                if search_lower in m.get('match_name', '').lower()
-            ]
-        
-        # Calculate pagination
-        total_filtered = len(filtered_matches)
-        total_pages = (total_filtered + page_size - 1) // page_size if total_filtered > 0 else 1
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        paginated_matches = filtered_matches[start_idx:end_idx]
-        
-        response_data = {
-            'source': 'oddsmagnet_americanfootball',
-            'sport': 'american-football',
-            'timestamp': data.get('timestamp'),
-            'iteration': data.get('iteration'),
-            'pagination': {
-                'page': page,
-                'page_size': page_size,
-                'total_items': total_filtered,
-                'total_pages': total_pages,
-                'has_next': page < total_pages,
-                'has_prev': page > 1
-            },
-            'filters': {
-                'league': league,
-                'search': search
-            },
-            'total_matches': len(all_matches),
-            'leagues_tracked': data.get('leagues_tracked', []),
-            'total_leagues': data.get('total_leagues', 0),
-            'matches': paginated_matches
-        }
-        
-        # Return with proper cache control headers and ETag
-        return JSONResponse(
-            content=response_data,
-            headers={
-                'ETag': etag,
-                'Cache-Control': 'no-cache',
-                'X-Data-Timestamp': data_timestamp,
-                'X-Data-Iteration': str(data_iteration),
-            }
-        )
-        
-    except Exception as e:
-        return JSONResponse(
-            content={
-                'error': str(e),
-                'matches': []
-            }
-        )
+    return await serve_oddsmagnet(request, 'americanfootball', page, page_size, league, search)
 
 
 @app.get("/oddsmagnet/api/cricket")
@@ -2376,150 +2015,7 @@ async def get_oddsmagnet_cricket(
     - league: Filter by specific league (partial match)
     - search: Search in match name (partial match, case-insensitive)
     """
-    try:
-        # Validate pagination parameters
-        page = max(1, page)
-        page_size = min(max(1, page_size), 999)
-        
-        # Read from Cricket realtime collector
-        cricket_file = BASE_DIR / "bookmakers" / "oddsmagnet" / "oddsmagnet_cricket.json"
-        
-        if not cricket_file.exists():
-            return JSONResponse(
-                content={
-                    'error': 'OddsMagnet Cricket data not available',
-                    'message': 'Cricket collector not running. Start with: python bookmakers/oddsmagnet/oddsmagnet_realtime_parallel.py --mode local',
-                    'matches': [],
-                    'timestamp': datetime.now().isoformat(),
-                    'source': 'oddsmagnet_cricket',
-                    'sport': 'cricket'
-                },
-                status_code=503
-            )
-        
-        # Read data with timeout (5 seconds max)
-        try:
-            try:
-                async with asyncio.timeout(5.0):
-                    async with aiofiles.open(cricket_file, 'r', encoding='utf-8') as f:
-                        content = await f.read()
-                        data = json.loads(content)
-            except AttributeError:
-                async def read_file():
-                    async with aiofiles.open(cricket_file, 'r', encoding='utf-8') as f:
-                        content = await f.read()
-                        return json.loads(content)
-                data = await asyncio.wait_for(read_file(), timeout=5.0)
-        except asyncio.TimeoutError:
-            return JSONResponse(
-                content={
-                    'error': 'Request timeout',
-                    'message': 'Cricket data file is being updated. Please try again in a moment.',
-                    'matches': [],
-                    'timestamp': datetime.now().isoformat(),
-                    'source': 'oddsmagnet_cricket',
-                    'sport': 'cricket'
-                },
-                status_code=504
-            )
-        except json.JSONDecodeError:
-            return JSONResponse(
-                content={
-                    'error': 'Data temporarily unavailable',
-                    'message': 'Cricket data is being updated. Please try again in a moment.',
-                    'matches': [],
-                    'timestamp': datetime.now().isoformat(),
-                    'source': 'oddsmagnet_cricket',
-                    'sport': 'cricket'
-                },
-                status_code=503
-            )
-        
-        # Generate ETag from actual data content (timestamp + iteration + query params)
-        data_timestamp = data.get('timestamp', '')
-        data_iteration = data.get('iteration', 0)
-        etag_base = f"{data_timestamp}-{data_iteration}-{page}-{page_size}-{league}-{search}"
-        etag = f'"{hashlib.md5(etag_base.encode()).hexdigest()}"'
-        
-        # Check if client has cached version
-        if_none_match = request.headers.get('if-none-match')
-        if if_none_match == etag:
-            return Response(
-                status_code=304,
-                headers={
-                    'ETag': etag,
-                    'Cache-Control': 'no-cache',
-                }
-            )
-        
-        # Data is from real-time collector
-        all_matches = data.get('matches', [])
-        
-        # Apply additional filters
-        filtered_matches = all_matches
-        if league:
-            league_lower = league.lower()
-            filtered_matches = [
-                m for m in filtered_matches 
-                if league_lower in m.get('league', '').lower() or 
-                   league_lower in m.get('match_uri', '').lower()
-            ]
-        
-        if search:
-            search_lower = search.lower()
-            filtered_matches = [
-                m for m in filtered_matches 
-                if search_lower in m.get('match_name', '').lower()
-            ]
-        
-        # Calculate pagination
-        total_filtered = len(filtered_matches)
-        total_pages = (total_filtered + page_size - 1) // page_size if total_filtered > 0 else 1
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        paginated_matches = filtered_matches[start_idx:end_idx]
-        
-        response_data = {
-            'source': 'oddsmagnet_cricket',
-            'sport': 'cricket',
-            'timestamp': data.get('timestamp'),
-            'iteration': data.get('iteration'),
-            'pagination': {
-                'page': page,
-                'page_size': page_size,
-                'total_items': total_filtered,
-                'total_pages': total_pages,
-                'has_next': page < total_pages,
-                'has_prev': page > 1
-            },
-            'filters': {
-                'league': league,
-                'search': search
-            },
-            'total_matches': len(all_matches),
-            'leagues_tracked': data.get('leagues_tracked', []),
-            'total_leagues': data.get('total_leagues', 0),
-            'matches': paginated_matches
-        }
-        
-        # Return with proper cache control headers and ETag
-        return JSONResponse(
-            content=response_data,
-            headers={
-                'ETag': etag,
-                'Cache-Control': 'no-cache',
-                'X-Data-Timestamp': data_timestamp,
-                'X-Data-Iteration': str(data_iteration),
-            }
-        )
-        
-    except Exception as e:
-        return JSONResponse(
-            content={
-                'error': str(e),
-                'matches': []
-            }
-        )
+    return await serve_oddsmagnet(request, 'cricket', page, page_size, league, search)
 
 
 @app.get("/oddsmagnet/api/baseball")
@@ -2545,319 +2041,35 @@ async def get_oddsmagnet_baseball(
     - page_size: Items per page (default: 999 [all], max: 999)
     - league: Filter by specific league (partial match)
     - search: Search in match name (partial match, case-insensitive)
-    """
-    try:
-        # Validate pagination parameters
-        page = max(1, page)
-        page_size = min(max(1, page_size), 999)
-        
-        # Read from Baseball realtime collector
-        baseball_file = BASE_DIR / "bookmakers" / "oddsmagnet" / "oddsmagnet_baseball.json"
-        
-        if not baseball_file.exists():
-            return JSONResponse(
-                content={
-                    'error': 'OddsMagnet Baseball data not available',
-                    'message': 'Baseball collector not running. Start with: python bookmakers/oddsmagnet/oddsmagnet_realtime_parallel.py --mode local',
-                    'matches': [],
-                    'timestamp': datetime.now().isoformat(),
-                    'source': 'oddsmagnet_baseball',
-                    'sport': 'baseball'
-                },
-                status_code=503
-            )
-        
-        # Read data with timeout (5 seconds max)
-        try:
-            try:
-                async with asyncio.timeout(5.0):
-                    async with aiofiles.open(baseball_file, 'r', encoding='utf-8') as f:
-                        content = await f.read()
-                        data = json.loads(content)
-            except AttributeError:
-                async def read_file():
-                    async with aiofiles.open(baseball_file, 'r', encoding='utf-8') as f:
-                        content = await f.read()
-                        return json.loads(content)
-                data = await asyncio.wait_for(read_file(), timeout=5.0)
-        except asyncio.TimeoutError:
-            return JSONResponse(
-                content={
-                    'error': 'Request timeout',
-                    'message': 'Baseball data file is being updated. Please try again in a moment.',
-                    'matches': [],
-                    'timestamp': datetime.now().isoformat(),
-                    'source': 'oddsmagnet_baseball',
-                    'sport': 'baseball'
-                },
-                status_code=504
-            )
-        except json.JSONDecodeError:
-            return JSONResponse(
-                content={
-                    'error': 'Data temporarily unavailable',
-                    'message': 'Baseball data is being updated. Please try again in a moment.',
-                    'matches': [],
-                    'timestamp': datetime.now().isoformat(),
-                    'source': 'oddsmagnet_baseball',
-                    'sport': 'baseball'
-                },
-                status_code=503
-            )
-        
-        # Generate ETag from actual data content (timestamp + iteration + query params)
-        data_timestamp = data.get('timestamp', '')
-        data_iteration = data.get('iteration', 0)
-        etag_base = f"{data_timestamp}-{data_iteration}-{page}-{page_size}-{league}-{search}"
-        etag = f'"{hashlib.md5(etag_base.encode()).hexdigest()}"'
-        
-        # Check if client has cached version
-        if_none_match = request.headers.get('if-none-match')
-        if if_none_match == etag:
-            return Response(
-                status_code=304,
-                headers={
-                    'ETag': etag,
-                    'Cache-Control': 'no-cache',
-                }
-            )
-        
-        # Data is from real-time collector
-        all_matches = data.get('matches', [])
-        
-        # Apply additional filters
-        filtered_matches = all_matches
-        if league:
-            league_lower = league.lower()
-            filtered_matches = [
-                m for m in filtered_matches 
-                if league_lower in m.get('league', '').lower() or 
-                   league_lower in m.get('match_uri', '').lower()
-            ]
-        
-        if search:
-            search_lower = search.lower()
-            filtered_matches = [
-                m for m in filtered_matches 
-                if search_lower in m.get('match_name', '').lower()
-            ]
-        
-        # Calculate pagination
-        total_filtered = len(filtered_matches)
-        total_pages = (total_filtered + page_size - 1) // page_size if total_filtered > 0 else 1
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        paginated_matches = filtered_matches[start_idx:end_idx]
-        
-        response_data = {
-            'source': 'oddsmagnet_baseball',
-            'sport': 'baseball',
-            'timestamp': data.get('timestamp'),
-            'iteration': data.get('iteration'),
-            'pagination': {
-                'page': page,
-                'page_size': page_size,
-                'total_items': total_filtered,
-                'total_pages': total_pages,
-                'has_next': page < total_pages,
-                'has_prev': page > 1
-            },
-            'filters': {
-                'league': league,
-                'search': search
-            },
-            'total_matches': len(all_matches),
-            'league_breakdown': data.get('league_breakdown', {}),
-            'matches': paginated_matches
-        }
-        
-        # Return with proper cache control headers and ETag
-        return JSONResponse(
-            content=response_data,
-            headers={
-                'ETag': etag,
-                'Cache-Control': 'no-cache',
-                'X-Data-Timestamp': data_timestamp,
-                'X-Data-Iteration': str(data_iteration),
-            }
-        )
-        
-    except Exception as e:
-        return JSONResponse(
-            content={
-                'error': str(e),
-                'matches': []
-            }
-        )
-
-
-@app.get("/oddsmagnet/api/tabletennis")
-@app.get("/oddsmagnet/tabletennis")  # Keep for backward compatibility
-async def get_oddsmagnet_tabletennis(
-    request: Request,
-    page: int = 1,
-    page_size: int = 999,
-    league: str = None,
-    search: str = None
-):
-    """Get OddsMagnet Table Tennis matches with pagination and filtering
-    
-    This endpoint provides real-time Table Tennis odds from all leagues (Setka Cup, Czech Pro League, etc.).
-    Supports ETag caching for faster subsequent loads.
-    
-    Accessible via:
-    - /oddsmagnet/api/tabletennis (recommended)
-    - /oddsmagnet/tabletennis (legacy)
-    
-    Query Parameters:
-    - page: Page number (default: 1)
-    - page_size: Items per page (default: 999 [all], max: 999)
-    - league: Filter by specific league (partial match)
-    - search: Search in match name (partial match, case-insensitive)
-    """
-    try:
-        # Validate pagination parameters
-        page = max(1, page)
-        page_size = min(max(1, page_size), 999)
-        
-        # Read from Table Tennis realtime collector
-        tabletennis_file = BASE_DIR / "bookmakers" / "oddsmagnet" / "oddsmagnet_table_tennis.json"
-        
-        if not tabletennis_file.exists():
-            return JSONResponse(
-                content={
-                    'error': 'OddsMagnet Table Tennis data not available',
-                    'message': 'Table Tennis collector not running. Start with: python bookmakers/oddsmagnet/oddsmagnet_realtime_parallel.py --mode local',
-                    'matches': [],
-                    'timestamp': datetime.now().isoformat(),
-                    'source': 'oddsmagnet_tabletennis',
-                    'sport': 'table-tennis'
-                },
-                status_code=503
-            )
-        
-        # Read data with timeout (5 seconds max)
-        try:
-            try:
-                async with asyncio.timeout(5.0):
-                    async with aiofiles.open(tabletennis_file, 'r', encoding='utf-8') as f:
-                        content = await f.read()
-                        data = json.loads(content)
-            except AttributeError:
-                async def read_file():
-                    async with aiofiles.open(tabletennis_file, 'r', encoding='utf-8') as f:
-                        content = await f.read()
-                        return json.loads(content)
-                data = await asyncio.wait_for(read_file(), timeout=5.0)
-        except asyncio.TimeoutError:
-            return JSONResponse(
-                content={
-                    'error': 'Request timeout',
-                    'message': 'Table Tennis data file is being updated. Please try again in a moment.',
-                    'matches': [],
-                    'timestamp': datetime.now().isoformat(),
-                    'source': 'oddsmagnet_tabletennis',
-                    'sport': 'table-tennis'
-                },
-                status_code=504
-            )
-        except json.JSONDecodeError:
-            return JSONResponse(
-                content={
-                    'error': 'Data temporarily unavailable',
-                    'message': 'Table Tennis data is being updated. Please try again in a moment.',
-                    'matches': [],
-                    'timestamp': datetime.now().isoformat(),
-                    'source': 'oddsmagnet_tabletennis',
-                    'sport': 'table-tennis'
-                },
-                status_code=503
-            )
-        
-        # Generate ETag from actual data content (timestamp + iteration + query params)
-        data_timestamp = data.get('timestamp', '')
-        data_iteration = data.get('iteration', 0)
-        etag_base = f"{data_timestamp}-{data_iteration}-{page}-{page_size}-{league}-{search}"
-        etag = f'"{hashlib.md5(etag_base.encode()).hexdigest()}"'
-        
-        # Check if client has cached version
-        if_none_match = request.headers.get('if-none-match')
-        if if_none_match == etag:
-            return Response(
-                status_code=304,
-                headers={
-                    'ETag': etag,
-                    'Cache-Control': 'no-cache',
-                }
-            )
-        
-        # Data is from real-time collector
-        all_matches = data.get('matches', [])
-        
-        # Apply additional filters
-        filtered_matches = all_matches
-        if league:
-            league_lower = league.lower()
-            filtered_matches = [
-                m for m in filtered_matches 
-                if league_lower in m.get('league', '').lower() or 
-                   league_lower in m.get('match_uri', '').lower()
-            ]
-        
-        if search:
-            search_lower = search.lower()
-            filtered_matches = [
-                m for m in filtered_matches 
-                if search_lower in m.get('match_name', '').lower()
-            ]
-        
-        # Calculate pagination
-        total_filtered = len(filtered_matches)
-        total_pages = (total_filtered + page_size - 1) // page_size if total_filtered > 0 else 1
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        paginated_matches = filtered_matches[start_idx:end_idx]
-        
-        response_data = {
-            'source': 'oddsmagnet_tabletennis',
-            'sport': 'table-tennis',
-            'timestamp': data.get('timestamp'),
-            'iteration': data.get('iteration'),
-            'pagination': {
-                'page': page,
-                'page_size': page_size,
-                'total_items': total_filtered,
-                'total_pages': total_pages,
-                'has_next': page < total_pages,
-                'has_prev': page > 1
-            },
-            'filters': {
-                'league': league,
-                'search': search
-            },
-            'total_matches': len(all_matches),
-            'league_breakdown': data.get('league_breakdown', {}),
-            'matches': paginated_matches
-        }
-        
-        # Return with proper cache control headers and ETag
-        return JSONResponse(
-            content=response_data,
-            headers={
-                'ETag': etag,
-                'Cache-Control': 'no-cache',
-                'X-Data-Timestamp': data_timestamp,
-                'X-Data-Iteration': str(data_iteration),
-            }
-        )
-        
-    except Exception as e:
-        return JSONResponse(
-            content={
-                'error': str(e),
-                'matches': []
-            }
-        )
+    """
+    return await serve_oddsmagnet(request, 'baseball', page, page_size, league, search)
+
+
+@app.get("/oddsmagnet/api/tabletennis")
+@app.get("/oddsmagnet/tabletennis")  # Keep for backward compatibility
+async def get_oddsmagnet_tabletennis(
+    request: Request,
+    page: int = 1,
+    page_size: int = 999,
+    league: str = None,
+    search: str = None
+):
+    """Get OddsMagnet Table Tennis matches with pagination and filtering
+    
+    This endpoint provides real-time Table Tennis odds from all leagues (Setka Cup, Czech Pro League, etc.).
+    Supports ETag caching for faster subsequent loads.
+    
+    Accessible via:
+    - /oddsmagnet/api/tabletennis (recommended)
+    - /oddsmagnet/tabletennis (legacy)
+    
+    Query Parameters:
+    - page: Page number (default: 1)
+    - page_size: Items per page (default: 999 [all], max: 999)
+    - league: Filter by specific league (partial match)
+    - search: Search in match name (partial match, case-insensitive)
+    """
+    return await serve_oddsmagnet(request, 'tabletennis', page, page_size, league, search)
 
 
 @app.get("/oddsmagnet/api/tennis")
@@ -2884,149 +2096,7 @@ async def get_oddsmagnet_tennis(
     - league: Filter by specific tournament (partial match)
     - search: Search in match name (partial match, case-insensitive)
     """
-    try:
-        # Validate pagination parameters
-        page = max(1, page)
-        page_size = min(max(1, page_size), 999)
-        
-        # Read from Tennis realtime collector
-        tennis_file = BASE_DIR / "bookmakers" / "oddsmagnet" / "oddsmagnet_tennis.json"
-        
-        if not tennis_file.exists():
-            return JSONResponse(
-                content={
-                    'error': 'OddsMagnet Tennis data not available',
-                    'message': 'Tennis collector not running. Start with: python bookmakers/oddsmagnet/oddsmagnet_realtime_parallel.py --mode local',
-                    'matches': [],
-                    'timestamp': datetime.now().isoformat(),
-                    'source': 'oddsmagnet_tennis',
-                    'sport': 'tennis'
-                },
-                status_code=503
-            )
-        
-        # Read data with timeout (5 seconds max)
-        try:
-            try:
-                async with asyncio.timeout(5.0):
-                    async with aiofiles.open(tennis_file, 'r', encoding='utf-8') as f:
-                        content = await f.read()
-                        data = json.loads(content)
-            except AttributeError:
-                async def read_file():
-                    async with aiofiles.open(tennis_file, 'r', encoding='utf-8') as f:
-                        content = await f.read()
-                        return json.loads(content)
-                data = await asyncio.wait_for(read_file(), timeout=5.0)
-        except asyncio.TimeoutError:
-            return JSONResponse(
-                content={
-                    'error': 'Request timeout',
-                    'message': 'Tennis data file is being updated. Please try again in a moment.',
-                    'matches': [],
-                    'timestamp': datetime.now().isoformat(),
-                    'source': 'oddsmagnet_tennis',
-                    'sport': 'tennis'
-                },
-                status_code=504
-            )
-        except json.JSONDecodeError:
-            return JSONResponse(
-                content={
-                    'error': 'Data temporarily unavailable',
-                    'message': 'Tennis data is being updated. Please try again in a moment.',
-                    'matches': [],
-                    'timestamp': datetime.now().isoformat(),
-                    'source': 'oddsmagnet_tennis',
-                    'sport': 'tennis'
-                },
-                status_code=503
-            )
-        
-        # Generate ETag from actual data content (timestamp + iteration + query params)
-        data_timestamp = data.get('timestamp', '')
-        data_iteration = data.get('iteration', 0)
-        etag_base = f"{data_timestamp}-{data_iteration}-{page}-{page_size}-{league}-{search}"
-        etag = f'"{hashlib.md5(etag_base.encode()).hexdigest()}"'
-        
-        # Check if client has cached version
-        if_none_match = request.headers.get('if-none-match')
-        if if_none_match == etag:
-            return Response(
-                status_code=304,
-                headers={
-                    'ETag': etag,
-                    'Cache-Control': 'no-cache',
-                }
-            )
-        
-        # Data is from real-time collector
-        all_matches = data.get('matches', [])
-        
-        # Apply additional filters
-        filtered_matches = all_matches
-        if league:
-            league_lower = league.lower()
-            filtered_matches = [
-                m for m in filtered_matches 
-                if league_lower in m.get('league', '').lower() or 
-                   league_lower in m.get('match_uri', '').lower()
-            ]
-        
-        if search:
-            search_lower = search.lower()
-            filtered_matches = [
-                m for m in filtered_matches 
-                if search_lower in m.get('match_name', '').lower()
-            ]
-        
-        # Calculate pagination
-        total_filtered = len(filtered_matches)
-        total_pages = (total_filtered + page_size - 1) // page_size if total_filtered > 0 else 1
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        paginated_matches = filtered_matches[start_idx:end_idx]
-        
-        response_data = {
-            'source': 'oddsmagnet_tennis',
-            'sport': 'tennis',
-            'timestamp': data.get('timestamp'),
-            'iteration': data.get('iteration'),
-            'pagination': {
-                'page': page,
-                'page_size': page_size,
-                'total_items': total_filtered,
-                'total_pages': total_pages,
-                'has_next': page < total_pages,
-                'has_prev': page > 1
-            },
-            'filters': {
-                'league': league,
-                'search': search
-            },
-            'total_matches': len(all_matches),
-            'tournament_breakdown': data.get('tournament_breakdown', {}),
-            'matches': paginated_matches
-        }
-        
-        # Return with proper cache control headers and ETag
-        return JSONResponse(
-            content=response_data,
-            headers={
-                'ETag': etag,
-                'Cache-Control': 'no-cache',
-                'X-Data-Timestamp': data_timestamp,
-                'X-Data-Iteration': str(data_iteration),
-            }
-        )
-        
-    except Exception as e:
-        return JSONResponse(
-            content={
-                'error': str(e),
-                'matches': []
-            }
-        )
+    return await serve_oddsmagnet(request, 'tennis', page, page_size, league, search)
 
 
 @app.get("/oddsmagnet/api/boxing")
@@ -3053,149 +2123,7 @@ async def get_oddsmagnet_boxing(
     - league: Filter by specific event (partial match)
     - search: Search in match name (partial match, case-insensitive)
     """
-    try:
-        # Validate pagination parameters
-        page = max(1, page)
-        page_size = min(max(1, page_size), 999)
-        
-        # Read from Boxing realtime collector
-        boxing_file = BASE_DIR / "bookmakers" / "oddsmagnet" / "oddsmagnet_boxing.json"
-        
-        if not boxing_file.exists():
-            return JSONResponse(
-                content={
-                    'error': 'OddsMagnet Boxing data not available',
-                    'message': 'Boxing collector not running. Start with: python bookmakers/oddsmagnet/oddsmagnet_realtime_parallel.py --mode local',
-                    'matches': [],
-                    'timestamp': datetime.now().isoformat(),
-                    'source': 'oddsmagnet_boxing',
-                    'sport': 'boxing'
-                },
-                status_code=503
-            )
-        
-        # Read data with timeout (5 seconds max)
-        try:
-            try:
-                async with asyncio.timeout(5.0):
-                    async with aiofiles.open(boxing_file, 'r', encoding='utf-8') as f:
-                        content = await f.read()
-                        data = json.loads(content)
-            except AttributeError:
-                async def read_file():
-                    async with aiofiles.open(boxing_file, 'r', encoding='utf-8') as f:
-                        content = await f.read()
-                        return json.loads(content)
-                data = await asyncio.wait_for(read_file(), timeout=5.0)
-        except asyncio.TimeoutError:
-            return JSONResponse(
-                content={
-                    'error': 'Request timeout',
-                    'message': 'Boxing data file is being updated. Please try again in a moment.',
-                    'matches': [],
-                    'timestamp': datetime.now().isoformat(),
-                    'source': 'oddsmagnet_boxing',
-                    'sport': 'boxing'
-                },
-                status_code=504
-            )
-        except json.JSONDecodeError:
-            return JSONResponse(
-                content={
-                    'error': 'Data temporarily unavailable',
-                    'message': 'Boxing data is being updated. Please try again in a moment.',
-                    'matches': [],
-                    'timestamp': datetime.now().isoformat(),
-                    'source': 'oddsmagnet_boxing',
-                    'sport': 'boxing'
-                },
-                status_code=503
-            )
-        
-        # Generate ETag from actual data content (timestamp + iteration + query params)
-        data_timestamp = data.get('timestamp', '')
-        data_iteration = data.get('iteration', 0)
-        etag_base = f"{data_timestamp}-{data_iteration}-{page}-{page_size}-{league}-{search}"
-        etag = f'"{hashlib.md5(etag_base.encode()).hexdigest()}"'
-        
-        # Check if client has cached version
-        if_none_match = request.headers.get('if-none-match')
-        if if_none_match == etag:
-            return Response(
-                status_code=304,
-                headers={
-                    'ETag': etag,
-                    'Cache-Control': 'no-cache',
-                }
-            )
-        
-        # Data is from real-time collector
-        all_matches = data.get('matches', [])
-        
-        # Apply additional filters
-        filtered_matches = all_matches
-        if league:
-            league_lower = league.lower()
-            filtered_matches = [
-                m for m in filtered_matches 
-                if league_lower in m.get('league', '').lower() or 
-                   league_lower in m.get('match_uri', '').lower()
-            ]
-        
-        if search:
-            search_lower = search.lower()
-            filtered_matches = [
-                m for m in filtered_matches 
-                if search_lower in m.get('match_name', '').lower()
-            ]
-        
-        # Calculate pagination
-        total_filtered = len(filtered_matches)
-        total_pages = (total_filtered + page_size - 1) // page_size if total_filtered > 0 else 1
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        paginated_matches = filtered_matches[start_idx:end_idx]
-        
-        response_data = {
-            'source': 'oddsmagnet_boxing',
-            'sport': 'boxing',
-            'timestamp': data.get('timestamp'),
-            'iteration': data.get('iteration'),
-            'pagination': {
-                'page': page,
-                'page_size': page_size,
-                'total_items': total_filtered,
-                'total_pages': total_pages,
-                'has_next': page < total_pages,
-                'has_prev': page > 1
-            },
-            'filters': {
-                'league': league,
-                'search': search
-            },
-            'total_matches': len(all_matches),
-            'event_breakdown': data.get('event_breakdown', {}),
-            'matches': paginated_matches
-        }
-        
-        # Return with proper cache control headers and ETag
-        return JSONResponse(
-            content=response_data,
-            headers={
-                'ETag': etag,
-                'Cache-Control': 'no-cache',
-                'X-Data-Timestamp': data_timestamp,
-                'X-Data-Iteration': str(data_iteration),
-            }
-        )
-        
-    except Exception as e:
-        return JSONResponse(
-            content={
-                'error': str(e),
-                'matches': []
-            }
-        )
+    return await serve_oddsmagnet(request, 'boxing', page, page_size, league, search)
 
 
 @app.get("/oddsmagnet/api/volleyball")
@@ -3222,149 +2150,7 @@ async def get_oddsmagnet_volleyball(
     - league: Filter by specific league (partial match)
     - search: Search in match name (partial match, case-insensitive)
     """
-    try:
-        # Validate pagination parameters
-        page = max(1, page)
-        page_size = min(max(1, page_size), 999)
-        
-        # Read from Volleyball realtime collector
-        volleyball_file = BASE_DIR / "bookmakers" / "oddsmagnet" / "oddsmagnet_volleyball.json"
-        
-        if not volleyball_file.exists():
-            return JSONResponse(
-                content={
-                    'error': 'OddsMagnet Volleyball data not available',
-                    'message': 'Volleyball collector not running. Start with: python bookmakers/oddsmagnet/oddsmagnet_realtime_parallel.py --mode local',
-                    'matches': [],
-                    'timestamp': datetime.now().isoformat(),
-                    'source': 'oddsmagnet_volleyball',
-                    'sport': 'volleyball'
-                },
-                status_code=503
-            )
-        
-        # Read data with timeout (5 seconds max)
-        try:
-            try:
-                async with asyncio.timeout(5.0):
-                    async with aiofiles.open(volleyball_file, 'r', encoding='utf-8') as f:
-                        content = await f.read()
-                        data = json.loads(content)
-            except AttributeError:
-                async def read_file():
-                    async with aiofiles.open(volleyball_file, 'r', encoding='utf-8') as f:
-                        content = await f.read()
-                        return json.loads(content)
-                data = await asyncio.wait_for(read_file(), timeout=5.0)
-        except asyncio.TimeoutError:
-            return JSONResponse(
-                content={
-                    'error': 'Request timeout',
-                    'message': 'Volleyball data file is being updated. Please try again in a moment.',
-                    'matches': [],
-                    'timestamp': datetime.now().isoformat(),
-                    'source': 'oddsmagnet_volleyball',
-                    'sport': 'volleyball'
-                },
-                status_code=504
-            )
-        except json.JSONDecodeError:
-            return JSONResponse(
-                content={
-                    'error': 'Data temporarily unavailable',
-                    'message': 'Volleyball data is being updated. Please try again in a moment.',
-                    'matches': [],
-                    'timestamp': datetime.now().isoformat(),
-                    'source': 'oddsmagnet_volleyball',
-                    'sport': 'volleyball'
-                },
-                status_code=503
-            )
-        
-        # Generate ETag from actual data content (timestamp + iteration + query params)
-        data_timestamp = data.get('timestamp', '')
-        data_iteration = data.get('iteration', 0)
-        etag_base = f"{data_timestamp}-{data_iteration}-{page}-{page_size}-{league}-{search}"
-        etag = f'"{hashlib.md5(etag_base.encode()).hexdigest()}"'
-        
-        # Check if client has cached version
-        if_none_match = request.headers.get('if-none-match')
-        if if_none_match == etag:
-            return Response(
-                status_code=304,
-                headers={
-                    'ETag': etag,
-                    'Cache-Control': 'no-cache',
-                }
-            )
-        
-        # Data is from real-time collector
-        all_matches = data.get('matches', [])
-        
-        # Apply additional filters
-        filtered_matches = all_matches
-        if league:
-            league_lower = league.lower()
-            filtered_matches = [
-                m for m in filtered_matches 
-                if league_lower in m.get('league', '').lower() or 
-                   league_lower in m.get('match_uri', '').lower()
-            ]
-        
-        if search:
-            search_lower = search.lower()
-            filtered_matches = [
-                m for m in filtered_matches 
-                if search_lower in m.get('match_name', '').lower()
-            ]
-        
-        # Calculate pagination
-        total_filtered = len(filtered_matches)
-        total_pages = (total_filtered + page_size - 1) // page_size if total_filtered > 0 else 1
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        paginated_matches = filtered_matches[start_idx:end_idx]
-        
-        response_data = {
-            'source': 'oddsmagnet_volleyball',
-            'sport': 'volleyball',
-            'timestamp': data.get('timestamp'),
-            'iteration': data.get('iteration'),
-            'pagination': {
-                'page': page,
-                'page_size': page_size,
-                'total_items': total_filtered,
-                'total_pages': total_pages,
-                'has_next': page < total_pages,
-                'has_prev': page > 1
-            },
-            'filters': {
-                'league': league,
-                'search': search
-            },
-            'total_matches': len(all_matches),
-            'league_breakdown': data.get('league_breakdown', {}),
-            'matches': paginated_matches
-        }
-        
-        # Return with proper cache control headers and ETag
-        return JSONResponse(
-            content=response_data,
-            headers={
-                'ETag': etag,
-                'Cache-Control': 'no-cache',
-                'X-Data-Timestamp': data_timestamp,
-                'X-Data-Iteration': str(data_iteration),
-            }
-        )
-        
-    except Exception as e:
-        return JSONResponse(
-            content={
-                'error': str(e),
-                'matches': []
-            }
-        )
+    return await serve_oddsmagnet(request, 'volleyball', page, page_size, league, search)
 
 
 @app.get("/bet365")
@@ -3379,7 +2165,7 @@ async def get_bet365_optic_odds():
 @app.get("/bet365/pregame")
 async def get_bet365_pregame_optic_odds():
     """Get Bet365 pregame odds in OpticOdds format (homepage scraper data)"""
-    data = load_unified_data()
+    data = load_unified_data(sections=('pregame',))
     
     # Filter for only pregame matches
     pregame_only = {
@@ -3396,7 +2182,7 @@ async def get_bet365_pregame_optic_odds():
 @app.get("/bet365/live")
 async def get_bet365_live_optic_odds():
     """Get Bet365 live odds in OpticOdds format (concurrent scraper data)"""
-    data = load_unified_data()
+    data = load_unified_data(sections=('live',))
     
     # Filter for only live matches
     live_only = {
@@ -3624,32 +2410,31 @@ async def get_oddportal_data(
 # ==================== History API Endpoint ====================
 
 @app.get("/history")
-async def get_history():
-    """Get all completed/historical matches from all bookmakers"""
-    history = history_manager.load_history()
-    return history
+async def get_merged_history(cursor: str = None, limit: int = 100, sport: str = None, bookmaker: str = None,
+                             date_from: str = None, date_to: str = None):
+    """Get completed/historical matches from all bookmakers, newest first (cursor-paginated, filterable)"""
+    return await _query_index(merged_history_index, cursor, limit, sport, bookmaker, date_from, date_to)
 
 
 @app.get("/history/{bookmaker}")
-async def get_history_by_bookmaker(bookmaker: str):
-    """Get historical matches for a specific bookmaker"""
+async def get_history_by_bookmaker(bookmaker: str, cursor: str = None, limit: int = 100, sport: str = None,
+                                   date_from: str = None, date_to: str = None):
+    """Get historical matches for a specific bookmaker (cursor-paginated, filterable)"""
     bookmaker = bookmaker.lower()
     if bookmaker not in ['1xbet', 'fanduel', 'bet365']:
         raise HTTPException(status_code=404, detail=f"Bookmaker '{bookmaker}' not found")
     
-    history = history_manager.load_history()
-    return {
-        'metadata': history.get('metadata', {}),
-        'bookmaker': bookmaker,
-        'matches': history['matches'].get(bookmaker, {'pregame': [], 'live': []})
-    }
+    result = await _query_index(merged_history_index, cursor, limit, sport, bookmaker, date_from, date_to)
+    if isinstance(result, dict):
+        result['bookmaker'] = bookmaker
+    return result
 
 
 @app.post("/api/clean-history")
 async def clean_history_now():
     """Manually trigger history cleanup"""
     try:
-        results = history_manager.clean_all()
+        results = await asyncio.to_thread(history_manager.clean_all)
         total_moved = sum(results.values())
         return {
             'success': True,
@@ -25,6 +25,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.cache_manager.dynamic_cache_manager import DynamicCacheManager
 from core.monitoring_status_api import update_monitoring_status
+from utils.helpers.data_sidecar import read_sidecar
 from utils.security.secure_config import SecureConfig
 
 # Try to import enhanced cache manager
@@ -312,8 +313,13 @@ class ModuleMonitor:
             return result
         
         try:
-            # Check file age
-            file_mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
+            # Writers that support it leave a <file>.meta sidecar; when it is current
+            # the data file itself is never opened
+            meta = read_sidecar(file_path)
+            if meta is not None:
+                file_mtime = datetime.fromtimestamp(meta['written_at_unix'])
+            else:
+                file_mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
             age_minutes = (datetime.now() - file_mtime).total_seconds() / 60
             result['data']['file_age_minutes'] = age_minutes
             result['data']['last_updated'] = file_mtime.isoformat()
@@ -324,24 +330,33 @@ class ModuleMonitor:
                     f"Data is stale ({age_minutes:.1f} minutes old, threshold: {stale_threshold_minutes})"
                 )
             
-            # Check file content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Count matches
-            matches = []
-            if 'matches' in data:
-                matches = data['matches']
-            elif 'data' in data and isinstance(data['data'], dict) and 'matches' in data['data']:
-                matches = data['data']['matches']
-            elif 'sports_data' in data:
-                for sport_info in data['sports_data'].values():
-                    matches.extend(sport_info.get('games', []))
+            if meta is not None:
+                match_count = meta['total_matches']
+                result['data']['matches_by_sport'] = meta.get('matches_by_sport', {})
+                result['data']['content_hash'] = meta.get('content_hash')
+                result['data']['file_size_bytes'] = meta['data_size']
+                result['data']['source'] = 'sidecar'
+            else:
+                # No current sidecar (writer without sidecar support): parse the file
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                
+                # Count matches
+                matches = []
+                if 'matches' in data:
+                    matches = data['matches']
+                elif 'data' in data and isinstance(data['data'], dict) and 'matches' in data['data']:
+                    matches = data['data']['matches']
+                elif 'sports_data' in data:
+                    for sport_info in data['sports_data'].values():
+                        matches.extend(sport_info.get('games', []))
+                match_count = len(matches)
+                result['data']['file_size_bytes'] = file_path.stat().st_size
+                result['data']['source'] = 'file'
             
-            result['data']['match_count'] = len(matches)
-            result['data']['file_size_bytes'] = file_path.stat().st_size
+            result['data']['match_count'] = match_count
             
-            if len(matches) == 0:
+            if match_count == 0:
                 result['status'] = 'warning'
                 result['warnings'].append("No matches found in data file")
             
@@ -383,7 +398,7 @@ class OddsMonitoringSystem:
         # Initialize cache manager if auto-update is enabled
         if self.config.get('cache.auto_update', True):
             if USE_ENHANCED_CACHE:
-                self.cache_manager = EnhancedCacheManager(self.base_dir)
+                self.cache_manager = EnhancedCacheManager(self.base_dir, shared=True)
                 print("✓ Enhanced cache auto-update ENABLED with intelligent deduplication")
             else:
                 self.cache_manager = DynamicCacheManager(self.base_dir)
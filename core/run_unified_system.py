@@ -31,6 +31,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.unified_odds_collector import UnifiedOddsCollector
 from utils.security.secure_config import SecureConfig
+from utils.helpers.unified_sections import write_sections, get_sections_path
+from utils.helpers.data_sidecar import read_sidecar
+from utils.helpers.metrics import REGISTRY as METRICS
 
 # Import cache auto-update hook for automatic background updates
 try:
@@ -64,10 +67,10 @@ except ImportError:
 class RealtimeUnifiedCollector:
     """Monitors source files and updates unified odds in real-time"""
     
-    def __init__(self):
-        self.collector = UnifiedOddsCollector()
-        # base_dir should be project root, not core/
-        self.base_dir = Path(__file__).parent.parent
+    def __init__(self, base_dir=None):
+        # base_dir should be project root, not core/ (or a feed_replay sandbox)
+        self.base_dir = Path(base_dir) if base_dir else Path(__file__).parent.parent
+        self.collector = UnifiedOddsCollector(base_dir=base_dir)
 
         # Files to monitor
         self.bet365_pregame = self.base_dir / "bookmakers" / "bet365" / "bet365_current_pregame.json"
@@ -78,6 +81,7 @@ class RealtimeUnifiedCollector:
         self.xbet_live = self.base_dir / "bookmakers" / "1xbet" / "1xbet_live.json"
 
         self.output_file = self.base_dir / "data" / "unified_odds.json"
+        self.sections_file = get_sections_path(self.output_file)
         
         # Track last modification times
         self.last_modified = {}
@@ -164,6 +168,7 @@ class RealtimeUnifiedCollector:
                 # Save to file
                 with open(self.output_file, 'w', encoding='utf-8') as f:
                     json.dump(output, f, indent=2, ensure_ascii=False)
+                write_sections(output, self.sections_file)
                 
                 self.update_count += 1
                 
@@ -245,6 +250,46 @@ class OddsFileEventHandler(FileSystemEventHandler):
         if not event.is_directory and event.src_path in self.monitored_files:
             self.collector.update_unified_odds(event.src_path)
 
+    def on_moved(self, event):
+        # Atomic writers (tmp file + os.replace) show up as a move onto the target
+        if not event.is_directory and event.dest_path in self.monitored_files:
+            self.collector.update_unified_odds(event.dest_path)
+
+
+def run_merge_watcher(base_dir=None):
+    """
+    Real-time merging of source files someone else is writing (no scrapers)
+
+    Used with utils/helpers/feed_replay.py: point base_dir at the replay
+    sandbox to soak-test the merge layer with recorded production traffic.
+    """
+    if not WATCHDOG_AVAILABLE:
+        print(" watchdog not installed")
+        print("   Install with: pip install watchdog")
+        return
+
+    collector = RealtimeUnifiedCollector(base_dir=base_dir)
+    for book in ("bet365", "fanduel", "1xbet"):
+        (collector.base_dir / "bookmakers" / book).mkdir(parents=True, exist_ok=True)
+    (collector.base_dir / "data").mkdir(parents=True, exist_ok=True)
+    collector.initial_update()
+
+    event_handler = OddsFileEventHandler(collector)
+    observer = Observer()
+    for book in ("bet365", "fanduel", "1xbet"):
+        observer.schedule(event_handler, str(collector.base_dir / "bookmakers" / book), recursive=False)
+    observer.start()
+
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print("\n\n⏹  Stopping merge watcher...")
+    finally:
+        observer.stop()
+        observer.join()
+        collector.print_statistics()
+
 
 class AlertSystem:
     """Monitoring and alert system for scraper modules"""
@@ -475,23 +520,23 @@ Please check the system logs and restart if necessary.
             return False
 
     def check_data_files(self):
-        """Check if data files are being updated"""
+        """Check if data files are being updated (reads only the .meta sidecars, never the data)"""
         try:
-            base_dir = os.path.dirname(os.path.abspath(__file__))
+            project_root = Path(__file__).parent.parent
             files_to_check = [
-                ('bet365', 'bet365_current_pregame.json'),
-                ('fanduel', 'fanduel_pregame.json'),
-                ('1xbet', '1xbet_pregame.json'),
-                ('unified', 'unified_odds.json')
+                ('bet365', project_root / 'bookmakers' / 'bet365' / 'bet365_current_pregame.json'),
+                ('fanduel', project_root / 'bookmakers' / 'fanduel' / 'fanduel_pregame.json'),
+                ('1xbet', project_root / 'bookmakers' / '1xbet' / '1xbet_pregame.json'),
+                ('unified', project_root / 'data' / 'unified_odds.json')
             ]
 
             current_time = time.time()
             stale_threshold = 600  # 10 minutes
 
-            for module, filename in files_to_check:
-                filepath = os.path.join(base_dir, module, filename)
+            for module, filepath in files_to_check:
                 if os.path.exists(filepath):
-                    mtime = os.path.getmtime(filepath)
+                    meta = read_sidecar(filepath)
+                    mtime = meta['written_at_unix'] if meta else os.path.getmtime(filepath)
                     age = current_time - mtime
 
                     if age > stale_threshold:
@@ -617,11 +662,23 @@ class UnifiedSystemRunner:
         # Process tracking
         self.processes = []
         self.merge_interval = 30  # seconds
+        self.merge_workers = 1  # collector matching processes (1 = serial)
         self.include_live = include_live  # Whether to include live scrapers
         self.live_only = live_only  # Whether to run ONLY live scrapers
         self.chrome_processes = []  # Track Chrome processes we started
         self.shutdown_flag = False
 
+        # Resident collector - built once, rebuilt only when its cache files change
+        self.resident_collector = None
+        self.collector_cache_versions = None
+        self.collector_lock = threading.Lock()
+        self.collector_stats = {
+            'builds': 0,
+            'reuses': 0,
+            'last_setup_seconds': 0.0,
+            'setup_seconds_saved': 0.0,
+        }
+
         # Alert system
         self.alert_system = AlertSystem()
 
@@ -915,22 +972,109 @@ class UnifiedSystemRunner:
         except Exception as e:
             self.log(f" Chrome cleanup error: {e}")
 
+    def _collector_cache_files(self, collector):
+        """Files a UnifiedOddsCollector loads at construction (cache + name mappings)"""
+        files = [collector.cache_file]
+        cache_manager = getattr(collector, 'cache_manager', None)
+        for attr in ('cache_file', 'mappings_file'):
+            path = getattr(cache_manager, attr, None)
+            if path is not None:
+                files.append(str(path))
+        return files
+
+    @staticmethod
+    def _file_versions(paths):
+        versions = []
+        for path in paths:
+            try:
+                st = os.stat(path)
+                versions.append((path, st.st_mtime_ns, st.st_size))
+            except OSError:
+                versions.append((path, None, None))
+        return tuple(versions)
+
+    def _absorb_own_writes(self, collector, before):
+        """
+        Versions to compare against on the next cycle after a collector run
+
+        A file that changed during the run is absorbed only if its version is
+        the one the collector's cache manager reports writing; a write by any
+        other process keeps the pre-run version, so the next cycle rebuilds.
+        """
+        written = getattr(getattr(collector, 'cache_manager', None), 'written_versions', {})
+        after = self._file_versions(self._collector_cache_files(collector))
+        versions = []
+        for old, new in zip(before, after):
+            path, mtime, size = new
+            if old == new or written.get(path) == (mtime, size):
+                versions.append(new)
+            else:
+                versions.append(old)
+        return tuple(versions)
+
+    def get_resident_collector(self):
+        """
+        Return the long-lived collector, rebuilding it only when cache files changed
+
+        The collector saves its own cache updates during every cycle; only the
+        versions it wrote are absorbed after each run (see _absorb_own_writes),
+        so changes made by other processes trigger a rebuild here.
+        """
+        collector = self.resident_collector
+        if collector is not None:
+            current = self._file_versions(self._collector_cache_files(collector))
+            if current == self.collector_cache_versions:
+                self.collector_stats['reuses'] += 1
+                self.collector_stats['setup_seconds_saved'] += self.collector_stats['last_setup_seconds']
+                return collector
+            self.log("🔄 Cache files changed on disk - rebuilding resident collector")
+            self.discard_resident_collector()
+
+        start = time.perf_counter()
+        collector = UnifiedOddsCollector()
+        collector.merge_workers = self.merge_workers
+        setup = time.perf_counter() - start
+
+        self.resident_collector = collector
+        self.collector_cache_versions = self._file_versions(self._collector_cache_files(collector))
+        self.collector_stats['builds'] += 1
+        self.collector_stats['last_setup_seconds'] = setup
+        self.log(f"[TIME] Collector setup: {setup:.2f}s (build #{self.collector_stats['builds']})")
+        return collector
+
+    def discard_resident_collector(self):
+        """Drop the resident collector and stop its merge worker processes"""
+        collector, self.resident_collector = self.resident_collector, None
+        if collector is not None:
+            try:
+                collector.close_merge_pool()
+            except Exception as e:
+                self.log(f"[WARN] Could not stop merge workers: {e}")
+
     def run_unified_collector(self):
-        """Run the unified odds collector"""
+        """Run the unified odds collector (resident instance, reused across cycles)"""
         try:
             self.log(" Running unified collector...")
 
-            # Import and run collector
-            from unified_odds_collector import UnifiedOddsCollector
+            with self.collector_lock:
+                reuses_before = self.collector_stats['reuses']
+                collector = self.get_resident_collector()
+                before = self.collector_cache_versions
+                collector.collect_and_merge()
+                self.collector_cache_versions = self._absorb_own_writes(collector, before)
 
-            collector = UnifiedOddsCollector()
-            collector.collect_and_merge()
+                if self.collector_stats['reuses'] > reuses_before:
+                    stats = self.collector_stats
+                    self.log(f"[TIME] Reused resident collector: saved ~{stats['last_setup_seconds']:.2f}s setup "
+                             f"({stats['setup_seconds_saved']:.1f}s over {stats['reuses']} cycles, {stats['builds']} builds)")
 
             self.log(" Unified database updated")
             return True
 
         except Exception as e:
             self.log(f" Collector failed: {e}")
+            # Rebuild on the next cycle rather than reuse a possibly half-updated instance
+            self.discard_resident_collector()
             # Send alert for collector failure
             # COMMENTED OUT: Reduced email notifications
             # self.alert_system.send_alert(
@@ -944,6 +1088,7 @@ class UnifiedSystemRunner:
     def stop_all_scrapers(self):
         """Stop all running scrapers and clean up Chrome instances"""
         self.log("\n Stopping all scrapers...")
+        self.discard_resident_collector()
 
         failed_stops = []
 
@@ -1549,9 +1694,16 @@ def main():
     parser = argparse.ArgumentParser(description='Unified Odds System Runner')
     parser.add_argument(
         '--mode',
-        choices=['once', 'continuous', 'realtime'],
+        choices=['once', 'continuous', 'realtime', 'watch'],
         default='once',
-        help='Run mode: once (collect then merge), continuous (periodic merges), or realtime (instant updates)'
+        help='Run mode: once (collect then merge), continuous (periodic merges), realtime (instant updates), '
+             'or watch (instant merges of files written elsewhere, no scrapers)'
+    )
+    parser.add_argument(
+        '--base-dir',
+        type=str,
+        default=None,
+        help='Root holding bookmakers/ and data/ for watch mode (e.g. a feed_replay sandbox)'
     )
     parser.add_argument(
         '--duration',
@@ -1575,6 +1727,12 @@ def main():
         action='store_true',
         help='Run ONLY live match scrapers (no pregame data collection)'
     )
+    parser.add_argument(
+        '--merge-workers',
+        type=int,
+        default=1,
+        help='Processes for sport-sharded matching in the merge (default: 1 = serial, 0 = one per CPU)'
+    )
     parser.add_argument(
         '--alert-test',
         action='store_true',
@@ -1586,8 +1744,14 @@ def main():
     # If --live-only is set, include_live should also be True
     include_live = args.include_live or args.live_only
     
+    METRICS.configure('unified')
+    if args.mode == 'watch':
+        run_merge_watcher(args.base_dir)
+        return
+
     runner = UnifiedSystemRunner(include_live=include_live, live_only=args.live_only)
     runner.merge_interval = args.interval
+    runner.merge_workers = args.merge_workers if args.merge_workers > 0 else (os.cpu_count() or 1)
 
     # Test alert system if requested
     if args.alert_test:
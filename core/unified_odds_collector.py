@@ -41,6 +41,8 @@ from typing import Dict, List, Optional, Tuple
 from difflib import SequenceMatcher
 import re
 import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -54,14 +56,185 @@ except ImportError:
     from utils.cache_manager.dynamic_cache_manager import DynamicCacheManager
     USE_ENHANCED_CACHE = False
 
+from utils.helpers.unified_sections import write_sections, get_sections_path
+from utils.helpers.odds_model import quotes_from_odds, quotes_from_american, pack_quotes
+from utils.helpers.data_sidecar import write_sidecar, count_by_sport
+from utils.helpers.metrics import REGISTRY as METRICS, timed_stage
+
+
+class MatchNameMemo:
+    """
+    Merge-cycle memo for match comparison
+
+    The all-pairs matching in merge_pregame_data/merge_live_data compares every
+    match with every other bookmaker's matches, so the same team and sport
+    strings are canonicalized and normalized thousands of times per cycle.
+    This memo computes each distinct string once and caches pairwise
+    similarity scores. It is only valid while the cache is not modified, i.e.
+    for one matching phase (see UnifiedOddsCollector.begin_match_cycle).
+    """
+
+    def __init__(self, collector: 'UnifiedOddsCollector'):
+        self.collector = collector
+        self.sports: Dict[str, str] = {}
+        self.canonical: Dict[str, str] = {}
+        self.normalized: Dict[str, str] = {}
+        self.similarity: Dict[Tuple[str, str], float] = {}
+        self.matchers: Dict[str, SequenceMatcher] = {}
+        self.stats = {'pairs': 0, 'similarity_computed': 0, 'similarity_cached': 0, 'similarity_pruned': 0}
+
+    def sport(self, sport: str) -> str:
+        value = self.sports.get(sport)
+        if value is None:
+            value = self.sports[sport] = self.collector.normalize_sport_name(sport)
+        return value
+
+    def canonical_name(self, team: str) -> str:
+        value = self.canonical.get(team)
+        if value is None:
+            value = self.canonical[team] = self.collector.get_canonical_team_name(team)
+        return value
+
+    def normalized_name(self, team: str) -> str:
+        value = self.normalized.get(team)
+        if value is None:
+            value = self.normalized[team] = self.collector.normalize_team_name(team)
+        return value
+
+    def name_similarity(self, name1: str, name2: str) -> float:
+        """Same value as calculate_name_similarity, computed once per normalized pair"""
+        norm1 = self.normalized_name(name1)
+        norm2 = self.normalized_name(name2)
+        key = (norm1, norm2)
+        value = self.similarity.get(key)
+        if value is not None:
+            self.stats['similarity_cached'] += 1
+            return value
+
+        # One matcher per second string: SequenceMatcher caches its index of seq2
+        matcher = self.matchers.get(norm2)
+        if matcher is None:
+            matcher = self.matchers[norm2] = SequenceMatcher(None, '', norm2)
+        matcher.set_seq1(norm1)
+        value = self.similarity[key] = matcher.ratio()
+        self.stats['similarity_computed'] += 1
+        return value
+
+    def similarity_upper_bound(self, name1: str, name2: str) -> float:
+        """Cheap upper bound of name_similarity (length-only real_quick_ratio)"""
+        norm1 = self.normalized_name(name1)
+        norm2 = self.normalized_name(name2)
+        total = len(norm1) + len(norm2)
+        return 2.0 * min(len(norm1), len(norm2)) / total if total else 1.0
+
+    @classmethod
+    def from_snapshot(cls, canonical: Dict[str, str], normalized: Dict[str, str]) -> 'MatchNameMemo':
+        """Collector-free memo for merge worker processes, pre-filled with every name it will see"""
+        memo = cls(None)
+        memo.canonical = canonical
+        memo.normalized = normalized
+        return memo
+
+    def snapshot(self, teams) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Read-only canonical/normalized tables for the given team names (see from_snapshot)"""
+        return ({team: self.canonical_name(team) for team in teams},
+                {team: self.normalized_name(team) for team in teams})
+
+    def same_teams(self, home1: str, away1: str, home2: str, away2: str, threshold: float) -> bool:
+        """Team part of matches_are_same: exact canonical comparison if all four names are cached, else fuzzy"""
+        home1_canonical = self.canonical_name(home1)
+        away1_canonical = self.canonical_name(away1)
+        home2_canonical = self.canonical_name(home2)
+        away2_canonical = self.canonical_name(away2)
+        
+        if (home1_canonical != home1 and away1_canonical != away1 and
+                home2_canonical != home2 and away2_canonical != away2):
+            return ((home1_canonical == home2_canonical and away1_canonical == away2_canonical) or
+                    (home1_canonical == away2_canonical and away1_canonical == home2_canonical))
+        
+        return self.fuzzy_match(home1, away1, home2, away2, threshold)
+
+    def fuzzy_match(self, home1: str, away1: str, home2: str, away2: str, threshold: float) -> bool:
+        """Average home/away similarity (straight or reversed) reaches the threshold"""
+        for a1, b1 in ((home2, away2), (away2, home2)):
+            # Skip the exact ratios when even the upper bound can't reach the threshold
+            if (self.similarity_upper_bound(home1, a1) + self.similarity_upper_bound(away1, b1)) / 2 < threshold:
+                self.stats['similarity_pruned'] += 1
+                continue
+            if (self.name_similarity(home1, a1) + self.name_similarity(away1, b1)) / 2 >= threshold:
+                return True
+        return False
+
+
+def _match_sport_shard(task: Dict) -> Dict:
+    """
+    Merge worker: run the matching for one sport shard in a worker process
+    
+    Module-level so ProcessPoolExecutor can pickle it. The task carries the
+    shard's rows as (original index, home, away) plus a read-only name snapshot,
+    so the worker never touches the collector or the cache files.
+    
+    Args:
+        task: Shard built by UnifiedOddsCollector.match_in_sport_shards
+    
+    Returns:
+        {'pairs': [(book_pair, [(i, j), ...]), ...]} for pregame, {'picks': [(i, {book: j or None}), ...]} for live,
+        plus the worker memo's stats
+    """
+    memo = MatchNameMemo.from_snapshot(task['canonical'], task['normalized'])
+    threshold = task['threshold']
+    stats = memo.stats
+    
+    if task['mode'] == 'pregame':
+        found = []
+        for book_pair, rows1, rows2 in task['jobs']:
+            pairs = []
+            for i, home1, away1 in rows1:
+                for j, home2, away2 in rows2:
+                    if memo.same_teams(home1, away1, home2, away2, threshold):
+                        pairs.append((i, j))
+                stats['pairs'] += len(rows2)
+            found.append((book_pair, pairs))
+        return {'pairs': found, 'stats': stats}
+    
+    # Live: same greedy best-similarity pick as merge_live_data, in original order
+    others = task['others']
+    taken = {name: set() for name in others}
+    picks = []
+    for i, home1, away1 in task['primary']:
+        chosen = {}
+        for name, rows in others.items():
+            best_idx = None
+            best_sim = 0.0
+            for j, home2, away2 in rows:
+                if j in taken[name]:
+                    continue
+                stats['pairs'] += 1
+                if memo.same_teams(home1, away1, home2, away2, threshold):
+                    avg_sim = (memo.name_similarity(home1, home2) + memo.name_similarity(away1, away2)) / 2
+                    if avg_sim > best_sim:
+                        best_sim = avg_sim
+                        best_idx = j
+            chosen[name] = best_idx
+        for name, j in chosen.items():
+            if j is not None:
+                taken[name].add(j)
+        picks.append((i, chosen))
+    return {'picks': picks, 'stats': stats}
+
 
 class UnifiedOddsCollector:
     """Combines odds data from Bet365, FanDuel, and 1xBet into a unified database"""
     
-    def __init__(self):
+    def __init__(self, base_dir: Optional[str] = None):
+        """
+        Args:
+            base_dir: Root holding bookmakers/ and data/ (default: project root);
+                      point it at a feed_replay sandbox to merge replayed traffic
+        """
         # Paths to data sources - base_dir is project root
         script_dir = os.path.dirname(os.path.abspath(__file__))
-        self.base_dir = os.path.dirname(script_dir)  # Go up from core/ to project root
+        self.base_dir = str(base_dir) if base_dir else os.path.dirname(script_dir)  # Go up from core/ to project root
         
         # Bet365 sources
         self.bet365_pregame_file = os.path.join(self.base_dir, "bookmakers", "bet365", "bet365_current_pregame.json")
@@ -84,6 +257,9 @@ class UnifiedOddsCollector:
         # Output file - should be in data/ folder
         self.unified_output_file = os.path.join(self.base_dir, "data", "unified_odds.json")
         
+        # Indexed pregame/live per-sport sections for partial readers
+        self.unified_sections_file = get_sections_path(self.unified_output_file)
+        
         # File write lock to prevent concurrent writes
         self.file_lock = threading.Lock()
         
@@ -127,6 +303,18 @@ class UnifiedOddsCollector:
         # Fallback cache for normalized team names (legacy)
         self.team_name_cache = {}
         
+        # Per-merge-cycle memo for matches_are_same (see MatchNameMemo)
+        self.match_memo_enabled = True
+        self.match_memo: Optional[MatchNameMemo] = None
+        
+        # Sport-sharded parallel matching (see match_in_sport_shards); 1 = serial.
+        # Opt-in (run_unified_system.py --merge-workers) until a multi-core host
+        # shows benchmarks/bench_parallel_merge.py beating the serial merge.
+        self.merge_workers = 1
+        self.parallel_merge_min_comparisons = 500000
+        self._merge_pool: Optional[ProcessPoolExecutor] = None
+        self._merge_pool_workers = 0
+        
         # Sport name mapping (FanDuel -> Bet365 format, plus 1xBet mappings)
         self.sport_mapping = {
             'basketball': 'NBA',  # FanDuel uses 'basketball' for both NBA and NCAAB
@@ -475,8 +663,153 @@ class UnifiedOddsCollector:
         
         return None
     
+    def begin_match_cycle(self) -> Optional[MatchNameMemo]:
+        """Start a fresh name memo for one matching phase (after team normalization)"""
+        self.match_memo = MatchNameMemo(self) if self.match_memo_enabled else None
+        return self.match_memo
+    
+    def end_match_cycle(self):
+        """Drop the name memo (the cache may change before the next cycle)"""
+        memo, self.match_memo = self.match_memo, None
+        if memo is not None:
+            stats = memo.stats
+            print(f"[INFO] Name memo: {stats['pairs']} pairs, {len(memo.canonical)} distinct teams, "
+                  f"similarity {stats['similarity_computed']} computed / {stats['similarity_cached']} cached / "
+                  f"{stats['similarity_pruned']} pruned")
+    
+    def _get_merge_pool(self, workers: int) -> ProcessPoolExecutor:
+        """Persistent worker pool, reused across merge cycles while the collector lives"""
+        if self._merge_pool is None or self._merge_pool_workers != workers:
+            self.close_merge_pool()
+            # spawn: the collector runs next to scraper threads, forking those is unsafe
+            self._merge_pool = ProcessPoolExecutor(max_workers=workers,
+                                                   mp_context=multiprocessing.get_context('spawn'))
+            self._merge_pool_workers = workers
+        return self._merge_pool
+    
+    def close_merge_pool(self):
+        """Shut down the merge worker processes"""
+        pool, self._merge_pool = self._merge_pool, None
+        self._merge_pool_workers = 0
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+    
+    def match_in_sport_shards(self, mode: str, books: Dict[str, List[Dict]],
+                              threshold: float = 0.6) -> Optional[Dict]:
+        """
+        Run the matching phase partitioned by normalized sport across worker processes
+        
+        Matches can only pair within the same normalize_sport_name value, so each
+        sport is an independent shard. Pregame shards are further split by rows of
+        the first book so one big sport doesn't serialize the pool; live shards stay
+        whole because the greedy pick depends on earlier picks of the same sport.
+        Results are reassembled in the serial scan order, so the merged output is
+        identical to the in-process path.
+        
+        Must be called inside a match cycle (begin_match_cycle).
+        
+        Args:
+            mode: 'pregame' or 'live'
+            books: Bookmaker name -> normalized matches (first book is the live primary)
+            threshold: matches_are_same similarity threshold
+        
+        Returns:
+            Pregame: {(book1, book2): [(i, j), ...]} in serial order.
+            Live: {book: [picked index or None per primary match]} for every non-primary book.
+            None when the merge should stay serial (disabled, too small, or the pool failed).
+        """
+        memo = self.match_memo
+        if memo is None or self.merge_workers <= 1:
+            return None
+        
+        names = list(books)
+        shards: Dict[str, Dict[str, list]] = {}
+        for name in names:
+            for idx, match in enumerate(books[name]):
+                shard = shards.setdefault(memo.sport(match.get('sport', '')), {n: [] for n in names})
+                shard[name].append((idx, match.get('home_team', ''), match.get('away_team', '')))
+        
+        if mode == 'pregame':
+            book_pairs = [(n1, n2) for k, n1 in enumerate(names) for n2 in names[k + 1:]]
+            comparisons = sum(len(shard[n1]) * len(shard[n2]) for shard in shards.values() for n1, n2 in book_pairs)
+        else:
+            primary, others = names[0], names[1:]
+            comparisons = sum(len(shard[primary]) * sum(len(shard[n]) for n in others) for shard in shards.values())
+        
+        workers = min(self.merge_workers, len(shards))
+        if workers <= 1 or comparisons < self.parallel_merge_min_comparisons:
+            return None
+        
+        def with_snapshot(task: Dict, rows) -> Dict:
+            teams = {team for row_list in rows for _, home, away in row_list for team in (home, away)}
+            task['canonical'], task['normalized'] = memo.snapshot(teams)
+            task['threshold'] = threshold
+            task['mode'] = mode
+            return task
+        
+        tasks = []
+        if mode == 'pregame':
+            # One task per sport covering every book pair (so the worker memo is shared
+            # across pairs); sports bigger than the target are split by first-book rows
+            target = max(1, comparisons // workers)
+            for shard in shards.values():
+                shard_pairs = [(n1, n2) for n1, n2 in book_pairs if shard[n1] and shard[n2]]
+                if not shard_pairs:
+                    continue
+                size = sum(len(shard[n1]) * len(shard[n2]) for n1, n2 in shard_pairs)
+                parts = min(-(-size // target), max(len(shard[n1]) for n1, _ in shard_pairs))
+                for k in range(parts):
+                    jobs = []
+                    for n1, n2 in shard_pairs:
+                        rows1 = shard[n1]
+                        part = rows1[k * len(rows1) // parts:(k + 1) * len(rows1) // parts]
+                        if part:
+                            jobs.append(((n1, n2), part, shard[n2]))
+                    if jobs:
+                        tasks.append(with_snapshot({'jobs': jobs},
+                                                   [rows for _, part, rows2 in jobs for rows in (part, rows2)]))
+        else:
+            for shard in shards.values():
+                if not shard[primary]:
+                    continue
+                rows = {n: shard[n] for n in others}
+                tasks.append(with_snapshot({'primary': shard[primary], 'others': rows},
+                                           [shard[primary], *rows.values()]))
+        
+        start = time.time()
+        try:
+            results = list(self._get_merge_pool(workers).map(_match_sport_shard, tasks))
+        except Exception as e:
+            print(f"[WARN] Parallel merge failed, falling back to serial: {e}")
+            self.close_merge_pool()
+            return None
+        
+        for result in results:
+            for key, value in result['stats'].items():
+                memo.stats[key] += value
+        print(f"[INFO] Sport-sharded {mode} matching: {len(tasks)} tasks over {len(shards)} sports, "
+              f"{workers} workers, {comparisons} comparisons in {time.time() - start:.2f}s")
+        
+        if mode == 'pregame':
+            pairwise = {pair: [] for pair in book_pairs}
+            for result in results:
+                for book_pair, pairs in result['pairs']:
+                    pairwise[book_pair].extend(pairs)
+            for pairs in pairwise.values():
+                pairs.sort()   # serial scan order: first index, then second
+            return pairwise
+        
+        picks = {name: [None] * len(books[primary]) for name in others}
+        for result in results:
+            for i, chosen in result['picks']:
+                for name, j in chosen.items():
+                    picks[name][i] = j
+        return picks
+    
     def calculate_name_similarity(self, name1: str, name2: str) -> float:
         """Calculate similarity between two team names (0-1 scale)"""
+        if self.match_memo is not None:
+            return self.match_memo.name_similarity(name1, name2)
         norm1 = self.normalize_team_name(name1)
         norm2 = self.normalize_team_name(name2)
         return SequenceMatcher(None, norm1, norm2).ratio()
@@ -541,6 +874,9 @@ class UnifiedOddsCollector:
         This ensures cache normalization is used first, with fuzzy matching
         only for teams not yet in the cache database.
         """
+        memo = self.match_memo
+        if memo is not None:
+            return self._matches_are_same_memo(memo, match1, match2, threshold)
 
         # First check if sports match (normalized)
         sport1 = self.normalize_sport_name(match1.get('sport', ''))
@@ -600,6 +936,17 @@ class UnifiedOddsCollector:
 
         return avg_similarity_rev >= threshold
     
+    def _matches_are_same_memo(self, memo: MatchNameMemo, match1: Dict, match2: Dict,
+                               threshold: float) -> bool:
+        """matches_are_same with every name lookup served from the cycle memo (same result)"""
+        memo.stats['pairs'] += 1
+        if memo.sport(match1.get('sport', '')) != memo.sport(match2.get('sport', '')):
+            return False
+        
+        return memo.same_teams(match1.get('home_team', ''), match1.get('away_team', ''),
+                               match2.get('home_team', ''), match2.get('away_team', ''), threshold)
+    
+    @timed_stage('load_bet365_pregame')
     def load_bet365_pregame(self) -> List[Dict]:
         """Load Bet365 pregame data"""
         try:
@@ -637,6 +984,7 @@ class UnifiedOddsCollector:
             print(f"Error loading Bet365 pregame data: {e}")
             return []
     
+    @timed_stage('load_bet365_live')
     def load_bet365_live(self) -> List[Dict]:
         """Load Bet365 live data"""
         try:
@@ -672,6 +1020,7 @@ class UnifiedOddsCollector:
             print(f"Error loading Bet365 live data: {e}")
             return []
     
+    @timed_stage('load_fanduel_pregame')
     def load_fanduel_pregame(self) -> List[Dict]:
         """Load FanDuel pregame data"""
         try:
@@ -714,6 +1063,7 @@ class UnifiedOddsCollector:
             print(f"Error loading FanDuel pregame data: {e}")
             return []
     
+    @timed_stage('load_fanduel_live')
     def load_fanduel_live(self) -> List[Dict]:
         """Load FanDuel live data"""
         try:
@@ -747,6 +1097,7 @@ class UnifiedOddsCollector:
             print(f"Error loading FanDuel live data: {e}")
             return []
     
+    @timed_stage('load_1xbet_pregame')
     def load_1xbet_pregame(self) -> List[Dict]:
         """Load 1xBet pregame data"""
         try:
@@ -795,6 +1146,7 @@ class UnifiedOddsCollector:
             print(f"Error loading 1xBet pregame data: {e}")
             return []
     
+    @timed_stage('load_1xbet_live')
     def load_1xbet_live(self) -> List[Dict]:
         """Load 1xBet live data"""
         try:
@@ -840,6 +1192,7 @@ class UnifiedOddsCollector:
             print(f"Error loading 1xBet live data: {e}")
             return []
     
+    @timed_stage('load_oddportal')
     def load_oddportal(self) -> List[Dict]:
         """Load OddPortal unified data"""
         try:
@@ -999,6 +1352,12 @@ class UnifiedOddsCollector:
         """Extract odds from 1xBet match data"""
         # 1xBet uses 'odds_data' field in pregame and 'odds' in live
         odds_data = match_data.get('odds_data', {}) or match_data.get('odds', {})
+        if isinstance(odds_data, str):
+            # Legacy files stored odds_data as a JSON string
+            try:
+                odds_data = json.loads(odds_data)
+            except ValueError:
+                odds_data = {}
         
         # 1xBet odds structure
         extracted = {
@@ -1013,6 +1372,23 @@ class UnifiedOddsCollector:
         
         return extracted
     
+    def extract_bet365_quotes(self, match_data: Dict) -> List[list]:
+        """Typed quote rows for Bet365 (its scraped page text is parsed here, once)"""
+        return pack_quotes(quotes_from_odds(self.extract_bet365_odds(match_data)))
+    
+    def extract_fanduel_quotes(self, match_data: Dict) -> List[list]:
+        """Typed quote rows for FanDuel, built from its numeric American prices and lines"""
+        return pack_quotes(quotes_from_american(self.extract_fanduel_odds(match_data)))
+    
+    def extract_1xbet_quotes(self, match_data: Dict) -> List[list]:
+        """Typed quote rows for 1xBet, as written by the scrapers from the raw odds codes"""
+        quotes = match_data.get('quotes')
+        if quotes is None:
+            # Scraper files written before typed quotes existed
+            quotes = pack_quotes(quotes_from_odds(self.extract_1xbet_odds(match_data)))
+        return quotes
+    
+    @timed_stage('merge_pregame_data')
     def merge_pregame_data(self, bet365_matches: List[Dict],
                            fanduel_matches: List[Dict],
                            xbet_matches: List[Dict]) -> List[Dict]:
@@ -1033,11 +1409,13 @@ class UnifiedOddsCollector:
         
         How to add a new bookmaker:
         1. Create a loader function (e.g., load_draftkings_pregame())
-        2. Create an odds extractor (e.g., extract_draftkings_odds())
+        2. Create an odds extractor and a typed quote extractor (e.g., extract_draftkings_odds()
+           and extract_draftkings_quotes())
         3. Add the bookmaker to the 'bookmakers' dict in this function:
            'draftkings': {
                'matches': [self.normalize_match_teams(m) for m in draftkings_matches],
                'extract_odds': self.extract_draftkings_odds,
+               'extract_quotes': self.extract_draftkings_quotes,
                'extra_fields': lambda m: {'match_id': m.get('match_id', '')}
            }
         4. That's it! The matching logic will automatically include the new bookmaker.
@@ -1055,16 +1433,19 @@ class UnifiedOddsCollector:
             'bet365': {
                 'matches': [self.normalize_match_teams(m) for m in bet365_matches],
                 'extract_odds': self.extract_bet365_odds,
+                'extract_quotes': self.extract_bet365_quotes,
                 'extra_fields': lambda m: {'fixture_id': m.get('fixture_id', '')}
             },
             'fanduel': {
                 'matches': [self.normalize_match_teams(m) for m in fanduel_matches],
                 'extract_odds': self.extract_fanduel_odds,
+                'extract_quotes': self.extract_fanduel_quotes,
                 'extra_fields': lambda m: {'match_id': m.get('match_id', ''), 'game_id': m.get('game_id', '')}
             },
             '1xbet': {
                 'matches': [self.normalize_match_teams(m) for m in xbet_matches],
                 'extract_odds': self.extract_1xbet_odds,
+                'extract_quotes': self.extract_1xbet_quotes,
                 'extra_fields': lambda m: {'match_id': m.get('match_id', ''), 'game_id': m.get('game_id', '')}
             }
         }
@@ -1074,6 +1455,7 @@ class UnifiedOddsCollector:
         # 'draftkings': {
         #     'matches': [self.normalize_match_teams(m) for m in draftkings_matches],
         #     'extract_odds': self.extract_draftkings_odds,
+        #     'extract_quotes': self.extract_draftkings_quotes,
         #     'extra_fields': lambda m: {'match_id': m.get('match_id', '')}
         # }
         
@@ -1091,21 +1473,46 @@ class UnifiedOddsCollector:
         
         def find_matches(matches1, matches2, threshold=0.6):
             """Generator to find matching pairs"""
+            memo = self.match_memo
+            if memo is not None:
+                # Different sports never match, so only compare within the same
+                # normalized sport (same pairs, same order as the full scan)
+                by_sport = {}
+                for j, match2 in enumerate(matches2):
+                    by_sport.setdefault(memo.sport(match2.get('sport', '')), []).append((j, match2))
+                for i, match1 in enumerate(matches1):
+                    for j, match2 in by_sport.get(memo.sport(match1.get('sport', '')), ()):
+                        if self._matches_are_same_memo(memo, match1, match2, threshold):
+                            yield (i, j)
+                return
+            
             for i, match1 in enumerate(matches1):
                 for j, match2 in enumerate(matches2):
                     if self.matches_are_same(match1, match2, threshold=threshold):
                         yield (i, j)
         
+        # Team names are normalized above, so name lookups are stable for this phase
+        self.begin_match_cycle()
+        
+        # Large merges are partitioned by sport across worker processes (None = serial)
+        sharded_pairs = self.match_in_sport_shards(
+            'pregame', {name: bookmakers[name]['matches'] for name in bookmaker_names}, 0.6)
+        
         # Find all unique pairs of bookmakers
         for i, name1 in enumerate(bookmaker_names):
             for name2 in bookmaker_names[i+1:]:
                 print(f"  Finding {name1} + {name2} matches...")
                 matches1 = bookmakers[name1]['matches']
                 matches2 = bookmakers[name2]['matches']
-                pairs = list(find_matches(matches1, matches2, 0.6))
+                if sharded_pairs is not None:
+                    pairs = sharded_pairs[(name1, name2)]
+                else:
+                    pairs = list(find_matches(matches1, matches2, 0.6))
                 pairwise_matches[(name1, name2)] = pairs
                 print(f"    Found {len(pairs)} matches")
         
+        self.end_match_cycle()
+        
         # STEP 3: Build match groups (clusters of related matches across bookmakers)
         print("\n[INFO] Building match groups across all bookmakers...")
         match_groups = []  # Each group is a dict: {bookmaker_name: match_index}
@@ -1183,11 +1590,13 @@ class UnifiedOddsCollector:
                     idx = group[bookmaker_name]
                     match_data = bookmakers[bookmaker_name]['matches'][idx]
                     odds = bookmakers[bookmaker_name]['extract_odds'](match_data['raw_data'])
+                    quotes = bookmakers[bookmaker_name]['extract_quotes'](match_data['raw_data'])
                     extra = bookmakers[bookmaker_name]['extra_fields'](match_data)
                     
                     unified_match[bookmaker_name] = {
                         'available': True,
                         'odds': odds,
+                        'quotes': quotes,
                         **extra
                     }
                 else:
@@ -1220,10 +1629,12 @@ class UnifiedOddsCollector:
                     
                     # Add this bookmaker's odds
                     odds = bookmakers[bookmaker_name]['extract_odds'](match_data['raw_data'])
+                    quotes = bookmakers[bookmaker_name]['extract_quotes'](match_data['raw_data'])
                     extra = bookmakers[bookmaker_name]['extra_fields'](match_data)
                     unified_match[bookmaker_name] = {
                         'available': True,
                         'odds': odds,
+                        'quotes': quotes,
                         **extra
                     }
                     
@@ -1333,6 +1744,7 @@ class UnifiedOddsCollector:
         
         return score_info
     
+    @timed_stage('merge_live_data')
     def merge_live_data(self, bet365_matches: List[Dict], 
                         fanduel_matches: List[Dict],
                         xbet_matches: List[Dict]) -> List[Dict]:
@@ -1354,10 +1766,16 @@ class UnifiedOddsCollector:
         matched_fanduel_indices = set()
         matched_xbet_indices = set()
         
+        self.begin_match_cycle()
+        
         print(f"\n Matching {len(bet365_matches)} Bet365, {len(fanduel_matches)} FanDuel, and {len(xbet_matches)} 1xBet live matches...")
         
+        # Large merges are partitioned by sport across worker processes (None = serial)
+        live_picks = self.match_in_sport_shards(
+            'live', {'bet365': bet365_matches, 'fanduel': fanduel_matches, '1xbet': xbet_matches})
+        
         # Try to match each Bet365 live match with FanDuel and 1xBet
-        for bet365_match in bet365_matches:
+        for bet365_idx, bet365_match in enumerate(bet365_matches):
             # Use canonical sport name for consistency
             canonical_sport = self.get_canonical_sport_name(bet365_match['sport'])
             
@@ -1379,7 +1797,8 @@ class UnifiedOddsCollector:
                 'bet365': {
                     'available': True,
                     'live_data': bet365_match['raw_data'],
-                    'odds': self.extract_bet365_odds(bet365_match['raw_data'])
+                    'odds': self.extract_bet365_odds(bet365_match['raw_data']),
+                    'quotes': self.extract_bet365_quotes(bet365_match['raw_data'])
                 },
                 'fanduel': {
                     'available': False,
@@ -1393,51 +1812,55 @@ class UnifiedOddsCollector:
                 }
             }
             
-            # Try to find matching FanDuel match
-            best_fanduel_idx = None
-            best_fanduel_sim = 0.0
+            if live_picks is not None:
+                best_fanduel_idx = live_picks['fanduel'][bet365_idx]
+                best_xbet_idx = live_picks['1xbet'][bet365_idx]
+            else:
+                # Try to find matching FanDuel match
+                best_fanduel_idx = None
+                best_fanduel_sim = 0.0
             
-            for idx, fanduel_match in enumerate(fanduel_matches):
-                if idx in matched_fanduel_indices:
-                    continue
+                for idx, fanduel_match in enumerate(fanduel_matches):
+                    if idx in matched_fanduel_indices:
+                        continue
                 
-                if self.matches_are_same(bet365_match, fanduel_match):
-                    home_sim = self.calculate_name_similarity(
-                        bet365_match['home_team'], 
-                        fanduel_match['home_team']
-                    )
-                    away_sim = self.calculate_name_similarity(
-                        bet365_match['away_team'], 
-                        fanduel_match['away_team']
-                    )
-                    avg_sim = (home_sim + away_sim) / 2
+                    if self.matches_are_same(bet365_match, fanduel_match):
+                        home_sim = self.calculate_name_similarity(
+                            bet365_match['home_team'], 
+                            fanduel_match['home_team']
+                        )
+                        away_sim = self.calculate_name_similarity(
+                            bet365_match['away_team'], 
+                            fanduel_match['away_team']
+                        )
+                        avg_sim = (home_sim + away_sim) / 2
                     
-                    if avg_sim > best_fanduel_sim:
-                        best_fanduel_sim = avg_sim
-                        best_fanduel_idx = idx
+                        if avg_sim > best_fanduel_sim:
+                            best_fanduel_sim = avg_sim
+                            best_fanduel_idx = idx
             
-            # Try to find matching 1xBet match
-            best_xbet_idx = None
-            best_xbet_sim = 0.0
+                # Try to find matching 1xBet match
+                best_xbet_idx = None
+                best_xbet_sim = 0.0
             
-            for idx, xbet_match in enumerate(xbet_matches):
-                if idx in matched_xbet_indices:
-                    continue
+                for idx, xbet_match in enumerate(xbet_matches):
+                    if idx in matched_xbet_indices:
+                        continue
                 
-                if self.matches_are_same(bet365_match, xbet_match):
-                    home_sim = self.calculate_name_similarity(
-                        bet365_match['home_team'], 
-                        xbet_match['home_team']
-                    )
-                    away_sim = self.calculate_name_similarity(
-                        bet365_match['away_team'], 
-                        xbet_match['away_team']
-                    )
-                    avg_sim = (home_sim + away_sim) / 2
+                    if self.matches_are_same(bet365_match, xbet_match):
+                        home_sim = self.calculate_name_similarity(
+                            bet365_match['home_team'], 
+                            xbet_match['home_team']
+                        )
+                        away_sim = self.calculate_name_similarity(
+                            bet365_match['away_team'], 
+                            xbet_match['away_team']
+                        )
+                        avg_sim = (home_sim + away_sim) / 2
                     
-                    if avg_sim > best_xbet_sim:
-                        best_xbet_sim = avg_sim
-                        best_xbet_idx = idx
+                        if avg_sim > best_xbet_sim:
+                            best_xbet_sim = avg_sim
+                            best_xbet_idx = idx
             
             # Add FanDuel match if found
             if best_fanduel_idx is not None:
@@ -1447,7 +1870,8 @@ class UnifiedOddsCollector:
                 unified_match['fanduel'] = {
                     'available': True,
                     'live_data': fanduel_match['raw_data'],
-                    'odds': self.extract_fanduel_odds(fanduel_match['raw_data'])
+                    'odds': self.extract_fanduel_odds(fanduel_match['raw_data']),
+                    'quotes': self.extract_fanduel_quotes(fanduel_match['raw_data'])
                 }
                 
                 # Update score info with FanDuel data (if available and more complete)
@@ -1463,7 +1887,8 @@ class UnifiedOddsCollector:
                 unified_match['1xbet'] = {
                     'available': True,
                     'live_data': xbet_match['raw_data'],
-                    'odds': self.extract_1xbet_odds(xbet_match['raw_data'])
+                    'odds': self.extract_1xbet_odds(xbet_match['raw_data']),
+                    'quotes': self.extract_1xbet_quotes(xbet_match['raw_data'])
                 }
                 
                 # Update score info with 1xBet data (if not already set)
@@ -1505,7 +1930,8 @@ class UnifiedOddsCollector:
                     'fanduel': {
                         'available': True,
                         'live_data': fanduel_match['raw_data'],
-                        'odds': self.extract_fanduel_odds(fanduel_match['raw_data'])
+                        'odds': self.extract_fanduel_odds(fanduel_match['raw_data']),
+                        'quotes': self.extract_fanduel_quotes(fanduel_match['raw_data'])
                     },
                     '1xbet': {
                         'available': False,
@@ -1546,7 +1972,8 @@ class UnifiedOddsCollector:
                     '1xbet': {
                         'available': True,
                         'live_data': xbet_match['raw_data'],
-                        'odds': self.extract_1xbet_odds(xbet_match['raw_data'])
+                        'odds': self.extract_1xbet_odds(xbet_match['raw_data']),
+                        'quotes': self.extract_1xbet_quotes(xbet_match['raw_data'])
                     }
                 }
                 unified_matches.append(unified_match)
@@ -1557,6 +1984,7 @@ class UnifiedOddsCollector:
         print(f"   FanDuel only: {len(fanduel_matches) - len(matched_fanduel_indices)}")
         print(f"   1xBet only: {len(xbet_matches) - len(matched_xbet_indices)}")
         
+        self.end_match_cycle()
         return unified_matches
     
     def collect_and_merge(self):
@@ -1732,6 +2160,7 @@ class UnifiedOddsCollector:
         # Save to file with streaming to reduce memory usage
         print(f"\n Saving unified data to {self.unified_output_file}...")
         self.stream_json_to_file(output, self.unified_output_file)
+        write_sections(output, self.unified_sections_file)
 
         print(f"Unified odds database created successfully!")
         print(f"\n Output file: {self.unified_output_file}")
@@ -1739,6 +2168,7 @@ class UnifiedOddsCollector:
         print(f"   - Live matches: {len(unified_live)}")
         print("="*80)
 
+    @timed_stage('stream_json_to_file')
     def stream_json_to_file(self, data, filepath):
         """Stream JSON to file with atomic write and locking to prevent corruption"""
         import json
@@ -1771,9 +2201,12 @@ class UnifiedOddsCollector:
                     # Sanitize data before writing to prevent JSON errors
                     sanitized_data = self._sanitize_data_for_json(data)
                     
+                    # Serialize once: the same text is written and hashed for the sidecar
+                    content = json.dumps(sanitized_data, indent=2, ensure_ascii=False, allow_nan=False)
+                    
                     # Write to temp file with explicit flush
                     with open(temp_file, 'w', encoding='utf-8') as f:
-                        json.dump(sanitized_data, f, indent=2, ensure_ascii=False, allow_nan=False)
+                        f.write(content)
                         f.flush()
                         os.fsync(f.fileno())  # Force write to disk
                     
@@ -1801,6 +2234,16 @@ class UnifiedOddsCollector:
                     # Atomic replace using os.replace (atomic on Windows and Unix)
                     os.replace(temp_file, filepath)
                     
+                    # Metadata sidecar so monitors never parse the unified file
+                    pregame = sanitized_data.get('pregame_matches') or []
+                    live = sanitized_data.get('live_matches') or []
+                    write_sidecar(filepath, count_by_sport(pregame + live, ('sport',)), content,
+                                  writer='unified_odds_collector',
+                                  extra={'pregame_matches': len(pregame), 'live_matches': len(live)})
+                    unified_matches = METRICS.gauge('odds_unified_matches', 'Matches in the last unified_odds.json write', ('phase',))
+                    unified_matches.set(len(pregame), phase='pregame')
+                    unified_matches.set(len(live), phase='live')
+                    
                     print("[OK] File saved successfully (atomic write with validation)")
                     
                 except Exception as e:
@@ -1845,6 +2288,7 @@ class UnifiedOddsCollector:
 
 
 def main():
+    METRICS.configure('unified')
     collector = UnifiedOddsCollector()
     collector.collect_and_merge()
 
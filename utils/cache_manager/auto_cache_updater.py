@@ -38,7 +38,7 @@ class AutoCacheUpdater:
         
         # Initialize cache manager
         if USE_ENHANCED:
-            self.cache_manager = EnhancedCacheManager(self.base_dir)
+            self.cache_manager = EnhancedCacheManager(self.base_dir, shared=True)
         else:
             self.cache_manager = DynamicCacheManager(self.base_dir)
         
@@ -55,7 +55,7 @@ def _run_cache_update_silent(source_name: str, data_file: Path):
         
         # Initialize and update cache
         if use_enhanced:
-            cache_manager = EnhancedCacheManager(base_dir)
+            cache_manager = EnhancedCacheManager(base_dir, shared=True)
             if data_file.exists():
                 # Update silently (quiet=True)
                 cache_manager.auto_update_from_json(data_file, source_name, quiet=True)
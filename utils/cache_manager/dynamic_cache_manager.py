@@ -26,6 +26,8 @@ class DynamicCacheManager:
         
         # Thread safety for concurrent updates
         self.lock = threading.Lock()
+        # path -> (mtime_ns, size) of the last file version this manager wrote
+        self.written_versions = {}
         
         # Cache structure
         self.cache_data = {
@@ -143,6 +145,8 @@ class DynamicCacheManager:
                 # Save main cache
                 with open(self.cache_file, 'w', encoding='utf-8') as f:
                     json.dump(self.cache_data, f, indent=2, ensure_ascii=False)
+                st = os.stat(self.cache_file)
+                self.written_versions[str(self.cache_file)] = (st.st_mtime_ns, st.st_size)
 
                 # Replicate to subfolders if requested
                 if replicate_to_subfolders:
@@ -17,6 +17,7 @@ from collections import defaultdict
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from utils.mappers.intelligent_name_mapper import IntelligentNameMapper
+from utils.cache_manager.name_cache_snapshot import SharedNameCache, publish_snapshot
 
 
 class EnhancedCacheManager:
@@ -28,13 +29,24 @@ class EnhancedCacheManager:
     - Cross-source name standardization (1xbet, fanduel, bet365)
     - Automatic backup and versioning
     - Thread-safe operations
+    - Lookup tables published as a shared, memory-mapped snapshot (name_cache/)
+
+    With shared=True the manager maps the published snapshot instead of
+    loading the JSON files, answers lookups from it, and loads the full cache
+    only when an update actually has something new to add (releasing it again
+    once saved). Processes that mostly look names up or re-check known teams
+    (monitoring, auto updater, scraper hook) then share one copy of the tables.
     """
     
-    def __init__(self, base_dir: Optional[Path] = None):
+    def __init__(self, base_dir: Optional[Path] = None, shared: bool = False):
         self.base_dir = base_dir or Path(__file__).parent
         self.cache_file = self.base_dir / "cache_data.json"
         self.mappings_file = self.base_dir / "name_mappings.json"
         self.cache_backup_dir = self.base_dir / "cache_backups"
+        self.snapshot_dir = self.base_dir / "name_cache"
+        self.shared = shared
+        self.shared_cache = SharedNameCache(self.snapshot_dir)
+        self._loaded = False
         
         # Create backup directory
         self.cache_backup_dir.mkdir(exist_ok=True)
@@ -42,6 +54,9 @@ class EnhancedCacheManager:
         # Thread safety
         self.lock = threading.Lock()
         
+        # path -> (mtime_ns, size) of the last file version this manager wrote
+        self.written_versions: Dict[str, Tuple[int, int]] = {}
+        
         # Initialize intelligent name mapper
         self.name_mapper = IntelligentNameMapper()
         
@@ -72,10 +87,84 @@ class EnhancedCacheManager:
         self.sport_id_counter = 1
         self.team_id_counter = 1
         
-        # Load existing cache and mappings
+        # Load existing cache and mappings (or map the published snapshot)
+        snapshot = self.shared_cache.current() if shared else None
+        if snapshot is not None and snapshot.meta.get('sources') == self._source_versions():
+            print(f"[OK] Mapped name cache snapshot gen {snapshot.generation}: "
+                  f"{snapshot.meta.get('total_sports', 0)} sports, "
+                  f"{snapshot.meta.get('total_teams', 0)} teams, "
+                  f"{snapshot.count('alias')} aliases ({snapshot.size / 1024:.0f} KB shared)")
+        else:
+            self._ensure_loaded()
+            snapshot = self.shared_cache.current()
+            if snapshot is None or snapshot.meta.get('sources') != self._source_versions():
+                self.publish_snapshot()
+    
+    def _ensure_loaded(self):
+        """Load the full cache and mappings into memory (needed before any update)"""
+        if self._loaded:
+            return
+        self._loaded = True
         self.load_cache()
         self.load_mappings()
     
+    def _release(self):
+        """Drop the in-memory cache after a save in shared mode; lookups go back to the snapshot"""
+        if not self.shared or not self._loaded:
+            return
+        with self.lock:
+            self.cache_data = {'version': '3.0', 'structure': 'enhanced_with_intelligent_mapping',
+                               'sports': {}, 'metadata': {}}
+            self.team_lookup = {}
+            self.sport_lookup = {}
+            self.name_mapper = IntelligentNameMapper()
+            self._loaded = False
+    
+    def _source_versions(self) -> Dict:
+        """(mtime_ns, size) of the files a snapshot is built from"""
+        versions = {}
+        for path in (self.cache_file, self.mappings_file):
+            try:
+                stat = path.stat()
+                versions[path.name] = [stat.st_mtime_ns, stat.st_size]
+            except OSError:
+                versions[path.name] = None
+        return versions
+    
+    def publish_snapshot(self) -> bool:
+        """Publish the current lookup tables for other processes to map"""
+        if not self._loaded:
+            return False
+        try:
+            sports = self.cache_data['sports']
+            metadata = self.cache_data.get('metadata', {})
+            tables = {
+                'alias': self.name_mapper.alias_to_canonical,
+                'normalized': self.name_mapper.normalized_to_canonical,
+                'canonical': dict.fromkeys(self.name_mapper.canonical_names),
+                'team': self.team_lookup,
+                'sport': self.sport_lookup,
+                'sports': dict.fromkeys(sports),
+                'sport_team': {f"{sport}\x1f{team}": None
+                               for sport, sport_data in sports.items() for team in sport_data.get('teams', {})},
+            }
+            meta = {
+                'sources': self._source_versions(),
+                'cache_version': self.cache_data.get('version'),
+                'total_sports': len(sports),
+                'total_teams': sum(len(s.get('teams', {})) for s in sports.values()),
+                'total_aliases': len(self.name_mapper.alias_to_canonical),
+                'mapper_canonical_names': len(self.name_mapper.canonical_names),
+                'dedup_stats': metadata.get('dedup_stats', {}),
+                'last_updated': metadata.get('last_updated'),
+            }
+            publish_snapshot(self.snapshot_dir, tables, meta)
+            self.shared_cache.refresh()
+            return True
+        except Exception as e:
+            print(f"[WARN] Name cache snapshot not published: {e}")
+            return False
+    
     def load_cache(self) -> bool:
         """Load existing cache from disk"""
         try:
@@ -131,6 +220,8 @@ class EnhancedCacheManager:
     
     def save_cache(self, create_backup: bool = True) -> bool:
         """Save cache to disk with optional backup"""
+        if not self._loaded:
+            return True  # mapped snapshot only - nothing changed in this process
         with self.lock:
             try:
                 # Update metadata
@@ -154,6 +245,7 @@ class EnhancedCacheManager:
                 # Save main cache
                 with open(self.cache_file, 'w', encoding='utf-8') as f:
                     json.dump(self.cache_data, f, indent=2, ensure_ascii=False)
+                self._record_write(self.cache_file)
                 
                 # Replicate to subfolders
                 for subfolder in ['1xbet', 'bet365', 'fanduel']:
@@ -167,12 +259,24 @@ class EnhancedCacheManager:
                 print(f"[ERROR] Error saving cache: {e}")
                 return False
     
+    def _record_write(self, path: Path):
+        """Remember the version of a file this manager just wrote (see written_versions)"""
+        try:
+            st = os.stat(path)
+            self.written_versions[str(path)] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            pass
+    
     def save_mappings(self) -> bool:
-        """Save name mappings to disk"""
+        """Save name mappings to disk and publish the lookup snapshot"""
+        if not self._loaded:
+            return True
         try:
             mappings = self.name_mapper.export_mappings()
             with open(self.mappings_file, 'w', encoding='utf-8') as f:
                 json.dump(mappings, f, indent=2, ensure_ascii=False)
+            self._record_write(self.mappings_file)
+            self.publish_snapshot()
             return True
         except Exception as e:
             print(f"[ERROR] Error saving mappings: {e}")
@@ -292,6 +396,12 @@ class EnhancedCacheManager:
         if not team_name:
             return team_name
         
+        if not self._loaded:
+            snapshot = self.shared_cache.current()
+            if snapshot is not None:
+                return self._snapshot_team_name(snapshot, team_name)
+            self._ensure_loaded()
+        
         # Try name mapper first
         canonical = self.name_mapper.get_canonical_name(team_name)
         
@@ -309,8 +419,45 @@ class EnhancedCacheManager:
             return sport_name
         
         normalized = self.name_mapper.normalize_string(sport_name)
+        if not self._loaded:
+            snapshot = self.shared_cache.current()
+            if snapshot is not None:
+                return snapshot.get('sport', normalized, sport_name)
+            self._ensure_loaded()
         return self.sport_lookup.get(normalized, sport_name)
     
+    def _snapshot_team_name(self, snapshot, team_name: str) -> str:
+        """get_canonical_team_name answered from a mapped snapshot"""
+        # IntelligentNameMapper.get_canonical_name
+        canonical = snapshot.get('alias', team_name.lower())
+        if canonical is None:
+            normalized = self.name_mapper.normalize_string(team_name)
+            canonical = snapshot.get('normalized', normalized)
+            if canonical is None:
+                pattern_canonical = self.name_mapper.team_name_patterns.get(normalized)
+                if pattern_canonical is not None and snapshot.contains('canonical', pattern_canonical):
+                    canonical = pattern_canonical
+                else:
+                    canonical = team_name
+        
+        # Then the team index
+        if canonical == team_name:
+            found = snapshot.get('team', self.name_mapper.normalize_string(team_name))
+            if found is not None:
+                canonical = found[1]
+        return canonical
+    
+    def _is_known_team(self, snapshot, sport: str, team_name: str) -> bool:
+        """True if add_or_update_team would resolve team_name to an existing team (no new entry)"""
+        if self.name_mapper.is_esports_or_virtual(team_name):
+            return True
+        sport_canonical = self.get_canonical_sport_name(sport)
+        if not snapshot.contains('sports', sport_canonical):
+            return False
+        existing = self._snapshot_team_name(snapshot, team_name)
+        return (snapshot.contains('sport_team', f"{sport_canonical}\x1f{existing}") or
+                snapshot.contains('sport_team', f"{sport_canonical}\x1f{team_name}"))
+    
     def add_or_update_team(self, sport: str, team_name: str, source: str = "", 
                           aliases: Optional[List[str]] = None) -> Tuple[str, bool]:
         """
@@ -318,6 +465,7 @@ class EnhancedCacheManager:
         Automatically filters out esports/virtual/simulation teams
         Returns: (canonical_name, was_created)
         """
+        self._ensure_loaded()
         with self.lock:
             # Filter out esports/virtual teams
             if self.name_mapper.is_esports_or_virtual(team_name):
@@ -499,6 +647,28 @@ class EnhancedCacheManager:
                         game['sport'] = game.get('sport', sport_name)
                         matches.append(game)
             
+            # Shared mode: only load the full cache if some team is not in the snapshot yet
+            snapshot = None if self._loaded else self.shared_cache.current()
+            if snapshot is not None:
+                has_new = False
+                for match in matches:
+                    sport = match.get('sport') or match.get('sport_name', '')
+                    home = match.get('home_team') or match.get('team1', '')
+                    away = match.get('away_team') or match.get('team2', '')
+                    if self.name_mapper.is_esports_or_virtual(match.get('home_team', match.get('team1', ''))) or \
+                            self.name_mapper.is_esports_or_virtual(match.get('away_team', match.get('team2', ''))):
+                        summary['esports_filtered'] += 1
+                        continue
+                    summary['matches_processed'] += 1
+                    if sport and home and away and not has_new:
+                        has_new = not (self._is_known_team(snapshot, sport, home) and
+                                       self._is_known_team(snapshot, sport, away))
+                if not has_new:
+                    summary['success'] = True
+                    return summary
+                summary['matches_processed'] = summary['esports_filtered'] = 0
+            self._ensure_loaded()
+            
             # Process matches
             teams_before = self.cache_data['metadata']['total_teams']
             sports_before = self.cache_data['metadata']['total_sports']
@@ -533,6 +703,7 @@ class EnhancedCacheManager:
                           f"+{summary['new_teams']} teams, "
                           f"+{summary['new_sports']} sports, "
                           f"{summary['esports_filtered']} esports filtered")
+                self._release()
             
             summary['success'] = True
             return summary
@@ -547,6 +718,7 @@ class EnhancedCacheManager:
         Intelligent cleanup and deduplication using name mapper
         Returns summary of operations
         """
+        self._ensure_loaded()
         with self.lock:
             summary = {
                 'duplicates_merged': 0,
@@ -624,6 +796,21 @@ class EnhancedCacheManager:
     
     def get_stats(self) -> Dict:
         """Get comprehensive statistics"""
+        snapshot = None if self._loaded else self.shared_cache.current()
+        if snapshot is not None:
+            meta = snapshot.meta
+            return {
+                'cache_version': meta.get('cache_version'),
+                'total_sports': meta.get('total_sports', 0),
+                'total_teams': meta.get('total_teams', 0),
+                'total_aliases': meta.get('total_aliases', 0),
+                'mapper_canonical_names': meta.get('mapper_canonical_names', 0),
+                'mapper_total_aliases': snapshot.count('alias'),
+                'dedup_stats': meta.get('dedup_stats', {}),
+                'last_updated': meta.get('last_updated'),
+                'snapshot_generation': snapshot.generation
+            }
+        self._ensure_loaded()
         mapper_stats = self.name_mapper.get_mapping_stats()
         
         return {
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Name Cache Snapshot - Read-only, memory-mapped name tables shared across processes
+
+EnhancedCacheManager publishes its lookup tables (team/sport indices and the
+IntelligentNameMapper alias tables) as one versioned binary file. Every other
+process maps that file read-only instead of parsing cache_data.json and
+name_mappings.json and building its own dicts, so the tables exist once in
+the page cache rather than once per process.
+
+Layout of a snapshot file (little-endian):
+
+    header      magic b'ONCS', format, table count, generation, created,
+                meta length, string pool offset and length
+    meta        JSON: source file versions, counts
+    directory   per table: name, slot count, entry count, slot offset
+    slots       per table: open-addressed hash table (load factor <= 0.7),
+                16-byte slots: crc32, key, up to two values (pool offsets)
+    pool        length-prefixed UTF-8 strings, each stored once
+
+Publishing is atomic: the writer writes `gen-<generation>-<pid>.bin` and
+then replaces the `current` pointer file. Readers re-read the pointer at
+most every `check_interval` seconds and swap to the new mapping; a mapping
+in use is never modified or truncated, which also keeps the swap working on
+Windows, where a mapped file cannot be replaced.
+
+    publish_snapshot(snapshot_dir, tables, meta)          # writer
+    cache = SharedNameCache(snapshot_dir)                  # readers
+    snap = cache.current()
+    snap.get('alias', 'man utd')  -> 'Manchester United'
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+MAGIC = b'ONCS'
+FORMAT_VERSION = 1
+POINTER_FILE = 'current'
+
+_HEADER = struct.Struct('<4sHHQdIIQQ')     # magic, format, n_tables, generation, created, meta_len, pad, pool_off, pool_len
+_DIR_ENTRY = struct.Struct('<16sIIQ')       # name, slots, count, slots offset
+_SLOT = struct.Struct('<IIII')              # crc32, key, value 1, value 2 (pool offsets)
+_LENGTH = struct.Struct('<H')
+_EMPTY = 0xFFFFFFFF
+_LOAD_FACTOR = 0.7
+
+# A table value: None (set membership), a string, or a (string, string) pair
+Value = Union[None, str, Tuple[str, str]]
+
+
+def _align(n: int, to: int = 8) -> int:
+    return (n + to - 1) // to * to
+
+
+def build_snapshot(tables: Dict[str, Dict[str, Value]], generation: int, meta: Optional[Dict] = None) -> bytes:
+    """
+    Serialise tables into snapshot bytes
+
+    Args:
+        tables: table name -> {key: value}; a value is None, a string or a pair of strings
+        generation: Version number stored in the header
+        meta: JSON-serialisable metadata stored alongside the tables
+
+    Returns:
+        The snapshot file contents
+    """
+    pool = bytearray()
+    pool_index: Dict[bytes, int] = {}
+
+    def intern(text: str) -> int:
+        data = text.encode('utf-8')
+        offset = pool_index.get(data)
+        if offset is None:
+            if len(data) > 0xFFFF:
+                raise ValueError(f"Name too long for snapshot: {text[:40]}...")
+            offset = pool_index[data] = len(pool)
+            pool.extend(_LENGTH.pack(len(data)))
+            pool.extend(data)
+        return offset
+
+    meta_bytes = json.dumps(meta or {}, ensure_ascii=False, sort_keys=True).encode('utf-8')
+    offset = _align(_HEADER.size + len(meta_bytes) + _DIR_ENTRY.size * len(tables))
+
+    directory, slot_blobs = [], []
+    for name, entries in tables.items():
+        slots = max(8, int(len(entries) / _LOAD_FACTOR) + 1)
+        blob = bytearray(_SLOT.pack(0, _EMPTY, _EMPTY, _EMPTY) * slots)
+        for key, value in entries.items():
+            crc = zlib.crc32(key.encode('utf-8'))
+            v1 = v2 = _EMPTY
+            if isinstance(value, tuple):
+                v1, v2 = intern(value[0]), intern(value[1])
+            elif value is not None:
+                v1 = intern(value)
+            i = crc % slots
+            while struct.unpack_from('<I', blob, i * _SLOT.size + 4)[0] != _EMPTY:
+                i = (i + 1) % slots
+            _SLOT.pack_into(blob, i * _SLOT.size, crc, intern(key), v1, v2)
+        directory.append(_DIR_ENTRY.pack(name.encode('utf-8')[:16], slots, len(entries), offset))
+        slot_blobs.append(blob)
+        offset += len(blob)
+
+    pool_offset = offset
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, len(tables), generation, time.time(),
+                          len(meta_bytes), 0, pool_offset, len(pool))
+    out = bytearray(header + meta_bytes + b''.join(directory))
+    out.extend(b'\0' * (_align(len(out)) - len(out)))
+    for blob in slot_blobs:
+        out.extend(blob)
+    out.extend(pool)
+    return bytes(out)
+
+
+def read_pointer(snapshot_dir: Path) -> Optional[str]:
+    """File name of the current snapshot, or None if nothing is published"""
+    try:
+        return (Path(snapshot_dir) / POINTER_FILE).read_text(encoding='utf-8').strip() or None
+    except OSError:
+        return None
+
+
+def publish_snapshot(snapshot_dir: Path, tables: Dict[str, Dict[str, Value]], meta: Optional[Dict] = None,
+                     keep: int = 3) -> Path:
+    """
+    Write a new snapshot generation and point readers at it
+
+    Args:
+        snapshot_dir: Directory holding the snapshots and the `current` pointer
+        tables: See build_snapshot
+        meta: Metadata stored in the snapshot
+        keep: Older generations to keep for readers that have not swapped yet
+
+    Returns:
+        Path of the published snapshot
+    """
+    snapshot_dir = Path(snapshot_dir)
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+
+    generation = 1
+    current = read_pointer(snapshot_dir)
+    if current:
+        try:
+            generation = NameCacheSnapshot(snapshot_dir / current).generation + 1
+        except (OSError, ValueError):
+            pass
+
+    path = snapshot_dir / f"gen-{generation:08d}-{os.getpid()}.bin"
+    tmp = path.with_suffix('.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(build_snapshot(tables, generation, meta))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+    pointer_tmp = snapshot_dir / f"{POINTER_FILE}.{os.getpid()}.tmp"
+    pointer_tmp.write_text(path.name, encoding='utf-8')
+    os.replace(pointer_tmp, snapshot_dir / POINTER_FILE)
+
+    # Prune old generations; a file still mapped elsewhere (Windows) is retried next time
+    old = sorted((p for p in snapshot_dir.glob('gen-*.bin') if p != path), key=lambda p: p.name)
+    for stale in old[:-keep] if keep else old:
+        try:
+            stale.unlink()
+        except OSError:
+            pass
+    return path
+
+
+class NameCacheSnapshot:
+    """One read-only snapshot file, memory-mapped"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        mm = self._mm
+        if len(mm) < _HEADER.size:
+            raise ValueError(f"Truncated name cache snapshot: {self.path}")
+        (magic, fmt, n_tables, self.generation, self.created, meta_len, _,
+         self._pool, pool_len) = _HEADER.unpack_from(mm, 0)
+        if magic != MAGIC or fmt != FORMAT_VERSION:
+            raise ValueError(f"Not a v{FORMAT_VERSION} name cache snapshot: {self.path}")
+        if self._pool + pool_len > len(mm):
+            raise ValueError(f"Truncated name cache snapshot: {self.path}")
+        self.meta = json.loads(mm[_HEADER.size:_HEADER.size + meta_len].decode('utf-8'))
+
+        self.tables: Dict[str, Tuple[int, int, int]] = {}   # name -> (slots offset, slots, count)
+        offset = _HEADER.size + meta_len
+        for _ in range(n_tables):
+            name, slots, count, slots_offset = _DIR_ENTRY.unpack_from(mm, offset)
+            self.tables[name.rstrip(b'\0').decode('utf-8')] = (slots_offset, slots, count)
+            offset += _DIR_ENTRY.size
+
+    def _slot(self, table: str, key: str):
+        entry = self.tables.get(table)
+        if entry is None:
+            return None
+        base, slots, _ = entry
+        key_bytes = key.encode('utf-8')
+        crc = zlib.crc32(key_bytes)
+        mm, pool = self._mm, self._pool
+        i = crc % slots
+        while True:
+            slot = _SLOT.unpack_from(mm, base + i * _SLOT.size)
+            if slot[1] == _EMPTY:
+                return None
+            if slot[0] == crc:
+                start = pool + slot[1]
+                length = _LENGTH.unpack_from(mm, start)[0]
+                if mm[start + 2:start + 2 + length] == key_bytes:
+                    return slot
+            i = (i + 1) % slots
+
+    def _text(self, offset: int) -> str:
+        start = self._pool + offset
+        length = _LENGTH.unpack_from(self._mm, start)[0]
+        return self._mm[start + 2:start + 2 + length].decode('utf-8')
+
+    def get(self, table: str, key: str, default: Value = None) -> Value:
+        """Value stored for key (string or pair), or default"""
+        slot = self._slot(table, key)
+        if slot is None or slot[2] == _EMPTY:
+            return default
+        if slot[3] != _EMPTY:
+            return self._text(slot[2]), self._text(slot[3])
+        return self._text(slot[2])
+
+    def contains(self, table: str, key: str) -> bool:
+        return self._slot(table, key) is not None
+
+    def count(self, table: str) -> int:
+        entry = self.tables.get(table)
+        return entry[2] if entry else 0
+
+    def items(self, table: str) -> Iterable[Tuple[str, Value]]:
+        """All (key, value) pairs of a table, in slot order"""
+        entry = self.tables.get(table)
+        if entry is None:
+            return
+        base, slots, _ = entry
+        for i in range(slots):
+            slot = _SLOT.unpack_from(self._mm, base + i * _SLOT.size)
+            if slot[1] == _EMPTY:
+                continue
+            key = self._text(slot[1])
+            if slot[2] == _EMPTY:
+                yield key, None
+            elif slot[3] != _EMPTY:
+                yield key, (self._text(slot[2]), self._text(slot[3]))
+            else:
+                yield key, self._text(slot[2])
+
+    @property
+    def size(self) -> int:
+        return len(self._mm)
+
+
+class SharedNameCache:
+    """
+    The current snapshot of a snapshot directory, swapped when a writer publishes
+
+    current() costs an attribute read between checks; every `check_interval`
+    seconds it re-reads the pointer file and maps the new generation if it
+    changed. The previous mapping is released once no caller holds it.
+    """
+
+    def __init__(self, snapshot_dir: Path, check_interval: float = 1.0):
+        self.snapshot_dir = Path(snapshot_dir)
+        self.check_interval = check_interval
+        self._snapshot: Optional[NameCacheSnapshot] = None
+        self._name: Optional[str] = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+        self.swaps = 0
+
+    def current(self) -> Optional[NameCacheSnapshot]:
+        """Latest published snapshot, or None if none is published (or readable)"""
+        now = time.monotonic()
+        if now - self._checked >= self.check_interval or self._snapshot is None:
+            self.refresh(now)
+        return self._snapshot
+
+    def refresh(self, now: Optional[float] = None) -> bool:
+        """Re-read the pointer now; True if a new generation was mapped"""
+        with self._lock:
+            self._checked = time.monotonic() if now is None else now
+            name = read_pointer(self.snapshot_dir)
+            if not name or name == self._name:
+                return False
+            try:
+                snapshot = NameCacheSnapshot(self.snapshot_dir / name)
+            except (OSError, ValueError) as e:
+                print(f"[WARN] Name cache snapshot {name} not usable: {e}")
+                return False
+            self._snapshot, self._name = snapshot, name   # single reference swap
+            self.swaps += 1
+            return True
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Inspect a name cache snapshot directory')
+    parser.add_argument('snapshot_dir', type=Path, help='Directory with the `current` pointer')
+    parser.add_argument('--get', nargs=2, metavar=('TABLE', 'KEY'), help='Look up one key')
+    args = parser.parse_args()
+
+    snap = SharedNameCache(args.snapshot_dir).current()
+    if snap is None:
+        print(f"[WARN] No snapshot published in {args.snapshot_dir}")
+        sys.exit(1)
+    if args.get:
+        print(json.dumps(snap.get(*args.get), ensure_ascii=False))
+        return
+    print(f"[OK] {snap.path.name}: generation {snap.generation}, {snap.size / 1024:.1f} KB")
+    for name in snap.tables:
+        print(f"  {name:<12} {snap.count(name):8d} entries")
+    print(json.dumps(snap.meta, indent=2, ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    main()
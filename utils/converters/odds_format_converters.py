@@ -1,10 +1,23 @@
 """
 Odds Format Converters - Convert unified odds data to OpticOdds and Eternity formats
 Supports: 1xBet, FanDuel, Bet365
+
+Bookmaker entries carrying typed 'quotes' rows (see utils.helpers.odds_model)
+are converted straight from numbers; the legacy string 'odds' dict is only
+parsed for data written before quotes existed.
 """
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+from utils.helpers.odds_model import sorted_rows, format_american, format_line
+
+# Market labels for typed quotes
+OPTIC_MARKET_NAMES = {
+    'moneyline': 'Moneyline',
+    'spread': 'Point Spread',
+    'total': 'Total Points',
+}
+
 
 class OpticOddsConverter:
     """Convert odds data to OpticOdds API format"""
@@ -59,7 +72,8 @@ class OpticOddsConverter:
             # Handle nested odds structure: 1xbet.odds.moneyline_home OR direct: 1xbet.moneyline_home
             xbet_odds = xbet_data.get('odds', xbet_data)
             odds.extend(OpticOddsConverter._convert_bookmaker_odds(
-                match_id, '1xBet', xbet_odds, home_team, away_team, timestamp
+                match_id, '1xBet', xbet_odds, home_team, away_team, timestamp,
+                quotes=xbet_data.get('quotes')
             ))
         
         # Process FanDuel odds
@@ -68,7 +82,8 @@ class OpticOddsConverter:
             # Handle nested odds structure
             fd_odds = fd_data.get('odds', fd_data)
             odds.extend(OpticOddsConverter._convert_bookmaker_odds(
-                match_id, 'FanDuel', fd_odds, home_team, away_team, timestamp
+                match_id, 'FanDuel', fd_odds, home_team, away_team, timestamp,
+                quotes=fd_data.get('quotes')
             ))
         
         # Process Bet365 odds
@@ -77,7 +92,8 @@ class OpticOddsConverter:
             # Handle nested odds structure OR direct fields (home_odds, away_odds)
             b365_odds = b365_data.get('odds', b365_data)
             odds.extend(OpticOddsConverter._convert_bookmaker_odds(
-                match_id, 'Bet365', b365_odds, home_team, away_team, timestamp
+                match_id, 'Bet365', b365_odds, home_team, away_team, timestamp,
+                quotes=b365_data.get('quotes')
             ))
         
         # Safely get sport and league IDs
@@ -123,10 +139,70 @@ class OpticOddsConverter:
         
         return game_obj
     
+    @staticmethod
+    def _convert_quotes(match_id: str, sportsbook: str, quotes: List[list], betlink: str,
+                        home_team: str, away_team: str, timestamp: float) -> List[Dict]:
+        """Convert typed quote rows to OpticOdds format (no string parsing)"""
+        odds_list = []
+        book_id = sportsbook.lower()
+        
+        for market, side, line, american, _decimal in sorted_rows(quotes):
+            if american is None:
+                continue
+            
+            if market == 'moneyline':
+                if side == 'draw':
+                    name = selection = 'Draw'
+                else:
+                    name = selection = home_team if side == 'home' else away_team
+                selection_line = None
+                grouping_key = "default"
+            elif market in ('spread', 'total') and line is not None:
+                line_text = format_line(line)
+                grouping_key = f"default:{line_text}"
+                if market == 'spread':
+                    selection = home_team if side == 'home' else away_team
+                    name = f"{selection} {format_line(line, signed=True)}"
+                    selection_line = None
+                else:
+                    selection = ""
+                    name = f"{side.capitalize()} {line_text}"
+                    selection_line = side
+            else:
+                continue
+            
+            odds_list.append({
+                "id": f"{match_id}:{book_id}:{market}:{side}",
+                "sportsbook": sportsbook,
+                "market": OPTIC_MARKET_NAMES.get(market, market),
+                "name": name,
+                "is_main": True,
+                "selection": selection,
+                "normalized_selection": selection.lower().replace(' ', '_'),
+                "market_id": market,
+                "selection_line": selection_line,
+                "player_id": None,
+                "team_id": None,
+                "price": american,
+                "timestamp": timestamp,
+                "grouping_key": grouping_key,
+                "points": line if market != 'moneyline' else None,
+                "betlink": betlink,
+                "limits": None
+            })
+        
+        return odds_list
+    
     @staticmethod
     def _convert_bookmaker_odds(match_id: str, sportsbook: str, odds_data: Dict, 
-                                home_team: str, away_team: str, timestamp: float) -> List[Dict]:
+                                home_team: str, away_team: str, timestamp: float,
+                                quotes: Optional[List[list]] = None) -> List[Dict]:
         """Convert bookmaker odds to OpticOdds format"""
+        if quotes is not None:
+            return OpticOddsConverter._convert_quotes(
+                match_id, sportsbook, quotes, odds_data.get('url', ''), home_team, away_team, timestamp
+            )
+        
         odds_list = []
         
         # Helper to convert odds string to integer
@@ -435,6 +511,42 @@ class EternityFormatConverter:
                 odds_data = bookmaker_data.get('odds', bookmaker_data)
                 betlink = bookmaker_data.get('url', '')
                 
+                # Typed quotes: numbers rendered to display strings only here
+                if bookmaker_data.get('quotes') is not None:
+                    for market, side, line, american, _decimal in sorted_rows(bookmaker_data['quotes']):
+                        if american is None or side == 'draw':
+                            continue
+                        if market == 'total':
+                            bet_team = None
+                            bet_occurence = side.capitalize()
+                        else:
+                            bet_team = home_team if side == 'home' else away_team
+                            bet_occurence = None
+                        bets.append({
+                            "league": league,
+                            "limit": None,
+                            "tournament": None,
+                            "start_date": iso_date,
+                            "book": book_name,
+                            "bet_player": None,
+                            "sgp": None,
+                            "is_main": True,
+                            "away_brief": away_brief,
+                            "line": line if market != 'moneyline' else None,
+                            "am_odds": format_american(american),
+                            "home_short": home_brief,
+                            "bet_team": bet_team,
+                            "home": home_team,
+                            "market": OPTIC_MARKET_NAMES.get(market, market),
+                            "bet_occurence": bet_occurence,
+                            "internal_betlink": betlink,
+                            "away_short": away_brief,
+                            "home_brief": home_brief,
+                            "away": away_team,
+                            "betlink": betlink
+                        })
+                    continue
+                
                 # Moneyline bets
                 if odds_data.get('moneyline_home') is not None:
                     bets.append({
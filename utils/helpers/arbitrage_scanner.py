@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Arbitrage Scanner
+Best available price, bookmaker margin and cross-book arbitrage over merged matches.
+
+Each merged match's typed quotes (see odds_model) are first laid out as a
+compact per-match layout:
+
+    {'books': [...], 'groups': [[market, line, three_way], ...],
+     'cells': [group * books * 3 + book * 3 + outcome, ...], 'prices': [decimal, ...]}
+
+The scan concatenates those per-match columns and scatters them into one
+NumPy array:
+
+    prices[group, book, outcome]   (decimal odds, NaN where missing)
+
+where a group is one (match, market, line) and the outcome axis is
+(home/over, draw, away/under). Best prices, per-book overround and arbitrage
+are then computed in a single vectorized pass over all groups. Layouts are
+built by the scan itself and never stored in unified_odds.json; the viewer
+runs one scan per file version and serves every request from its result.
+"""
+
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from utils.helpers.odds_model import quotes_from_odds, pack_quotes, decimal_to_american
+
+BOOKS = ('bet365', 'fanduel', '1xbet')
+
+# market -> side -> (outcome axis position, kind); kind 0 = moneyline, 1 = lined, 2 = negated line
+# Outcome axis is (home/over, draw, away/under)
+OUTCOME_INFO = {
+    'moneyline': {'home': (0, 0), 'draw': (1, 0), 'away': (2, 0)},
+    'spread': {'home': (0, 1), 'away': (2, 2)},
+    'total': {'over': (0, 1), 'under': (2, 1)},
+}
+
+# Sports whose moneyline is 1X2 - a home/away-only book can never form an arbitrage there
+DRAW_SPORTS = {'soccer', 'handball', 'futsal', 'rugby', 'rugby union', 'rugby league'}
+
+OUTCOME_NAMES = {
+    'moneyline': ('home', 'draw', 'away'),
+    'spread': ('home', None, 'away'),
+    'total': ('over', None, 'under'),
+}
+
+
+class ScanResult:
+    """Columnar scan output; materializes JSON only for the rows requested"""
+
+    def __init__(self, groups: List[list], group_match, matches: List[Dict], books: tuple,
+                 prices, best, best_book, book_margin, best_sum, complete, required,
+                 scan_ms: float, layout_ms: float = 0.0):
+        self.groups = groups          # [market, line, three_way]
+        self.group_match = group_match
+        self.matches = matches
+        self.books = books
+        self.prices = prices
+        self.best = best
+        self.best_book = best_book
+        self.book_margin = book_margin
+        self.best_sum = best_sum
+        self.complete = complete
+        self.required = required
+        self.scan_ms = scan_ms
+        self.layout_ms = layout_ms
+        self.generated_at = datetime.now().isoformat()
+
+        self.arbitrage = complete & (best_sum < 1.0)
+        self.arbitrage_idx = np.flatnonzero(self.arbitrage)
+        # Highest profit first
+        self.arbitrage_idx = self.arbitrage_idx[np.argsort(best_sum[self.arbitrage_idx], kind='stable')]
+
+    def _match_info(self, group: int) -> Dict[str, Any]:
+        market, line = self.groups[group][:2]
+        match = self.matches[int(self.group_match[group])]
+        return {
+            'match_id': match.get('match_id') or match.get('game_id'),
+            'sport': match.get('sport'),
+            'league': match.get('league'),
+            'home_team': match.get('home_team'),
+            'away_team': match.get('away_team'),
+            'is_live': match.get('is_live', False),
+            'market': market,
+            'line': line,
+        }
+
+    def _outcomes(self, group: int, with_stakes: bool = False) -> List[Dict[str, Any]]:
+        market = self.groups[group][0]
+        names = OUTCOME_NAMES[market]
+        outcomes = []
+        total_inverse = float(self.best_sum[group])
+        for o, name in enumerate(names):
+            if name is None or not self.required[group, o]:
+                continue
+            price = float(self.best[group, o])
+            if price != price:  # NaN - outcome not priced by any book
+                outcomes.append({'outcome': name, 'book': None, 'decimal': None, 'american': None})
+                continue
+            entry = {
+                'outcome': name,
+                'book': self.books[int(self.best_book[group, o])],
+                'decimal': round(price, 4),
+                'american': decimal_to_american(price),
+            }
+            if with_stakes:
+                entry['stake_pct'] = round((1 / price) / total_inverse * 100, 2)
+            outcomes.append(entry)
+        return outcomes
+
+    def _book_margins(self, group: int) -> Dict[str, Optional[float]]:
+        margins = {}
+        for b, book in enumerate(self.books):
+            margin = float(self.book_margin[group, b])
+            margins[book] = None if margin != margin else round(margin * 100, 2)
+        return margins
+
+    def opportunities(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Arbitrage opportunities, most profitable first"""
+        idx = self.arbitrage_idx if limit is None else self.arbitrage_idx[:limit]
+        result = []
+        for group in idx.tolist():
+            entry = self._match_info(group)
+            entry['profit_pct'] = round((1 / float(self.best_sum[group]) - 1) * 100, 3)
+            entry['legs'] = self._outcomes(group, with_stakes=True)
+            result.append(entry)
+        return result
+
+    def best_prices(self, offset: int = 0, limit: int = 100, sport: Optional[str] = None,
+                    market: Optional[str] = None) -> Dict[str, Any]:
+        """Best price per outcome with market margin, paginated and filtered"""
+        selected = range(len(self.groups))
+        if sport or market:
+            sport_lower = sport.lower() if sport else None
+            selected = [
+                g for g in selected
+                if (market is None or self.groups[g][0] == market)
+                and (sport_lower is None or (self.matches[self.group_match[g]].get('sport') or '').lower() == sport_lower)
+            ]
+        total = len(selected)
+        rows = []
+        for group in list(selected)[offset:offset + limit]:
+            entry = self._match_info(group)
+            entry['outcomes'] = self._outcomes(group)
+            entry['margin_pct'] = round((float(self.best_sum[group]) - 1) * 100, 3) if self.complete[group] else None
+            entry['book_margin_pct'] = self._book_margins(group)
+            entry['arbitrage'] = bool(self.arbitrage[group])
+            rows.append(entry)
+        return {'total': total, 'offset': offset, 'limit': limit, 'items': rows}
+
+    def summary(self) -> Dict[str, Any]:
+        """Counts and average per-book margins"""
+        avg_margin = {}
+        for b, book in enumerate(self.books):
+            column = self.book_margin[:, b]
+            column = column[~np.isnan(column)]
+            avg_margin[book] = round(float(column.mean()) * 100, 3) if column.size else None
+        return {
+            'generated_at': self.generated_at,
+            'scan_ms': round(self.scan_ms, 2),
+            'layout_ms': round(self.layout_ms, 2),
+            'matches_scanned': len(self.matches),
+            'markets_scanned': len(self.groups),
+            'complete_markets': int(self.complete.sum()),
+            'arbitrage_count': int(self.arbitrage_idx.size),
+            'avg_book_margin_pct': avg_margin,
+        }
+
+
+def _match_quotes(entry: Dict) -> List[list]:
+    quotes = entry.get('quotes')
+    if quotes is None:
+        # Unified files written before typed quotes existed
+        quotes = pack_quotes(quotes_from_odds(entry.get('odds') or {}))
+    return quotes
+
+
+def build_scan_layout(match: Dict, books: tuple = BOOKS) -> Dict[str, Any]:
+    """
+    Lay one merged match's quotes out for the scanner
+
+    Groups are numbered locally, in first-seen order across books; the scan
+    offsets them when it concatenates matches.
+
+    Args:
+        match: Unified match with per-book 'quotes' (or legacy 'odds')
+        books: Bookmaker keys, in price-array order
+
+    Returns:
+        {'books', 'groups', 'cells', 'prices'}
+    """
+    groups: List[list] = []
+    cells: List[int] = []
+    prices: List[float] = []
+    push_cell = cells.append
+    push_price = prices.append
+    local: Dict[Any, int] = {}  # group key -> local group index
+    outcome_info = OUTCOME_INFO
+    stride = len(books) * 3
+    draw_sport = (match.get('sport') or '').lower() in DRAW_SPORTS
+
+    for b, book in enumerate(books):
+        entry = match.get(book)
+        if not entry or not entry.get('available'):
+            continue
+        offset = b * 3
+        quotes = entry.get('quotes')
+        if quotes is None:
+            quotes = _match_quotes(entry)
+        for market, side, line, _american, decimal in quotes:
+            sides = outcome_info.get(market)
+            if sides is None:
+                continue
+            info = sides.get(side)
+            if info is None or not decimal or decimal <= 1:
+                continue
+            o, kind = info
+            if kind == 0:        # moneyline - no line
+                key = market
+                line = None
+            elif line is None:
+                continue
+            else:
+                if kind == 2:    # spread away: +1.5 pairs with home -1.5
+                    line = -line
+                key = (market, line)
+            g = local.get(key)
+            if g is None:
+                g = local[key] = len(groups)
+                groups.append([market, line, draw_sport and kind == 0])
+            if o == 1:
+                groups[g][2] = True
+            push_cell(g * stride + offset + o)
+            push_price(decimal)
+
+    return {'books': list(books), 'groups': groups, 'cells': cells, 'prices': prices}
+
+
+def scan_matches(matches: Iterable[Dict], books: tuple = BOOKS) -> ScanResult:
+    """
+    Run one vectorized best-price / margin / arbitrage pass
+
+    Args:
+        matches: Unified matches (pregame and/or live)
+        books: Bookmaker keys to compare
+
+    Returns:
+        ScanResult
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy is required for the arbitrage scanner (pip install numpy)")
+
+    start = time.perf_counter()
+    matches = list(matches)
+
+    # Lay out and concatenate the per-match columns
+    groups: List[list] = []
+    cells: List[int] = []
+    values: List[float] = []
+    group_counts: List[int] = []
+    cell_counts: List[int] = []
+    for match in matches:
+        layout = build_scan_layout(match, books)
+        groups.extend(layout['groups'])
+        cells.extend(layout['cells'])
+        values.extend(layout['prices'])
+        group_counts.append(len(layout['groups']))
+        cell_counts.append(len(layout['cells']))
+
+    n_groups = len(groups)
+    n_books = len(books)
+    counts = np.array(group_counts, dtype=np.intp)
+    group_match = np.repeat(np.arange(len(matches), dtype=np.intp), counts)
+    first_group = np.cumsum(counts) - counts
+    flat_cells = np.array(cells, dtype=np.intp) + np.repeat(first_group * (n_books * 3), cell_counts)
+    three_way = np.fromiter((g[2] for g in groups), dtype=bool, count=n_groups)
+
+    layout_ms = (time.perf_counter() - start) * 1000
+
+    prices = np.full((n_groups, n_books, 3), np.nan)
+    if cells:
+        prices.reshape(-1)[flat_cells] = np.array(values, dtype=float)
+
+    # Outcomes each market needs (draw only for 3-way moneylines)
+    required = np.ones((n_groups, 3), dtype=bool)
+    required[:, 1] = three_way
+
+    # Book-major copy: reductions across books become elementwise ops on contiguous rows
+    by_book = np.ascontiguousarray(prices.transpose(1, 2, 0))   # [book, outcome, group]
+    needed = required.T                                          # [outcome, group]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Best price per outcome across books (NaN comparisons are False)
+        best = by_book[0].copy()
+        best_book = np.zeros(best.shape, dtype=np.intp)
+        for b in range(1, n_books):
+            better = (by_book[b] > best) | (np.isnan(best) & ~np.isnan(by_book[b]))
+            best[better] = by_book[b][better]
+            best_book[better] = b
+
+        inverse_best = np.where(needed, 1.0 / best, 0.0)
+        complete = ~np.isnan(inverse_best).any(axis=0)
+        best_sum = np.where(complete, np.nan_to_num(inverse_best, nan=0.0).sum(axis=0), np.inf)
+
+        # Per-book overround (only where the book prices every required outcome)
+        book_margin = np.empty((n_books, n_groups))
+        for b in range(n_books):
+            inverse = np.where(needed, 1.0 / by_book[b], 0.0)
+            book_margin[b] = inverse.sum(axis=0) - 1.0   # NaN unless every required outcome is priced
+
+    best, best_book, book_margin = best.T, best_book.T, book_margin.T
+
+    scan_ms = (time.perf_counter() - start) * 1000
+    return ScanResult(groups, group_match, matches, books, prices, best, best_book, book_margin,
+                      best_sum, complete, required, scan_ms, layout_ms)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Data File Sidecars
+Tiny metadata files written next to each scraper/collector output so monitors
+can check freshness and match counts without parsing multi-MB JSON.
+
+For `fanduel_live.json` the sidecar is `fanduel_live.json.meta`:
+
+    {
+      "schema_version": 1,
+      "written_at": "2025-11-03T18:00:00.123456",
+      "written_at_unix": 1762192800.12,
+      "total_matches": 412,
+      "matches_by_sport": {"Basketball": 120, "Soccer": 292},
+      "content_hash": "blake2b:…",
+      "data_size": 1843921,
+      "data_mtime_ns": 1762192800120000000,
+      "writer": "fanduel_live_monitor"
+    }
+
+`data_size`/`data_mtime_ns` describe the data file right after it was written,
+so a reader can tell whether the sidecar still matches the file (a writer
+without sidecar support, or a crash between the two writes, makes it stale).
+"""
+
+import hashlib
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+SIDECAR_SCHEMA_VERSION = 1
+SIDECAR_SUFFIX = '.meta'   # not '.json', so *.json globs never pick sidecars up
+
+
+def sidecar_path(data_path: Union[str, Path]) -> Path:
+    data_path = Path(data_path)
+    return data_path.with_name(data_path.name + SIDECAR_SUFFIX)
+
+
+def content_hash(content: Union[str, bytes]) -> str:
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    return 'blake2b:' + hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def count_by_sport(matches: Iterable[Dict], sport_keys: tuple = ('sport', 'sport_name')) -> Dict[str, int]:
+    """Match count per sport, using the first present key of sport_keys"""
+    counts: Dict[str, int] = {}
+    for match in matches:
+        sport = 'Unknown'
+        for key in sport_keys:
+            value = match.get(key)
+            if value:
+                sport = str(value)
+                break
+        counts[sport] = counts.get(sport, 0) + 1
+    return counts
+
+
+def write_sidecar(data_path: Union[str, Path], matches_by_sport: Dict[str, int],
+                  content: Union[str, bytes, None] = None, writer: str = '',
+                  extra: Optional[Dict[str, Any]] = None) -> Optional[Path]:
+    """
+    Write the sidecar for a data file that was just written
+
+    Args:
+        data_path: The data file (already written)
+        matches_by_sport: Match count per sport (see count_by_sport)
+        content: The exact serialized data (for content_hash); omitted if None
+        writer: Name of the writing module
+        extra: Additional fields (e.g. per-section totals)
+
+    Returns:
+        Sidecar path, or None if it could not be written (never raises)
+    """
+    path = sidecar_path(data_path)
+    try:
+        st = os.stat(data_path)
+        now = time.time()
+        meta = {
+            'schema_version': SIDECAR_SCHEMA_VERSION,
+            'written_at': datetime.fromtimestamp(now).isoformat(),
+            'written_at_unix': now,
+            'total_matches': sum(matches_by_sport.values()),
+            'matches_by_sport': matches_by_sport,
+            'content_hash': content_hash(content) if content is not None else None,
+            'data_size': st.st_size,
+            'data_mtime_ns': st.st_mtime_ns,
+            'writer': writer,
+        }
+        if extra:
+            meta.update(extra)
+        tmp = path.with_name(path.name + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp, path)
+        return path
+    except Exception as e:
+        print(f"[WARN] Could not write sidecar {path.name}: {e}")
+        return None
+
+
+def read_sidecar(data_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """
+    Read a data file's sidecar if it is current
+
+    Returns:
+        The sidecar dict, or None if missing, unreadable, from another schema
+        version, or not matching the data file's current size/mtime
+    """
+    path = sidecar_path(data_path)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        st = os.stat(data_path)
+    except (OSError, ValueError):
+        return None
+    if meta.get('schema_version') != SIDECAR_SCHEMA_VERSION:
+        return None
+    if meta.get('data_size') != st.st_size or meta.get('data_mtime_ns') != st.st_mtime_ns:
+        return None
+    return meta
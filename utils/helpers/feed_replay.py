@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Scraper Output Record & Replay
+Captures every write to the scraper output files as a timestamped journal and
+re-emits those writes into a sandbox directory, so the merge layer
+(RealtimeUnifiedCollector) and the viewer's WebSocket push loops can be
+driven by real production traffic without a network.
+
+Journal layout:
+
+    journal_dir/
+      journal.jsonl        header line, then one line per captured write:
+                           {"seq": 17, "t": 42.318, "wall": "...", "file":
+                            "bookmakers/1xbet/1xbet_live.json", "size": 812345,
+                            "hash": "blake2b:…"}
+      blobs/<hash>.gz      file content, gzip'd and stored once per distinct hash
+
+`t` is seconds since recording started. The sandbox mirrors the project
+layout (`bookmakers/<book>/<file>`, `data/`), so it can be used as a base dir:
+
+    python -m utils.helpers.feed_replay record journals/evening --duration 10800
+    python -m utils.helpers.feed_replay replay journals/evening sandbox --speed 10
+    python core/run_unified_system.py --mode watch --base-dir sandbox
+    ODDS_DATA_DIR=sandbox python core/live_odds_viewer_clean.py
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import os
+import shutil
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, Tuple, Union
+
+from utils.helpers.data_sidecar import content_hash
+from utils.helpers.file_notifier import FileChangeNotifier
+
+JOURNAL_VERSION = 1
+JOURNAL_INDEX = 'journal.jsonl'
+BLOB_DIR = 'blobs'
+
+# Scraper outputs read by the unified collector and the viewer (project-relative)
+DEFAULT_FEEDS = {
+    'bet365_pregame': 'bookmakers/bet365/bet365_current_pregame.json',
+    'bet365_live': 'bookmakers/bet365/bet365_live_current.json',
+    'fanduel_pregame': 'bookmakers/fanduel/fanduel_pregame.json',
+    'fanduel_live': 'bookmakers/fanduel/fanduel_live.json',
+    '1xbet_pregame': 'bookmakers/1xbet/1xbet_pregame.json',
+    '1xbet_live': 'bookmakers/1xbet/1xbet_live.json',
+}
+
+# Name-matching state the unified collector reads from its base dir
+CACHE_FILES = ('cache_data.json', 'name_mappings.json', 'data/cache_data.json')
+
+
+def _blob_path(journal_dir: Path, digest: str) -> Path:
+    return journal_dir / BLOB_DIR / (digest.split(':', 1)[-1] + '.gz')
+
+
+class FeedRecorder:
+    """Journals every complete write to the watched scraper output files"""
+
+    def __init__(self, journal_dir: Union[str, Path], base_dir: Union[str, Path],
+                 feeds: Optional[Dict[str, str]] = None, poll_interval: float = 0.25,
+                 validate: bool = True):
+        """
+        Args:
+            journal_dir: Journal directory (created; an existing journal is appended to)
+            base_dir: Project root the feed paths are relative to
+            feeds: name -> relative path; defaults to DEFAULT_FEEDS
+            poll_interval: stat() interval when watchdog is unavailable
+            validate: Skip content that doesn't parse as JSON (a write caught halfway)
+        """
+        self.journal_dir = Path(journal_dir)
+        self.base_dir = Path(base_dir)
+        self.feeds = dict(feeds or DEFAULT_FEEDS)
+        self.poll_interval = poll_interval
+        self.validate = validate
+
+        self._versions: Dict[str, Optional[Tuple]] = {}
+        self._last_hash: Dict[str, str] = {}
+        self._seq = 0
+        self._t0 = time.monotonic()
+        self._t_offset = 0.0   # appended sessions continue the previous timeline
+        self._index = None
+        self.stats = {'captured': 0, 'unchanged': 0, 'incomplete': 0,
+                      'blobs_written': 0, 'bytes_captured': 0, 'bytes_stored': 0}
+
+    def open(self):
+        (self.journal_dir / BLOB_DIR).mkdir(parents=True, exist_ok=True)
+        index_path = self.journal_dir / JOURNAL_INDEX
+        if index_path.exists():
+            for record in iter_journal(self.journal_dir):
+                self._seq = max(self._seq, record['seq'])
+                self._t_offset = max(self._t_offset, record['t'])
+                self._last_hash[record['file']] = record['hash']
+        self._index = open(index_path, 'a', encoding='utf-8')
+        self._index.write(json.dumps({
+            'journal_version': JOURNAL_VERSION,
+            'started_at': datetime.now().isoformat(),
+            'base_dir': str(self.base_dir),
+            'feeds': self.feeds,
+        }) + '\n')
+        self._index.flush()
+        self._t0 = time.monotonic()
+
+    def close(self):
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+
+    @staticmethod
+    def _stat_version(path: Path) -> Optional[Tuple]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _read_complete(self, path: Path, attempts: int = 3) -> Optional[bytes]:
+        """Read the file once its size is stable (and it parses, if validating)"""
+        for attempt in range(attempts):
+            try:
+                before = os.stat(path).st_size
+                with open(path, 'rb') as f:
+                    content = f.read()
+                if os.stat(path).st_size == before == len(content):
+                    if not self.validate:
+                        return content
+                    json.loads(content)
+                    return content
+            except (OSError, ValueError):
+                pass
+            time.sleep(0.05 * (attempt + 1))
+        return None
+
+    def capture(self, rel_path: str) -> Optional[Dict]:
+        """
+        Journal the current content of one feed if it changed
+
+        Returns:
+            The journal record, or None if unchanged/missing/incomplete
+        """
+        path = self.base_dir / rel_path
+        version = self._stat_version(path)
+        if version is None or version == self._versions.get(rel_path):
+            return None
+        self._versions[rel_path] = version
+
+        content = self._read_complete(path)
+        if content is None:
+            self.stats['incomplete'] += 1
+            self._versions.pop(rel_path, None)   # retry on the next event
+            return None
+
+        digest = content_hash(content)
+        if digest == self._last_hash.get(rel_path):
+            self.stats['unchanged'] += 1
+            return None
+        self._last_hash[rel_path] = digest
+
+        blob = _blob_path(self.journal_dir, digest)
+        if not blob.exists():
+            tmp = blob.with_name(blob.name + '.tmp')
+            with open(tmp, 'wb') as f:
+                f.write(gzip.compress(content, compresslevel=6))
+            os.replace(tmp, blob)
+            self.stats['blobs_written'] += 1
+            self.stats['bytes_stored'] += blob.stat().st_size
+
+        self._seq += 1
+        record = {
+            'seq': self._seq,
+            't': round(self._t_offset + time.monotonic() - self._t0, 3),
+            'wall': datetime.now().isoformat(),
+            'file': rel_path,
+            'size': len(content),
+            'hash': digest,
+        }
+        self._index.write(json.dumps(record) + '\n')
+        self._index.flush()
+        self.stats['captured'] += 1
+        self.stats['bytes_captured'] += len(content)
+        return record
+
+    def capture_all(self):
+        for rel_path in self.feeds.values():
+            self.capture(rel_path)
+
+    async def run(self, duration: Optional[float] = None):
+        """
+        Record until duration elapses (or forever / Ctrl+C)
+
+        The current content of every feed is captured first, so a replay
+        starts from the same state the recording did.
+        """
+        notifier = FileChangeNotifier(poll_interval=self.poll_interval, debounce=0.0,
+                                      idle_timeout=max(self.poll_interval, 1.0))
+        subscription = notifier.subscribe(self.base_dir / rel for rel in self.feeds.values())
+        by_path = {str(self.base_dir / rel): rel for rel in self.feeds.values()}
+
+        self.open()
+        notifier.start()
+        print(f"[INFO] Recording {len(self.feeds)} feeds from {self.base_dir} -> {self.journal_dir} "
+              f"({notifier.mode})")
+        self.capture_all()
+        deadline = None if duration is None else time.monotonic() + duration
+        try:
+            while deadline is None or time.monotonic() < deadline:
+                timeout = notifier.idle_timeout
+                if deadline is not None:
+                    timeout = max(0.0, min(timeout, deadline - time.monotonic()))
+                changed = await subscription.wait(timeout)
+                if not changed:
+                    # Periodic sweep catches anything an event coalesced away
+                    self.capture_all()
+                    continue
+                for path in changed:
+                    rel_path = by_path.get(str(path))
+                    record = self.capture(rel_path) if rel_path else None
+                    if record:
+                        print(f"[{datetime.now():%H:%M:%S}] 📼 #{record['seq']} {record['file']} "
+                              f"({record['size'] / 1024:.0f} KB)")
+        finally:
+            notifier.stop()
+            self.close()
+
+
+def iter_journal(journal_dir: Union[str, Path]) -> Iterator[Dict]:
+    """Journal write records in order (header lines and torn last lines skipped)"""
+    path = Path(journal_dir) / JOURNAL_INDEX
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if 'seq' in record:
+                yield record
+
+
+def journal_info(journal_dir: Union[str, Path]) -> Dict:
+    """Summary of a journal: writes, duration and bytes per file"""
+    files: Dict[str, Dict] = {}
+    first = last = None
+    count = 0
+    for record in iter_journal(journal_dir):
+        count += 1
+        first = record['t'] if first is None else first
+        last = record['t']
+        entry = files.setdefault(record['file'], {'writes': 0, 'bytes': 0})
+        entry['writes'] += 1
+        entry['bytes'] += record['size']
+    blobs = list((Path(journal_dir) / BLOB_DIR).glob('*.gz'))
+    return {
+        'writes': count,
+        'duration_s': round((last or 0) - (first or 0), 3),
+        'files': files,
+        'blobs': len(blobs),
+        'blob_bytes': sum(b.stat().st_size for b in blobs),
+    }
+
+
+class FeedReplayer:
+    """Re-emits journaled writes into a sandbox at 1x, Nx or maximum speed"""
+
+    def __init__(self, journal_dir: Union[str, Path], target_dir: Union[str, Path],
+                 speed: float = 1.0):
+        """
+        Args:
+            journal_dir: Journal written by FeedRecorder
+            target_dir: Sandbox root (feeds land at target_dir/<relative path>)
+            speed: Time scale; 1.0 real time, 10.0 ten times faster, 0 as fast as possible
+        """
+        self.journal_dir = Path(journal_dir)
+        self.target_dir = Path(target_dir)
+        self.speed = speed
+        self._blob_cache: Dict[str, Tuple[str, bytes]] = {}   # last blob per file (repeats are common after a loop)
+        self.stats = {'emitted': 0, 'bytes': 0, 'max_lag_s': 0.0, 'loops': 0}
+
+    def _content(self, record: Dict) -> bytes:
+        cached = self._blob_cache.get(record['file'])
+        if cached is not None and cached[0] == record['hash']:
+            return cached[1]
+        with open(_blob_path(self.journal_dir, record['hash']), 'rb') as f:
+            content = gzip.decompress(f.read())
+        self._blob_cache[record['file']] = (record['hash'], content)
+        return content
+
+    def emit(self, record: Dict) -> Path:
+        """Write one journaled file version into the sandbox (atomic replace)"""
+        path = self.target_dir / record['file']
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + '.replay.tmp')
+        content = self._content(record)
+        with open(tmp, 'wb') as f:
+            f.write(content)
+        os.replace(tmp, path)
+        self.stats['emitted'] += 1
+        self.stats['bytes'] += len(content)
+        return path
+
+    def run(self, loops: int = 1, start: float = 0.0, end: Optional[float] = None,
+            on_write: Optional[Callable[[Path, Dict], None]] = None) -> Dict:
+        """
+        Replay the journal
+
+        Args:
+            loops: Number of passes over the journal (0 = forever)
+            start: Skip writes recorded before this offset (seconds)
+            end: Stop at this offset (seconds); None plays to the end
+            on_write: Called with (sandbox path, record) after each write
+
+        Returns:
+            Replay statistics (max_lag_s is how far the replay fell behind schedule)
+        """
+        records = [r for r in iter_journal(self.journal_dir)
+                   if r['t'] >= start and (end is None or r['t'] <= end)]
+        if not records:
+            print(f"[WARN] No writes to replay in {self.journal_dir}")
+            return self.stats
+
+        span = records[-1]['t'] - records[0]['t']
+        print(f"[INFO] Replaying {len(records)} writes ({span:.0f}s recorded) -> {self.target_dir} "
+              f"at {'max' if self.speed <= 0 else f'{self.speed:g}x'} speed")
+        started = time.monotonic()
+        loop = 0
+        while loops == 0 or loop < loops:
+            loop_start = time.monotonic()
+            base_t = records[0]['t']
+            for record in records:
+                if self.speed > 0:
+                    due = loop_start + (record['t'] - base_t) / self.speed
+                    delay = due - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                    else:
+                        self.stats['max_lag_s'] = max(self.stats['max_lag_s'], -delay)
+                path = self.emit(record)
+                if on_write:
+                    on_write(path, record)
+            loop += 1
+            self.stats['loops'] = loop
+
+        elapsed = time.monotonic() - started
+        self.stats['elapsed_s'] = round(elapsed, 3)
+        self.stats['writes_per_s'] = round(self.stats['emitted'] / elapsed, 2) if elapsed > 0 else None
+        self.stats['max_lag_s'] = round(self.stats['max_lag_s'], 3)
+        return self.stats
+
+
+def seed_cache(project_dir: Union[str, Path], sandbox_dir: Union[str, Path]) -> int:
+    """Copy the team-name cache/mappings into a sandbox (existing sandbox copies are kept)"""
+    copied = 0
+    for rel in CACHE_FILES:
+        src, dst = Path(project_dir) / rel, Path(sandbox_dir) / rel
+        if src.exists() and not dst.exists():
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(src, dst)
+            copied += 1
+    print(f"[OK] Seeded {copied} cache file(s) into {sandbox_dir}")
+    return copied
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Record and replay scraper output files')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    rec = sub.add_parser('record', help='Journal every write to the scraper output files')
+    rec.add_argument('journal', help='Journal directory')
+    rec.add_argument('--base-dir', default=str(Path(__file__).parent.parent.parent),
+                     help='Project root the scrapers write under (default: this checkout)')
+    rec.add_argument('--duration', type=float, default=None, help='Seconds to record (default: until Ctrl+C)')
+    rec.add_argument('--poll-interval', type=float, default=0.25)
+    rec.add_argument('--no-validate', action='store_true', help='Journal content even if it is not valid JSON')
+
+    rep = sub.add_parser('replay', help='Re-emit journaled writes into a sandbox directory')
+    rep.add_argument('journal', help='Journal directory')
+    rep.add_argument('sandbox', help='Sandbox root (mirrors the project layout)')
+    rep.add_argument('--speed', type=float, default=1.0, help='1 = real time, N = N times faster, 0 = max')
+    rep.add_argument('--loops', type=int, default=1, help='Passes over the journal (0 = forever)')
+    rep.add_argument('--start', type=float, default=0.0, help='Start offset in seconds')
+    rep.add_argument('--end', type=float, default=None, help='End offset in seconds')
+    rep.add_argument('--seed-cache', action='store_true',
+                     help="Copy this checkout's team-name cache into the sandbox first, so merges match as in production")
+
+    info = sub.add_parser('info', help='Summarize a journal')
+    info.add_argument('journal', help='Journal directory')
+
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        recorder = FeedRecorder(args.journal, args.base_dir, poll_interval=args.poll_interval,
+                                validate=not args.no_validate)
+        try:
+            asyncio.run(recorder.run(args.duration))
+        except KeyboardInterrupt:
+            pass
+        print(f"[OK] Recording stopped: {recorder.stats}")
+    elif args.command == 'replay':
+        replayer = FeedReplayer(args.journal, args.sandbox, speed=args.speed)
+        if args.seed_cache:
+            seed_cache(Path(__file__).parent.parent.parent, args.sandbox)
+        try:
+            replayer.run(loops=args.loops, start=args.start, end=args.end)
+        except KeyboardInterrupt:
+            pass
+        print(f"[OK] Replay finished: {replayer.stats}")
+    else:
+        print(json.dumps(journal_info(args.journal), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Async File Change Notifier
+Shared file-change notifications for asyncio loops (viewer push loops).
+
+Uses watchdog (inotify/FSEvents/ReadDirectoryChangesW) when available, so
+subscribers wake within milliseconds of a write instead of on the next poll.
+Files in directories that cannot be watched, or every file when watchdog is
+not installed, fall back to stat() polling.
+"""
+
+import asyncio
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+    # Define dummy classes to avoid NameError
+    class Observer:
+        pass
+    class FileSystemEventHandler:
+        pass
+
+
+def _normalize(path) -> str:
+    return os.path.normcase(os.path.abspath(str(path)))
+
+
+class FileSubscription:
+    """Set of watched files with a coalescing wake-up event"""
+
+    def __init__(self, notifier: 'FileChangeNotifier', paths: Iterable[Path]):
+        self.notifier = notifier
+        self.paths = {_normalize(p): Path(p) for p in paths}
+        self._pending: Set[Path] = set()
+        self._event = asyncio.Event()
+
+    def _push(self, key: str):
+        path = self.paths.get(key)
+        if path is not None:
+            self._pending.add(path)
+            self._event.set()
+
+    async def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        """
+        Wait until a watched file changes (or timeout expires)
+
+        Args:
+            timeout: Maximum seconds to wait; None waits forever
+
+        Returns:
+            Set of changed paths (empty on timeout)
+        """
+        if not self._pending:
+            try:
+                await asyncio.wait_for(self._event.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return set()
+            # Writers often touch several files at once - coalesce the burst
+            if self.notifier.debounce > 0:
+                await asyncio.sleep(self.notifier.debounce)
+        changed = self._pending
+        self._pending = set()
+        self._event.clear()
+        return changed
+
+
+class _WatchdogHandler(FileSystemEventHandler):
+    """Forwards watchdog events (observer thread) into the asyncio loop"""
+
+    def __init__(self, notifier: 'FileChangeNotifier'):
+        self.notifier = notifier
+
+    def _forward(self, path):
+        if path:
+            self.notifier.loop.call_soon_threadsafe(self.notifier._notify, _normalize(path))
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self._forward(event.src_path)
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self._forward(event.src_path)
+
+    def on_moved(self, event):
+        # Atomic writers (temp file + os.replace) show up as moves onto the target
+        if not event.is_directory:
+            self._forward(getattr(event, 'dest_path', None))
+
+
+class FileChangeNotifier:
+    """Single watcher shared by every subscriber in the process"""
+
+    def __init__(self, poll_interval: float = 5.0, debounce: float = 0.02, idle_timeout: float = 30.0):
+        """
+        Args:
+            poll_interval: stat() interval for files that can't be watched natively
+            debounce: Seconds to coalesce bursts of events before waking subscribers
+            idle_timeout: Suggested wait timeout for subscribers in event mode
+        """
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self._idle_timeout = idle_timeout
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._subscriptions: List[FileSubscription] = []
+        self._observer = None
+        self._watched_dirs: Set[str] = set()
+        self._polled: Dict[str, Path] = {}
+        self._poll_versions: Dict[str, Optional[Tuple]] = {}
+        self._poll_task: Optional[asyncio.Task] = None
+
+    @property
+    def mode(self) -> str:
+        """'watchdog', 'mixed' (some files polled) or 'polling'"""
+        if self._observer is None:
+            return 'polling'
+        return 'mixed' if self._polled else 'watchdog'
+
+    @property
+    def idle_timeout(self) -> float:
+        """How long subscribers may sleep between periodic housekeeping wake-ups"""
+        return self.poll_interval if self.mode == 'polling' else self._idle_timeout
+
+    def start(self):
+        """Start the watcher; must be called from the running event loop"""
+        self.loop = asyncio.get_running_loop()
+        if WATCHDOG_AVAILABLE:
+            try:
+                self._observer = Observer()
+                self._observer.start()
+                print("👁️ File notifier using watchdog events")
+            except Exception as e:
+                print(f"⚠️ watchdog unavailable ({e}), falling back to polling")
+                self._observer = None
+        else:
+            print(f"⚠️ watchdog not installed - file notifier polling every {self.poll_interval}s")
+
+        for subscription in self._subscriptions:
+            self._watch(subscription.paths)
+
+    def stop(self):
+        """Stop the observer and polling task"""
+        if self._observer is not None:
+            try:
+                self._observer.stop()
+                self._observer.join(timeout=2)
+            except Exception:
+                pass
+            self._observer = None
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            self._poll_task = None
+
+    def subscribe(self, paths: Iterable[Path]) -> FileSubscription:
+        """Register interest in a set of files"""
+        subscription = FileSubscription(self, paths)
+        self._subscriptions.append(subscription)
+        if self.loop is not None:
+            self._watch(subscription.paths)
+        return subscription
+
+    def _watch(self, paths: Dict[str, Path]):
+        for key, path in paths.items():
+            directory = os.path.dirname(key)
+            if self._observer is not None:
+                if directory in self._watched_dirs:
+                    continue
+                if os.path.isdir(directory):
+                    try:
+                        self._observer.schedule(_WatchdogHandler(self), directory, recursive=False)
+                        self._watched_dirs.add(directory)
+                        continue
+                    except Exception as e:
+                        print(f"⚠️ Cannot watch {directory}: {e} - polling instead")
+            self._polled[key] = path
+            self._poll_versions[key] = self._stat_version(path)
+
+        if self._polled and self._poll_task is None:
+            self._poll_task = asyncio.create_task(self._poll_loop())
+
+    @staticmethod
+    def _stat_version(path: Path) -> Optional[Tuple]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    async def _poll_loop(self):
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            for key, path in list(self._polled.items()):
+                version = self._stat_version(path)
+                if version != self._poll_versions.get(key):
+                    self._poll_versions[key] = version
+                    if version is not None:
+                        self._notify(key)
+
+    def _notify(self, key: str):
+        for subscription in self._subscriptions:
+            subscription._push(key)
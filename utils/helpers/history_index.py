@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+History Index
+In-memory, mtime-invalidated index over history/futures JSON files for the viewer.
+
+Each source file is parsed once per change (mtime/size), flattened into records
+and sorted by timestamp. Per-filter key lists (all, sport, bookmaker,
+sport+bookmaker) make every query a couple of bisects plus one slice, so the
+cost and payload of a page stay flat however large the history grows.
+
+Pagination is by cursor: an opaque token holding the sort key of the last
+record returned. The sort key is stable across rebuilds, so a client paging
+through history does not skip or repeat records when the files change.
+"""
+
+import base64
+import json
+import os
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+MAX_PAGE_SIZE = 500
+
+
+def parse_timestamp(value: Any, end_of_day: bool = False) -> Optional[float]:
+    """
+    Parse epoch seconds/milliseconds or an ISO/'%Y-%m-%d %H:%M:%S' string to epoch seconds
+
+    Args:
+        value: Timestamp in any of the formats the scrapers write
+        end_of_day: For a bare date ('2025-11-03'), return the end of that day
+
+    Returns:
+        Epoch seconds, or None if the value can't be parsed
+    """
+    if value is None or value == '':
+        return None
+    if isinstance(value, (int, float)):
+        return value / 1000.0 if value > 1e12 else float(value)
+    text = str(value).strip()
+    try:
+        number = float(text)
+        return number / 1000.0 if number > 1e12 else number
+    except ValueError:
+        pass
+    try:
+        if len(text) == 10:
+            dt = datetime.strptime(text, '%Y-%m-%d')
+            return dt.timestamp() + (86400 - 0.001 if end_of_day else 0)
+        if 'T' in text:
+            return datetime.fromisoformat(text[:-1] if text.endswith('Z') else text).timestamp()
+        return datetime.strptime(text, '%Y-%m-%d %H:%M:%S').timestamp()
+    except (ValueError, OverflowError):
+        return None
+
+
+def encode_cursor(key: Tuple[float, str]) -> str:
+    raw = json.dumps([key[0], key[1]]).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[float, str]:
+    """Raises ValueError for malformed cursors"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        sort_ts, uid = json.loads(raw)
+        return float(sort_ts), str(uid)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {e}")
+
+
+class HistoryIndex:
+    """Sorted, filterable view over one or more JSON files, rebuilt when any of them changes"""
+
+    def __init__(self, name: str, paths: List[Path], build: Callable[[], List[Dict]],
+                 newest_first: bool = True):
+        """
+        Args:
+            name: Label for logs and stats
+            paths: Files whose (mtime, size) invalidate the index
+            build: Returns the entries as dicts with 'record' (the JSON returned to
+                clients), 'sport', 'bookmaker', 'timestamp' (epoch seconds or None) and 'id';
+                or (entries, metadata) to also expose file-level metadata
+            newest_first: Sort by timestamp descending (history) or ascending (futures);
+                entries without a timestamp always come last
+        """
+        self.name = name
+        self.paths = [Path(p) for p in paths]
+        self.build = build
+        self.sign = -1.0 if newest_first else 1.0
+        self.lock = threading.Lock()
+        self.versions = None
+        # (records, views, metadata), swapped as one object so queries never mix generations.
+        # views: filter key -> (sort keys, sort timestamps for date bisects, record positions)
+        self.state: Tuple[List[Dict], Dict[Tuple, Tuple[list, list, list]], Optional[Dict]] = ([], {}, None)
+        self.stats = {'builds': 0, 'last_build_ms': 0.0, 'queries': 0, 'built_at': None}
+
+    def _file_versions(self) -> tuple:
+        versions = []
+        for path in self.paths:
+            try:
+                st = os.stat(path)
+                versions.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                versions.append(None)
+        return tuple(versions)
+
+    def refresh(self) -> bool:
+        """Rebuild if a source file changed; returns True when a rebuild happened"""
+        versions = self._file_versions()
+        if versions == self.versions:
+            return False
+        with self.lock:
+            if versions == self.versions:
+                return False
+            start = time.perf_counter()
+            try:
+                entries = self.build()
+            except (json.JSONDecodeError, OSError) as e:
+                if self.versions is None:
+                    raise
+                # Most likely caught mid-write: keep serving the previous index, retry next query
+                print(f"[WARN] {self.name} index rebuild failed, serving previous data: {e}")
+                return False
+            metadata = None
+            if isinstance(entries, tuple):
+                entries, metadata = entries
+
+            keyed = []
+            occurrences: Dict[Tuple[float, str], int] = {}
+            for entry in entries:
+                ts = entry.get('timestamp')
+                sort_ts = float('inf') if ts is None else self.sign * ts
+                base = str(entry.get('id', ''))
+                n = occurrences.get((sort_ts, base), 0)
+                occurrences[(sort_ts, base)] = n + 1
+                keyed.append(((sort_ts, f"{base}#{n}"), entry))
+            keyed.sort(key=lambda item: item[0])
+
+            records = []
+            views: Dict[Tuple, Tuple[list, list, list]] = {}
+            for position, (key, entry) in enumerate(keyed):
+                records.append(entry['record'])
+                sport = (entry.get('sport') or '').lower()
+                bookmaker = (entry.get('bookmaker') or '').lower()
+                for view_key in (('',), ('sport', sport), ('bookmaker', bookmaker),
+                                 ('sport_bookmaker', sport, bookmaker)):
+                    view = views.get(view_key)
+                    if view is None:
+                        view = views[view_key] = ([], [], [])
+                    view[0].append(key)
+                    view[1].append(key[0])
+                    view[2].append(position)
+
+            self.state = (records, views, metadata)
+            self.versions = versions
+            self.stats['builds'] += 1
+            self.stats['last_build_ms'] = round((time.perf_counter() - start) * 1000, 2)
+            self.stats['built_at'] = datetime.now().isoformat()
+            return True
+
+    def query(self, cursor: Optional[str] = None, limit: int = 100, sport: Optional[str] = None,
+              bookmaker: Optional[str] = None, date_from: Any = None, date_to: Any = None) -> Dict[str, Any]:
+        """
+        One page of records, refreshing the index first if a source file changed
+
+        Blocking (stat + possible rebuild) - call it from a worker thread in async handlers.
+
+        Args:
+            cursor: next_cursor from the previous page (None for the first page)
+            limit: Page size (capped at MAX_PAGE_SIZE)
+            sport: Case-insensitive exact sport filter
+            bookmaker: Case-insensitive bookmaker filter
+            date_from: Earliest timestamp (epoch or ISO; a bare date means start of day)
+            date_to: Latest timestamp (epoch or ISO; a bare date means end of day)
+
+        Returns:
+            {'matches', 'total', 'limit', 'next_cursor', 'index'} (+ 'metadata' if the
+            build provides it); total counts every record matching the filters
+
+        Raises:
+            ValueError: Malformed cursor or date
+        """
+        self.refresh()
+        self.stats['queries'] += 1
+        limit = min(max(1, int(limit)), MAX_PAGE_SIZE)
+
+        sport_key = sport.lower() if sport else None
+        book_key = bookmaker.lower() if bookmaker else None
+        if sport_key and book_key:
+            view_key = ('sport_bookmaker', sport_key, book_key)
+        elif sport_key:
+            view_key = ('sport', sport_key)
+        elif book_key:
+            view_key = ('bookmaker', book_key)
+        else:
+            view_key = ('',)
+
+        records, views, metadata = self.state
+        keys, sort_ts, positions = views.get(view_key, ([], [], []))
+
+        ts_from = parse_timestamp(date_from)
+        ts_to = parse_timestamp(date_to, end_of_day=True)
+        if (date_from not in (None, '') and ts_from is None) or (date_to not in (None, '') and ts_to is None):
+            raise ValueError("Dates must be epoch seconds or ISO format (YYYY-MM-DD[THH:MM:SS])")
+
+        # Date range is contiguous in sort order
+        start, end = 0, len(keys)
+        if self.sign < 0:
+            if ts_to is not None:
+                start = bisect_left(sort_ts, -ts_to)
+            if ts_from is not None:
+                end = bisect_right(sort_ts, -ts_from)
+        else:
+            if ts_from is not None:
+                start = bisect_left(sort_ts, ts_from)
+            if ts_to is not None:
+                end = bisect_right(sort_ts, ts_to)
+        if ts_from is not None or ts_to is not None:
+            end = min(end, bisect_left(sort_ts, float('inf')))   # undated entries never match a range
+        total = max(0, end - start)
+
+        if cursor:
+            start = max(start, bisect_right(keys, decode_cursor(cursor)))
+        stop = min(end, start + limit)
+
+        page = [records[p] for p in positions[start:stop]]
+        next_cursor = encode_cursor(keys[stop - 1]) if page and stop < end else None
+        result = {
+            'matches': page,
+            'total': total,
+            'limit': limit,
+            'next_cursor': next_cursor,
+            'index': {'name': self.name, 'entries': len(records), 'built_at': self.stats['built_at']},
+        }
+        if metadata is not None:
+            result['metadata'] = metadata
+        return result
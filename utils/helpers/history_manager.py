@@ -4,11 +4,13 @@ Manages completed/finished matches across all bookmakers (1xBet, FanDuel, Bet365
 Moves old matches to history.json to keep live data clean
 """
 
+import heapq
 import json
+import os
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -37,6 +39,22 @@ class HistoryManager:
         # Track match IDs we've seen
         self.seen_match_ids: Set[str] = set()
         
+        # Cleanup sources: name -> (file, path to the match list, history bookmaker, phase)
+        self.cleanup_sources = {
+            '1xbet_pregame': (self.xbet_pregame, ('matches',), '1xbet', 'pregame'),
+            '1xbet_live': (self.xbet_live, ('matches',), '1xbet', 'live'),
+            'fanduel_pregame': (self.fanduel_pregame, ('data', 'matches'), 'fanduel', 'pregame'),
+            'fanduel_live': (self.fanduel_live, ('data', 'matches'), 'fanduel', 'live'),
+        }
+        
+        # Per-source expiry index: file version, expiry per match position and a
+        # min-heap of (expiry, position) for matches that can expire. Cleanup reads
+        # a file only when it changed on disk or the heap top has expired.
+        self._expiry_index: Dict[str, Dict] = {}
+        # Parsed timestamp strings (the same start times repeat on every run)
+        self._timestamp_cache: Dict[str, Optional[float]] = {}
+        self.cleanup_stats = {'runs': 0, 'index_builds': 0, 'files_read': 0, 'files_written': 0, 'removed': 0}
+        
     def load_history(self) -> Dict:
         """Load existing history from global unified file and merge with 1xbet-specific history"""
         # Load global history
@@ -107,235 +125,243 @@ class HistoryManager:
         
         logger.info(f"✓ Saved history: {history_data['metadata']['total_matches']} total matches")
     
-    def is_match_old_pregame(self, match: Dict) -> bool:
-        """Check if pregame match is old (past start time)"""
+    def _parse_naive_timestamp(self, value: str, iso_only: bool = False) -> Optional[float]:
+        """Epoch seconds for a naive ISO/'%Y-%m-%d %H:%M:%S' string (None if unparseable or tz-aware)"""
+        key = ('I' if iso_only else 'A') + value
+        if key in self._timestamp_cache:
+            return self._timestamp_cache[key]
         try:
-            start_time_str = match.get('start_time') or match.get('start_date') or match.get('date')
-            if not start_time_str:
-                return False
-            
-            # Parse various time formats
+            if iso_only:
+                parsed = datetime.fromisoformat(value.replace('Z', ''))
+            elif 'T' in value:
+                parsed = datetime.fromisoformat(value[:-1] if value.endswith('Z') else value)
+            else:
+                parsed = datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
+            # Aware times never compared against the naive local clock
+            result = None if parsed.tzinfo is not None else parsed.timestamp()
+        except (ValueError, OverflowError, OSError):
+            result = None
+        if len(self._timestamp_cache) > 200000:
+            self._timestamp_cache.clear()
+        self._timestamp_cache[key] = result
+        return result
+    
+    def pregame_expiry(self, match: Dict) -> Optional[float]:
+        """Epoch time after which a pregame match is old (its start time), None if it never expires"""
+        start_time_str = match.get('start_time') or match.get('start_date') or match.get('date')
+        if not start_time_str or not isinstance(start_time_str, str):
+            return None
+        return self._parse_naive_timestamp(start_time_str)
+    
+    def live_expiry(self, match: Dict) -> Optional[float]:
+        """Epoch time after which a live match is completed/stale, None if it never expires"""
+        status = str(match.get('status') or '').lower()
+        if status in ['completed', 'finished', 'ended', 'final']:
+            return float('-inf')
+        
+        last_updated = match.get('last_updated') or match.get('updated_at') or match.get('timestamp')
+        if not last_updated:
+            return None
+        if isinstance(last_updated, (int, float)):
             try:
-                if 'T' in start_time_str:
-                    if start_time_str.endswith('Z'):
-                        start_time = datetime.fromisoformat(start_time_str[:-1])
-                    else:
-                        start_time = datetime.fromisoformat(start_time_str)
-                else:
-                    start_time = datetime.strptime(start_time_str, '%Y-%m-%d %H:%M:%S')
-            except:
-                return False
-            
-            # Match is old if start time has passed
-            now = datetime.now()
-            return now > start_time
-            
-        except Exception as e:
-            logger.debug(f"Error checking match age: {e}")
-            return False
+                updated = datetime.fromtimestamp(last_updated).timestamp()
+            except (ValueError, OverflowError, OSError):
+                return None
+        else:
+            updated = self._parse_naive_timestamp(str(last_updated), iso_only=True)
+            if updated is None:
+                return None
+        return updated + self.live_stale_minutes * 60
+    
+    def is_match_old_pregame(self, match: Dict) -> bool:
+        """Check if pregame match is old (past start time)"""
+        expiry = self.pregame_expiry(match)
+        return expiry is not None and time.time() > expiry
     
     def is_match_completed_live(self, match: Dict) -> bool:
         """Check if live match is completed or stale"""
-        # Check explicit status
-        status = match.get('status', '').lower()
-        if status in ['completed', 'finished', 'ended', 'final']:
-            return True
+        expiry = self.live_expiry(match)
+        return expiry is not None and time.time() > expiry
+    
+    @staticmethod
+    def _file_version(path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(path)
+            return st.st_mtime_ns, st.st_size
+        except OSError:
+            return None
+    
+    @staticmethod
+    def _match_list(data: Dict, keys: Tuple[str, ...]) -> List[Dict]:
+        node = data
+        for key in keys:
+            node = node.get(key, {}) if isinstance(node, dict) else {}
+        return node if isinstance(node, list) else []
+    
+    def _build_expiry_index(self, matches: List[Dict], phase: str, version) -> Dict:
+        expiry_of = self.pregame_expiry if phase == 'pregame' else self.live_expiry
+        expiries = [expiry_of(match) for match in matches]
+        heap = [(expiry, position) for position, expiry in enumerate(expiries) if expiry is not None]
+        heapq.heapify(heap)
+        self.cleanup_stats['index_builds'] += 1
+        return {'version': version, 'expiries': expiries, 'heap': heap}
+    
+    def _read_source(self, path: Path) -> Tuple[Optional[Dict], Optional[Tuple[int, int]]]:
+        """Load a source file with the version it was read at ((None, None) if it kept changing)"""
+        for _ in range(3):
+            before = self._file_version(path)
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            after = self._file_version(path)
+            if before == after:
+                self.cleanup_stats['files_read'] += 1
+                return data, after
+        return None, None
+    
+    def _clean_source(self, name: str, now: float) -> List[Dict]:
+        """
+        Remove expired matches from one source file
         
-        # Check if match hasn't been updated recently (stale)
-        last_updated = match.get('last_updated') or match.get('updated_at') or match.get('timestamp')
-        if last_updated:
+        The file is read only if it changed since it was last indexed or the
+        earliest expiry has passed, and written only if something was removed.
+        Heap positions are applied only to the file version they were built
+        from, each candidate's expiry is re-checked, and the file is replaced
+        atomically (skipped if the scraper wrote it in the meantime).
+        
+        Args:
+            name: Key of self.cleanup_sources
+            now: Current epoch time
+        
+        Returns:
+            The removed matches (tagged with moved_to_history_at and reason)
+        """
+        path, keys, _, phase = self.cleanup_sources[name]
+        version = self._file_version(path)
+        if version is None:
+            self._expiry_index.pop(name, None)
+            return []
+        
+        index = self._expiry_index.get(name)
+        data = None
+        if index is None or index['version'] != version:
+            data, version = self._read_source(path)
+            if data is None:
+                return []
+            index = self._expiry_index[name] = self._build_expiry_index(self._match_list(data, keys), phase, version)
+        
+        heap = index['heap']
+        if not heap or heap[0][0] >= now:
+            return []
+        
+        if data is None:
+            data, version = self._read_source(path)
+            if data is None:
+                return []
+            if version != index['version']:
+                # Rewritten since it was indexed - positions refer to the old content
+                index = self._expiry_index[name] = self._build_expiry_index(self._match_list(data, keys), phase, version)
+                heap = index['heap']
+                if not heap or heap[0][0] >= now:
+                    return []
+        matches = self._match_list(data, keys)
+        
+        expiry_of = self.pregame_expiry if phase == 'pregame' else self.live_expiry
+        expiries = index['expiries']
+        expired = set()
+        while heap and heap[0][0] < now:
+            position = heapq.heappop(heap)[1]
+            expiry = expiry_of(matches[position])
+            if expiry is not None and expiry < now:
+                expired.add(position)
+            else:
+                expiries[position] = expiry
+        
+        if not expired:
+            index['heap'] = [(expiry, position) for position, expiry in enumerate(expiries) if expiry is not None]
+            heapq.heapify(index['heap'])
+            return []
+        
+        moved_at = datetime.now().isoformat()
+        reason = 'past_start_time' if phase == 'pregame' else 'completed_or_stale'
+        active_matches = []
+        removed = []
+        for position, match in enumerate(matches):
+            if position in expired:
+                match['moved_to_history_at'] = moved_at
+                match['reason'] = reason
+                removed.append(match)
+            else:
+                active_matches.append(match)
+        
+        # Update file with only active matches
+        if keys == ('matches',):
+            data['matches'] = active_matches
+        else:
+            data['data']['matches'] = active_matches
+        data['metadata'] = data.get('metadata', {})
+        data['metadata']['last_cleaned'] = moved_at
+        data['metadata']['total_matches'] = len(active_matches)
+        
+        temp_file = path.with_name(path.name + '.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        if self._file_version(path) != version:
+            # The scraper wrote a new version while we were cleaning - retry next run
+            os.remove(temp_file)
+            self._expiry_index.pop(name, None)
+            return []
+        os.replace(temp_file, path)
+        self.cleanup_stats['files_written'] += 1
+        
+        # Remaining positions shift down; expiries are already parsed
+        expiries = [expiry for position, expiry in enumerate(expiries) if position not in expired]
+        heap = [(expiry, position) for position, expiry in enumerate(expiries) if expiry is not None]
+        heapq.heapify(heap)
+        self._expiry_index[name] = {'version': self._file_version(path), 'expiries': expiries, 'heap': heap}
+        
+        return removed
+    
+    def _clean_sources(self, names: List[str]) -> Dict[str, int]:
+        """Clean the given sources and append everything removed to history in one save"""
+        now = time.time()
+        self.cleanup_stats['runs'] += 1
+        results = {}
+        moved = []
+        for name in names:
             try:
-                if isinstance(last_updated, (int, float)):
-                    # Unix timestamp
-                    last_update_time = datetime.fromtimestamp(last_updated)
-                else:
-                    # ISO string
-                    last_update_time = datetime.fromisoformat(str(last_updated).replace('Z', ''))
-                
-                # Match is stale if not updated in last 30 minutes
-                minutes_since_update = (datetime.now() - last_update_time).total_seconds() / 60
-                return minutes_since_update > self.live_stale_minutes
-                
-            except:
-                pass
+                removed = self._clean_source(name, now)
+            except Exception as e:
+                logger.error(f"Error cleaning {name}: {e}")
+                removed = []
+            results[name] = len(removed)
+            if removed:
+                _, _, bookmaker, phase = self.cleanup_sources[name]
+                moved.append((bookmaker, phase, removed))
+                logger.info(f"✓ {name}: Moved {len(removed)} matches to history")
         
-        return False
+        if moved:
+            history = self.load_history()
+            for bookmaker, phase, removed in moved:
+                history['matches'].setdefault(bookmaker, {'pregame': [], 'live': []})[phase].extend(removed)
+                self.cleanup_stats['removed'] += len(removed)
+            self.save_history(history)
+        return results
     
     def clean_1xbet_pregame(self) -> int:
         """Clean 1xBet pregame data, move old matches to history"""
-        if not self.xbet_pregame.exists():
-            return 0
-        
-        try:
-            with open(self.xbet_pregame, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            matches = data.get('matches', [])
-            active_matches = []
-            old_matches = []
-            
-            for match in matches:
-                if self.is_match_old_pregame(match):
-                    match['moved_to_history_at'] = datetime.now().isoformat()
-                    match['reason'] = 'past_start_time'
-                    old_matches.append(match)
-                else:
-                    active_matches.append(match)
-            
-            if old_matches:
-                # Update file with only active matches
-                data['matches'] = active_matches
-                data['metadata'] = data.get('metadata', {})
-                data['metadata']['last_cleaned'] = datetime.now().isoformat()
-                data['metadata']['total_matches'] = len(active_matches)
-                
-                with open(self.xbet_pregame, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                
-                # Add to history
-                history = self.load_history()
-                history['matches']['1xbet']['pregame'].extend(old_matches)
-                self.save_history(history)
-                
-                logger.info(f"✓ 1xBet pregame: Moved {len(old_matches)} old matches to history")
-            
-            return len(old_matches)
-            
-        except Exception as e:
-            logger.error(f"Error cleaning 1xBet pregame: {e}")
-            return 0
+        return self._clean_sources(['1xbet_pregame'])['1xbet_pregame']
     
     def clean_1xbet_live(self) -> int:
         """Clean 1xBet live data, move completed matches to history"""
-        if not self.xbet_live.exists():
-            return 0
-        
-        try:
-            with open(self.xbet_live, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            matches = data.get('matches', [])
-            active_matches = []
-            completed_matches = []
-            
-            for match in matches:
-                if self.is_match_completed_live(match):
-                    match['moved_to_history_at'] = datetime.now().isoformat()
-                    match['reason'] = 'completed_or_stale'
-                    completed_matches.append(match)
-                else:
-                    active_matches.append(match)
-            
-            if completed_matches:
-                # Update file with only active matches
-                data['matches'] = active_matches
-                data['metadata'] = data.get('metadata', {})
-                data['metadata']['last_cleaned'] = datetime.now().isoformat()
-                data['metadata']['total_matches'] = len(active_matches)
-                
-                with open(self.xbet_live, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                
-                # Add to history
-                history = self.load_history()
-                history['matches']['1xbet']['live'].extend(completed_matches)
-                self.save_history(history)
-                
-                logger.info(f"✓ 1xBet live: Moved {len(completed_matches)} completed matches to history")
-            
-            return len(completed_matches)
-            
-        except Exception as e:
-            logger.error(f"Error cleaning 1xBet live: {e}")
-            return 0
+        return self._clean_sources(['1xbet_live'])['1xbet_live']
     
     def clean_fanduel_pregame(self) -> int:
         """Clean FanDuel pregame data"""
-        if not self.fanduel_pregame.exists():
-            return 0
-        
-        try:
-            with open(self.fanduel_pregame, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            matches = data.get('data', {}).get('matches', [])
-            active_matches = []
-            old_matches = []
-            
-            for match in matches:
-                if self.is_match_old_pregame(match):
-                    match['moved_to_history_at'] = datetime.now().isoformat()
-                    match['reason'] = 'past_start_time'
-                    old_matches.append(match)
-                else:
-                    active_matches.append(match)
-            
-            if old_matches:
-                # Update file
-                data['data']['matches'] = active_matches
-                data['metadata'] = data.get('metadata', {})
-                data['metadata']['last_cleaned'] = datetime.now().isoformat()
-                data['metadata']['total_matches'] = len(active_matches)
-                
-                with open(self.fanduel_pregame, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                
-                # Add to history
-                history = self.load_history()
-                history['matches']['fanduel']['pregame'].extend(old_matches)
-                self.save_history(history)
-                
-                logger.info(f"✓ FanDuel pregame: Moved {len(old_matches)} old matches to history")
-            
-            return len(old_matches)
-            
-        except Exception as e:
-            logger.error(f"Error cleaning FanDuel pregame: {e}")
-            return 0
+        return self._clean_sources(['fanduel_pregame'])['fanduel_pregame']
     
     def clean_fanduel_live(self) -> int:
         """Clean FanDuel live data"""
-        if not self.fanduel_live.exists():
-            return 0
-        
-        try:
-            with open(self.fanduel_live, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            matches = data.get('data', {}).get('matches', [])
-            active_matches = []
-            completed_matches = []
-            
-            for match in matches:
-                if self.is_match_completed_live(match):
-                    match['moved_to_history_at'] = datetime.now().isoformat()
-                    match['reason'] = 'completed_or_stale'
-                    completed_matches.append(match)
-                else:
-                    active_matches.append(match)
-            
-            if completed_matches:
-                # Update file
-                data['data']['matches'] = active_matches
-                data['metadata'] = data.get('metadata', {})
-                data['metadata']['last_cleaned'] = datetime.now().isoformat()
-                data['metadata']['total_matches'] = len(active_matches)
-                
-                with open(self.fanduel_live, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                
-                # Add to history
-                history = self.load_history()
-                history['matches']['fanduel']['live'].extend(completed_matches)
-                self.save_history(history)
-                
-                logger.info(f"✓ FanDuel live: Moved {len(completed_matches)} completed matches to history")
-            
-            return len(completed_matches)
-            
-        except Exception as e:
-            logger.error(f"Error cleaning FanDuel live: {e}")
-            return 0
+        return self._clean_sources(['fanduel_live'])['fanduel_live']
     
     def clean_all(self) -> Dict[str, int]:
         """Clean all bookmaker data files"""
@@ -343,12 +369,7 @@ class HistoryManager:
         logger.info("CLEANING OLD/COMPLETED MATCHES")
         logger.info("="*70)
         
-        results = {
-            '1xbet_pregame': self.clean_1xbet_pregame(),
-            '1xbet_live': self.clean_1xbet_live(),
-            'fanduel_pregame': self.clean_fanduel_pregame(),
-            'fanduel_live': self.clean_fanduel_live()
-        }
+        results = self._clean_sources(list(self.cleanup_sources))
         
         total_moved = sum(results.values())
         
@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+Match History Journal
+Append-only, line-delimited history of live matches with an index by match key.
+
+The old history file was one JSON document that was loaded and rewritten on
+every change, so recording a score change cost as much as the whole history.
+Here every event is one line appended to the journal:
+
+    {"k": "<match key>", "e": "new" | "update" | "completed", "t": <epoch>, "d": {...}}
+
+    new        full match snapshot when it first appears
+    update     changed fields only (scores, status, time, odds) plus 'changes'
+    completed  full final snapshot when the match leaves the live page
+
+The first line is a header carrying a journal id. The writer keeps the byte
+offsets of every record per match key in memory and saves them to a sidecar
+index (<journal>.idx) on compaction and close. A reader loads the sidecar,
+parses only the lines appended after it was written, then seeks straight to
+one match's lines, so replaying a timeline never parses the whole file. An
+index whose journal id does not match the journal's header (the journal was
+compacted after it was written) is ignored and rebuilt.
+
+Compaction rewrites the journal atomically: completed matches older than
+keep_timeline_s collapse to their first and final snapshots, and completed
+matches older than max_age_s (if set) are dropped.
+
+Usage:
+    python -m utils.helpers.match_journal info bookmakers/bet365/bet365_live_history.jsonl
+    python -m utils.helpers.match_journal show bookmakers/bet365/bet365_live_history.jsonl <match key>
+    python -m utils.helpers.match_journal compact bookmakers/bet365/bet365_live_history.jsonl
+"""
+
+import argparse
+import json
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+HEADER_KEY = '#journal'
+INDEX_SUFFIX = '.idx'
+INDEX_VERSION = 1
+
+# Fields an update record carries (everything else is fixed for a match)
+UPDATE_FIELDS = ('scores', 'status', 'time', 'odds', 'markets', 'last_updated')
+
+
+def _dumps(record: Dict) -> bytes:
+    return (json.dumps(record, ensure_ascii=False, separators=(',', ':'), default=str) + '\n').encode('utf-8')
+
+
+def _scan(path: Path, start: int = 0) -> Tuple[Optional[str], List[Tuple[int, Dict]], int]:
+    """
+    Parse journal lines from a byte offset
+
+    Returns:
+        (journal id from the header if start is 0, [(offset, record)], offset after
+        the last complete line). A trailing line without a newline (still being
+        written) is left for the next scan.
+    """
+    journal_id = None
+    records = []
+    end = start
+    with open(path, 'rb') as f:
+        f.seek(start)
+        offset = start
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            if isinstance(record, dict):
+                if record.get('k') == HEADER_KEY:
+                    journal_id = record.get('id')
+                else:
+                    records.append((offset, record))
+            offset += len(line)
+            end = offset
+    return journal_id, records, end
+
+
+def _header_id(f) -> Optional[str]:
+    try:
+        f.seek(0)
+        record = json.loads(f.readline() or b'{}')
+        return record.get('id') if record.get('k') == HEADER_KEY else None
+    except ValueError:
+        return None
+
+
+def _read_header_id(path: Path) -> Optional[str]:
+    try:
+        with open(path, 'rb') as f:
+            return _header_id(f)
+    except OSError:
+        return None
+
+
+class JournalIndex:
+    """Per-match byte offsets into a journal, plus when each completed match finished"""
+
+    def __init__(self, journal_id: Optional[str] = None):
+        self.journal_id = journal_id
+        self.offsets: Dict[str, List[int]] = {}
+        self.completed: Dict[str, float] = {}   # key -> completion time of its latest timeline
+        self.end = 0                            # journal bytes covered by this index
+        self.records = 0
+
+    def add(self, offset: int, record: Dict):
+        key = record.get('k')
+        self.offsets.setdefault(key, []).append(offset)
+        event = record.get('e')
+        if event == 'completed':
+            self.completed[key] = record.get('t', 0)
+        elif event == 'new':
+            self.completed.pop(key, None)
+        self.records += 1
+
+    def to_dict(self) -> Dict:
+        return {'version': INDEX_VERSION, 'journal_id': self.journal_id, 'end': self.end,
+                'records': self.records, 'offsets': self.offsets, 'completed': self.completed}
+
+    @classmethod
+    def load(cls, journal_path: Path) -> 'JournalIndex':
+        """
+        Index for a journal: the sidecar if it belongs to this journal, caught up
+        with the lines appended since; otherwise a full scan
+        """
+        journal_id = _read_header_id(journal_path)
+        index = None
+        try:
+            with open(str(journal_path) + INDEX_SUFFIX, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if (data.get('version') == INDEX_VERSION and journal_id is not None
+                    and data.get('journal_id') == journal_id
+                    and data.get('end', 0) <= journal_path.stat().st_size):
+                index = cls(journal_id)
+                index.offsets = data.get('offsets', {})
+                index.completed = data.get('completed', {})
+                index.end = data['end']
+                index.records = data.get('records', 0)
+        except (OSError, ValueError, KeyError):
+            index = None
+
+        if index is None:
+            scanned_id, records, end = _scan(journal_path)
+            index = cls(scanned_id)
+        else:
+            _, records, end = _scan(journal_path, index.end)
+        for offset, record in records:
+            index.add(offset, record)
+        index.end = end
+        return index
+
+
+def _read_at(f, offsets: Iterable[int]) -> List[Dict]:
+    records = []
+    for offset in offsets:
+        f.seek(offset)
+        records.append(json.loads(f.readline()))
+    return records
+
+
+def read_records(journal_path: Path, offsets: Iterable[int]) -> List[Dict]:
+    """Parse the journal lines at the given byte offsets"""
+    with open(journal_path, 'rb') as f:
+        return _read_at(f, offsets)
+
+
+def fold_timeline(records: List[Dict]) -> Optional[Dict]:
+    """
+    Final state of a match from its records (latest timeline only: a 'new'
+    record after a 'completed' one starts a new timeline for the same key)
+    """
+    state = None
+    for record in records:
+        event = record.get('e')
+        if event in ('new', 'completed') or state is None:
+            state = dict(record.get('d') or {})
+        else:
+            state.update({k: v for k, v in (record.get('d') or {}).items() if k != 'changes'})
+    return state
+
+
+class MatchJournal:
+    """Single-writer append-only match history with an in-memory index"""
+
+    def __init__(self, path, keep_timeline_s: float = 6 * 3600, max_age_s: Optional[float] = None,
+                 compact_every: int = 20000, metrics=None):
+        """
+        Args:
+            path: Journal file (created with a header if missing)
+            keep_timeline_s: Completed matches keep their update records this long
+            max_age_s: Completed matches older than this are dropped on compaction (None keeps them)
+            compact_every: Records appended between automatic compactions
+            metrics: Optional MetricsRegistry; appended records are counted per event
+        """
+        self.path = Path(path)
+        self.keep_timeline_s = keep_timeline_s
+        self.max_age_s = max_age_s
+        self.compact_every = compact_every
+        self.appended_since_compact = 0
+
+        self._records_total = None
+        if metrics is not None:
+            self._records_total = metrics.counter('odds_history_journal_records_total',
+                                                  'Match history journal records appended, by event', ('event',))
+
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            self._write_header(self.path)
+        self.index = JournalIndex.load(self.path)
+        if self.index.journal_id is None:
+            # Headerless file (not a journal we wrote): start it over as one
+            self.compact(force=True)
+        # Drop a torn last line from a crash so appends start on a line boundary
+        if self.path.stat().st_size > self.index.end:
+            with open(self.path, 'r+b') as f:
+                f.truncate(self.index.end)
+        self._file = open(self.path, 'ab')
+
+    def _write_header(self, path: Path) -> str:
+        journal_id = uuid.uuid4().hex
+        with open(path, 'wb') as f:
+            f.write(_dumps({'k': HEADER_KEY, 'id': journal_id, 'created': time.time()}))
+        return journal_id
+
+    # writing -----------------------------------------------------------
+
+    def append(self, key: str, event: str, data: Dict, timestamp: Optional[float] = None):
+        """Append one record (buffered; call flush() once per batch)"""
+        record = {'k': key, 'e': event, 't': timestamp if timestamp is not None else time.time(), 'd': data}
+        offset = self.index.end
+        line = _dumps(record)
+        self._file.write(line)
+        self.index.end += len(line)
+        self.index.add(offset, record)
+        self.appended_since_compact += 1
+        if self._records_total is not None:
+            self._records_total.inc(event=event)
+
+    def record_new(self, key: str, match: Dict):
+        self.append(key, 'new', match)
+
+    def record_update(self, key: str, match: Dict, changes: List[str]):
+        data = {field: match[field] for field in UPDATE_FIELDS if field in match}
+        data['changes'] = changes
+        self.append(key, 'update', data)
+
+    def record_completed(self, key: str, match: Dict):
+        self.append(key, 'completed', match)
+
+    def flush(self):
+        self._file.flush()
+        if self.appended_since_compact >= self.compact_every:
+            self.compact()
+
+    def save_index(self):
+        """Write the sidecar index atomically"""
+        target = str(self.path) + INDEX_SUFFIX
+        tmp = target + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.index.to_dict(), f, separators=(',', ':'))
+        os.replace(tmp, target)
+
+    def close(self):
+        if self._file and not self._file.closed:
+            self._file.flush()
+            self._file.close()
+            self.save_index()
+
+    # reading -----------------------------------------------------------
+
+    def keys(self) -> List[str]:
+        return list(self.index.offsets)
+
+    def timeline(self, key: str) -> List[Dict]:
+        """Every record for one match, oldest first"""
+        self._file.flush()
+        return read_records(self.path, self.index.offsets.get(key, []))
+
+    def replay(self, key: str) -> Optional[Dict]:
+        return fold_timeline(self.timeline(key))
+
+    def completed_count(self) -> int:
+        return len(self.index.completed)
+
+    # compaction --------------------------------------------------------
+
+    def compact(self, force: bool = False, now: Optional[float] = None) -> Dict[str, int]:
+        """
+        Rewrite the journal without records that are no longer needed
+
+        Args:
+            force: Rewrite even if nothing would be dropped
+            now: Clock override (epoch seconds)
+
+        Returns:
+            {'records_before', 'records_after', 'bytes_before', 'bytes_after'}
+        """
+        now = time.time() if now is None else now
+        if self._file_is_open():
+            self._file.flush()
+        bytes_before = self.path.stat().st_size if self.path.exists() else 0
+        _, records, _ = _scan(self.path) if self.path.exists() else (None, [], 0)
+
+        by_key: Dict[str, List[Dict]] = {}
+        for _, record in records:
+            by_key.setdefault(record.get('k'), []).append(record)
+
+        kept: List[Dict] = []
+        for key, timeline in by_key.items():
+            completed_at = self.index.completed.get(key)
+            if completed_at is None:
+                kept.extend(timeline)
+                continue
+            age = now - completed_at
+            if self.max_age_s is not None and age > self.max_age_s:
+                continue
+            if age > self.keep_timeline_s:
+                # Collapse to first and final snapshots of each timeline
+                kept.extend(r for r in timeline if r.get('e') != 'update')
+            else:
+                kept.extend(timeline)
+
+        if not force and len(kept) == len(records):
+            self.appended_since_compact = 0
+            return {'records_before': len(records), 'records_after': len(records),
+                    'bytes_before': bytes_before, 'bytes_after': bytes_before}
+
+        tmp = self.path.with_name(self.path.name + '.compact')
+        journal_id = self._write_header(tmp)
+        index = JournalIndex(journal_id)
+        with open(tmp, 'ab') as f:
+            offset = f.tell()
+            for record in kept:
+                line = _dumps(record)
+                f.write(line)
+                index.add(offset, record)
+                offset += len(line)
+        index.end = offset
+
+        was_open = self._file_is_open()
+        if was_open:
+            self._file.close()
+        os.replace(tmp, self.path)
+        self.index = index
+        self.save_index()
+        if was_open:
+            self._file = open(self.path, 'ab')
+        self.appended_since_compact = 0
+        return {'records_before': len(records), 'records_after': len(kept),
+                'bytes_before': bytes_before, 'bytes_after': index.end}
+
+    def _file_is_open(self) -> bool:
+        return getattr(self, '_file', None) is not None and not self._file.closed
+
+
+class JournalReader:
+    """Read-only access for other processes (never writes the journal or its index)"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.index = JournalIndex.load(self.path)
+
+    def refresh(self):
+        """Pick up records appended since the index was loaded (reloads after a compaction)"""
+        if _read_header_id(self.path) != self.index.journal_id:
+            self.index = JournalIndex.load(self.path)
+            return
+        _, records, end = _scan(self.path, self.index.end)
+        for offset, record in records:
+            self.index.add(offset, record)
+        self.index.end = end
+
+    def keys(self) -> List[str]:
+        return list(self.index.offsets)
+
+    def timeline(self, key: str) -> List[Dict]:
+        """
+        Records of one match. The writer compacts by replacing the file, which
+        invalidates cached offsets: the header id is checked on the same open
+        file the records are read from, and the index reloaded if it changed.
+        """
+        for _ in range(3):
+            with open(self.path, 'rb') as f:
+                if _header_id(f) == self.index.journal_id:
+                    return _read_at(f, self.index.offsets.get(key, []))
+            self.index = JournalIndex.load(self.path)
+        raise RuntimeError(f"Journal {self.path} kept changing while reading {key}")
+
+    def replay(self, key: str) -> Optional[Dict]:
+        return fold_timeline(self.timeline(key))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Match history journal tools')
+    sub = parser.add_subparsers(dest='command', required=True)
+    info = sub.add_parser('info', help='Summarise a journal')
+    info.add_argument('journal')
+    show = sub.add_parser('show', help="Print one match's timeline and final state")
+    show.add_argument('journal')
+    show.add_argument('key')
+    compact = sub.add_parser('compact', help='Compact a journal (stop the scraper first)')
+    compact.add_argument('journal')
+    compact.add_argument('--keep-timeline-hours', type=float, default=6)
+    compact.add_argument('--max-age-days', type=float, default=None)
+    args = parser.parse_args()
+
+    if args.command == 'info':
+        reader = JournalReader(args.journal)
+        index = reader.index
+        print("=" * 60)
+        print(f"MATCH JOURNAL {args.journal}")
+        print("=" * 60)
+        print(f"  journal id: {index.journal_id}")
+        print(f"  bytes:      {index.end}")
+        print(f"  records:    {index.records}")
+        print(f"  matches:    {len(index.offsets)} ({len(index.completed)} completed)")
+    elif args.command == 'show':
+        reader = JournalReader(args.journal)
+        timeline = reader.timeline(args.key)
+        if not timeline:
+            print(f"[WARN] No records for {args.key}")
+            return
+        for record in timeline:
+            detail = record['d'].get('changes') if record['e'] == 'update' else ''
+            print(f"  {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(record['t']))}  {record['e']:<10} {detail}")
+        print(json.dumps(fold_timeline(timeline), indent=2, ensure_ascii=False))
+    else:
+        journal = MatchJournal(args.journal, keep_timeline_s=args.keep_timeline_hours * 3600,
+                               max_age_s=args.max_age_days * 86400 if args.max_age_days else None)
+        result = journal.compact()
+        journal.close()
+        print(f"[OK] {result['records_before']} -> {result['records_after']} records, "
+              f"{result['bytes_before']} -> {result['bytes_after']} bytes")
+
+
+if __name__ == '__main__':
+    main()
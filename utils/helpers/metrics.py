@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Pipeline Metrics
+Lightweight in-process counters, gauges and latency histograms for the
+scraper -> merge -> viewer pipeline, rendered in Prometheus text format.
+
+Every scraper and the unified collector run in their own process, so each
+process keeps its own registry and (once `configure`d) periodically writes a
+snapshot to data/metrics/<process>.json. The viewer renders its own registry
+plus every snapshot on /metrics, labelling samples with `process`.
+
+Recording is a perf_counter pair, a bisect over fixed buckets and a few
+integer increments under a lock - about a microsecond - so stages stay
+instrumented in production. Very hot per-item calls (e.g. per-match parsing)
+are timed per batch with an item count instead of per call.
+
+    from utils.helpers.metrics import REGISTRY, stage_timer, timed_stage
+
+    REGISTRY.configure('1xbet_pregame')
+
+    with stage_timer('merge_pregame_data', items=len(matches)):
+        ...
+
+    @timed_stage('decompress_response')
+    def decompress_response(self, data): ...
+"""
+
+import asyncio
+import functools
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Seconds; covers sub-millisecond decompression up to minute-long scrape cycles
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25,
+                   0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+METRICS_DIR = Path(__file__).parent.parent.parent / 'data' / 'metrics'
+SNAPSHOT_INTERVAL = 15.0      # seconds between snapshot writes per process
+SNAPSHOT_MAX_AGE = 600.0      # snapshots older than this are from dead processes
+
+
+class _Metric:
+    kind = ''
+
+    def __init__(self, name: str, help_text: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self.lock = threading.Lock()
+        self.values: Dict[Tuple[str, ...], Any] = {}
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def samples(self) -> List[list]:
+        with self.lock:
+            return [[list(key), value] for key, value in self.values.items()]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down (queue depth, matches in a file)"""
+    kind = 'gauge'
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self.lock:
+            self.values[key] = value
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    def samples(self) -> List[list]:
+        with self.lock:
+            return [[list(key), value] for key, value in self.values.items()]
+
+
+class Histogram(_Metric):
+    """Latency distribution over fixed buckets (per-bucket counts, sum, count)"""
+    kind = 'histogram'
+
+    def __init__(self, name: str, help_text: str, labelnames: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        slot = bisect_left(self.buckets, value)   # len(buckets) means +Inf
+        with self.lock:
+            entry = self.values.get(key)
+            if entry is None:
+                entry = self.values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][slot] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def samples(self) -> List[list]:
+        with self.lock:
+            return [[list(key), list(counts), total, count]
+                    for key, (counts, total, count) in self.values.items()]
+
+
+class MetricsRegistry:
+    """Named metrics of one process, plus snapshot export for the viewer"""
+
+    def __init__(self):
+        self.metrics: Dict[str, _Metric] = {}
+        self.lock = threading.Lock()
+        self.process: Optional[str] = None
+        self.snapshot_dir: Optional[Path] = None
+        self.snapshot_interval = SNAPSHOT_INTERVAL
+        self._next_snapshot = 0.0
+        self.started_at = time.time()
+
+        self.stage_seconds = self.histogram(
+            'odds_stage_duration_seconds', 'Wall time of one pipeline stage call or batch', ('stage',))
+        self.stage_items = self.counter(
+            'odds_stage_items_total', 'Items (matches, responses, messages) processed per stage', ('stage',))
+        self.stage_errors = self.counter(
+            'odds_stage_errors_total', 'Pipeline stage calls that raised', ('stage',))
+
+    def _get_or_create(self, cls, name: str, help_text: str, labelnames: Tuple[str, ...], **kwargs):
+        metric = self.metrics.get(name)
+        if metric is None:
+            with self.lock:
+                metric = self.metrics.get(name)
+                if metric is None:
+                    metric = self.metrics[name] = cls(name, help_text, labelnames, **kwargs)
+        if not isinstance(metric, cls):
+            raise ValueError(f"Metric {name} already registered as {metric.kind}")
+        return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help_text, labelnames)
+
+    def gauge(self, name: str, help_text: str, labelnames: Tuple[str, ...] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, help_text, labelnames)
+
+    def histogram(self, name: str, help_text: str, labelnames: Tuple[str, ...] = (),
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, help_text, labelnames, buckets=buckets)
+
+    def configure(self, process: str, snapshot_dir: Optional[Path] = None,
+                  interval: float = SNAPSHOT_INTERVAL):
+        """
+        Name this process and enable periodic snapshots for the viewer
+
+        Args:
+            process: Value of the `process` label (e.g. '1xbet_live')
+            snapshot_dir: Where to write <process>.json (default data/metrics)
+            interval: Minimum seconds between snapshot writes
+        """
+        self.process = process
+        self.snapshot_dir = Path(snapshot_dir) if snapshot_dir else METRICS_DIR
+        self.snapshot_interval = interval
+        self._next_snapshot = 0.0
+
+    def record_stage(self, stage: str, seconds: float, items: int = 0, error: bool = False):
+        self.stage_seconds.observe(seconds, stage=stage)
+        if items:
+            self.stage_items.inc(items, stage=stage)
+        if error:
+            self.stage_errors.inc(stage=stage)
+        if self.snapshot_dir is not None and time.monotonic() >= self._next_snapshot:
+            self.write_snapshot()
+
+    def collect(self) -> Dict[str, Dict[str, Any]]:
+        """Plain-dict copy of every metric (the snapshot file format)"""
+        families = {}
+        for name, metric in list(self.metrics.items()):
+            family = {'type': metric.kind, 'help': metric.help,
+                      'labelnames': list(metric.labelnames), 'samples': metric.samples()}
+            if isinstance(metric, Histogram):
+                family['buckets'] = list(metric.buckets)
+            families[name] = family
+        return families
+
+    def write_snapshot(self) -> Optional[Path]:
+        """Atomically write this process's snapshot (never raises)"""
+        self._next_snapshot = time.monotonic() + self.snapshot_interval
+        if self.snapshot_dir is None or not self.process:
+            return None
+        path = self.snapshot_dir / f"{self.process}.json"
+        try:
+            self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+            snapshot = {'process': self.process, 'pid': os.getpid(), 'written_at': time.time(),
+                        'started_at': self.started_at, 'metrics': self.collect()}
+            tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f)
+            os.replace(tmp, path)
+            return path
+        except Exception as e:
+            print(f"[WARN] Could not write metrics snapshot {path.name}: {e}")
+            return None
+
+
+REGISTRY = MetricsRegistry()
+
+
+class stage_timer:
+    """
+    Context manager timing one stage call or batch into REGISTRY
+
+    Args:
+        stage: Stage label (e.g. 'parse_match')
+        items: Items processed (may also be set on the timer inside the block)
+    """
+
+    __slots__ = ('stage', 'items', 'start')
+
+    def __init__(self, stage: str, items: int = 0):
+        self.stage = stage
+        self.items = items
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        REGISTRY.record_stage(self.stage, time.perf_counter() - self.start, self.items, exc_type is not None)
+        return False
+
+
+def timed_stage(stage: str):
+    """Decorator form of stage_timer for sync and async functions"""
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with stage_timer(stage):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage_timer(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def load_snapshots(snapshot_dir: Optional[Path] = None, max_age: float = SNAPSHOT_MAX_AGE) -> List[Dict[str, Any]]:
+    """Read the other processes' snapshots, skipping stale or unreadable ones"""
+    snapshot_dir = Path(snapshot_dir) if snapshot_dir else METRICS_DIR
+    snapshots = []
+    now = time.time()
+    for path in sorted(snapshot_dir.glob('*.json')):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if now - snapshot.get('written_at', 0) <= max_age:
+            snapshots.append(snapshot)
+    return snapshots
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labels(names: Iterable[str], values: Iterable[str], extra: Optional[Dict[str, str]] = None) -> str:
+    pairs = list(zip(names, values))
+    if extra:
+        pairs.extend(extra.items())
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _number(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+def render_prometheus(sources: Iterable[Tuple[str, Dict[str, Dict[str, Any]]]]) -> str:
+    """
+    Render metric families in Prometheus text exposition format (0.0.4)
+
+    Args:
+        sources: (process label, collect()-style families) pairs; families with the
+            same name from different processes are merged under one HELP/TYPE
+
+    Returns:
+        The exposition text
+    """
+    merged: Dict[str, Tuple[Dict[str, Any], List[Tuple[str, Dict[str, Any]]]]] = {}
+    for process, families in sources:
+        for name, family in families.items():
+            if name not in merged:
+                merged[name] = (family, [])
+            if merged[name][0]['type'] == family['type']:
+                merged[name][1].append((process, family))
+
+    lines = []
+    for name in sorted(merged):
+        first, members = merged[name]
+        lines.append(f"# HELP {name} {first['help']}")
+        lines.append(f"# TYPE {name} {first['type']}")
+        for process, family in members:
+            extra = {'process': process}
+            labelnames = family['labelnames']
+            if family['type'] != 'histogram':
+                for values, value in family['samples']:
+                    lines.append(f"{name}{_labels(labelnames, values, extra)} {_number(value)}")
+                continue
+            bounds = family['buckets'] + [float('inf')]
+            for values, counts, total, count in family['samples']:
+                cumulative = 0
+                for bound, bucket_count in zip(bounds, counts):
+                    cumulative += bucket_count
+                    le = {'le': _number(float(bound)), **extra}
+                    lines.append(f"{name}_bucket{_labels(labelnames, values, le)} {cumulative}")
+                lines.append(f"{name}_sum{_labels(labelnames, values, extra)} {_number(total)}")
+                lines.append(f"{name}_count{_labels(labelnames, values, extra)} {count}")
+    return '\n'.join(lines) + '\n'
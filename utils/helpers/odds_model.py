@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Typed Odds Model
+Numeric odds records carried through merging and format conversion.
+
+Scrapers used to hand odds on only as display strings ("O 2.5 (+110)",
+"-1.5 (-110)", "+150", "1.91") that every consumer re-parsed. Quotes are now
+built from each feed's own numbers where it has them - 1xBet's coefficient and
+param codes in the scraper (quotes_from_xbet), FanDuel's American prices in
+the collector's extractor (quotes_from_american) - and only Bet365's scraped
+page text is parsed, once, when the collector extracts it (quotes_from_odds).
+Each unified bookmaker entry stores them under 'quotes' as compact rows:
+
+    [market, side, line, american, decimal]
+
+The legacy 'odds' dict is kept for existing readers. Strings are only
+rendered at the API edge (render_quote / format_american / format_line).
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+MARKETS = ('moneyline', 'spread', 'total')
+
+# Market aliases used by the different scrapers
+MARKET_ALIASES = {
+    'moneyline': 'moneyline',
+    'spread': 'spread',
+    'handicap': 'spread',
+    'runline': 'spread',
+    'puckline': 'spread',
+    'total': 'total',
+}
+
+# Output order used by the converters (matches the legacy record order)
+QUOTE_ORDER = {
+    ('moneyline', 'home'): 0,
+    ('moneyline', 'away'): 1,
+    ('spread', 'home'): 2,
+    ('spread', 'away'): 3,
+    ('total', 'over'): 4,
+    ('total', 'under'): 5,
+    ('moneyline', 'draw'): 6,
+}
+
+_NUMBER_RE = re.compile(r'[+-]?\d+(?:\.\d+)?')
+_TOTAL_PREFIX_RE = re.compile(r'^\s*(?:o|u|over|under)\b', re.IGNORECASE)
+
+
+@dataclass
+class OddsQuote:
+    """Single priced selection: market/side with optional line"""
+    market: str
+    side: str
+    american: Optional[int] = None
+    decimal: Optional[float] = None
+    line: Optional[float] = None
+
+    def to_row(self) -> list:
+        """Compact JSON row: [market, side, line, american, decimal]"""
+        return [self.market, self.side, self.line, self.american, self.decimal]
+
+    @classmethod
+    def from_row(cls, row: list) -> 'OddsQuote':
+        market, side, line, american, decimal = row
+        return cls(market, side, american, decimal, line)
+
+
+def american_to_decimal(american: int) -> float:
+    """+150 -> 2.5, -200 -> 1.5"""
+    if american > 0:
+        return round(1 + american / 100, 4)
+    return round(1 + 100 / abs(american), 4)
+
+
+def decimal_to_american(decimal: float) -> Optional[int]:
+    """2.5 -> +150, 1.5 -> -200"""
+    if decimal <= 1:
+        return None
+    if decimal >= 2:
+        return int(round((decimal - 1) * 100))
+    return int(round(-100 / (decimal - 1)))
+
+
+def _price(number: float, text: str) -> Optional[tuple]:
+    """Classify a parsed number as (american, decimal)"""
+    is_integer = '.' not in text
+    if is_integer and abs(number) >= 100:
+        american = int(number)
+        return american, american_to_decimal(american)
+    if not text.startswith(('+', '-')) and 1 < number < 100:
+        return decimal_to_american(number), round(number, 4)
+    return None
+
+
+def parse_price(value: Any) -> Optional[tuple]:
+    """
+    Parse a bare price ("+110", "-150", 110, "1.91", 1.91)
+
+    Returns:
+        (american, decimal) or None if the value is not a price
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return _price(float(value), str(value))
+    if isinstance(value, float):
+        return _price(value, repr(value))
+    numbers = _NUMBER_RE.findall(str(value))
+    if len(numbers) != 1:
+        return None
+    return _price(float(numbers[0]), numbers[0])
+
+
+def parse_line(value: Any) -> Optional[float]:
+    """Parse a handicap/total line ("+1.5", -1.5, "O 2.5")"""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = _NUMBER_RE.search(str(value))
+    return float(match.group()) if match else None
+
+
+def parse_display_odds(value: Any) -> tuple:
+    """
+    Parse a display string with optional line and price
+
+    Handles "O 2.5 (+110)", "U 2.5 -110", "-1.5 (-110)", "+1.5 1.91", "+150", "1.91".
+
+    Returns:
+        (line, american, decimal) - missing parts are None
+    """
+    if value is None:
+        return None, None, None
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        price = parse_price(value)
+        return (None,) + (price or (None, None))
+
+    text = str(value)
+    numbers = _NUMBER_RE.findall(text)
+    if not numbers:
+        return None, None, None
+    if len(numbers) == 1 and _TOTAL_PREFIX_RE.match(text):
+        # "O 2.5" - a total line without a price
+        return float(numbers[0]), None, None
+
+    # Price is the last number; anything before it is the line
+    price = _price(float(numbers[-1]), numbers[-1])
+    if price is None:
+        # Lone line (e.g. "+1.5") or an unrecognized value
+        return (float(numbers[-1]) if len(numbers) == 1 else None), None, None
+    line = float(numbers[-2]) if len(numbers) >= 2 else None
+    return (line,) + price
+
+
+def _quote(market: str, side: str, value: Any, line: Any = None) -> Optional[OddsQuote]:
+    parsed_line, american, decimal = parse_display_odds(value)
+    if american is None and decimal is None:
+        return None
+    if line is not None:
+        parsed_line = parse_line(line)
+    return OddsQuote(market, side, american, decimal, parsed_line)
+
+
+def quotes_from_odds(odds: Dict[str, Any]) -> List[OddsQuote]:
+    """
+    Build typed quotes from any extracted odds dict (Bet365, FanDuel, 1xBet layouts)
+
+    Args:
+        odds: Odds dict as returned by the unified collector's extract_*_odds
+
+    Returns:
+        List of OddsQuote (unparseable entries are skipped)
+    """
+    if not odds:
+        return []
+
+    quotes = []
+    add = quotes.append
+
+    # Flat keyed layout (FanDuel, 1xBet, live feeds)
+    for side in ('home', 'away', 'draw'):
+        value = odds.get(f'moneyline_{side}')
+        if value is not None:
+            q = _quote('moneyline', side, value)
+            if q:
+                add(q)
+
+    for side in ('home', 'away'):
+        value = odds.get(f'spread_{side}_odds')
+        if value is not None:
+            q = _quote('spread', side, value, odds.get(f'spread_{side}_line'))
+        else:
+            value = odds.get(f'spread_{side}')
+            q = _quote('spread', side, value, odds.get(f'spread_{side}_line')) if value is not None else None
+        if q:
+            add(q)
+
+    for side in ('over', 'under'):
+        value = odds.get(f'total_{side}_odds')
+        if value is None:
+            value = odds.get(f'total_{side}')
+        if value is not None:
+            q = _quote('total', side, value, odds.get('total_line'))
+            if q:
+                add(q)
+
+    # Positional list layout (Bet365): [home, away] / [home, draw, away] / [over, under]
+    for key, market in MARKET_ALIASES.items():
+        values = odds.get(key)
+        if not isinstance(values, list) or not values:
+            continue
+        if market == 'total':
+            sides = ('over', 'under')
+        elif market == 'moneyline' and len(values) == 3:
+            sides = ('home', 'draw', 'away')
+        else:
+            sides = ('home', 'away')
+        for side, value in zip(sides, values):
+            q = _quote(market, side, value)
+            if q:
+                add(q)
+
+    return quotes
+
+
+def american_quote(market: str, side: str, american: Any, line: Any = None) -> Optional[OddsQuote]:
+    """Quote from a numeric American price and line; other values go through the string parser"""
+    if isinstance(american, int) and not isinstance(american, bool) and abs(american) >= 100:
+        return OddsQuote(market, side, american, american_to_decimal(american), parse_line(line))
+    return _quote(market, side, american, line) if american is not None else None
+
+
+# (market, side, American price field, line field) in the FanDuel flat layout
+AMERICAN_FIELDS = (
+    ('moneyline', 'home', 'moneyline_home', None),
+    ('moneyline', 'away', 'moneyline_away', None),
+    ('moneyline', 'draw', 'moneyline_draw', None),
+    ('spread', 'home', 'spread_home_odds', 'spread_home_line'),
+    ('spread', 'away', 'spread_away_odds', 'spread_away_line'),
+    ('total', 'over', 'total_over_odds', 'total_line'),
+    ('total', 'under', 'total_under_odds', 'total_line'),
+)
+
+
+def quotes_from_american(odds: Dict[str, Any]) -> List[OddsQuote]:
+    """
+    Build typed quotes from FanDuel's numeric fields (American prices, numeric lines)
+
+    Args:
+        odds: Odds dict as returned by the unified collector's extract_fanduel_odds
+
+    Returns:
+        List of OddsQuote (missing prices are skipped)
+    """
+    quotes = []
+    for market, side, price_key, line_key in AMERICAN_FIELDS:
+        q = american_quote(market, side, odds.get(price_key), odds.get(line_key) if line_key else None)
+        if q:
+            quotes.append(q)
+    return quotes
+
+
+# 1xBet (group, bet type) codes -> (market, side); set totals (group 17) win over
+# game totals (group 15), as in the collector's extract_1xbet_odds
+XBET_CODES = {
+    (1, 1): ('moneyline', 'home'),
+    (1, 3): ('moneyline', 'away'),
+    (1, 2): ('moneyline', 'draw'),
+    (2, 7): ('spread', 'home'),
+    (2, 8): ('spread', 'away'),
+    (15, 11): ('total', 'over'),
+    (15, 12): ('total', 'under'),
+    (17, 9): ('total', 'over'),
+    (17, 10): ('total', 'under'),
+}
+
+
+def quotes_from_xbet(raw_odds: Dict[str, Any]) -> List[OddsQuote]:
+    """
+    Build typed quotes straight from 1xBet's raw odds codes
+
+    The decimal price is 1xBet's coefficient (C); the American price is its CV
+    field when that is a whole number, otherwise derived from the coefficient.
+
+    Args:
+        raw_odds: {'<group>_<type>': {'coefficient', 'american_odds', 'param'}}
+
+    Returns:
+        List of OddsQuote in converter order
+    """
+    selected = {}
+    for key, value in (raw_odds or {}).items():
+        try:
+            group, bet_type = (int(part) for part in key.split('_'))
+        except (ValueError, AttributeError):
+            continue
+        target = XBET_CODES.get((group, bet_type))
+        if target is None or not isinstance(value, dict):
+            continue
+        if target not in selected or group == 17:
+            selected[target] = value
+
+    quotes = []
+    for (market, side), value in sorted(selected.items(), key=lambda item: QUOTE_ORDER[item[0]]):
+        decimal = value.get('coefficient')
+        try:
+            american = int(value.get('american_odds'))
+        except (TypeError, ValueError):
+            american = None
+        if isinstance(decimal, (int, float)) and not isinstance(decimal, bool) and decimal > 1:
+            decimal = round(float(decimal), 4)
+            if american is None:
+                american = decimal_to_american(decimal)
+        elif american is not None and abs(american) >= 100:
+            decimal = american_to_decimal(american)
+        else:
+            continue
+        line = parse_line(value.get('param')) if market != 'moneyline' else None
+        if market == 'total' and line is None:
+            continue
+        quotes.append(OddsQuote(market, side, american, decimal, line))
+    return quotes
+
+
+def pack_quotes(quotes: List[OddsQuote]) -> List[list]:
+    """Serialize quotes as compact rows for unified_odds.json"""
+    return [q.to_row() for q in quotes]
+
+
+def unpack_quotes(rows: Optional[List[list]]) -> List[OddsQuote]:
+    """Deserialize compact rows (tolerates missing/malformed rows)"""
+    quotes = []
+    for row in rows or []:
+        try:
+            quotes.append(OddsQuote.from_row(row))
+        except (TypeError, ValueError):
+            continue
+    return quotes
+
+
+def sort_quotes(quotes: List[OddsQuote]) -> List[OddsQuote]:
+    """Order quotes like the legacy converters did (moneyline, spread, total, draw)"""
+    return sorted(quotes, key=lambda q: QUOTE_ORDER.get((q.market, q.side), len(QUOTE_ORDER)))
+
+
+def sorted_rows(rows: Optional[List[list]]) -> List[list]:
+    """
+    Valid compact rows in converter order, without building OddsQuote objects
+
+    Hot path for the converters: rows are unpacked as
+    market, side, line, american, decimal = row
+    """
+    last = len(QUOTE_ORDER)
+    return sorted(
+        (row for row in rows or () if len(row) == 5),
+        key=lambda row: QUOTE_ORDER.get((row[0], row[1]), last)
+    )
+
+
+# ----------------------------- API edge rendering ----------------------------- #
+
+def format_american(american: Optional[int]) -> Optional[str]:
+    """110 -> '+110', -150 -> '-150'"""
+    if american is None:
+        return None
+    return f"+{american}" if american > 0 else str(american)
+
+
+def format_line(line: Optional[float], signed: bool = False) -> Optional[str]:
+    """2.5 -> '2.5', 3.0 -> '3', signed: 1.5 -> '+1.5'"""
+    if line is None:
+        return None
+    text = f"{line:g}"
+    if signed and line > 0:
+        text = f"+{text}"
+    return text
+
+
+def render_quote(quote: OddsQuote) -> str:
+    """Render a quote in the scrapers' display format ("O 2.5 (+110)", "-1.5 (-110)", "+150")"""
+    price = format_american(quote.american) if quote.american is not None else f"{quote.decimal}"
+    if quote.market == 'total' and quote.line is not None:
+        return f"{'O' if quote.side == 'over' else 'U'} {format_line(quote.line)} ({price})"
+    if quote.market == 'spread' and quote.line is not None:
+        return f"{format_line(quote.line, signed=True)} ({price})"
+    return price
@@ -0,0 +1,504 @@
+#!/usr/bin/env python3
+"""
+Odds Time-Series Store
+Embedded SQLite store for odds movement (line history) per match.
+
+history.json only records matches that finished; this store records every
+price change as a tick:
+
+    (match, book, market, outcome) -> [(timestamp, price, line), ...]
+
+Scrapers call record() from their existing change detectors. Ticks are
+de-duplicated in memory (only real price/line changes are kept), buffered and
+written in batches by a background thread, so ingest never blocks the
+scraper loop. Disk growth is bounded: raw ticks older than raw_retention are
+downsampled into per-minute OHLC buckets, and buckets older than
+rollup_retention are deleted.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from utils.helpers.odds_model import MARKET_ALIASES, parse_display_odds, parse_line
+
+try:
+    from utils.cache_manager.enhanced_cache_manager import EnhancedCacheManager
+    CANONICAL_NAMES_AVAILABLE = True
+except ImportError:
+    CANONICAL_NAMES_AVAILABLE = False
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_DB_PATH = PROJECT_ROOT / "data" / "odds_timeseries.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS series (
+    id INTEGER PRIMARY KEY,
+    match_key TEXT NOT NULL,
+    book TEXT NOT NULL,
+    market TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    UNIQUE (match_key, book, market, outcome)
+);
+CREATE TABLE IF NOT EXISTS ticks (
+    series_id INTEGER NOT NULL,
+    ts INTEGER NOT NULL,
+    price REAL,
+    line REAL
+);
+CREATE INDEX IF NOT EXISTS ticks_series_ts ON ticks (series_id, ts);
+CREATE INDEX IF NOT EXISTS ticks_ts ON ticks (ts);
+CREATE TABLE IF NOT EXISTS rollup (
+    series_id INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    open REAL,
+    high REAL,
+    low REAL,
+    close REAL,
+    line REAL,
+    ticks INTEGER,
+    PRIMARY KEY (series_id, bucket)
+) WITHOUT ROWID;
+"""
+
+# Per-minute OHLC of every full bucket older than the cutoff (buckets roll up once)
+ROLLUP_SQL = """
+INSERT INTO rollup (series_id, bucket, open, high, low, close, line, ticks)
+SELECT series_id, bucket,
+       max(CASE WHEN first_rank = 1 THEN price END),
+       max(price), min(price),
+       max(CASE WHEN last_rank = 1 THEN price END),
+       max(CASE WHEN last_rank = 1 THEN line END),
+       count(*)
+FROM (
+    SELECT series_id, ts / :bucket * :bucket AS bucket, price, line,
+           row_number() OVER (PARTITION BY series_id, ts / :bucket ORDER BY ts) AS first_rank,
+           row_number() OVER (PARTITION BY series_id, ts / :bucket ORDER BY ts DESC) AS last_rank
+    FROM ticks WHERE ts < :cutoff
+)
+WHERE 1
+GROUP BY series_id, bucket
+ON CONFLICT (series_id, bucket) DO UPDATE SET
+    high = max(high, excluded.high),
+    low = min(low, excluded.low),
+    close = excluded.close,
+    line = excluded.line,
+    ticks = ticks + excluded.ticks
+"""
+
+
+def make_match_key(sport: Any, home: Any, away: Any,
+                   canonical: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    Bookmaker-independent series key: 'basketball|los angeles lakers|boston celtics'
+
+    Args:
+        sport: Sport name
+        home: Home team as the book spells it
+        away: Away team as the book spells it
+        canonical: Team-name canonicalizer (see load_team_canonicalizer); without it
+                   'LA Lakers' and 'Los Angeles Lakers' end up under different keys
+    """
+    def clean(value):
+        return ' '.join(str(value or '').lower().split())
+    if canonical is not None:
+        home, away = canonical(home), canonical(away)
+    return f"{clean(sport)}|{clean(home)}|{clean(away)}"
+
+
+def load_team_canonicalizer(base_dir: Optional[Path] = None) -> Callable[[Any], Any]:
+    """
+    Team-name canonicalizer for make_match_key
+
+    Uses the same cache as the unified collector (EnhancedCacheManager on the
+    project's cache_data.json, answered from the shared name_cache snapshot),
+    so every book's series for a match land on one key. Results are memoized
+    per process: a name keeps its key for the life of the match even if the
+    cache learns a new alias meanwhile. Falls back to the name as given when
+    the cache is unavailable.
+
+    Args:
+        base_dir: Directory holding cache_data.json (default: project root)
+
+    Returns:
+        Callable mapping a team name to its canonical name
+    """
+    manager = None
+    if CANONICAL_NAMES_AVAILABLE:
+        try:
+            manager = EnhancedCacheManager(Path(base_dir) if base_dir else PROJECT_ROOT, shared=True)
+        except Exception as e:
+            print(f"⚠️ Team name cache unavailable, series keyed on raw names: {e}")
+    names: Dict[Any, Any] = {}
+
+    def canonical(team):
+        if not team or manager is None:
+            return team
+        value = names.get(team)
+        if value is None:
+            try:
+                value = manager.get_canonical_team_name(str(team)) or team
+            except Exception:
+                value = team
+            names[team] = value
+        return value
+
+    return canonical
+
+
+def ticks_from_markets(markets: Dict[str, Any]) -> List[Tuple[str, str, float, Optional[float]]]:
+    """
+    Flatten a nested {market: {outcome: {'odds': ..., 'line': ...}}} dict (Bet365 live)
+
+    Returns:
+        List of (market, outcome, decimal_price, line)
+    """
+    ticks = []
+    for market_name, outcomes in (markets or {}).items():
+        if not isinstance(outcomes, dict):
+            continue
+        market = MARKET_ALIASES.get(market_name, market_name)
+        for outcome, selection in outcomes.items():
+            if not isinstance(selection, dict):
+                continue
+            line, _american, decimal = parse_display_odds(selection.get('odds'))
+            if decimal is None:
+                continue
+            if selection.get('line') not in (None, ''):
+                line = parse_line(selection.get('line'))
+            ticks.append((market, outcome, decimal, line))
+    return ticks
+
+
+class OddsTimeSeriesStore:
+    """Batched, de-duplicated tick writer plus line-movement queries"""
+
+    def __init__(self, db_path: Optional[Path] = None, flush_interval: float = 1.0,
+                 max_pending: int = 200000, raw_retention_hours: float = 6,
+                 rollup_retention_days: float = 7, bucket_seconds: int = 60,
+                 maintenance_interval: float = 60.0):
+        """
+        Args:
+            db_path: SQLite file (default: data/odds_timeseries.db)
+            flush_interval: Seconds between batched writes
+            max_pending: Buffered ticks kept when the writer falls behind (oldest dropped)
+            raw_retention_hours: Raw ticks kept at full resolution
+            rollup_retention_days: Downsampled buckets kept
+            bucket_seconds: Downsampling bucket size
+            maintenance_interval: Seconds between rollup/retention passes
+        """
+        self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.raw_retention_ms = int(raw_retention_hours * 3600 * 1000)
+        self.rollup_retention_ms = int(rollup_retention_days * 86400 * 1000)
+        self.bucket_ms = int(bucket_seconds * 1000)
+        self.maintenance_interval = maintenance_interval
+
+        self._last: Dict[tuple, tuple] = {}         # series -> (price, line) last recorded
+        self._pending: List[tuple] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._last_maintenance = 0.0
+
+        self.stats = {
+            'ticks_offered': 0,
+            'ticks_recorded': 0,
+            'ticks_written': 0,
+            'ticks_dropped': 0,
+            'flushes': 0,
+            'last_flush_ms': 0.0,
+            'rollups': 0,
+        }
+
+    # ------------------------------------------------------------------ ingest
+
+    def record(self, match_key: str, book: str, market: str, outcome: str,
+               price: Optional[float], line: Optional[float] = None,
+               ts: Optional[float] = None) -> bool:
+        """
+        Queue a price observation; unchanged prices are ignored
+
+        Args:
+            match_key: Series key (see make_match_key)
+            book: Bookmaker ('bet365', 'fanduel', ...)
+            market: 'moneyline', 'spread', 'total', ...
+            outcome: 'home', 'away', 'draw', 'over', 'under', ...
+            price: Decimal odds
+            line: Handicap/total line if any
+            ts: Unix time in seconds (default: now)
+
+        Returns:
+            bool: True if this was a change and was queued
+        """
+        self.stats['ticks_offered'] += 1
+        if price is None:
+            return False
+        key = (match_key, book, market, outcome)
+        value = (price, line)
+        if self._last.get(key) == value:
+            return False
+        self._last[key] = value
+
+        tick = (key, int((ts if ts is not None else time.time()) * 1000), price, line)
+        with self._lock:
+            self._pending.append(tick)
+            if len(self._pending) > self.max_pending:
+                overflow = len(self._pending) - self.max_pending
+                del self._pending[:overflow]
+                self.stats['ticks_dropped'] += overflow
+        self.stats['ticks_recorded'] += 1
+        return True
+
+    def record_match(self, match_key: str, book: str,
+                     ticks: Iterable[Tuple[str, str, float, Optional[float]]],
+                     ts: Optional[float] = None) -> int:
+        """
+        Record every (market, outcome, price, line) of one match snapshot
+
+        Returns:
+            int: Number of changed prices queued
+        """
+        now = ts if ts is not None else time.time()
+        changed = 0
+        for market, outcome, price, line in ticks:
+            if self.record(match_key, book, market, outcome, price, line, now):
+                changed += 1
+        return changed
+
+    def prime(self, book: Optional[str] = None) -> int:
+        """
+        Load the last recorded price per series so a restarted scraper
+        doesn't re-record unchanged prices
+
+        Returns:
+            int: Number of series primed
+        """
+        conn = self._read_connection()
+        if conn is None:
+            return 0
+        try:
+            query = ("SELECT s.match_key, s.book, s.market, s.outcome, t.price, t.line, max(t.ts) "
+                     "FROM ticks t JOIN series s ON s.id = t.series_id {where} GROUP BY t.series_id")
+            if book:
+                rows = conn.execute(query.format(where="WHERE s.book = ?"), (book,)).fetchall()
+            else:
+                rows = conn.execute(query.format(where="")).fetchall()
+        except sqlite3.Error:
+            rows = []
+        finally:
+            conn.close()
+        for match_key, series_book, market, outcome, price, line, _ts in rows:
+            self._last.setdefault((match_key, series_book, market, outcome), (price, line))
+        return len(rows)
+
+    def forget(self, match_key: str):
+        """Drop de-duplication state for a finished match"""
+        for key in [k for k in self._last if k[0] == match_key]:
+            del self._last[key]
+
+    # ------------------------------------------------------------------ writer
+
+    def start(self):
+        """Start the background writer thread"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._writer, name='odds-timeseries-writer', daemon=True)
+        self._thread.start()
+
+    def close(self):
+        """Flush pending ticks and stop the writer"""
+        if self._thread is not None:
+            self._stop.set()
+            self._wake.set()
+            self._thread.join(timeout=10)
+            self._thread = None
+        else:
+            self.flush()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _writer(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"⚠️ Odds time-series flush failed: {e}")
+        try:
+            self.flush()
+        except Exception as e:
+            print(f"⚠️ Odds time-series final flush failed: {e}")
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+            # Must be set before the first table is created to take effect
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("PRAGMA journal_mode = WAL")       # readers (viewer) never block the writer
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _resolve_series(self, conn: sqlite3.Connection, keys: Iterable[tuple]) -> Dict[tuple, int]:
+        """
+        Series ids for one batch, looked up inside the batch's write transaction
+
+        Several scrapers share the database and any of them may delete empty
+        series in maintain(), after which SQLite can hand the freed id to a new
+        series. Ids are therefore never cached across flushes: the INSERT takes
+        the write lock first, so the ids read here are the ones the ticks land on.
+        """
+        keys = list(set(keys))
+        conn.executemany(
+            "INSERT OR IGNORE INTO series (match_key, book, market, outcome) VALUES (?, ?, ?, ?)", keys)
+        ids = {}
+        for key in keys:
+            ids[key] = conn.execute(
+                "SELECT id FROM series WHERE match_key = ? AND book = ? AND market = ? AND outcome = ?", key
+            ).fetchone()[0]
+        return ids
+
+    def flush(self) -> int:
+        """
+        Write buffered ticks in one transaction (and run maintenance when due)
+
+        Returns:
+            int: Number of ticks written
+        """
+        with self._lock:
+            batch, self._pending = self._pending, []
+
+        conn = self._connect()
+        if batch:
+            start = time.perf_counter()
+            with conn:
+                ids = self._resolve_series(conn, (tick[0] for tick in batch))
+                conn.executemany(
+                    "INSERT INTO ticks (series_id, ts, price, line) VALUES (?, ?, ?, ?)",
+                    [(ids[key], ts, price, line) for key, ts, price, line in batch]
+                )
+            self.stats['ticks_written'] += len(batch)
+            self.stats['flushes'] += 1
+            self.stats['last_flush_ms'] = round((time.perf_counter() - start) * 1000, 2)
+
+        if time.time() - self._last_maintenance >= self.maintenance_interval:
+            self.maintain()
+        return len(batch)
+
+    def maintain(self, now: Optional[float] = None):
+        """Downsample raw ticks past retention and delete expired buckets"""
+        conn = self._connect()
+        now_ms = int((now if now is not None else time.time()) * 1000)
+        cutoff = (now_ms - self.raw_retention_ms) // self.bucket_ms * self.bucket_ms
+        with conn:
+            conn.execute(ROLLUP_SQL, {'bucket': self.bucket_ms, 'cutoff': cutoff})
+            conn.execute("DELETE FROM ticks WHERE ts < ?", (cutoff,))
+            conn.execute("DELETE FROM rollup WHERE bucket < ?", (now_ms - self.rollup_retention_ms,))
+            conn.execute(
+                "DELETE FROM series WHERE id NOT IN (SELECT series_id FROM ticks) "
+                "AND id NOT IN (SELECT series_id FROM rollup)")
+        conn.executescript("PRAGMA incremental_vacuum;")   # executescript steps it to completion
+        self._last_maintenance = time.time()
+        self.stats['rollups'] += 1
+
+    # ------------------------------------------------------------------ queries
+
+    def _read_connection(self) -> Optional[sqlite3.Connection]:
+        if not self.db_path.exists():
+            return None
+        return sqlite3.connect(f"file:{self.db_path.as_posix()}?mode=ro", uri=True, timeout=10)
+
+    def series(self, match_key: str, book: Optional[str] = None, market: Optional[str] = None,
+               since: Optional[float] = None, max_points: int = 500) -> Dict[str, Any]:
+        """
+        Line-movement series for one match
+
+        Older history comes from the per-minute rollup (close price), recent
+        history from raw ticks. Each series is thinned to max_points, always
+        keeping the latest point.
+
+        Args:
+            match_key: Series key (see make_match_key)
+            book: Optional bookmaker filter
+            market: Optional market filter
+            since: Unix time in seconds; default returns everything retained
+            max_points: Maximum points per series
+
+        Returns:
+            {'match_key', 'series': [{'book', 'market', 'outcome', 'points': [[ts_ms, price, line], ...]}]}
+        """
+        result = {'match_key': match_key, 'ts_unit': 'ms', 'series': []}
+        conn = self._read_connection()
+        if conn is None:
+            return result
+        try:
+            query = "SELECT id, book, market, outcome FROM series WHERE match_key = ?"
+            params: List[Any] = [match_key]
+            if book:
+                query += " AND book = ?"
+                params.append(book)
+            if market:
+                query += " AND market = ?"
+                params.append(market)
+            since_ms = int(since * 1000) if since is not None else 0
+
+            for series_id, series_book, series_market, outcome in conn.execute(query + " ORDER BY book, market, outcome", params):
+                points = conn.execute(
+                    "SELECT bucket, close, line FROM rollup WHERE series_id = ? AND bucket >= ? ORDER BY bucket",
+                    (series_id, since_ms)).fetchall()
+                points += conn.execute(
+                    "SELECT ts, price, line FROM ticks WHERE series_id = ? AND ts >= ? ORDER BY ts",
+                    (series_id, since_ms)).fetchall()
+                if not points:
+                    continue
+                if len(points) > max_points > 0:
+                    step = len(points) / max_points
+                    thinned = [points[int(i * step)] for i in range(max_points - 1)]
+                    points = thinned + [points[-1]]
+                result['series'].append({
+                    'book': series_book,
+                    'market': series_market,
+                    'outcome': outcome,
+                    'points': [list(p) for p in points],
+                })
+        finally:
+            conn.close()
+        return result
+
+    def matches(self, search: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """Match keys with recorded movement (optionally filtered by substring)"""
+        conn = self._read_connection()
+        if conn is None:
+            return []
+        try:
+            query = ("SELECT match_key, group_concat(DISTINCT book), count(*) FROM series "
+                     "{where} GROUP BY match_key ORDER BY match_key LIMIT ?")
+            if search:
+                rows = conn.execute(query.format(where="WHERE match_key LIKE ?"),
+                                    (f"%{search.lower()}%", limit)).fetchall()
+            else:
+                rows = conn.execute(query.format(where=""), (limit,)).fetchall()
+        finally:
+            conn.close()
+        return [{'match_key': key, 'books': (books or '').split(','), 'series': count}
+                for key, books, count in rows]
+
+    def disk_usage(self) -> Dict[str, int]:
+        """Database and WAL file sizes in bytes"""
+        usage = {}
+        for suffix in ('', '-wal'):
+            path = f"{self.db_path}{suffix}"
+            usage['db' if not suffix else 'wal'] = os.path.getsize(path) if os.path.exists(path) else 0
+        return usage
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+OddsMagnet Store
+Shared per-sport in-memory cache of OddsMagnet collector output for the viewer
+
+Each dataset is reloaded only when its file changes (mtime/size/inode) and
+keeps pre-lowercased league, match_uri and match_name columns plus
+league -> match and league_slug -> match indexes, so filtered and paginated
+requests avoid re-reading the file and re-scanning every match.
+
+Responses are content-addressed: the ETag is derived from the file version
+(known from a stat() call, before any parsing) plus the query, and encoded
+response bodies (with lazily built gzip/brotli variants) are cached per
+snapshot so repeated queries skip JSON serialization and compression.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Optional brotli support - gzip is always available
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Same threshold as the viewer's GZipMiddleware
+MIN_COMPRESS_BYTES = 1000
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick a precompressed variant from an Accept-Encoding header
+
+    Args:
+        accept_encoding: Raw Accept-Encoding header value
+
+    Returns:
+        'br', 'gzip' or None (identity)
+    """
+    if not accept_encoding:
+        return None
+    accepted = set()
+    for part in accept_encoding.lower().split(','):
+        token, _, params = part.strip().partition(';')
+        if params.strip().replace(' ', '') in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+            continue
+        accepted.add(token.strip())
+    if BROTLI_AVAILABLE and 'br' in accepted:
+        return 'br'
+    if 'gzip' in accepted or '*' in accepted:
+        return 'gzip'
+    return None
+
+
+class EncodedResponse:
+    """Pre-encoded JSON response body with lazily built compressed variants"""
+
+    __slots__ = ('etag', 'body', 'headers', '_variants')
+
+    def __init__(self, etag: Optional[str], payload: Dict, headers: Optional[Dict[str, str]] = None):
+        self.etag = etag
+        # Same encoding options as fastapi's JSONResponse
+        self.body = json.dumps(payload, ensure_ascii=False, allow_nan=False,
+                               indent=None, separators=(',', ':')).encode('utf-8')
+        self.headers = headers or {}
+        self._variants: Dict[str, bytes] = {}
+
+    def variant(self, encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+        """Return (body, content_encoding) for a negotiated encoding"""
+        if encoding is None or len(self.body) < MIN_COMPRESS_BYTES:
+            return self.body, None
+        body = self._variants.get(encoding)
+        if body is None:
+            if encoding == 'br':
+                body = brotli.compress(self.body, quality=5)
+            else:
+                body = gzip.compress(self.body, compresslevel=6)
+            self._variants[encoding] = body
+        return body, encoding
+
+
+class OddsMagnetSnapshot:
+    """Immutable view of one loaded OddsMagnet file with precomputed filter indexes"""
+
+    MAX_MEMO_ENTRIES = 256
+    MAX_RESPONSE_ENTRIES = 64
+
+    def __init__(self, path: Path, version: Tuple, data: Dict):
+        self.path = path
+        self.version = version
+        self.data = data
+        self.matches: List[Dict] = data.get('matches', [])
+
+        # Pre-lowercased columns (computed once per file version)
+        self.league_lower = [(m.get('league') or '').lower() for m in self.matches]
+        self.uri_lower = [(m.get('match_uri') or '').lower() for m in self.matches]
+        self.name_lower = [(m.get('match_name') or '').lower() for m in self.matches]
+
+        # league (lowercase) -> match indices, league_slug -> match indices
+        self.league_index: Dict[str, List[int]] = {}
+        self.slug_index: Dict[str, List[int]] = {}
+        for i, match in enumerate(self.matches):
+            self.league_index.setdefault(self.league_lower[i], []).append(i)
+            self.slug_index.setdefault(match.get('league_slug', ''), []).append(i)
+
+        # (league, search, league_slug, league_in_uri) -> tuple of match indices
+        self._memo: Dict[Tuple, Tuple[int, ...]] = {}
+        # query key -> EncodedResponse (dropped together with the snapshot)
+        self._responses: Dict[Tuple, EncodedResponse] = {}
+
+    def _select_indices(self, league: Optional[str], search: Optional[str],
+                        league_slug: Optional[str], league_in_uri: bool) -> Tuple[int, ...]:
+        key = (league, search, league_slug, league_in_uri)
+        cached = self._memo.get(key)
+        if cached is not None:
+            return cached
+
+        if league_slug is not None:
+            candidates = self.slug_index.get(league_slug, [])
+        else:
+            candidates = range(len(self.matches))
+
+        if league:
+            # Partial league match: scan distinct league names, not every match
+            hits = set()
+            for league_name, indices in self.league_index.items():
+                if league in league_name:
+                    hits.update(indices)
+            if league_in_uri:
+                uri_lower = self.uri_lower
+                hits.update(i for i in candidates if league in uri_lower[i])
+            candidates = [i for i in candidates if i in hits]
+
+        if search:
+            name_lower = self.name_lower
+            candidates = [i for i in candidates if search in name_lower[i]]
+
+        result = tuple(candidates)
+        if len(self._memo) >= self.MAX_MEMO_ENTRIES:
+            self._memo.clear()
+        self._memo[key] = result
+        return result
+
+    def select(self, league: Optional[str] = None, search: Optional[str] = None,
+               league_slug: Optional[str] = None, league_in_uri: bool = True) -> List[Dict]:
+        """
+        Return matches filtered by league/search (partial, case-insensitive)
+
+        Args:
+            league: League filter, matched against league (and match_uri if league_in_uri)
+            search: Substring searched in match_name
+            league_slug: Exact league_slug restriction (e.g. 'usa-nba')
+            league_in_uri: Whether the league filter also matches match_uri
+        """
+        indices = self._select_indices(
+            league.lower() if league else None,
+            search.lower() if search else None,
+            league_slug,
+            league_in_uri
+        )
+        matches = self.matches
+        return [matches[i] for i in indices]
+
+    def get_response(self, key: Tuple) -> Optional[EncodedResponse]:
+        """Return a cached encoded response for a query key"""
+        return self._responses.get(key)
+
+    def put_response(self, key: Tuple, response: EncodedResponse) -> EncodedResponse:
+        """Cache an encoded response for a query key (bounded)"""
+        if len(self._responses) >= self.MAX_RESPONSE_ENTRIES:
+            self._responses.clear()
+        self._responses[key] = response
+        return response
+
+
+class OddsMagnetStore:
+    """Registry of per-sport OddsMagnet snapshots, reloaded on file change"""
+
+    def __init__(self, datasets: Dict[str, List[Path]], read_timeout: float = 5.0):
+        """
+        Args:
+            datasets: dataset name -> candidate files (first existing file is used)
+            read_timeout: Seconds allowed for a reload before giving up
+        """
+        self.datasets = {name: [Path(p) for p in paths] for name, paths in datasets.items()}
+        self.read_timeout = read_timeout
+        self._snapshots: Dict[str, OddsMagnetSnapshot] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def resolve_path(self, name: str) -> Optional[Path]:
+        """Return the first existing file for a dataset, or None"""
+        for path in self.datasets.get(name, []):
+            if path.exists():
+                return path
+        return None
+
+    @staticmethod
+    def file_version(path: Path) -> Optional[Tuple]:
+        """Cheap file version from a single stat() call"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def current_version(self, name: str) -> Optional[Tuple[Path, Tuple]]:
+        """Return (path, version) of a dataset's file without reading it"""
+        path = self.resolve_path(name)
+        if path is None:
+            return None
+        version = self.file_version(path)
+        if version is None:
+            return None
+        return path, version
+
+    @staticmethod
+    def make_etag(path: Path, version: Tuple, query: Tuple) -> str:
+        """Content-addressed ETag from a file version and the query parameters"""
+        base = f"{path.name}:{':'.join(map(str, version))}:{':'.join(map(str, query))}"
+        return f'"{hashlib.md5(base.encode()).hexdigest()}"'  # Wrap in quotes per HTTP spec
+
+    @staticmethod
+    def _load(path: Path, version: Tuple) -> OddsMagnetSnapshot:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return OddsMagnetSnapshot(path, version, data)
+
+    def peek(self, name: str) -> Optional[OddsMagnetSnapshot]:
+        """Return the currently cached snapshot without checking the file"""
+        return self._snapshots.get(name)
+
+    async def get(self, name: str) -> Optional[OddsMagnetSnapshot]:
+        """
+        Return an up-to-date snapshot for a dataset
+
+        Returns None if no file exists for the dataset. Raises asyncio.TimeoutError
+        or json.JSONDecodeError when the file cannot be reloaded and no previous
+        snapshot is available to fall back to.
+        """
+        current = self.current_version(name)
+        if current is None:
+            return None
+        path, version = current
+
+        snapshot = self._snapshots.get(name)
+        if snapshot is not None and snapshot.path == path and snapshot.version == version:
+            return snapshot
+
+        lock = self._locks.setdefault(name, asyncio.Lock())
+        async with lock:
+            # Another request may have reloaded while we waited
+            snapshot = self._snapshots.get(name)
+            if snapshot is not None and snapshot.path == path and snapshot.version == version:
+                return snapshot
+
+            try:
+                snapshot = await asyncio.wait_for(
+                    asyncio.to_thread(self._load, path, version),
+                    timeout=self.read_timeout
+                )
+            except (asyncio.TimeoutError, json.JSONDecodeError):
+                # File is mid-write - keep serving the previous version if we have one
+                previous = self._snapshots.get(name)
+                if previous is not None:
+                    return previous
+                raise
+
+            self._snapshots[name] = snapshot
+            return snapshot
+
+    def invalidate(self, name: str):
+        """Drop the cached snapshot for a dataset"""
+        self._snapshots.pop(name, None)
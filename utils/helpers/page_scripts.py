@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Page Script Registry
+Installs a library of named extraction functions into a Playwright page once
+and calls them by name, instead of sending the full JavaScript source with
+every page.evaluate().
+
+    registry = PageScriptRegistry('__b365x', HELPERS, EXTRACTORS)
+    await registry.install(page)                      # once per page
+    rows = await registry.run(page, 'soccer_section', {'label': 'EPL', ...}, label='EPL')
+    rows = await registry.run(grid, 'mlb', label='MLB')   # element handle: function gets the element
+
+Each extractor is a JS function expression called as fn(root, cfg, helpers):
+root is `document` for a page target and the element for an element handle,
+cfg is the JSON config passed to run(), helpers is the shared HELPERS object.
+Per call only the name and config cross CDP, and the page parses and compiles
+the library once instead of once per call.
+
+The library is also registered as an init script on the page's context so it
+survives navigations; if a call still finds it missing (new document, CSP,
+version change) it is installed on the spot and the call retried.
+
+mode='inline' sends the full function source on every call (the old
+behaviour) so the two can be compared with the same per-label stats.
+"""
+
+import hashlib
+import json
+import time
+from typing import Any, Dict, Optional
+
+
+class PageScriptRegistry:
+    """Named in-page extraction functions with per-label latency stats"""
+
+    def __init__(self, namespace: str, helpers_js: str, scripts: Dict[str, str],
+                 mode: str = 'library', metrics=None):
+        """
+        Args:
+            namespace: window property the library is installed under
+            helpers_js: JS object expression passed to every function as its third argument
+            scripts: name -> JS function expression
+            mode: 'library' (install once, call by name) or 'inline' (send the source each call)
+            metrics: Optional MetricsRegistry; call latency and bytes sent are exported per label
+        """
+        if mode not in ('library', 'inline'):
+            raise ValueError(f"Unknown script mode: {mode}")
+        self.namespace = namespace
+        self.helpers_js = helpers_js.strip()
+        self.scripts = {name: source.strip() for name, source in scripts.items()}
+        self.mode = mode
+        self.version = hashlib.blake2b(
+            json.dumps([self.helpers_js, self.scripts], sort_keys=True).encode('utf-8'), digest_size=6).hexdigest()
+        self.library_js = self._build_library()
+        self._contexts = set()
+        self.stats: Dict[str, Dict[str, float]] = {}
+
+        self._seconds = self._bytes = None
+        if metrics is not None:
+            self._seconds = metrics.histogram('odds_page_script_seconds',
+                                              'In-page extraction call latency, by label and mode', ('label', 'mode'))
+            self._bytes = metrics.counter('odds_page_script_bytes_total',
+                                          'Script bytes sent to the browser for extraction calls', ('mode',))
+
+    def _build_library(self) -> str:
+        entries = ',\n'.join(f"{json.dumps(name)}: {source}" for name, source in self.scripts.items())
+        ns, version = json.dumps(self.namespace), json.dumps(self.version)
+        return (
+            "() => {\n"
+            f"const ns = {ns}, version = {version};\n"
+            "if (window[ns] && window[ns].version === version) return version;\n"
+            f"const helpers = ({self.helpers_js});\n"
+            f"const scripts = {{\n{entries}\n}};\n"
+            "window[ns] = {\n"
+            "    version: version,\n"
+            "    names: Object.keys(scripts),\n"
+            "    run(name, root, cfg) {\n"
+            "        const fn = scripts[name];\n"
+            "        if (!fn) throw new Error(`Unknown extraction script: ${name}`);\n"
+            "        return fn(root, cfg || {}, helpers);\n"
+            "    }\n"
+            "};\n"
+            "return version;\n"
+            "}"
+        )
+
+    # Small call stubs: the library answers {ok: false} when it is missing or stale
+    _PAGE_CALL = ("([ns, version, name, cfg]) => (window[ns] && window[ns].version === version)"
+                  " ? {ok: true, value: window[ns].run(name, document, cfg)} : {ok: false}")
+    _ELEMENT_CALL = ("(el, [ns, version, name, cfg]) => (window[ns] && window[ns].version === version)"
+                     " ? {ok: true, value: window[ns].run(name, el, cfg)} : {ok: false}")
+
+    @staticmethod
+    def _is_page(target) -> bool:
+        return hasattr(target, 'goto')
+
+    async def install(self, target):
+        """Install the library into a page (and its context's future documents) or an element's frame"""
+        if self.mode != 'library':
+            return
+        if self._is_page(target):
+            context = getattr(target, 'context', None)
+            if context is not None and id(context) not in self._contexts:
+                try:
+                    await context.add_init_script(script=f"({self.library_js})()")
+                    self._contexts.add(id(context))
+                except Exception:
+                    pass  # connected over CDP without init-script support; the per-call check covers it
+            await target.evaluate(self.library_js)
+        else:
+            await target.evaluate(f"(el) => ({self.library_js})()")
+
+    async def run(self, target, name: str, config: Optional[Dict[str, Any]] = None, label: Optional[str] = None) -> Any:
+        """
+        Call a registered extractor
+
+        Args:
+            target: Playwright page (root is document) or element handle (root is the element)
+            name: Registered script name
+            config: JSON-serialisable config passed as cfg
+            label: Stats label (sport); defaults to the script name
+
+        Returns:
+            Whatever the extractor returns
+        """
+        if name not in self.scripts:
+            raise KeyError(f"Unknown extraction script: {name}")
+        label = label or name
+        entry = self.stats.setdefault(label, {'calls': 0, 'seconds': 0.0, 'max_s': 0.0, 'bytes_sent': 0,
+                                              'installs': 0, 'errors': 0})
+        config = config or {}
+        is_page = self._is_page(target)
+        start = time.perf_counter()
+        try:
+            if self.mode == 'inline':
+                call = (f"(cfg) => ({self.scripts[name]})(document, cfg, ({self.helpers_js}))" if is_page
+                        else f"(el, cfg) => ({self.scripts[name]})(el, cfg, ({self.helpers_js}))")
+                sent = len(call) + len(json.dumps(config))
+                value = await target.evaluate(call, config)
+            else:
+                call = self._PAGE_CALL if is_page else self._ELEMENT_CALL
+                args = [self.namespace, self.version, name, config]
+                sent = len(call) + len(json.dumps(args))
+                result = await target.evaluate(call, args)
+                if not result.get('ok'):
+                    await self.install(target)
+                    entry['installs'] += 1
+                    sent += len(self.library_js)
+                    result = await target.evaluate(call, args)
+                    sent += len(call) + len(json.dumps(args))
+                value = result.get('value')
+        except Exception:
+            entry['errors'] += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            entry['calls'] += 1
+            entry['seconds'] += elapsed
+            entry['max_s'] = max(entry['max_s'], elapsed)
+            if self._seconds is not None:
+                self._seconds.observe(elapsed, label=label, mode=self.mode)
+        entry['bytes_sent'] += sent
+        if self._bytes is not None:
+            self._bytes.inc(sent, mode=self.mode)
+        return value
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-label calls, mean/max latency in ms and bytes sent"""
+        result = {}
+        for label, entry in sorted(self.stats.items()):
+            calls = entry['calls'] or 1
+            result[label] = {
+                'calls': entry['calls'],
+                'mean_ms': round(entry['seconds'] / calls * 1000, 1),
+                'max_ms': round(entry['max_s'] * 1000, 1),
+                'bytes_per_call': int(entry['bytes_sent'] / calls),
+                'installs': entry['installs'],
+                'errors': entry['errors'],
+            }
+        return result
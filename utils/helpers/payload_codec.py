@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Response Payload Decoding
+Single-pass format sniffing and pooled decompressor contexts for the
+bookmaker APIs that return compressed bodies with auto-decompression off
+(1xBet `*_VZip` endpoints).
+
+The codec is picked from the first bytes instead of trying gzip, zstd and
+zlib in turn and catching the failures:
+
+    gzip     1f 8b
+    zstd     28 b5 2f fd        (or a skippable frame 5? 2a 4d 18)
+    zlib     78 xx              (CMF/FLG header checksum)
+    json     '{' or '[' after optional whitespace / BOM
+
+Bodies that match none of these still go through the old trial chain, so
+nothing that decoded before stops decoding.
+
+zstd contexts are expensive to build (window buffers), so they are kept in a
+small pool and reused; an optional trained dictionary is loaded once and
+shared by every pooled context.
+"""
+
+import json
+import threading
+import time
+import zlib
+from typing import Any, Dict, List, Optional
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+CODECS = ('gzip', 'zstd', 'zlib', 'json', 'unknown')
+
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+_JSON_LEAD = frozenset(b'{[')
+_WHITESPACE = b' \t\r\n'
+
+
+def sniff_codec(data: bytes) -> str:
+    """Codec name for a payload from its leading bytes (see CODECS)"""
+    if len(data) < 2:
+        return 'unknown'
+    b0, b1 = data[0], data[1]
+    if b0 == 0x1f and b1 == 0x8b:
+        return 'gzip'
+    if data[:4] == _ZSTD_MAGIC or (len(data) >= 4 and data[0] & 0xf0 == 0x50 and data[1:4] == b'\x2a\x4d\x18'):
+        return 'zstd'
+    if b0 & 0x0f == 8 and b0 >> 4 <= 7 and (b0 << 8 | b1) % 31 == 0:
+        return 'zlib'
+    head = data[:64]
+    if head.startswith(b'\xef\xbb\xbf'):
+        head = head[3:]
+    head = head.lstrip(_WHITESPACE)
+    if head and head[0] in _JSON_LEAD:
+        return 'json'
+    return 'unknown'
+
+
+class PayloadDecoder:
+    """Decodes compressed JSON bodies, reusing zstd contexts and counting per codec"""
+
+    def __init__(self, zstd_dict: Optional[bytes] = None, pool_size: int = 4, metrics=None):
+        """
+        Args:
+            zstd_dict: Trained zstd dictionary (raw bytes); only used by frames that reference it
+            pool_size: Maximum idle zstd contexts kept for reuse
+            metrics: Optional MetricsRegistry; bytes and seconds per codec are exported
+        """
+        self.pool_size = pool_size
+        self._zstd_dict = None
+        if zstd_dict and ZSTD_AVAILABLE:
+            self._zstd_dict = zstandard.ZstdCompressionDict(zstd_dict)
+        self._pool: List[Any] = []
+        self._lock = threading.Lock()
+        self.stats: Dict[str, Dict[str, float]] = {
+            codec: {'count': 0, 'bytes_in': 0, 'bytes_out': 0, 'seconds': 0.0, 'errors': 0}
+            for codec in CODECS
+        }
+        self.stats['zstd']['contexts_created'] = 0
+
+        self._bytes = self._seconds = None
+        if metrics is not None:
+            self._bytes = metrics.counter('odds_decompress_bytes_total',
+                                          'Payload bytes decoded, by codec and direction', ('codec', 'direction'))
+            self._seconds = metrics.counter('odds_decompress_seconds_total',
+                                            'Time spent decoding payloads, by codec', ('codec',))
+
+    # zstd context pool -------------------------------------------------
+
+    def _acquire_zstd(self):
+        with self._lock:
+            if self._pool:
+                return self._pool.pop()
+            self.stats['zstd']['contexts_created'] += 1
+        if self._zstd_dict is not None:
+            return zstandard.ZstdDecompressor(dict_data=self._zstd_dict)
+        return zstandard.ZstdDecompressor()
+
+    def _release_zstd(self, dctx):
+        with self._lock:
+            if len(self._pool) < self.pool_size:
+                self._pool.append(dctx)
+
+    def _zstd(self, data: bytes) -> bytes:
+        if not ZSTD_AVAILABLE:
+            raise ValueError('zstd payload but zstandard is not installed (pip install zstandard)')
+        dctx = self._acquire_zstd()
+        try:
+            # decompressobj handles frames written without a content size
+            return dctx.decompressobj().decompress(data)
+        finally:
+            self._release_zstd(dctx)
+
+    # decoding ----------------------------------------------------------
+
+    def _decode_as(self, codec: str, data: bytes) -> bytes:
+        if codec == 'gzip':
+            return zlib.decompress(data, zlib.MAX_WBITS | 16)
+        if codec == 'zstd':
+            return self._zstd(data)
+        if codec == 'zlib':
+            return zlib.decompress(data)
+        return data
+
+    def _record(self, codec: str, bytes_in: int, bytes_out: int, seconds: float):
+        entry = self.stats[codec]
+        entry['count'] += 1
+        entry['bytes_in'] += bytes_in
+        entry['bytes_out'] += bytes_out
+        entry['seconds'] += seconds
+        if self._bytes is not None:
+            self._bytes.inc(bytes_in, codec=codec, direction='in')
+            self._bytes.inc(bytes_out, codec=codec, direction='out')
+            self._seconds.inc(seconds, codec=codec)
+
+    def decode(self, data: bytes) -> bytes:
+        """
+        Decompress a payload
+
+        Returns:
+            The decompressed bytes
+
+        Raises:
+            ValueError: No codec could decode the payload
+        """
+        start = time.perf_counter()
+        codec = sniff_codec(data)
+        if codec != 'unknown':
+            try:
+                out = self._decode_as(codec, data)
+                self._record(codec, len(data), len(out), time.perf_counter() - start)
+                return out
+            except Exception:
+                self.stats[codec]['errors'] += 1
+
+        # Unrecognised (or mislabelled) body: the old trial order
+        for candidate in ('gzip', 'zstd', 'zlib'):
+            if candidate == codec or (candidate == 'zstd' and not ZSTD_AVAILABLE):
+                continue
+            try:
+                out = self._decode_as(candidate, data)
+            except Exception:
+                continue
+            self._record('unknown', len(data), len(out), time.perf_counter() - start)
+            return out
+        self.stats['unknown']['errors'] += 1
+        raise ValueError(f"Unrecognised payload ({len(data)} bytes, starts {data[:4].hex()})")
+
+    def decode_json(self, data: bytes) -> Any:
+        """Decompress and parse a JSON payload (raises ValueError on failure)"""
+        return json.loads(self.decode(data))
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-codec stats for codecs that were seen, with compression ratio and MB/s"""
+        result = {}
+        for codec, entry in self.stats.items():
+            if not entry['count'] and not entry['errors']:
+                continue
+            row = dict(entry)
+            row['ratio'] = round(entry['bytes_out'] / entry['bytes_in'], 2) if entry['bytes_in'] else None
+            row['mb_per_s'] = round(entry['bytes_out'] / entry['seconds'] / 1e6, 1) if entry['seconds'] else None
+            result[codec] = row
+        return result
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Team Name Index
+Precomputed lookups for the bet365 scrapers' team-name normalization
+(hierarchical cache `alias_lookup` in cache_data.json), built once per process
+and shared by every scraper instance.
+
+normalize() returns exactly what the scrapers' six-stage normalize_team_name
+returned; the stages that scanned lists are answered from tables instead:
+
+    Stage 4  nickname -> first candidate, and nickname -> first candidate per
+             upper-cased sport/league (was: walk every alias with that nickname)
+    Stage 5  per sport/league: suffix of an alias's last token -> first alias's
+             canonical name (was: `alias.endswith(nickname)` over the whole
+             sport index). The nickname is a whitespace-free word, so it can
+             only be a suffix of an alias's trailing token; indexing those
+             suffixes in alias order gives the same first match.
+
+Every stage is now a handful of dict lookups, so a name costs O(its length).
+"""
+
+import json
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+_PUNCTUATION = re.compile(r'[^\w\s]')
+_WHITESPACE = re.compile(r'\s+')
+_MISSING = object()
+
+
+class TeamNameIndex:
+    """Alias tables for one alias_lookup dict"""
+
+    def __init__(self, alias_lookup: Dict[str, Dict[str, Any]]):
+        self.alias_lookup = alias_lookup
+        # Same shapes the scrapers exposed before (kept for callers that read them)
+        self.nickname_index: Dict[str, List[Tuple[str, Dict]]] = {}
+        self.sport_team_index: Dict[str, Dict[str, str]] = {}
+
+        for alias, path in alias_lookup.items():
+            words = alias.split()
+            if len(words) >= 2 and path.get('team'):
+                self.nickname_index.setdefault(words[-1], []).append((alias, path))
+
+            if path.get('team'):
+                canonical = path.get('canonical_name')
+                for key in (path.get('sport', ''), path.get('league', '')):
+                    if key:
+                        index = self.sport_team_index.setdefault(key, {})
+                        if canonical:
+                            index[alias] = canonical
+
+        # Stage 4 answers: first candidate, and first candidate matching each sport/league
+        self._nickname_first: Dict[str, Optional[str]] = {}
+        self._nickname_by_sport: Dict[str, Dict[str, Optional[str]]] = {}
+        for nickname, candidates in self.nickname_index.items():
+            self._nickname_first[nickname] = candidates[0][1].get('canonical_name')
+            by_sport: Dict[str, Optional[str]] = {}
+            for _, path in candidates:
+                for key in (path.get('sport', ''), path.get('league', '')):
+                    if key:
+                        by_sport.setdefault(key.upper(), path.get('canonical_name'))
+            self._nickname_by_sport[nickname] = by_sport
+
+        # Stage 5 answers: suffixes of each alias's trailing token, first alias wins
+        self._sport_suffixes: Dict[str, Dict[str, str]] = {}
+        for key, index in self.sport_team_index.items():
+            suffixes: Dict[str, str] = {}
+            for alias, canonical in index.items():
+                tail = alias.split()[-1] if alias.split() else ''
+                if not alias.endswith(tail):
+                    continue  # trailing whitespace: no whitespace-free suffix can match
+                for start in range(len(tail)):
+                    suffixes.setdefault(tail[start:], canonical)
+            self._sport_suffixes[key] = suffixes
+
+    def _canonical(self, key: str):
+        path = self.alias_lookup.get(key)
+        return path.get('canonical_name') if path else None
+
+    def normalize(self, team_name: str, sport: Optional[str] = None) -> str:
+        """
+        Canonical team name from the alias cache
+
+        Args:
+            team_name: Name as scraped
+            sport: Sport or league label used to disambiguate nicknames
+
+        Returns:
+            The canonical name, or team_name unchanged if nothing matches
+        """
+        if not team_name or not self.alias_lookup:
+            return team_name
+
+        team_lower = team_name.lower().strip()
+        team_cleaned = _WHITESPACE.sub(' ', _PUNCTUATION.sub('', team_lower)).strip()
+
+        # Stages 1-3: exact, cleaned, no spaces
+        canonical = self._canonical(team_lower)
+        if canonical:
+            return canonical
+        if team_cleaned != team_lower:
+            canonical = self._canonical(team_cleaned)
+            if canonical:
+                return canonical
+        team_no_space = team_cleaned.replace(' ', '')
+        if team_no_space != team_cleaned:
+            canonical = self._canonical(team_no_space)
+            if canonical:
+                return canonical
+
+        # Stage 4: nickname (last word)
+        words = team_cleaned.split()
+        nickname = words[-1] if len(words) >= 2 else None
+        if nickname is not None and nickname in self._nickname_first:
+            if not sport:
+                return self._nickname_first[nickname]
+            found = self._nickname_by_sport[nickname].get(sport.upper(), _MISSING)
+            if found is not _MISSING:
+                return found
+
+        # Stage 5: sport/league index
+        if sport:
+            sport_index = self.sport_team_index.get(sport, {})
+            for variant in (team_lower, team_cleaned, team_no_space):
+                if variant in sport_index:
+                    return sport_index[variant]
+            if nickname is not None:
+                found = self._sport_suffixes.get(sport, {}).get(nickname)
+                if found is not None:
+                    return found
+
+        # Stage 6: any contiguous run of words (short names only)
+        if len(words) <= 3:
+            for i in range(len(words)):
+                for j in range(i + 1, len(words) + 1):
+                    path = self.alias_lookup.get(' '.join(words[i:j]))
+                    if path and path.get('team'):
+                        canonical = path.get('canonical_name')
+                        if canonical:
+                            return canonical
+
+        return team_name
+
+
+_indexes: Dict[str, Tuple[Tuple[int, int], TeamNameIndex]] = {}
+_lock = threading.Lock()
+
+
+def load_team_name_index(cache_file='cache_data.json') -> Optional[TeamNameIndex]:
+    """
+    Shared index for a cache file, rebuilt only when the file changes
+
+    Returns:
+        The index, or None if the file does not exist
+    """
+    path = Path(cache_file).resolve()
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    version = (stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        cached = _indexes.get(str(path))
+        if cached and cached[0] == version:
+            return cached[1]
+        with open(path, 'r', encoding='utf-8') as f:
+            index = TeamNameIndex(json.load(f).get('alias_lookup', {}))
+        _indexes[str(path)] = (version, index)
+        return index
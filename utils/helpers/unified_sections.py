@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Unified Sections Container
+Writes unified_odds.json content as an indexed container so readers can load
+only the sections they need (e.g. live matches of one sport) without parsing
+the much larger pregame payload.
+
+File layout (unified_odds.sections):
+    <header JSON>\n
+    <section payload bytes><section payload bytes>...
+
+The header holds the metadata block plus an index of
+"<kind>/<sport>" -> [offset, length, count], offsets relative to the first
+byte after the header line. Every payload is a JSON array of matches.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Any, Iterable, Optional
+
+SECTIONS_FORMAT = 'unified-sections'
+SECTIONS_VERSION = 1
+SECTION_KINDS = ('pregame', 'live')
+
+
+def get_sections_path(unified_file) -> Path:
+    """Return the container path that sits next to a unified_odds.json file"""
+    return Path(unified_file).with_suffix('.sections')
+
+
+def sport_section_key(sport: Optional[str]) -> str:
+    """Normalize a sport display name into a section key ('Table Tennis' -> 'table_tennis')"""
+    key = (sport or 'unknown').strip().lower().replace(' ', '_').replace('-', '_')
+    return key or 'unknown'
+
+
+def write_sections(data: Dict[str, Any], output_file: Path) -> bool:
+    """
+    Write unified data as an indexed section container (atomic replace)
+
+    Args:
+        data: Unified output dict with 'metadata', 'pregame_matches', 'live_matches'
+        output_file: Path of the .sections container
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    temp_file = str(output_file) + '.tmp'
+    try:
+        # Group matches per kind and sport, preserving original order
+        grouped: Dict[str, list] = {}
+        for kind in SECTION_KINDS:
+            for match in data.get(f'{kind}_matches', []):
+                key = f"{kind}/{sport_section_key(match.get('sport'))}"
+                grouped.setdefault(key, []).append(match)
+
+        index = {}
+        payloads = []
+        offset = 0
+        for key, matches in grouped.items():
+            payload = json.dumps(matches, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            index[key] = [offset, len(payload), len(matches)]
+            payloads.append(payload)
+            offset += len(payload)
+
+        header = {
+            'format': SECTIONS_FORMAT,
+            'version': SECTIONS_VERSION,
+            'metadata': data.get('metadata', {}),
+            'sections': index
+        }
+        header_bytes = json.dumps(header, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+        with open(temp_file, 'wb') as f:
+            f.write(header_bytes)
+            f.write(b'\n')
+            for payload in payloads:
+                f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(temp_file, output_file)
+        return True
+
+    except Exception as e:
+        print(f"⚠️ Error writing unified sections: {e}")
+        if os.path.exists(temp_file):
+            try:
+                os.remove(temp_file)
+            except:
+                pass
+        return False
+
+
+def read_sections(sections_file: Path, kinds: Optional[Iterable[str]] = None,
+                  sports: Optional[Iterable[str]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Read selected sections from an indexed container
+
+    Args:
+        sections_file: Path of the .sections container
+        kinds: Section kinds to load ('pregame', 'live'); None loads both
+        sports: Sport names to load; None loads every sport
+
+    Returns:
+        Dict shaped like unified_odds.json (kinds not requested are empty lists),
+        or None if the container is missing or unreadable
+    """
+    try:
+        sections_file = Path(sections_file)
+        if not sections_file.exists():
+            return None
+
+        wanted_kinds = set(kinds) if kinds else set(SECTION_KINDS)
+        wanted_sports = {sport_section_key(s) for s in sports} if sports else None
+
+        result = {
+            'metadata': {},
+            'pregame_matches': [],
+            'live_matches': []
+        }
+
+        with open(sections_file, 'rb') as f:
+            header = json.loads(f.readline())
+            if header.get('format') != SECTIONS_FORMAT or header.get('version') != SECTIONS_VERSION:
+                return None
+
+            base = f.tell()
+            result['metadata'] = header.get('metadata', {})
+
+            # Walk the index in file order so reads only move forward
+            for key, (offset, length, _count) in sorted(header.get('sections', {}).items(),
+                                                         key=lambda item: item[1][0]):
+                kind, _, sport = key.partition('/')
+                if kind not in wanted_kinds:
+                    continue
+                if wanted_sports is not None and sport not in wanted_sports:
+                    continue
+                f.seek(base + offset)
+                result[f'{kind}_matches'].extend(json.loads(f.read(length)))
+
+        return result
+
+    except Exception as e:
+        print(f"⚠️ Error reading unified sections from {sections_file}: {e}")
+        return None
+
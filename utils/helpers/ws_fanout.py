@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+WebSocket Fan-out Hub
+Encodes each broadcast once and delivers it to subscribers concurrently.
+
+Every client gets a bounded send queue drained by its own sender task, so one
+slow client can no longer stall pushes for everyone else. Messages pushed by
+the viewer are full per-sport snapshots, so when a client's queue is full its
+backlog is replaced by the newest message (snapshot-on-catch-up). Clients
+that stay behind for too long, or whose sends time out, are disconnected.
+"""
+
+import asyncio
+import json
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+
+def encode_message(message: Dict[str, Any]) -> str:
+    """Encode a message exactly like WebSocket.send_json does"""
+    return json.dumps(message, separators=(',', ':'), ensure_ascii=False)
+
+
+class ClientChannel:
+    """Bounded outgoing queue and sender task for one WebSocket client"""
+
+    def __init__(self, hub: 'FanoutHub', websocket, group: str):
+        self.hub = hub
+        self.websocket = websocket
+        self.group = group
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=hub.max_queue)
+        self.sent = 0
+        self.resyncs = 0
+        self.consecutive_resyncs = 0
+        self.task = asyncio.create_task(self._sender())
+
+    def offer(self, text: str) -> bool:
+        """
+        Queue a message without blocking
+
+        Returns:
+            bool: False if the client has fallen too far behind and should be dropped
+        """
+        try:
+            self.queue.put_nowait((text, time.perf_counter()))
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        # Backlog is stale - the newest full snapshot supersedes it
+        dropped = 0
+        while not self.queue.empty():
+            self.queue.get_nowait()
+            dropped += 1
+        self.queue.put_nowait((text, time.perf_counter()))
+        self.resyncs += 1
+        self.consecutive_resyncs += 1
+        self.hub.stats['messages_dropped'] += dropped
+        self.hub.stats['snapshot_resyncs'] += 1
+        return self.consecutive_resyncs <= self.hub.max_resyncs
+
+    async def _sender(self):
+        try:
+            while True:
+                text, queued_at = await self.queue.get()
+                await asyncio.wait_for(self.websocket.send_text(text), timeout=self.hub.send_timeout)
+                self.sent += 1
+                self.consecutive_resyncs = 0
+                self.hub._record_send(time.perf_counter() - queued_at)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"⚠️ Failed to send to client ({self.group}): {type(e).__name__} {e}")
+            self.hub._drop(self, reason='send_failed')
+
+
+class FanoutHub:
+    """Groups of WebSocket clients (e.g. one per sport) with single-encode broadcast"""
+
+    LATENCY_WINDOW = 500
+
+    def __init__(self, max_queue: int = 4, send_timeout: float = 10.0, max_resyncs: int = 5):
+        """
+        Args:
+            max_queue: Maximum pending messages per client
+            send_timeout: Seconds a single send may take before the client is dropped
+            max_resyncs: Consecutive snapshot resyncs (without a completed send) before dropping
+        """
+        self.max_queue = max_queue
+        self.send_timeout = send_timeout
+        self.max_resyncs = max_resyncs
+        self.groups: Dict[str, Dict[Any, ClientChannel]] = {}
+        self.latencies = deque(maxlen=self.LATENCY_WINDOW)
+        self.stats = {
+            'broadcasts': 0,
+            'messages_sent': 0,
+            'messages_dropped': 0,
+            'snapshot_resyncs': 0,
+            'clients_dropped': 0,
+        }
+
+    def add(self, group: str, websocket) -> ClientChannel:
+        """Subscribe a WebSocket to a group (moving it out of any other group)"""
+        self.remove(websocket)
+        channel = ClientChannel(self, websocket, group)
+        self.groups.setdefault(group, {})[websocket] = channel
+        return channel
+
+    def move(self, websocket, group: str) -> ClientChannel:
+        """Move a subscribed WebSocket to another group, keeping its sender task"""
+        for members in self.groups.values():
+            channel = members.pop(websocket, None)
+            if channel is not None:
+                channel.group = group
+                self.groups.setdefault(group, {})[websocket] = channel
+                return channel
+        return self.add(group, websocket)
+
+    def remove(self, websocket):
+        """Unsubscribe a WebSocket from every group and stop its sender"""
+        for members in self.groups.values():
+            channel = members.pop(websocket, None)
+            if channel is not None:
+                channel.task.cancel()
+
+    def count(self, group: str) -> int:
+        """Number of subscribers in a group"""
+        return len(self.groups.get(group, {}))
+
+    def send(self, websocket, message: Dict[str, Any]):
+        """Queue a message for one subscribed client (keeps ordering with broadcasts)"""
+        for members in self.groups.values():
+            channel = members.get(websocket)
+            if channel is not None:
+                if not channel.offer(encode_message(message)):
+                    self._drop(channel, reason='too_slow')
+                return
+
+    def broadcast(self, group: str, message: Dict[str, Any]) -> int:
+        """
+        Encode a message once and queue it for every subscriber of a group
+
+        Returns:
+            int: Number of clients the message was queued for
+        """
+        members = self.groups.get(group)
+        if not members:
+            return 0
+        text = encode_message(message)
+        self.stats['broadcasts'] += 1
+        queued = 0
+        for channel in list(members.values()):
+            if channel.offer(text):
+                queued += 1
+            else:
+                self._drop(channel, reason='too_slow')
+        return queued
+
+    def _record_send(self, latency: float):
+        self.stats['messages_sent'] += 1
+        self.latencies.append(latency)
+
+    def _drop(self, channel: ClientChannel, reason: str):
+        members = self.groups.get(channel.group, {})
+        if members.get(channel.websocket) is not channel:
+            return
+        del members[channel.websocket]
+        self.stats['clients_dropped'] += 1
+        print(f"🧹 Dropped {reason} client from {channel.group}")
+        if channel.task is not asyncio.current_task():
+            channel.task.cancel()
+        asyncio.create_task(self._close(channel.websocket))
+
+    @staticmethod
+    async def _close(websocket):
+        try:
+            await websocket.close(code=1013)  # Try again later
+        except Exception:
+            pass
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue depth, client counts and send latency statistics"""
+        latencies = sorted(self.latencies)
+
+        def percentile(p: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000, 2)
+
+        groups = {}
+        for group, members in self.groups.items():
+            depths = [channel.queue.qsize() for channel in members.values()]
+            groups[group] = {
+                'clients': len(members),
+                'queue_depth_total': sum(depths),
+                'queue_depth_max': max(depths) if depths else 0,
+            }
+
+        return {
+            **self.stats,
+            'max_queue': self.max_queue,
+            'send_latency_ms': {
+                'samples': len(latencies),
+                'p50': percentile(0.50),
+                'p95': percentile(0.95),
+                'max': round(latencies[-1] * 1000, 2) if latencies else None,
+            },
+            'groups': groups,
+        }